@@ -1,16 +1,88 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 
 
 class AccountAppConfig(AppConfig):
     name = "saleor.account"
 
     def ready(self):
-        from .models import User
-        from .signals import delete_avatar
+        from django.contrib.auth.models import Group
+
+        from .models import Address, User
+        from .signals import (
+            collect_users_to_update_on_address_delete,
+            delete_avatar,
+            invalidate_group_users_auth,
+            invalidate_user_auth,
+            invalidate_user_auth_on_group_permissions_change,
+            invalidate_user_auth_on_m2m_change,
+            update_user_search_document_on_save,
+            update_users_search_documents_on_address_delete,
+            update_users_search_documents_on_address_save,
+            update_users_search_documents_on_addresses_change,
+        )
 
         post_delete.connect(
             delete_avatar,
             sender=User,
             dispatch_uid="delete_user_avatar",
         )
+
+        # invalidating cached authentication data of JWT token owners
+        post_save.connect(
+            invalidate_user_auth,
+            sender=User,
+            dispatch_uid="invalidate_user_auth_on_save",
+        )
+        post_delete.connect(
+            invalidate_user_auth,
+            sender=User,
+            dispatch_uid="invalidate_user_auth_on_delete",
+        )
+        pre_delete.connect(
+            invalidate_group_users_auth,
+            sender=Group,
+            dispatch_uid="invalidate_user_auth_on_group_delete",
+        )
+        m2m_changed.connect(
+            invalidate_user_auth_on_m2m_change,
+            sender=User.groups.through,
+            dispatch_uid="invalidate_user_auth_on_groups_change",
+        )
+        m2m_changed.connect(
+            invalidate_user_auth_on_m2m_change,
+            sender=User.user_permissions.through,
+            dispatch_uid="invalidate_user_auth_on_user_permissions_change",
+        )
+        m2m_changed.connect(
+            invalidate_user_auth_on_group_permissions_change,
+            sender=Group.permissions.through,
+            dispatch_uid="invalidate_user_auth_on_group_permissions_change",
+        )
+
+        # keeping search documents of users up to date
+        post_save.connect(
+            update_user_search_document_on_save,
+            sender=User,
+            dispatch_uid="update_user_search_document_on_save",
+        )
+        post_save.connect(
+            update_users_search_documents_on_address_save,
+            sender=Address,
+            dispatch_uid="update_users_search_documents_on_address_save",
+        )
+        pre_delete.connect(
+            collect_users_to_update_on_address_delete,
+            sender=Address,
+            dispatch_uid="collect_users_to_update_on_address_delete",
+        )
+        post_delete.connect(
+            update_users_search_documents_on_address_delete,
+            sender=Address,
+            dispatch_uid="update_users_search_documents_on_address_delete",
+        )
+        m2m_changed.connect(
+            update_users_search_documents_on_addresses_change,
+            sender=User.addresses.through,
+            dispatch_uid="update_users_search_documents_on_addresses_change",
+        )
@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...models import User
+from ...order_stats import update_users_order_stats
+
+ORDER_STATS_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Recalculates order statistics of all users."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ORDER_STATS_BATCH_SIZE,
+            help="Number of users updated in a single batch.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        self.stdout.write("Updating order statistics of users.")
+        start = time.monotonic()
+        total = User.objects.count()
+        processed = 0
+        queryset = User.objects.order_by("pk").values_list("pk", flat=True)
+        last_pk = None
+        while True:
+            batch_queryset = (
+                queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            )
+            pks = list(batch_queryset[:batch_size])
+            if not pks:
+                break
+            update_users_order_stats(pks)
+            processed += len(pks)
+            last_pk = pks[-1]
+            elapsed = time.monotonic() - start
+            self.stdout.write(
+                f"Processed {processed}/{total} users in {elapsed:.2f}s "
+                f"({processed / max(elapsed, 1e-6):.0f} users/s)."
+            )
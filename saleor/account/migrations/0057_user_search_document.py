@@ -0,0 +1,29 @@
+# Generated by Django 3.2.7 on 2026-10-19 18:10
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("account", "0056_merge_20210903_0640"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="search_document",
+            field=models.TextField(blank=True, default=""),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="user_search_document_gin",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 3.2.7 on 2026-10-19 19:25
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("account", "0057_user_search_document"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="order_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="last_order_date",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="lifetime_spend",
+            field=models.DecimalField(decimal_places=3, default=0, max_digits=12),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(fields=["order_count"], name="user_order_count_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(
+                fields=["last_order_date"], name="user_last_order_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 3.2.7 on 2026-10-19 22:10
+
+from django.db import migrations
+
+from ...account.search import prepare_user_search_document_value
+
+BATCH_SIZE = 1000
+
+
+def populate_user_search_document(apps, schema_editor):
+    User = apps.get_model("account", "User")
+    users = User.objects.filter(search_document="").order_by("pk")
+    last_pk = None
+    while True:
+        batch_users = users if last_pk is None else users.filter(pk__gt=last_pk)
+        batch = list(batch_users.prefetch_related("addresses")[:BATCH_SIZE])
+        if not batch:
+            break
+        for user in batch:
+            user.search_document = prepare_user_search_document_value(user)
+        User.objects.bulk_update(batch, ["search_document"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+    # every batch is committed separately
+    atomic = False
+
+    dependencies = [
+        ("account", "0058_user_order_stats"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_user_search_document, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 3.2.7 on 2026-10-19 22:05
+
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import Count, Exists, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+BATCH_SIZE = 1000
+
+
+def populate_user_order_stats(apps, schema_editor):
+    User = apps.get_model("account", "User")
+    Order = apps.get_model("order", "Order")
+    orders = Order.objects.exclude(status="draft")
+
+    def aggregate_user_orders(aggregate):
+        return Subquery(
+            orders.filter(user_id=OuterRef("pk"))
+            .order_by()
+            .values("user_id")
+            .annotate(value=aggregate)
+            .values("value")
+        )
+
+    users = User.objects.filter(Exists(orders.filter(user_id=OuterRef("pk")))).order_by(
+        "pk"
+    )
+    last_pk = None
+    while True:
+        batch_users = users if last_pk is None else users.filter(pk__gt=last_pk)
+        pks = list(batch_users.values_list("pk", flat=True)[:BATCH_SIZE])
+        if not pks:
+            break
+        User.objects.filter(pk__in=pks).update(
+            order_count=Coalesce(aggregate_user_orders(Count("pk")), 0),
+            last_order_date=aggregate_user_orders(Max("created")),
+            lifetime_spend=Coalesce(
+                aggregate_user_orders(Sum("total_paid_amount")), Decimal(0)
+            ),
+        )
+        last_pk = pks[-1]
+
+
+class Migration(migrations.Migration):
+    # every batch is committed separately
+    atomic = False
+
+    dependencies = [
+        ("account", "0059_populate_user_search_document"),
+        ("order", "0122_populate_order_search_document"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_user_order_stats, migrations.RunPython.noop),
+    ]
@@ -22,7 +22,7 @@ from phonenumber_field.modelfields import PhoneNumber, PhoneNumberField
 from versatileimagefield.fields import VersatileImageField
 
 from ..app.models import App
-from ..core.models import ModelWithMetadata
+from ..core.models import ModelWithDeferredFieldsLoadedTogether, ModelWithMetadata
 from ..core.permissions import AccountPermissions, BasePermissionEnum, get_permissions
 from ..core.utils.json_serializer import CustomJsonEncoder
 from ..order.models import Order
@@ -148,7 +148,12 @@ class UserManager(BaseUserManager):
         return self.get_queryset().filter(is_staff=True)
 
 
-class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
+class User(
+    PermissionsMixin,
+    ModelWithMetadata,
+    ModelWithDeferredFieldsLoadedTogether,
+    AbstractBaseUser,
+):
     email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=256, blank=True)
     last_name = models.CharField(max_length=256, blank=True)
@@ -170,6 +175,15 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
     language_code = models.CharField(
         max_length=35, choices=settings.LANGUAGES, default=settings.LANGUAGE_CODE
     )
+    search_document = models.TextField(blank=True, default="")
+    # statistics of orders placed by the user, excluding draft orders
+    order_count = models.PositiveIntegerField(default=0)
+    last_order_date = models.DateTimeField(null=True, blank=True)
+    lifetime_spend = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+    )
 
     USERNAME_FIELD = "email"
 
@@ -191,6 +205,13 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
                 fields=["email", "first_name", "last_name"],
                 opclasses=["gin_trgm_ops"] * 3,
             ),
+            GinIndex(
+                name="user_search_document_gin",
+                fields=["search_document"],
+                opclasses=["gin_trgm_ops"],
+            ),
+            models.Index(name="user_order_count_idx", fields=["order_count"]),
+            models.Index(name="user_last_order_date_idx", fields=["last_order_date"]),
         ]
 
     def __init__(self, *args, **kwargs):
@@ -0,0 +1,42 @@
+"""Order statistics of customers.
+
+The dashboard filters and sorts customers by the number and the dates of their
+orders. Instead of aggregating the orders of all users in every query, the number
+of orders, the date of the last order and the total amount paid for the orders of
+each user are stored on the user and recalculated when the orders change. The
+amounts are summed regardless of the currencies of the orders.
+"""
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from django.db.models import Count, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from ..order.models import Order
+from .models import User
+
+
+def _aggregate_user_orders(aggregate):
+    orders = (
+        Order.objects.non_draft()
+        .filter(user_id=OuterRef("pk"))
+        .order_by()
+        .values("user_id")
+        .annotate(value=aggregate)
+        .values("value")
+    )
+    return Subquery(orders)
+
+
+def update_users_order_stats(user_ids: Iterable[Optional[int]]):
+    """Recalculate order statistics of the users with a single query."""
+    user_ids = {pk for pk in user_ids if pk is not None}
+    if not user_ids:
+        return
+    User.objects.filter(pk__in=user_ids).update(
+        order_count=Coalesce(_aggregate_user_orders(Count("pk")), 0),
+        last_order_date=_aggregate_user_orders(Max("created")),
+        lifetime_spend=Coalesce(
+            _aggregate_user_orders(Sum("total_paid_amount")), Decimal(0)
+        ),
+    )
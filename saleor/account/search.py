@@ -0,0 +1,49 @@
+"""Search documents of users.
+
+The dashboard searches customers and staff members by their email, names and
+the names, city, country and phone of their addresses. These values are joined
+into a single lowercased document per user, stored in `User.search_document`
+and indexed with a trigram GIN index, so the search doesn't join addresses.
+"""
+from typing import Iterable, List
+
+from django.db.models import QuerySet
+
+from .models import Address, User
+
+
+def generate_search_document(values: Iterable) -> str:
+    return "\n".join(str(value) for value in values if value).lower()
+
+
+def get_user_search_values(user: User) -> List:
+    return [user.email, user.first_name, user.last_name]
+
+
+def get_address_search_values(address: Address) -> List:
+    return [
+        address.first_name,
+        address.last_name,
+        address.city,
+        address.country.code,
+        address.phone,
+    ]
+
+
+def prepare_user_search_document_value(user: User) -> str:
+    values = get_user_search_values(user)
+    for address in user.addresses.all():
+        values.extend(get_address_search_values(address))
+    return generate_search_document(values)
+
+
+def update_user_search_document(user: User):
+    user.search_document = prepare_user_search_document_value(user)
+    User.objects.filter(pk=user.pk).update(search_document=user.search_document)
+
+
+def update_users_search_documents(users: QuerySet):
+    users = list(users.prefetch_related("addresses"))
+    for user in users:
+        user.search_document = prepare_user_search_document_value(user)
+    User.objects.bulk_update(users, ["search_document"])
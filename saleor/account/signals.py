@@ -1,6 +1,98 @@
+from ..core.jwt import invalidate_user_auth_cache
 from ..core.utils import delete_versatile_image
+from ..order.search import update_orders_search_documents
+from .models import User
+from .search import update_user_search_document, update_users_search_documents
+
+USER_SEARCH_FIELDS = {"email", "first_name", "last_name"}
 
 
 def delete_avatar(sender, instance, **kwargs):
     if avatar := instance.avatar:
         delete_versatile_image(avatar)
+
+
+def invalidate_user_auth(sender, instance, **kwargs):
+    invalidate_user_auth_cache([instance.pk])
+
+
+def invalidate_group_users_auth(sender, instance, **kwargs):
+    invalidate_user_auth_cache(instance.user_set.values_list("pk", flat=True))
+
+
+def invalidate_user_auth_on_m2m_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Invalidate cached authentication data when user groups or permissions change.
+
+    Handle both `User.groups` and `User.user_permissions` relations, changed from
+    the user side or from the group/permission side.
+    """
+    if action not in ["post_add", "post_remove", "pre_clear"]:
+        return
+    if not reverse:
+        invalidate_user_auth_cache([instance.pk])
+    elif action == "pre_clear":
+        invalidate_user_auth_cache(instance.user_set.values_list("pk", flat=True))
+    else:
+        invalidate_user_auth_cache(pk_set)
+
+
+def invalidate_user_auth_on_group_permissions_change(
+    sender, instance, action, reverse, pk_set, model, **kwargs
+):
+    if action not in ["post_add", "post_remove", "pre_clear"]:
+        return
+    if not reverse:
+        user_ids = instance.user_set.values_list("pk", flat=True)
+    elif action == "pre_clear":
+        user_ids = instance.group_set.values_list("user__pk", flat=True)
+    else:
+        user_ids = model.objects.filter(pk__in=pk_set).values_list(
+            "user__pk", flat=True
+        )
+    invalidate_user_auth_cache([pk for pk in user_ids if pk is not None])
+
+
+def update_user_search_document_on_save(
+    sender, instance, created, update_fields, **kwargs
+):
+    """Update the search document of the user and of their orders.
+
+    Orders are updated only when the document of the user changed, as they
+    contain the email and names of the user.
+    """
+    if update_fields is not None and not USER_SEARCH_FIELDS.intersection(update_fields):
+        return
+    previous_search_document = instance.search_document
+    update_user_search_document(instance)
+    if not created and instance.search_document != previous_search_document:
+        update_orders_search_documents(instance.orders.all())
+
+
+def update_users_search_documents_on_address_save(sender, instance, **kwargs):
+    update_users_search_documents(User.objects.filter(addresses=instance))
+
+
+def collect_users_to_update_on_address_delete(sender, instance, **kwargs):
+    # relations with users are deleted together with the address, so the users
+    # have to be collected before
+    instance._search_user_ids = list(
+        instance.user_addresses.values_list("pk", flat=True)
+    )
+
+
+def update_users_search_documents_on_address_delete(sender, instance, **kwargs):
+    if user_ids := getattr(instance, "_search_user_ids", None):
+        update_users_search_documents(User.objects.filter(pk__in=user_ids))
+
+
+def update_users_search_documents_on_addresses_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+    if not reverse:
+        update_user_search_document(instance)
+    elif pk_set:
+        update_users_search_documents(User.objects.filter(pk__in=pk_set))
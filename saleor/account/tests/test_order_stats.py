@@ -0,0 +1,106 @@
+import io
+from decimal import Decimal
+
+from django.core.management import call_command
+from freezegun import freeze_time
+
+from ...order import OrderStatus
+from ...order.models import Order
+from ..models import User
+from ..order_stats import update_users_order_stats
+
+
+def test_user_order_stats_updated_on_order_create(customer_user, channel_USD):
+    # when
+    with freeze_time("2021-10-01 12:00:00"):
+        Order.objects.create(user=customer_user, channel=channel_USD)
+    order = Order.objects.create(user=customer_user, channel=channel_USD)
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.order_count == 2
+    assert customer_user.last_order_date == order.created
+    assert customer_user.lifetime_spend == Decimal(0)
+
+
+def test_user_order_stats_skip_draft_orders(customer_user, channel_USD):
+    # when
+    Order.objects.create(
+        user=customer_user, channel=channel_USD, status=OrderStatus.DRAFT
+    )
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.order_count == 0
+    assert customer_user.last_order_date is None
+
+
+def test_user_order_stats_updated_on_draft_order_complete(customer_user, channel_USD):
+    # given
+    order = Order.objects.create(
+        user=customer_user, channel=channel_USD, status=OrderStatus.DRAFT
+    )
+
+    # when
+    order.status = OrderStatus.UNFULFILLED
+    order.save(update_fields=["status"])
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.order_count == 1
+
+
+def test_user_order_stats_updated_on_payment(payment_txn_captured):
+    # given
+    order = payment_txn_captured.order
+
+    # when
+    order.update_total_paid()
+
+    # then
+    order.user.refresh_from_db()
+    assert order.user.lifetime_spend == payment_txn_captured.captured_amount
+
+
+def test_user_order_stats_updated_on_order_delete(order):
+    # when
+    order.delete()
+
+    # then
+    order.user.refresh_from_db()
+    assert order.user.order_count == 0
+    assert order.user.last_order_date is None
+
+
+def test_update_users_order_stats(customer_user, channel_USD):
+    # given
+    orders = Order.objects.bulk_create(
+        [
+            Order(user=customer_user, channel=channel_USD, total_paid_amount=10),
+            Order(user=customer_user, channel=channel_USD, total_paid_amount=5),
+        ]
+    )
+
+    # when
+    update_users_order_stats([customer_user.pk, None])
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.order_count == 2
+    assert customer_user.last_order_date == max(order.created for order in orders)
+    assert customer_user.lifetime_spend == Decimal(15)
+
+
+def test_update_users_order_stats_command(order, staff_user):
+    # given
+    User.objects.update(order_count=10, lifetime_spend=100)
+
+    # when
+    call_command("update_users_order_stats", batch_size=1, stdout=io.StringIO())
+
+    # then
+    order.user.refresh_from_db()
+    staff_user.refresh_from_db()
+    assert order.user.order_count == 1
+    assert order.user.lifetime_spend == Decimal(0)
+    assert staff_user.order_count == 0
@@ -0,0 +1,92 @@
+from ..models import User
+from ..search import prepare_user_search_document_value, update_users_search_documents
+
+
+def test_prepare_user_search_document_value(customer_user):
+    # when
+    search_document = prepare_user_search_document_value(customer_user)
+
+    # then
+    assert search_document == (
+        "test@example.com\nleslie\nwade\njohn\ndoe\nwrocław\npl\n+48713988102"
+    )
+
+
+def test_user_search_document_updated_on_save(customer_user):
+    # given
+    customer_user.first_name = "Alice"
+
+    # when
+    customer_user.save(update_fields=["first_name"])
+
+    # then
+    customer_user.refresh_from_db()
+    assert "alice" in customer_user.search_document
+    assert "leslie" not in customer_user.search_document
+
+
+def test_user_search_document_updated_on_address_save(customer_user):
+    # given
+    address = customer_user.addresses.first()
+    address.city = "Kraków"
+
+    # when
+    address.save()
+
+    # then
+    customer_user.refresh_from_db()
+    assert "kraków" in customer_user.search_document
+    assert "wrocław" not in customer_user.search_document
+
+
+def test_user_search_document_updated_on_address_delete(customer_user):
+    # when
+    customer_user.addresses.first().delete()
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.search_document == "test@example.com\nleslie\nwade"
+
+
+def test_user_search_document_updated_on_addresses_change(customer_user, address):
+    # given
+    address.city = "Kraków"
+    address.save()
+
+    # when
+    customer_user.addresses.set([address])
+
+    # then
+    customer_user.refresh_from_db()
+    assert "kraków" in customer_user.search_document
+    assert "wrocław" not in customer_user.search_document
+
+
+def test_user_rename_updates_orders_search_documents(order):
+    # given
+    user = order.user
+    user.last_name = "Smith"
+
+    # when
+    user.save()
+
+    # then
+    order.refresh_from_db()
+    assert "smith" in order.search_document
+    assert "wade" not in order.search_document
+
+
+def test_update_users_search_documents(customer_user, staff_user):
+    # given
+    User.objects.update(search_document="")
+
+    # when
+    update_users_search_documents(User.objects.all())
+
+    # then
+    customer_user.refresh_from_db()
+    staff_user.refresh_from_db()
+    assert customer_user.search_document == prepare_user_search_document_value(
+        customer_user
+    )
+    assert staff_user.search_document.startswith(staff_user.email)
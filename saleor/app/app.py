@@ -0,0 +1,36 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class AppAppConfig(AppConfig):
+    name = "saleor.app"
+
+    def ready(self):
+        from .models import App, AppToken
+        from .signals import (
+            invalidate_app_auth,
+            invalidate_app_auth_on_permissions_change,
+            invalidate_app_token_auth,
+        )
+
+        # invalidating cached authentication data of apps
+        post_save.connect(
+            invalidate_app_auth,
+            sender=App,
+            dispatch_uid="invalidate_app_auth_on_save",
+        )
+        post_save.connect(
+            invalidate_app_token_auth,
+            sender=AppToken,
+            dispatch_uid="invalidate_app_token_auth_on_save",
+        )
+        post_delete.connect(
+            invalidate_app_token_auth,
+            sender=AppToken,
+            dispatch_uid="invalidate_app_token_auth_on_delete",
+        )
+        m2m_changed.connect(
+            invalidate_app_auth_on_permissions_change,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_app_auth_on_permissions_change",
+        )
@@ -4,7 +4,7 @@ from django.contrib.auth.models import Permission
 from django.db import models
 from oauthlib.common import generate_token
 
-from ..core.models import Job, ModelWithMetadata
+from ..core.models import Job, ModelWithDeferredFieldsLoadedTogether, ModelWithMetadata
 from ..core.permissions import AppPermission
 from ..webhook.event_types import WebhookEventType
 from .types import AppExtensionTarget, AppExtensionType, AppExtensionView, AppType
@@ -26,7 +26,7 @@ class AppQueryset(models.QuerySet):
         )
 
 
-class App(ModelWithMetadata):
+class App(ModelWithMetadata, ModelWithDeferredFieldsLoadedTogether):
     name = models.CharField(max_length=60)
     created = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
@@ -0,0 +1,28 @@
+from .models import AppToken
+from .utils import invalidate_app_auth_cache
+
+
+def invalidate_app_token_auth(sender, instance, **kwargs):
+    invalidate_app_auth_cache([instance.auth_token])
+
+
+def invalidate_app_auth(sender, instance, **kwargs):
+    invalidate_app_auth_cache(instance.tokens.values_list("auth_token", flat=True))
+
+
+def invalidate_app_auth_on_permissions_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ["post_add", "post_remove", "pre_clear"]:
+        return
+    if not reverse:
+        tokens = instance.tokens.values_list("auth_token", flat=True)
+    elif action == "pre_clear":
+        tokens = AppToken.objects.filter(app__permissions=instance).values_list(
+            "auth_token", flat=True
+        )
+    else:
+        tokens = AppToken.objects.filter(app__pk__in=pk_set).values_list(
+            "auth_token", flat=True
+        )
+    invalidate_app_auth_cache(tokens)
@@ -0,0 +1,172 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from ..utils import get_active_app_by_token, get_app_auth_cache_key
+
+
+def test_get_active_app_by_token_uses_cached_snapshot(
+    app, permission_manage_orders, django_assert_num_queries
+):
+    # given
+    app.permissions.add(permission_manage_orders)
+    token = app.tokens.first().auth_token
+    get_active_app_by_token(token)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_app = get_active_app_by_token(token)
+        has_perm = cached_app.has_perm("order.manage_orders")
+
+    # then
+    assert cached_app == app
+    assert cached_app.is_active
+    assert has_perm
+    assert not cached_app.has_perm("product.manage_products")
+
+
+def test_get_active_app_by_token_cached_loads_other_fields_together(
+    app, django_assert_num_queries
+):
+    # given
+    token = app.tokens.first().auth_token
+    get_active_app_by_token(token)
+    cached_app = get_active_app_by_token(token)
+
+    # when
+    with django_assert_num_queries(1):
+        created = cached_app.created
+        metadata = cached_app.metadata
+        version = cached_app.version
+
+    # then
+    assert created == app.created
+    assert metadata == app.metadata
+    assert version == app.version
+
+
+def test_app_auth_cache_invalidated_again_on_commit(app):
+    # given
+    token = app.tokens.first().auth_token
+    cache_key = get_app_auth_cache_key(token)
+
+    # when
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        app.save(update_fields=["name"])
+        # a concurrent request caches the data from before the commit
+        get_active_app_by_token(token)
+        assert cache.get(cache_key)
+
+    # then
+    assert cache.get(cache_key) is None
+
+
+def test_get_active_app_by_token_does_not_store_raw_token(app):
+    # given
+    token = app.tokens.first().auth_token
+
+    # when
+    get_active_app_by_token(token)
+
+    # then
+    cache_key = get_app_auth_cache_key(token)
+    assert token not in cache_key
+    assert cache.get(cache_key)["id"] == app.pk
+
+
+def test_get_active_app_by_token_cache_disabled(app, settings):
+    # given
+    settings.APP_TOKEN_CACHE_TIMEOUT = 0
+    token = app.tokens.first().auth_token
+
+    # when
+    result = get_active_app_by_token(token)
+
+    # then
+    assert result == app
+    assert cache.get(get_app_auth_cache_key(token)) is None
+
+
+def test_get_active_app_by_token_inactive_app(app):
+    # given
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+    token = app.tokens.first().auth_token
+
+    # when
+    result = get_active_app_by_token(token)
+
+    # then
+    assert result is None
+    assert cache.get(get_app_auth_cache_key(token)) is None
+
+
+def test_app_auth_cache_invalidated_on_app_deactivation(app):
+    # given
+    token = app.tokens.first().auth_token
+    get_active_app_by_token(token)
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert cache.get(get_app_auth_cache_key(token)) is None
+    assert get_active_app_by_token(token) is None
+
+
+def test_app_auth_cache_invalidated_on_token_delete(app):
+    # given
+    app_token = app.tokens.first()
+    token = app_token.auth_token
+    get_active_app_by_token(token)
+
+    # when
+    app_token.delete()
+
+    # then
+    assert cache.get(get_app_auth_cache_key(token)) is None
+    assert get_active_app_by_token(token) is None
+
+
+def test_app_auth_cache_invalidated_on_app_delete(app):
+    # given
+    token = app.tokens.first().auth_token
+    get_active_app_by_token(token)
+
+    # when
+    app.delete()
+
+    # then
+    assert cache.get(get_app_auth_cache_key(token)) is None
+    assert get_active_app_by_token(token) is None
+
+
+def test_app_auth_cache_invalidated_on_permissions_change(
+    app, permission_manage_orders
+):
+    # given
+    token = app.tokens.first().auth_token
+    get_active_app_by_token(token)
+
+    # when
+    app.permissions.add(permission_manage_orders)
+
+    # then
+    assert cache.get(get_app_auth_cache_key(token)) is None
+    assert get_active_app_by_token(token).has_perm("order.manage_orders")
+
+
+def test_app_auth_cache_invalidated_on_permission_apps_change(
+    app, permission_manage_orders
+):
+    # given
+    app.permissions.add(permission_manage_orders)
+    token = app.tokens.first().auth_token
+    get_active_app_by_token(token)
+
+    # when
+    permission_manage_orders.app_set.remove(app)
+
+    # then
+    assert cache.get(get_app_auth_cache_key(token)) is None
+    assert not get_active_app_by_token(token).has_perm("order.manage_orders")
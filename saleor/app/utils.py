@@ -0,0 +1,89 @@
+import hashlib
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from .models import App, AppToken
+
+APP_AUTH_CACHE_KEY = "app_token_auth:{}"
+APP_AUTH_CACHE_FIELDS = ["id", "name", "is_active", "type", "identifier"]
+
+
+def get_app_auth_cache_key(auth_token: str) -> str:
+    """Return the cache key of the app authenticated with the given token.
+
+    Tokens are hashed to not store the raw credentials in the cache.
+    """
+    token_hash = hashlib.sha256(auth_token.encode()).hexdigest()
+    return APP_AUTH_CACHE_KEY.format(token_hash)
+
+
+def get_active_app_by_token(auth_token: str) -> Optional[App]:
+    """Return the active app that owns the token.
+
+    The app is fetched from the cached authentication snapshot when possible;
+    authenticating an app with a valid snapshot doesn't hit the database.
+    """
+    app = get_app_from_auth_cache(auth_token)
+    if app is not None:
+        return app
+
+    tokens = AppToken.objects.filter(auth_token=auth_token).values("pk")
+    app = App.objects.filter(
+        Exists(tokens.filter(app_id=OuterRef("pk"))), is_active=True
+    ).first()
+    if app:
+        set_app_auth_cache(auth_token, app)
+    return app
+
+
+def get_app_from_auth_cache(auth_token: str) -> Optional[App]:
+    """Return the app from the cached authentication snapshot.
+
+    Remaining app fields are loaded together, with a single query, on the first
+    access to any of them.
+    """
+    if not settings.APP_TOKEN_CACHE_TIMEOUT:
+        return None
+    snapshot = cache.get(get_app_auth_cache_key(auth_token))
+    if not snapshot or not snapshot["is_active"]:
+        return None
+
+    field_names = [
+        field.attname
+        for field in App._meta.concrete_fields
+        if field.attname in APP_AUTH_CACHE_FIELDS
+    ]
+    app = App.from_db(
+        App.objects.db, field_names, [snapshot[name] for name in field_names]
+    )
+    app._app_perm_cache = set(snapshot["permissions"])
+    return app
+
+
+def set_app_auth_cache(auth_token: str, app: App):
+    if not settings.APP_TOKEN_CACHE_TIMEOUT:
+        return
+    snapshot = {name: getattr(app, name) for name in APP_AUTH_CACHE_FIELDS}
+    # `get_permissions` fills the permissions cache of the instance, so they are
+    # not fetched again when checking them for this request.
+    snapshot["permissions"] = list(app.get_permissions())
+    cache.set(
+        get_app_auth_cache_key(auth_token),
+        snapshot,
+        timeout=settings.APP_TOKEN_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_app_auth_cache(auth_tokens: Iterable[str]):
+    """Delete cached authentication data of the apps with the given tokens.
+
+    The data is deleted again after the commit, so data cached by concurrent
+    requests from before the commit is not reused.
+    """
+    keys = [get_app_auth_cache_key(token) for token in auth_tokens]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
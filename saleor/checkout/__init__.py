@@ -1,5 +1,7 @@
 import logging
 
+default_app_config = "saleor.checkout.app.CheckoutAppConfig"
+
 logger = logging.getLogger(__name__)
 
 
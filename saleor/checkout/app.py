@@ -0,0 +1,55 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class CheckoutAppConfig(AppConfig):
+    name = "saleor.checkout"
+
+    def ready(self):
+        from ..product.models import (
+            Collection,
+            Product,
+            ProductType,
+            ProductVariant,
+            ProductVariantChannelListing,
+        )
+        from .models import CheckoutLine
+        from .signals import (
+            invalidate_checkout_lines,
+            invalidate_checkout_lines_on_catalogue_change,
+            invalidate_checkout_lines_on_collection_products_change,
+        )
+
+        # invalidating cached checkout lines
+        post_save.connect(
+            invalidate_checkout_lines,
+            sender=CheckoutLine,
+            dispatch_uid="invalidate_checkout_lines_on_line_save",
+        )
+        post_delete.connect(
+            invalidate_checkout_lines,
+            sender=CheckoutLine,
+            dispatch_uid="invalidate_checkout_lines_on_line_delete",
+        )
+        for model in [
+            ProductType,
+            Product,
+            ProductVariant,
+            ProductVariantChannelListing,
+            Collection,
+        ]:
+            post_save.connect(
+                invalidate_checkout_lines_on_catalogue_change,
+                sender=model,
+                dispatch_uid=f"invalidate_checkout_lines_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_checkout_lines_on_catalogue_change,
+                sender=model,
+                dispatch_uid=f"invalidate_checkout_lines_{model.__name__}_delete",
+            )
+        m2m_changed.connect(
+            invalidate_checkout_lines_on_collection_products_change,
+            sender=Collection.products.through,
+            dispatch_uid="invalidate_checkout_lines_on_collection_products_change",
+        )
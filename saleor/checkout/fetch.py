@@ -3,24 +3,22 @@ from dataclasses import dataclass
 from functools import singledispatch
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
+from django.db.models import Prefetch
 from django.utils.encoding import smart_text
+from django.utils.functional import SimpleLazyObject
 
+from ..product.models import ProductVariantChannelListing
 from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
 from ..warehouse import WarehouseClickAndCollectOption
 from ..warehouse.models import Warehouse
+from .lines_cache import get_checkout_lines_from_cache, set_checkout_lines_cache
 
 if TYPE_CHECKING:
     from ..account.models import Address, User
     from ..channel.models import Channel
     from ..discount import DiscountInfo
     from ..plugins.manager import PluginsManager
-    from ..product.models import (
-        Collection,
-        Product,
-        ProductType,
-        ProductVariant,
-        ProductVariantChannelListing,
-    )
+    from ..product.models import Collection, Product, ProductType, ProductVariant
     from .models import Checkout, CheckoutLine
 
 
@@ -107,10 +105,7 @@ class ShippingMethodInfo(DeliveryMethodBase):
         return bool(self.shipping_address)
 
     def is_method_in_valid_methods(self, checkout_info: "CheckoutInfo") -> bool:
-        valid_delivery_methods = checkout_info.valid_delivery_methods
-        return bool(
-            valid_delivery_methods and self.delivery_method in valid_delivery_methods
-        )
+        return self.delivery_method in checkout_info.valid_shipping_methods
 
     def update_channel_listings(self, checkout_info: "CheckoutInfo") -> None:
         checkout_info.shipping_method_channel_listings = (
@@ -155,10 +150,7 @@ class CollectionPointInfo(DeliveryMethodBase):
         )
 
     def is_method_in_valid_methods(self, checkout_info) -> bool:
-        valid_delivery_methods = checkout_info.valid_delivery_methods
-        return bool(
-            valid_delivery_methods and self.delivery_method in valid_delivery_methods
-        )
+        return self.delivery_method in checkout_info.valid_pick_up_points
 
 
 @singledispatch
@@ -177,11 +169,27 @@ def get_delivery_method_info(
 
 
 def fetch_checkout_lines(checkout: "Checkout") -> Iterable[CheckoutLineInfo]:
-    """Fetch checkout lines as CheckoutLineInfo objects."""
-    lines = checkout.lines.prefetch_related(
+    """Fetch checkout lines as CheckoutLineInfo objects.
+
+    Lines are reused from the cache until the checkout or the catalogue changes.
+    """
+    lines_info = get_checkout_lines_from_cache(checkout)
+    if lines_info is None:
+        lines_info = _fetch_checkout_lines(checkout)
+        set_checkout_lines_cache(checkout, lines_info)
+    return lines_info
+
+
+def _fetch_checkout_lines(checkout: "Checkout") -> List[CheckoutLineInfo]:
+    lines = checkout.lines.select_related("variant__product__product_type")
+    lines = lines.prefetch_related(
         "variant__product__collections",
-        "variant__channel_listings__channel",
-        "variant__product__product_type",
+        Prefetch(
+            "variant__channel_listings",
+            queryset=ProductVariantChannelListing.objects.filter(
+                channel_id=checkout.channel_id
+            ),
+        ),
     )
     lines_info = []
 
@@ -201,6 +209,7 @@ def fetch_checkout_lines(checkout: "Checkout") -> Iterable[CheckoutLineInfo]:
         if not variant_channel_listing:
             continue
 
+        variant_channel_listing.channel = checkout.channel
         lines_info.append(
             CheckoutLineInfo(
                 line=line,
@@ -241,16 +250,9 @@ def fetch_checkout_info(
         valid_shipping_methods=[],
         valid_pick_up_points=[],
     )
-
-    valid_shipping_methods = get_valid_shipping_method_list_for_checkout_info(
+    update_delivery_method_lists_for_checkout_info(
         checkout_info, shipping_address, lines, discounts, manager
     )
-    valid_pick_up_points = get_valid_collection_points_for_checkout_info(
-        shipping_address, lines, checkout_info
-    )
-    checkout_info.valid_shipping_methods = valid_shipping_methods
-    checkout_info.valid_pick_up_points = valid_pick_up_points
-    checkout_info.delivery_method_info = delivery_method_info
 
     return checkout_info
 
@@ -263,16 +265,40 @@ def update_checkout_info_shipping_address(
     manager: "PluginsManager",
 ):
     checkout_info.shipping_address = address
-    valid_methods = get_valid_shipping_method_list_for_checkout_info(
+    update_delivery_method_lists_for_checkout_info(
         checkout_info, address, lines, discounts, manager
     )
-    checkout_info.valid_shipping_methods = valid_methods
     delivery_method = checkout_info.delivery_method_info.delivery_method
     checkout_info.delivery_method_info = get_delivery_method_info(
         delivery_method, address
     )
 
 
+def update_delivery_method_lists_for_checkout_info(
+    checkout_info: CheckoutInfo,
+    shipping_address: Optional["Address"],
+    lines: Iterable[CheckoutLineInfo],
+    discounts: Iterable["DiscountInfo"],
+    manager: "PluginsManager",
+):
+    """Set the valid shipping methods and pick up points of the checkout.
+
+    Both lists are evaluated on the first access, so mutations which don't need
+    them skip calculating the checkout subtotal. They have to be updated after
+    any change of the shipping address or checkout lines.
+    """
+    checkout_info.valid_shipping_methods = SimpleLazyObject(  # type: ignore
+        lambda: get_valid_shipping_method_list_for_checkout_info(
+            checkout_info, shipping_address, lines, discounts, manager
+        )
+    )
+    checkout_info.valid_pick_up_points = SimpleLazyObject(  # type: ignore
+        lambda: get_valid_collection_points_for_checkout_info(
+            shipping_address, lines, checkout_info
+        )
+    )
+
+
 def get_valid_shipping_method_list_for_checkout_info(
     checkout_info: "CheckoutInfo",
     shipping_address: Optional["Address"],
@@ -0,0 +1,161 @@
+"""Snapshots of checkout lines cached between requests.
+
+Each checkout mutation fetches the lines of the checkout together with their
+variants, products, product types, collections and channel listings. The field
+values of these objects are stored in the cache under the checkout token and
+reused as long as neither the checkout nor the catalogue changed.
+"""
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ..core.cache import CacheVersion
+from ..core.snapshots import get_snapshot_values, instance_from_snapshot_values
+from ..product.models import (
+    Collection,
+    Product,
+    ProductType,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from .models import CheckoutLine
+
+if TYPE_CHECKING:
+    from .fetch import CheckoutLineInfo
+    from .models import Checkout
+
+CHECKOUT_LINES_CACHE_KEY = "checkout_lines:{}"
+catalogue_version = CacheVersion("checkout_lines_catalogue_version")
+
+# Fields not needed to process the checkout; they are loaded on the first access.
+CHECKOUT_LINE_SNAPSHOT_DEFERRED_FIELDS = {
+    "description",
+    "description_plaintext",
+    "search_vector",
+}
+
+
+def get_line_snapshot_values(instance) -> tuple:
+    return get_snapshot_values(instance, CHECKOUT_LINE_SNAPSHOT_DEFERRED_FIELDS)
+
+
+def instance_from_line_snapshot_values(model, values: tuple):
+    return instance_from_snapshot_values(
+        model, values, CHECKOUT_LINE_SNAPSHOT_DEFERRED_FIELDS
+    )
+
+
+class CheckoutLineSnapshot:
+    """Field values of a checkout line and of the objects it depends on."""
+
+    __slots__ = (
+        "line",
+        "variant",
+        "channel_listing",
+        "product",
+        "product_type",
+        "collections",
+    )
+
+    def __init__(
+        self,
+        line: tuple,
+        variant: tuple,
+        channel_listing: tuple,
+        product: tuple,
+        product_type: tuple,
+        collections: Tuple[tuple, ...],
+    ):
+        self.line = line
+        self.variant = variant
+        self.channel_listing = channel_listing
+        self.product = product
+        self.product_type = product_type
+        self.collections = collections
+
+    @classmethod
+    def from_line_info(cls, line_info: "CheckoutLineInfo") -> "CheckoutLineSnapshot":
+        return cls(
+            line=get_line_snapshot_values(line_info.line),
+            variant=get_line_snapshot_values(line_info.variant),
+            channel_listing=get_line_snapshot_values(line_info.channel_listing),
+            product=get_line_snapshot_values(line_info.product),
+            product_type=get_line_snapshot_values(line_info.product_type),
+            collections=tuple(
+                get_line_snapshot_values(collection)
+                for collection in line_info.collections
+            ),
+        )
+
+    def to_line_info(self, checkout: "Checkout") -> "CheckoutLineInfo":
+        from .fetch import CheckoutLineInfo
+
+        product_type = instance_from_line_snapshot_values(
+            ProductType, self.product_type
+        )
+        product = instance_from_line_snapshot_values(Product, self.product)
+        product.product_type = product_type
+        variant = instance_from_line_snapshot_values(ProductVariant, self.variant)
+        variant.product = product
+        channel_listing = instance_from_line_snapshot_values(
+            ProductVariantChannelListing, self.channel_listing
+        )
+        channel_listing.variant = variant
+        channel_listing.channel = checkout.channel
+        line = instance_from_line_snapshot_values(CheckoutLine, self.line)
+        line.checkout = checkout
+        line.variant = variant
+        return CheckoutLineInfo(
+            line=line,
+            variant=variant,
+            channel_listing=channel_listing,
+            product=product,
+            product_type=product_type,
+            collections=[
+                instance_from_line_snapshot_values(Collection, values)
+                for values in self.collections
+            ],
+        )
+
+
+def get_checkout_lines_version(checkout: "Checkout") -> tuple:
+    return (checkout.last_change, checkout.channel_id, catalogue_version.get())
+
+
+def get_checkout_lines_from_cache(
+    checkout: "Checkout",
+) -> Optional[List["CheckoutLineInfo"]]:
+    if not settings.CHECKOUT_LINES_CACHE_TIMEOUT:
+        return None
+    cached = cache.get(CHECKOUT_LINES_CACHE_KEY.format(checkout.pk))
+    if not cached or cached[0] != get_checkout_lines_version(checkout):
+        return None
+    return [snapshot.to_line_info(checkout) for snapshot in cached[1]]
+
+
+def set_checkout_lines_cache(checkout: "Checkout", lines: Iterable["CheckoutLineInfo"]):
+    if not settings.CHECKOUT_LINES_CACHE_TIMEOUT:
+        return
+    snapshots = [CheckoutLineSnapshot.from_line_info(line_info) for line_info in lines]
+    cache.set(
+        CHECKOUT_LINES_CACHE_KEY.format(checkout.pk),
+        (get_checkout_lines_version(checkout), snapshots),
+        timeout=settings.CHECKOUT_LINES_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_checkout_lines_cache(checkout_tokens: Iterable):
+    keys = [CHECKOUT_LINES_CACHE_KEY.format(token) for token in checkout_tokens]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_checkout_lines_catalogue_version():
+    """Make the cached lines of all checkouts outdated.
+
+    Called when any of the variants, products, product types, collections or
+    variant channel listings change, as the cached lines store their copies.
+    """
+    catalogue_version.invalidate()
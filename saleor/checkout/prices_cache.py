@@ -0,0 +1,121 @@
+"""Memoization of checkout prices calculated by the plugins manager.
+
+The plugins manager lives as long as the request, so checkout prices calculated
+by different resolvers or mutations of the same request can be reused as long as
+the data they depend on did not change.
+"""
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, Optional
+
+if TYPE_CHECKING:
+    from ..account.models import Address
+    from ..discount import DiscountInfo
+    from .fetch import CheckoutInfo, CheckoutLineInfo
+
+
+def get_address_key(address: Optional["Address"]) -> Hashable:
+    if address is None:
+        return None
+    return tuple(sorted(address.as_data().items()))
+
+
+def get_lines_key(lines: Iterable["CheckoutLineInfo"]) -> Hashable:
+    return tuple(get_line_key(line_info) for line_info in lines)
+
+
+def get_line_key(line_info: "CheckoutLineInfo") -> Hashable:
+    channel_listing = line_info.channel_listing
+    return (
+        line_info.line.pk,
+        line_info.variant.pk,
+        line_info.line.quantity,
+        channel_listing.price_amount if channel_listing else None,
+    )
+
+
+def get_discounts_version(discounts: Iterable["DiscountInfo"]) -> Hashable:
+    return tuple(
+        (
+            type(discount.sale).__name__,
+            discount.sale.pk,
+            discount.sale.type,
+            tuple(
+                sorted(
+                    (channel_slug, listing.discount_value)
+                    for channel_slug, listing in discount.channel_listings.items()
+                )
+            ),
+            hash(frozenset(discount.product_ids)),
+            hash(frozenset(discount.category_ids)),
+            hash(frozenset(discount.collection_ids)),
+            hash(frozenset(discount.variants_ids)),
+        )
+        for discount in discounts
+    )
+
+
+class CheckoutPricesCache:
+    """Store checkout prices calculated within a single request.
+
+    Results are keyed on the checkout token, last change, lines, address and
+    discounts version, so any change of the checkout produces a new key instead
+    of returning outdated prices. `hits` and `misses` count the reused and the
+    calculated prices per calculation name.
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, Any] = {}
+        # The same discounts list is passed to all calculations of the request;
+        # the list is kept next to its version so its id can't be reused.
+        self._discounts_versions: Dict[int, tuple] = {}
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    def get_checkout_key(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        address: Optional["Address"],
+        discounts: Iterable["DiscountInfo"],
+    ) -> Hashable:
+        checkout = checkout_info.checkout
+        shipping_listing = checkout_info.shipping_method_channel_listings
+        return (
+            checkout.token,
+            checkout.last_change,
+            checkout_info.channel.pk,
+            checkout.currency,
+            checkout.country.code,
+            checkout.shipping_method_id,
+            checkout.collection_point_id,
+            checkout.voucher_code,
+            checkout.discount_amount,
+            shipping_listing.price_amount if shipping_listing else None,
+            get_lines_key(lines),
+            get_address_key(address),
+            self._get_discounts_version(discounts),
+        )
+
+    def _get_discounts_version(self, discounts: Iterable["DiscountInfo"]) -> Hashable:
+        cached = self._discounts_versions.get(id(discounts))
+        if cached is not None and cached[0] is discounts:
+            return cached[1]
+        version = get_discounts_version(discounts)
+        self._discounts_versions[id(discounts)] = (discounts, version)
+        return version
+
+    def get_or_calculate(
+        self, name: str, key: Hashable, calculate: Callable[[], Any]
+    ) -> Any:
+        cache_key = (name, key)
+        if cache_key in self._results:
+            self.hits[name] += 1
+            return self._results[cache_key]
+        self.misses[name] += 1
+        result = calculate()
+        self._results[cache_key] = result
+        return result
+
+    def clear(self):
+        self._results.clear()
+        self._discounts_versions.clear()
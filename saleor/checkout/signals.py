@@ -0,0 +1,21 @@
+from .lines_cache import (
+    CHECKOUT_LINE_SNAPSHOT_DEFERRED_FIELDS,
+    invalidate_checkout_lines_cache,
+    invalidate_checkout_lines_catalogue_version,
+)
+
+
+def invalidate_checkout_lines(sender, instance, **kwargs):
+    invalidate_checkout_lines_cache([instance.checkout_id])
+
+
+def invalidate_checkout_lines_on_catalogue_change(sender, update_fields=None, **kwargs):
+    # saves updating only fields which are not cached don't affect checkout lines
+    if update_fields and set(update_fields) <= CHECKOUT_LINE_SNAPSHOT_DEFERRED_FIELDS:
+        return
+    invalidate_checkout_lines_catalogue_version()
+
+
+def invalidate_checkout_lines_on_collection_products_change(sender, action, **kwargs):
+    if action.startswith("post_"):
+        invalidate_checkout_lines_catalogue_version()
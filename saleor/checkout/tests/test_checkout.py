@@ -24,6 +24,8 @@ from ..fetch import (
     fetch_checkout_info,
     fetch_checkout_lines,
     get_delivery_method_info,
+    get_valid_shipping_method_list_for_checkout_info,
+    update_checkout_info_shipping_address,
 )
 from ..models import Checkout
 from ..utils import (
@@ -1238,3 +1240,61 @@ def test_chckout_without_delivery_method_creates_empty_delivery_method(
     assert not delivery_method_info.is_valid_delivery_method()
     assert not delivery_method_info.is_local_collection_point
     assert not delivery_method_info.is_method_in_valid_methods(checkout_info)
+
+
+@patch(
+    "saleor.checkout.fetch.get_valid_shipping_method_list_for_checkout_info",
+    wraps=get_valid_shipping_method_list_for_checkout_info,
+)
+def test_fetch_checkout_info_valid_shipping_methods_evaluated_lazily(
+    mocked_get_valid_shipping_methods, checkout_with_item, address, shipping_zone
+):
+    # given
+    checkout = checkout_with_item
+    checkout.shipping_address = address
+    checkout.save()
+    manager = get_plugins_manager()
+    lines = fetch_checkout_lines(checkout)
+
+    # when
+    checkout_info = fetch_checkout_info(checkout, lines, [], manager)
+
+    # then
+    mocked_get_valid_shipping_methods.assert_not_called()
+    assert list(checkout_info.valid_shipping_methods) == list(
+        shipping_zone.shipping_methods.all()
+    )
+    assert list(checkout_info.valid_shipping_methods)
+    mocked_get_valid_shipping_methods.assert_called_once()
+
+
+@patch(
+    "saleor.checkout.fetch.get_valid_shipping_method_list_for_checkout_info",
+    wraps=get_valid_shipping_method_list_for_checkout_info,
+)
+def test_update_checkout_info_shipping_address_updates_valid_shipping_methods(
+    mocked_get_valid_shipping_methods,
+    checkout_with_item,
+    address,
+    address_other_country,
+    shipping_zone,
+):
+    # given
+    checkout = checkout_with_item
+    checkout.shipping_address = address
+    checkout.save()
+    shipping_zone.countries = [address.country.code]
+    shipping_zone.save(update_fields=["countries"])
+    manager = get_plugins_manager()
+    lines = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, [], manager)
+    assert checkout_info.valid_shipping_methods
+
+    # when
+    update_checkout_info_shipping_address(
+        checkout_info, address_other_country, lines, [], manager
+    )
+
+    # then
+    assert not checkout_info.valid_shipping_methods
+    assert mocked_get_valid_shipping_methods.call_count == 2
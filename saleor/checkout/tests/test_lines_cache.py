@@ -0,0 +1,122 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+
+from ..fetch import fetch_checkout_lines
+from ..lines_cache import CHECKOUT_LINES_CACHE_KEY, CheckoutLineSnapshot
+from ..utils import add_variants_to_checkout
+
+
+def _get_lines_data(lines):
+    return [
+        (
+            line_info.line.pk,
+            line_info.line.quantity,
+            line_info.variant.pk,
+            line_info.channel_listing.price_amount,
+            line_info.product.pk,
+            line_info.product_type.pk,
+            [collection.pk for collection in line_info.collections],
+        )
+        for line_info in lines
+    ]
+
+
+def test_fetch_checkout_lines_reuses_cached_lines(
+    checkout_with_item, collection, django_assert_num_queries
+):
+    # given
+    checkout = checkout_with_item
+    product = checkout.lines.get().variant.product
+    collection.products.add(product)
+    lines = fetch_checkout_lines(checkout)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_lines = fetch_checkout_lines(checkout)
+        line_info = cached_lines[0]
+        weight = line_info.variant.get_weight()
+
+    # then
+    assert _get_lines_data(cached_lines) == _get_lines_data(lines)
+    assert line_info.line.variant is line_info.variant
+    assert line_info.variant.product is line_info.product
+    assert line_info.line.checkout is checkout
+    assert line_info.channel_listing.channel == checkout.channel
+    assert weight == lines[0].variant.get_weight()
+    # fields not stored in the cache are loaded on demand
+    assert line_info.product.description == product.description
+
+
+def test_fetch_checkout_lines_cache_invalidated_on_line_change(checkout_with_item):
+    # given
+    checkout = checkout_with_item
+    fetch_checkout_lines(checkout)
+    line = checkout.lines.get()
+
+    # when
+    line.quantity = 7
+    line.save(update_fields=["quantity"])
+
+    # then
+    lines = fetch_checkout_lines(checkout)
+    assert lines[0].line.quantity == 7
+
+
+def test_fetch_checkout_lines_cache_invalidated_on_bulk_line_changes(
+    checkout_with_item, product_list
+):
+    # given
+    checkout = checkout_with_item
+    fetch_checkout_lines(checkout)
+    variants = [product.variants.get() for product in product_list]
+
+    # when
+    add_variants_to_checkout(
+        checkout, variants, [1] * len(variants), checkout.channel.slug
+    )
+
+    # then
+    lines = fetch_checkout_lines(checkout)
+    assert len(lines) == len(variants) + 1
+
+
+def test_fetch_checkout_lines_cache_invalidated_on_price_change(checkout_with_item):
+    # given
+    checkout = checkout_with_item
+    lines = fetch_checkout_lines(checkout)
+    channel_listing = lines[0].channel_listing
+
+    # when
+    channel_listing.price_amount = Decimal("99.99")
+    channel_listing.save(update_fields=["price_amount"])
+
+    # then
+    lines = fetch_checkout_lines(checkout)
+    assert lines[0].channel_listing.price_amount == Decimal("99.99")
+
+
+def test_fetch_checkout_lines_cache_disabled(checkout_with_item, settings):
+    # given
+    settings.CHECKOUT_LINES_CACHE_TIMEOUT = 0
+    checkout = checkout_with_item
+
+    # when
+    lines = fetch_checkout_lines(checkout)
+
+    # then
+    assert lines
+    assert cache.get(CHECKOUT_LINES_CACHE_KEY.format(checkout.pk)) is None
+
+
+def test_checkout_line_snapshot_does_not_store_deferred_fields(checkout_with_item):
+    # given
+    line_info = fetch_checkout_lines(checkout_with_item)[0]
+    line_info.product.description = {"blocks": [{"type": "paragraph"}]}
+
+    # when
+    snapshot = CheckoutLineSnapshot.from_line_info(line_info)
+
+    # then
+    assert not hasattr(snapshot, "__dict__")
+    assert line_info.product.description not in snapshot.product
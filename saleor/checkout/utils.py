@@ -38,6 +38,7 @@ from .fetch import (
     update_checkout_info_delivery_method,
     update_checkout_info_shipping_address,
 )
+from .lines_cache import invalidate_checkout_lines_cache
 from .models import Checkout, CheckoutLine
 
 if TYPE_CHECKING:
@@ -182,6 +183,7 @@ def add_variants_to_checkout(
         CheckoutLine.objects.bulk_update(to_update, ["quantity"])
     if to_create:
         CheckoutLine.objects.bulk_create(to_create)
+    invalidate_checkout_lines_cache([checkout.pk])
     return checkout
 
 
@@ -2,7 +2,7 @@ from django.apps import AppConfig
 from django.conf import settings
 from django.db.models import Field
 
-from .db.filters import PostgresILike
+from .db.filters import PostgresILike, PostgresTrigramWordSimilar
 
 
 class CoreAppConfig(AppConfig):
@@ -10,6 +10,7 @@ class CoreAppConfig(AppConfig):
 
     def ready(self):
         Field.register_lookup(PostgresILike)
+        Field.register_lookup(PostgresTrigramWordSimilar)
 
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
@@ -0,0 +1,35 @@
+"""Versions of data cached by all processes."""
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class CacheVersion:
+    """Version of cached data, stored in the cache under the given key.
+
+    Data is cached together with the version it was built for and is rebuilt when
+    the version no longer matches.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def get(self) -> str:
+        version = cache.get(self.key)
+        if version is None:
+            cache.add(self.key, str(uuid4()), timeout=None)
+            version = cache.get(self.key)
+        return version
+
+    def bump(self):
+        cache.set(self.key, str(uuid4()), timeout=None)
+
+    def invalidate(self):
+        """Make the data cached for the current version outdated.
+
+        The version is changed again after the commit, so data built from the
+        database state from before the commit is not reused.
+        """
+        self.bump()
+        transaction.on_commit(self.bump)
@@ -1,3 +1,4 @@
+from django.db.models import Lookup
 from django.db.models.lookups import IContains
 
 
@@ -9,3 +10,19 @@ class PostgresILike(IContains):
         rhs, rhs_params = self.process_rhs(compiler, connection)
         params = lhs_params + rhs_params
         return "%s ILIKE %s" % (lhs, rhs), params
+
+
+class PostgresTrigramWordSimilar(Lookup):
+    """Match values containing a word similar to the given one.
+
+    Backported from Django 4.0; uses the `%>` operator of pg_trgm, served by
+    trigram indexes.
+    """
+
+    lookup_name = "trigram_word_similar"
+
+    def as_postgresql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        params = lhs_params + rhs_params
+        return "%s %%%%> %s" % (lhs, rhs), params
@@ -0,0 +1,161 @@
+"""Per-request performance instrumentation.
+
+When a request asks for it, the time spent in SQL queries, DataLoader batches,
+plugin hooks and GraphQL resolvers is collected in an `Instrumentation` object
+and returned to the client with the response, so slow requests can be diagnosed
+without a tracing backend. Code which doesn't have access to the request finds
+the instrumentation of the current request with `get_current_instrumentation`.
+"""
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+# Number of the slowest or the most repeated entries included in reports.
+INSTRUMENTATION_REPORT_LIMIT = 10
+
+_current_instrumentation: ContextVar[Optional["Instrumentation"]] = ContextVar(
+    "current_instrumentation", default=None
+)
+
+
+def get_current_instrumentation() -> Optional["Instrumentation"]:
+    return _current_instrumentation.get()
+
+
+class Timing:
+    __slots__ = ("count", "time", "max_time")
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.max_time = 0.0
+
+    def add(self, duration: float):
+        self.count += 1
+        self.time += duration
+        self.max_time = max(self.max_time, duration)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "time_ms": round(self.time * 1000, 3),
+            "max_ms": round(self.max_time * 1000, 3),
+        }
+
+
+class DataLoaderStats:
+    __slots__ = ("loads", "cache_hits", "batch_sizes", "time")
+
+    def __init__(self):
+        self.loads = 0
+        self.cache_hits = 0
+        self.batch_sizes: List[int] = []
+        self.time = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "loads": self.loads,
+            "cache_hits": self.cache_hits,
+            "batches": len(self.batch_sizes),
+            "batch_sizes": self.batch_sizes,
+            "time_ms": round(self.time * 1000, 3),
+        }
+
+
+class Instrumentation:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.queries: Dict[str, Timing] = defaultdict(Timing)
+        self.query_params: Counter = Counter()
+        self.dataloaders: Dict[str, DataLoaderStats] = defaultdict(DataLoaderStats)
+        self.plugin_hooks: Dict[str, Timing] = defaultdict(Timing)
+        self.resolvers: Dict[str, Timing] = defaultdict(Timing)
+
+    @contextmanager
+    def activate(self):
+        token = _current_instrumentation.set(self)
+        try:
+            yield self
+        finally:
+            _current_instrumentation.reset(token)
+
+    def __call__(self, execute, sql, params, many, context):
+        """Record queries when used as a database execute wrapper."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries[sql].add(time.perf_counter() - start)
+            self.query_params[(sql, repr(params))] += 1
+
+    def record_dataloader_load(self, name: str, cache_hit: bool):
+        stats = self.dataloaders[name]
+        stats.loads += 1
+        if cache_hit:
+            stats.cache_hits += 1
+
+    def record_dataloader_batch(self, name: str, size: int, duration: float):
+        stats = self.dataloaders[name]
+        stats.batch_sizes.append(size)
+        stats.time += duration
+
+    def record_plugin_hook(self, name: str, duration: float):
+        self.plugin_hooks[name].add(duration)
+
+    def record_resolver(self, name: str, duration: float):
+        self.resolvers[name].add(duration)
+
+    def get_queries_report(self) -> dict:
+        timings = self.queries.values()
+        duplicates = [
+            {"sql": sql, "count": count}
+            for (sql, _), count in self.query_params.most_common()
+            if count > 1
+        ]
+        # the same statement executed with different parameters, usually a sign
+        # of a missing DataLoader or prefetch
+        repeated = sorted(
+            (
+                {"sql": sql, **timing.as_dict()}
+                for sql, timing in self.queries.items()
+                if timing.count > 1
+            ),
+            key=lambda entry: entry["count"],
+            reverse=True,
+        )
+        slowest = sorted(
+            ({"sql": sql, **timing.as_dict()} for sql, timing in self.queries.items()),
+            key=lambda entry: entry["max_ms"],
+            reverse=True,
+        )
+        return {
+            "count": sum(timing.count for timing in timings),
+            "time_ms": round(sum(timing.time for timing in timings) * 1000, 3),
+            "duplicates": duplicates[:INSTRUMENTATION_REPORT_LIMIT],
+            "repeated": repeated[:INSTRUMENTATION_REPORT_LIMIT],
+            "slowest": slowest[:INSTRUMENTATION_REPORT_LIMIT],
+        }
+
+    @staticmethod
+    def get_timings_report(timings: Dict[str, Timing]) -> List[dict]:
+        report = sorted(
+            ({"name": name, **timing.as_dict()} for name, timing in timings.items()),
+            key=lambda entry: entry["time_ms"],
+            reverse=True,
+        )
+        return report[:INSTRUMENTATION_REPORT_LIMIT]
+
+    def as_dict(self) -> dict:
+        return {
+            "time_ms": round((time.perf_counter() - self.start) * 1000, 3),
+            "cpu_ms": round((time.process_time() - self.cpu_start) * 1000, 3),
+            "queries": self.get_queries_report(),
+            "dataloaders": {
+                name: stats.as_dict() for name, stats in self.dataloaders.items()
+            },
+            "plugin_hooks": self.get_timings_report(self.plugin_hooks),
+            "resolvers": self.get_timings_report(self.resolvers),
+        }
@@ -5,6 +5,8 @@ import graphene
 import jwt
 from django.conf import settings
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db import transaction
 
 from ..account.models import User
 from ..app.models import App, AppExtension
@@ -25,6 +27,16 @@ PERMISSIONS_FIELD = "permissions"
 JWT_SALEOR_OWNER_NAME = "saleor"
 JWT_OWNER_FIELD = "owner"
 
+USER_AUTH_CACHE_KEY = "jwt_user_auth:{}"
+USER_AUTH_CACHE_FIELDS = [
+    "id",
+    "email",
+    "jwt_token_key",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+]
+
 
 def jwt_base_payload(
     exp_delta: Optional[timedelta], token_owner: str
@@ -112,7 +124,11 @@ def create_refresh_token(
 
 
 def get_user_from_payload(payload: Dict[str, Any]) -> Optional[User]:
-    user = User.objects.filter(email=payload["email"], is_active=True).first()
+    user = get_user_from_auth_cache(payload)
+    if user is None:
+        user = User.objects.filter(email=payload["email"], is_active=True).first()
+        if user:
+            set_user_auth_cache(user)
     user_jwt_token = payload.get("token")
     if not user_jwt_token or not user:
         raise jwt.InvalidTokenError(
@@ -125,6 +141,72 @@ def get_user_from_payload(payload: Dict[str, Any]) -> Optional[User]:
     return user
 
 
+def get_user_from_auth_cache(payload: Dict[str, Any]) -> Optional[User]:
+    """Return the user from the cached authentication snapshot.
+
+    The snapshot contains only the fields required to authenticate the request and
+    the user permissions, so authenticating a user with a valid snapshot doesn't
+    hit the database. Remaining user fields are loaded together, with a single
+    query, on the first access to any of them.
+    """
+    if not settings.JWT_USER_CACHE_TIMEOUT:
+        return None
+    try:
+        _, user_pk = graphene.Node.from_global_id(payload.get("user_id"))
+    except Exception:
+        return None
+    snapshot = cache.get(USER_AUTH_CACHE_KEY.format(user_pk))
+    if (
+        not snapshot
+        or not snapshot["is_active"]
+        or snapshot["email"] != payload.get("email")
+        or snapshot["jwt_token_key"] != payload.get("token")
+    ):
+        return None
+
+    field_names = [
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.attname in USER_AUTH_CACHE_FIELDS
+    ]
+    user = User.from_db(
+        User.objects.db, field_names, [snapshot[name] for name in field_names]
+    )
+    user._effective_permissions_cache = set(snapshot["permissions"])
+    return user
+
+
+def set_user_auth_cache(user: User):
+    if not settings.JWT_USER_CACHE_TIMEOUT:
+        return
+    permissions = user.effective_permissions.values_list(
+        "content_type__app_label", "codename"
+    ).order_by()
+    # Fill the permissions cache used by the authentication backend, to not fetch
+    # the same permissions again when checking them for this request.
+    user._effective_permissions_cache = {
+        f"{app_label}.{codename}" for app_label, codename in permissions
+    }
+    snapshot = {name: getattr(user, name) for name in USER_AUTH_CACHE_FIELDS}
+    snapshot["permissions"] = list(user._effective_permissions_cache)
+    cache.set(
+        USER_AUTH_CACHE_KEY.format(user.pk),
+        snapshot,
+        timeout=settings.JWT_USER_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_user_auth_cache(user_ids: Iterable[int]):
+    """Delete cached authentication data of the users.
+
+    The data is deleted again after the commit, so data cached by concurrent
+    requests from before the commit is not reused.
+    """
+    keys = [USER_AUTH_CACHE_KEY.format(pk) for pk in user_ids]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
 def is_saleor_token(token: str) -> bool:
     """Confirm that token was generated by Saleor not by plugin."""
     try:
@@ -138,9 +220,16 @@ def is_saleor_token(token: str) -> bool:
 
 
 def get_user_from_access_token(token: str) -> Optional[User]:
-    if not is_saleor_token(token):
+    try:
+        payload = jwt_decode(token)
+    except jwt.PyJWTError:
+        # Tokens created by plugins are signed with different keys and are not
+        # handled by this backend.
+        if not is_saleor_token(token):
+            return None
+        raise
+    if payload.get(JWT_OWNER_FIELD) != JWT_SALEOR_OWNER_NAME:
         return None
-    payload = jwt_decode(token)
     return get_user_from_access_payload(payload)
 
 
@@ -1,29 +1,118 @@
 import logging
 
-from django.core.management.base import BaseCommand
-from versatileimagefield.image_warmer import VersatileImageFieldWarmer
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
 
-from ....product.models import ProductMedia
+from ....thumbnail.tasks import warm_thumbnails_task
+from ....thumbnail.warmer import (
+    THUMBNAIL_SOURCES,
+    WarmingStats,
+    get_unsupported_formats,
+    iter_pk_chunks,
+    warm_thumbnails_in_processes,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
-    help = "Generate thumbnails for all images"
+    help = (
+        "Generate thumbnails for all images. Images with all thumbnails recorded "
+        "in the thumbnails manifest are skipped, so the command can be re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            action="append",
+            choices=sorted(THUMBNAIL_SOURCES),
+            dest="sources",
+            help="Images to generate thumbnails for; products by default.",
+        )
+        parser.add_argument(
+            "--format",
+            action="append",
+            dest="formats",
+            help=(
+                "Extra format, e.g. webp or avif, to convert the thumbnails to; "
+                "THUMBNAIL_EXTRA_FORMATS setting by default."
+            ),
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Number of processes generating thumbnails.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=100,
+            help="Number of images processed by a process or a task at once.",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            help="Resume generation after the image with this ID.",
+        )
+        parser.add_argument(
+            "--celery",
+            action="store_true",
+            help="Generate thumbnails in Celery tasks instead of local processes.",
+        )
 
     def handle(self, *args, **options):
-        self.warm_products()
-
-    def warm_products(self):
-        self.stdout.write("Products thumbnails generation:")
-        warmer = VersatileImageFieldWarmer(
-            instance_or_queryset=ProductMedia.objects.all(),
-            rendition_key_set="products",
-            image_attr="image",
-            verbose=True,
-        )
-        num_created, failed_to_create = warmer.warm()
-        self.log_failed_images(failed_to_create)
+        sources = options["sources"] or ["products"]
+        formats = options["formats"]
+        if formats is None:
+            formats = settings.THUMBNAIL_EXTRA_FORMATS
+        formats = [fmt.lower() for fmt in formats]
+        unsupported_formats = get_unsupported_formats(formats)
+        if unsupported_formats:
+            raise CommandError(
+                f"Unsupported thumbnail formats: {', '.join(unsupported_formats)}."
+            )
+        if options["chunk_size"] < 1:
+            raise CommandError("Chunk size has to be greater than 0.")
+        if options["start_after"] is not None and len(sources) > 1:
+            raise CommandError("--start-after can be used with a single source.")
+
+        for source_name in sources:
+            if options["celery"]:
+                self.dispatch_tasks(source_name, formats, options)
+            else:
+                self.warm_source(source_name, formats, options)
+
+    def warm_source(self, source_name, formats, options):
+        self.stdout.write(f"{source_name.capitalize()} thumbnails generation:")
+        stats = WarmingStats()
+
+        def on_chunk_done(results, cursor):
+            stats.add(results)
+            if cursor is not None:
+                self.stdout.write(f"  {stats.images} images done, up to ID {cursor}")
+
+        warm_thumbnails_in_processes(
+            source_name,
+            processes=options["processes"],
+            chunk_size=options["chunk_size"],
+            start_after=options["start_after"],
+            formats=formats,
+            on_chunk_done=on_chunk_done,
+        )
+        self.stdout.write(str(stats))
+        self.log_failed_images(stats.failed)
+
+    def dispatch_tasks(self, source_name, formats, options):
+        tasks_count = 0
+        for pks in iter_pk_chunks(
+            source_name, options["chunk_size"], options["start_after"]
+        ):
+            warm_thumbnails_task.delay(source_name, pks, formats)
+            tasks_count += 1
+        self.stdout.write(
+            f"Scheduled {tasks_count} tasks generating {source_name} thumbnails."
+        )
 
     def log_failed_images(self, failed_to_create):
         if failed_to_create:
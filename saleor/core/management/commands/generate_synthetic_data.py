@@ -0,0 +1,56 @@
+import time
+from dataclasses import fields
+
+from django.core.management.base import BaseCommand
+
+from ...utils.synthetic_data import SyntheticDataGenerator, SyntheticDataSize
+
+SYNTHETIC_DATA_BATCH_SIZE = 10_000
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a large, deterministic dataset of vendors, products, customers "
+        "and orders for performance testing."
+    )
+
+    def add_arguments(self, parser):
+        for field in fields(SyntheticDataSize):
+            parser.add_argument(
+                f"--{field.name.replace('_', '-')}",
+                type=int,
+                default=field.default,
+                help=f"Number of {field.name.replace('_', ' ')}.",
+            )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed of the generated values, the same seed gives the same data.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=SYNTHETIC_DATA_BATCH_SIZE,
+            help="Number of rows copied in a single transaction.",
+        )
+        parser.add_argument(
+            "--channel",
+            type=str,
+            default="synthetic",
+            help="Slug of the channel, created when it doesn't exist.",
+        )
+
+    def handle(self, *args, **options):
+        size = SyntheticDataSize(
+            **{field.name: options[field.name] for field in fields(SyntheticDataSize)}
+        )
+        generator = SyntheticDataGenerator(
+            size,
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            channel_slug=options["channel"],
+        )
+        start = time.monotonic()
+        for msg in generator.generate():
+            self.stdout.write(f"{msg} ({time.monotonic() - start:.2f}s).")
@@ -0,0 +1,81 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+
+from ...models import QueryReport
+from ...query_report import flush_query_reports
+
+ORDERINGS = {
+    "avg-queries": "-avg_query_count",
+    "max-queries": "-max_query_count",
+    "query-time": "-avg_query_time",
+    "flagged": "-flagged_count",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Lists GraphQL operations with the most SQL queries, based on the sampled "
+        "query reports."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of listed operations.",
+        )
+        parser.add_argument(
+            "--order-by",
+            choices=ORDERINGS.keys(),
+            default="avg-queries",
+            help="Sort operations by average or maximum number of queries, "
+            "average query time or number of flagged requests.",
+        )
+        parser.add_argument(
+            "--statements",
+            type=int,
+            default=3,
+            help="Number of the most repeated statements listed for each operation.",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete all reports after listing them.",
+        )
+
+    def handle(self, *args, **options):
+        # statistics collected by this process, e.g. when run from a shell
+        flush_query_reports()
+        reports = (
+            QueryReport.objects.filter(sample_count__gt=0)
+            .annotate(
+                avg_query_count=Cast("query_count", FloatField()) / F("sample_count"),
+                avg_query_time=F("query_time") / F("sample_count"),
+            )
+            .order_by(ORDERINGS[options["order_by"]], "operation_fingerprint")
+        )
+        self.stdout.write(
+            f"{'samples':>8} {'avg q':>8} {'max q':>6} {'avg ms':>9} "
+            f"{'flagged':>8}  operation"
+        )
+        for report in reports[: options["limit"]]:
+            self.stdout.write(
+                f"{report.sample_count:>8} {report.avg_query_count:>8.1f} "
+                f"{report.max_query_count:>6} {report.avg_query_time:>9.1f} "
+                f"{report.flagged_count:>8}  {report.operation_fingerprint}"
+            )
+            statements = sorted(
+                report.statements.items(),
+                key=lambda item: (item[1]["max"], item[1]["count"]),
+                reverse=True,
+            )
+            for template, counts in statements[: options["statements"]]:
+                self.stdout.write(
+                    f"{'':>8} max {counts['max']} per request, "
+                    f"{counts['count']} total: {template[:120]}"
+                )
+        if options["clear"]:
+            QueryReport.objects.all().delete()
+            self.stdout.write("Query reports cleared.")
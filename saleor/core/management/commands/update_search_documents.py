@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ....account.models import User
+from ....account.search import update_users_search_documents
+from ....order.models import Order
+from ....order.search import update_orders_search_documents
+
+SEARCH_DOCUMENTS_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Populates search documents of all users and orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=SEARCH_DOCUMENTS_BATCH_SIZE,
+            help="Number of users or orders updated in a single batch.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        for label, model, update_search_documents in [
+            ("users", User, update_users_search_documents),
+            ("orders", Order, update_orders_search_documents),
+        ]:
+            self.stdout.write(f"Updating search documents of {label}.")
+            start = time.monotonic()
+            total = model.objects.count()
+            processed = 0
+            queryset = model.objects.order_by("pk").values_list("pk", flat=True)
+            last_pk = None
+            while True:
+                batch_queryset = (
+                    queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+                )
+                pks = list(batch_queryset[:batch_size])
+                if not pks:
+                    break
+                update_search_documents(model.objects.filter(pk__in=pks))
+                processed += len(pks)
+                last_pk = pks[-1]
+                elapsed = time.monotonic() - start
+                self.stdout.write(
+                    f"Processed {processed}/{total} {label} in {elapsed:.2f}s "
+                    f"({processed / max(elapsed, 1e-6):.0f} {label}/s)."
+                )
@@ -0,0 +1,51 @@
+# Generated by Django 3.2.7 on 2026-10-19 19:40
+
+from django.db import migrations, models
+
+import saleor.core.utils.json_serializer
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_migrate_metadata"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueryReport",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "operation_fingerprint",
+                    models.CharField(max_length=255, unique=True),
+                ),
+                ("sample_count", models.PositiveIntegerField(default=0)),
+                ("query_count", models.PositiveIntegerField(default=0)),
+                ("max_query_count", models.PositiveIntegerField(default=0)),
+                ("query_time", models.FloatField(default=0)),
+                ("flagged_count", models.PositiveIntegerField(default=0)),
+                (
+                    "statements",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        encoder=saleor.core.utils.json_serializer.CustomJsonEncoder,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ("operation_fingerprint",),
+            },
+        ),
+    ]
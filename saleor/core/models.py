@@ -66,6 +66,24 @@ class PublishableModel(models.Model):
         )
 
 
+class ModelWithDeferredFieldsLoadedTogether(models.Model):
+    """Load all deferred fields of the instance with a single query.
+
+    Django loads each deferred field with its own query on the first access, which
+    is costly for instances restored with only a few fields, e.g. from the
+    authentication cache.
+    """
+
+    class Meta:
+        abstract = True
+
+    def refresh_from_db(self, using=None, fields=None):
+        deferred_fields = self.get_deferred_fields()
+        if fields and deferred_fields.issuperset(fields):
+            fields = deferred_fields
+        super().refresh_from_db(using=using, fields=fields)
+
+
 class ModelWithMetadata(models.Model):
     private_metadata = JSONField(
         blank=True, null=True, default=dict, encoder=CustomJsonEncoder
@@ -120,3 +138,25 @@ class Job(models.Model):
 
     class Meta:
         abstract = True
+
+
+class QueryReport(models.Model):
+    """SQL statistics of a GraphQL operation, aggregated over sampled requests."""
+
+    operation_fingerprint = models.CharField(max_length=255, unique=True)
+    sample_count = models.PositiveIntegerField(default=0)
+    query_count = models.PositiveIntegerField(default=0)
+    max_query_count = models.PositiveIntegerField(default=0)
+    query_time = models.FloatField(default=0)
+    # number of sampled requests which repeated a statement template
+    flagged_count = models.PositiveIntegerField(default=0)
+    # statement templates mapped to their total and maximum per request counts
+    statements = JSONField(blank=True, default=dict, encoder=CustomJsonEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("operation_fingerprint",)
+
+    def __str__(self):
+        return self.operation_fingerprint
@@ -0,0 +1,213 @@
+"""Reports of SQL statements executed by GraphQL operations.
+
+A sample of requests records the templates of the SQL statements executed by
+each operation, identified by its fingerprint. A statement template executed
+many times within a single request, e.g. the same `SELECT` with different IDs,
+is usually caused by a resolver which doesn't use a DataLoader, so such requests
+are logged and counted as flagged. Statistics are aggregated in memory of each
+process and periodically added to the `QueryReport` table, which is listed by
+the `query_report` command.
+"""
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from .models import QueryReport
+
+logger = logging.getLogger(__name__)
+
+# Lists of parameters, e.g. in `IN (%s, %s)`, are collapsed so statements which
+# differ only by the number of parameters share a template.
+PARAMETER_LIST_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)+\s*\)")
+STATEMENT_TEMPLATE_MAX_LENGTH = 2000
+# Number of statement templates stored in the report of a single operation.
+QUERY_REPORT_STATEMENTS_LIMIT = 20
+
+
+def get_statement_template(sql: str) -> str:
+    return PARAMETER_LIST_RE.sub("(%s, ...)", sql)[:STATEMENT_TEMPLATE_MAX_LENGTH]
+
+
+def should_sample_request() -> bool:
+    sample_rate = settings.QUERY_REPORT_SAMPLE_RATE
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+class QueryRecorder:
+    """Record statement templates executed by a single operation."""
+
+    def __init__(self, operation_fingerprint: str):
+        self.operation_fingerprint = operation_fingerprint
+        self.statements: Counter = Counter()
+        self.query_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_time += time.perf_counter() - start
+            self.statements[get_statement_template(sql)] += 1
+
+    def get_repeated_statements(self) -> Dict[str, int]:
+        threshold = settings.QUERY_REPORT_REPEATED_STATEMENT_THRESHOLD
+        return {
+            template: count
+            for template, count in self.statements.items()
+            if count >= threshold
+        }
+
+
+class OperationStats:
+    __slots__ = (
+        "sample_count",
+        "query_count",
+        "max_query_count",
+        "query_time",
+        "flagged_count",
+        "statements",
+    )
+
+    def __init__(self):
+        self.sample_count = 0
+        self.query_count = 0
+        self.max_query_count = 0
+        self.query_time = 0.0
+        self.flagged_count = 0
+        self.statements: Dict[str, Dict[str, int]] = {}
+
+    def add(self, recorder: QueryRecorder, flagged: bool):
+        query_count = sum(recorder.statements.values())
+        self.sample_count += 1
+        self.query_count += query_count
+        self.max_query_count = max(self.max_query_count, query_count)
+        self.query_time += recorder.query_time * 1000
+        self.flagged_count += int(flagged)
+        merge_statements(
+            self.statements,
+            {
+                template: {"count": count, "max": count}
+                for template, count in recorder.statements.items()
+            },
+        )
+
+
+def merge_statements(
+    statements: Dict[str, Dict[str, int]], new_statements: Dict[str, Dict[str, int]]
+):
+    """Merge statement counts into `statements`, keeping the most repeated ones."""
+    for template, counts in new_statements.items():
+        current = statements.setdefault(template, {"count": 0, "max": 0})
+        current["count"] += counts["count"]
+        current["max"] = max(current["max"], counts["max"])
+    if len(statements) > QUERY_REPORT_STATEMENTS_LIMIT:
+        kept = sorted(
+            statements.items(),
+            key=lambda item: (item[1]["max"], item[1]["count"]),
+            reverse=True,
+        )[:QUERY_REPORT_STATEMENTS_LIMIT]
+        statements.clear()
+        statements.update(kept)
+
+
+class QueryReportBuffer:
+    """Operation statistics of this process, not yet added to the reports."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operations: Dict[str, OperationStats] = {}
+        self.last_flush = time.monotonic()
+
+    def add(self, recorder: QueryRecorder, flagged: bool):
+        with self.lock:
+            stats = self.operations.setdefault(
+                recorder.operation_fingerprint, OperationStats()
+            )
+            stats.add(recorder, flagged)
+
+    def should_flush(self) -> bool:
+        interval = settings.QUERY_REPORT_FLUSH_INTERVAL
+        return time.monotonic() - self.last_flush >= interval
+
+    def pop_all(self) -> Dict[str, OperationStats]:
+        with self.lock:
+            operations = self.operations
+            self.operations = {}
+            self.last_flush = time.monotonic()
+        return operations
+
+
+query_report_buffer = QueryReportBuffer()
+
+
+def start_query_recording(connection, operation_fingerprint: str) -> QueryRecorder:
+    recorder = QueryRecorder(operation_fingerprint)
+    # the recorder is removed after wrappers installed later with
+    # `connection.execute_wrapper`, which pop the last wrapper on exit
+    connection.execute_wrappers.insert(0, recorder)
+    return recorder
+
+
+def finish_query_recording(connection, recorder: QueryRecorder):
+    connection.execute_wrappers.remove(recorder)
+    repeated = recorder.get_repeated_statements()
+    if repeated:
+        logger.warning(
+            "Operation %s repeated SQL statements: %s",
+            recorder.operation_fingerprint,
+            repeated,
+        )
+    query_report_buffer.add(recorder, flagged=bool(repeated))
+    if query_report_buffer.should_flush():
+        try:
+            flush_query_reports()
+        except DatabaseError:
+            logger.exception("Unable to update query reports.")
+
+
+def flush_query_reports(operations: Optional[Dict[str, OperationStats]] = None):
+    """Add the statistics collected by this process to the reports."""
+    if operations is None:
+        operations = query_report_buffer.pop_all()
+    if not operations:
+        return
+    QueryReport.objects.bulk_create(
+        [QueryReport(operation_fingerprint=fingerprint) for fingerprint in operations],
+        ignore_conflicts=True,
+    )
+    with transaction.atomic():
+        reports: List[QueryReport] = list(
+            QueryReport.objects.select_for_update()
+            .filter(operation_fingerprint__in=operations)
+            .order_by("pk")
+        )
+        now = timezone.now()
+        for report in reports:
+            stats = operations[report.operation_fingerprint]
+            report.sample_count += stats.sample_count
+            report.query_count += stats.query_count
+            report.max_query_count = max(report.max_query_count, stats.max_query_count)
+            report.query_time += stats.query_time
+            report.flagged_count += stats.flagged_count
+            merge_statements(report.statements, stats.statements)
+            report.updated_at = now
+        QueryReport.objects.bulk_update(
+            reports,
+            [
+                "sample_count",
+                "query_count",
+                "max_query_count",
+                "query_time",
+                "flagged_count",
+                "statements",
+                "updated_at",
+            ],
+        )
@@ -0,0 +1,34 @@
+"""Model instances stored as tuples of their field values.
+
+Snapshots are smaller and faster to pickle than the instances, and are turned
+back into instances with `Model.from_db`, without querying the database.
+"""
+from typing import Collection, List, Type
+
+from django.db.models import Model
+
+
+def get_snapshot_field_names(
+    model: Type[Model], deferred_fields: Collection[str] = ()
+) -> List[str]:
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if field.attname not in deferred_fields
+    ]
+
+
+def get_snapshot_values(instance: Model, deferred_fields: Collection[str] = ()):
+    return tuple(
+        getattr(instance, name)
+        for name in get_snapshot_field_names(type(instance), deferred_fields)
+    )
+
+
+def instance_from_snapshot_values(
+    model: Type[Model], values: tuple, deferred_fields: Collection[str] = ()
+):
+    """Return the instance; deferred fields are loaded on the first access."""
+    return model.from_db(
+        model.objects.db, get_snapshot_field_names(model, deferred_fields), values
+    )
@@ -0,0 +1,30 @@
+from django.test import TestCase
+
+from ..cache import CacheVersion
+
+
+def test_cache_version_get_returns_same_version():
+    # given
+    version = CacheVersion("test_version")
+
+    # when
+    current = version.get()
+
+    # then
+    assert current
+    assert version.get() == current
+
+
+def test_cache_version_invalidate_changes_version_again_on_commit():
+    # given
+    version = CacheVersion("test_version")
+    initial = version.get()
+
+    # when
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        version.invalidate()
+        in_transaction = version.get()
+
+    # then
+    assert in_transaction != initial
+    assert version.get() not in {initial, in_transaction}
@@ -372,3 +372,18 @@ def test_delete_versatile_image(product_with_image, media_root):
     assert not default_storage.exists(img_name)
     assert not default_storage.exists(thumb_400x400)
     assert not default_storage.exists(thumb_400x400)
+
+
+def test_update_search_documents_command(order, staff_user):
+    # given
+    User.objects.update(search_document="")
+    Order.objects.update(search_document="")
+
+    # when
+    call_command("update_search_documents", batch_size=1, stdout=io.StringIO())
+
+    # then
+    order.refresh_from_db()
+    staff_user.refresh_from_db()
+    assert order.search_document == "test@example.com\ntest@example.com\nleslie\nwade"
+    assert staff_user.search_document == "staff_test@example.com"
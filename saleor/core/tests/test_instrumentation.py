@@ -0,0 +1,73 @@
+from django.db import connection
+
+from ...product.models import Category, Product
+from ..instrumentation import Instrumentation, get_current_instrumentation
+
+
+def test_instrumentation_activate():
+    # given
+    instrumentation = Instrumentation()
+
+    # when
+    with instrumentation.activate():
+        current = get_current_instrumentation()
+
+    # then
+    assert current is instrumentation
+    assert get_current_instrumentation() is None
+
+
+def test_instrumentation_reports_duplicate_and_repeated_queries(product, category):
+    # given
+    instrumentation = Instrumentation()
+
+    # when
+    with connection.execute_wrapper(instrumentation):
+        Product.objects.filter(pk=product.pk).first()
+        Product.objects.filter(pk=product.pk).first()
+        Category.objects.filter(pk=category.pk).first()
+        Category.objects.filter(pk=category.pk + 1).first()
+
+    # then
+    report = instrumentation.as_dict()["queries"]
+    assert report["count"] == 4
+    assert report["time_ms"] > 0
+    assert len(report["duplicates"]) == 1
+    assert report["duplicates"][0]["count"] == 2
+    assert "product_product" in report["duplicates"][0]["sql"]
+    assert {entry["count"] for entry in report["repeated"]} == {2}
+    assert len(report["repeated"]) == 2
+
+
+def test_instrumentation_reports_dataloaders_and_timings():
+    # given
+    instrumentation = Instrumentation()
+
+    # when
+    instrumentation.record_dataloader_load("ProductByIdLoader", cache_hit=False)
+    instrumentation.record_dataloader_load("ProductByIdLoader", cache_hit=True)
+    instrumentation.record_dataloader_batch("ProductByIdLoader", 1, 0.002)
+    instrumentation.record_plugin_hook("WebhookPlugin.product_updated", 0.01)
+    instrumentation.record_resolver("Query.products", 0.003)
+    instrumentation.record_resolver("Query.products", 0.001)
+
+    # then
+    report = instrumentation.as_dict()
+    assert report["dataloaders"]["ProductByIdLoader"] == {
+        "loads": 2,
+        "cache_hits": 1,
+        "batches": 1,
+        "batch_sizes": [1],
+        "time_ms": 2.0,
+    }
+    assert report["plugin_hooks"] == [
+        {
+            "name": "WebhookPlugin.product_updated",
+            "count": 1,
+            "time_ms": 10.0,
+            "max_ms": 10.0,
+        }
+    ]
+    assert report["resolvers"] == [
+        {"name": "Query.products", "count": 2, "time_ms": 4.0, "max_ms": 3.0}
+    ]
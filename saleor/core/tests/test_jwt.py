@@ -1,6 +1,23 @@
+from unittest.mock import patch
+
 import graphene
+import jwt
+import pytest
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import TestCase
 
-from ..jwt import create_access_token_for_app_extension, jwt_decode
+from ...account.models import User
+from ..jwt import (
+    JWT_ACCESS_TYPE,
+    JWT_ALGORITHM,
+    USER_AUTH_CACHE_KEY,
+    create_access_token,
+    create_access_token_for_app_extension,
+    get_user_from_access_token,
+    jwt_decode,
+    jwt_user_payload,
+)
 
 
 def test_create_access_token_for_app_extension_staff_user_with_more_permissions(
@@ -63,3 +80,198 @@ def test_create_access_token_for_app_extension_with_more_permissions(
         decoded_token["app_extension"]
     )
     assert int(decode_extension_id) == extension.id
+
+
+def test_get_user_from_access_token_decodes_token_once(staff_user):
+    # given
+    access_token = create_access_token(staff_user)
+
+    # when
+    with patch("saleor.core.jwt.jwt.decode", wraps=jwt.decode) as decode_mock:
+        user = get_user_from_access_token(access_token)
+
+    # then
+    assert user == staff_user
+    assert decode_mock.call_count == 1
+
+
+def test_get_user_from_access_token_not_saleor_token(staff_user):
+    # given
+    payload = jwt_user_payload(staff_user, JWT_ACCESS_TYPE, None, token_owner="test")
+    token = jwt.encode(payload, "plugin-secret", JWT_ALGORITHM)
+
+    # when
+    user = get_user_from_access_token(token)
+
+    # then
+    assert user is None
+
+
+def test_get_user_from_access_token_uses_cached_snapshot(
+    staff_user, permission_manage_orders, django_assert_num_queries
+):
+    # given
+    staff_user.user_permissions.add(permission_manage_orders)
+    access_token = create_access_token(staff_user)
+    get_user_from_access_token(access_token)
+
+    # when
+    with django_assert_num_queries(0):
+        user = get_user_from_access_token(access_token)
+        has_perm = user.has_perm("order.manage_orders")
+
+    # then
+    assert user == staff_user
+    assert user.email == staff_user.email
+    assert user.is_staff
+    assert has_perm
+    assert not user.has_perm("product.manage_products")
+
+
+def test_get_user_from_access_token_cached_loads_other_fields_together(
+    staff_user, django_assert_num_queries
+):
+    # given
+    access_token = create_access_token(staff_user)
+    get_user_from_access_token(access_token)
+    user = get_user_from_access_token(access_token)
+
+    # when
+    with django_assert_num_queries(1):
+        first_name = user.first_name
+        last_name = user.last_name
+        default_billing_address_id = user.default_billing_address_id
+        metadata = user.metadata
+
+    # then
+    assert first_name == staff_user.first_name
+    assert last_name == staff_user.last_name
+    assert default_billing_address_id == staff_user.default_billing_address_id
+    assert metadata == staff_user.metadata
+
+
+def test_get_user_from_access_token_cached_customer_permissions(
+    customer_user, django_assert_num_queries
+):
+    # given
+    access_token = create_access_token(customer_user)
+    get_user_from_access_token(access_token)
+
+    # when
+    with django_assert_num_queries(0):
+        user = get_user_from_access_token(access_token)
+        has_perm = user.has_perm("order.manage_orders")
+
+    # then
+    assert not has_perm
+
+
+def test_get_user_from_access_token_cache_disabled(staff_user, settings):
+    # given
+    settings.JWT_USER_CACHE_TIMEOUT = 0
+    access_token = create_access_token(staff_user)
+
+    # when
+    user = get_user_from_access_token(access_token)
+
+    # then
+    assert user == staff_user
+    assert cache.get(USER_AUTH_CACHE_KEY.format(staff_user.pk)) is None
+
+
+def test_get_user_from_access_token_cached_snapshot_outdated_token_key(staff_user):
+    # given
+    access_token = create_access_token(staff_user)
+    get_user_from_access_token(access_token)
+    User.objects.filter(pk=staff_user.pk).update(jwt_token_key="new-key")
+    staff_user.refresh_from_db()
+    new_access_token = create_access_token(staff_user)
+
+    # when
+    user = get_user_from_access_token(new_access_token)
+
+    # then
+    assert user == staff_user
+    assert cache.get(USER_AUTH_CACHE_KEY.format(staff_user.pk))["jwt_token_key"] == (
+        "new-key"
+    )
+
+
+def test_user_auth_cache_invalidated_on_user_save(staff_user):
+    # given
+    access_token = create_access_token(staff_user)
+    get_user_from_access_token(access_token)
+    assert cache.get(USER_AUTH_CACHE_KEY.format(staff_user.pk))
+
+    # when
+    staff_user.is_active = False
+    staff_user.save(update_fields=["is_active"])
+
+    # then
+    assert cache.get(USER_AUTH_CACHE_KEY.format(staff_user.pk)) is None
+    with pytest.raises(jwt.InvalidTokenError):
+        get_user_from_access_token(access_token)
+
+
+def test_user_auth_cache_invalidated_again_on_commit(staff_user):
+    # given
+    access_token = create_access_token(staff_user)
+    cache_key = USER_AUTH_CACHE_KEY.format(staff_user.pk)
+
+    # when
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        staff_user.save(update_fields=["first_name"])
+        # a concurrent request caches the data from before the commit
+        get_user_from_access_token(access_token)
+        assert cache.get(cache_key)
+
+    # then
+    assert cache.get(cache_key) is None
+
+
+def test_user_auth_cache_invalidated_on_user_permissions_change(
+    staff_user, permission_manage_orders
+):
+    # given
+    access_token = create_access_token(staff_user)
+    get_user_from_access_token(access_token)
+
+    # when
+    staff_user.user_permissions.add(permission_manage_orders)
+
+    # then
+    assert cache.get(USER_AUTH_CACHE_KEY.format(staff_user.pk)) is None
+    user = get_user_from_access_token(access_token)
+    assert user.has_perm("order.manage_orders")
+
+
+def test_user_auth_cache_invalidated_on_group_permissions_change(
+    staff_user, permission_manage_orders
+):
+    # given
+    group = Group.objects.create(name="Orders")
+    group.user_set.add(staff_user)
+    access_token = create_access_token(staff_user)
+    get_user_from_access_token(access_token)
+
+    # when
+    group.permissions.add(permission_manage_orders)
+
+    # then
+    assert cache.get(USER_AUTH_CACHE_KEY.format(staff_user.pk)) is None
+    user = get_user_from_access_token(access_token)
+    assert user.has_perm("order.manage_orders")
+
+
+def test_user_auth_cache_invalidated_on_group_delete(staff_user):
+    # given
+    group = Group.objects.create(name="Orders")
+    group.user_set.add(staff_user)
+    access_token = create_access_token(staff_user)
+    get_user_from_access_token(access_token)
+
+    # when
+    group.delete()
+
+    # then
+    assert cache.get(USER_AUTH_CACHE_KEY.format(staff_user.pk)) is None
@@ -0,0 +1,146 @@
+import io
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+
+from ...product.models import Product
+from ..models import QueryReport
+from ..query_report import (
+    OperationStats,
+    QueryRecorder,
+    finish_query_recording,
+    flush_query_reports,
+    get_statement_template,
+    query_report_buffer,
+    start_query_recording,
+)
+
+
+def test_get_statement_template_collapses_parameter_lists():
+    # given
+    sql = 'SELECT "id" FROM "product_product" WHERE "id" IN (%s, %s, %s)'
+
+    # when
+    template = get_statement_template(sql)
+
+    # then
+    assert template == 'SELECT "id" FROM "product_product" WHERE "id" IN (%s, ...)'
+    assert get_statement_template(sql.replace("%s, %s, %s", "%s, %s")) == template
+
+
+def test_query_recording_flags_repeated_statements(product_list, settings):
+    # given
+    settings.QUERY_REPORT_REPEATED_STATEMENT_THRESHOLD = 3
+    settings.QUERY_REPORT_FLUSH_INTERVAL = 3600
+    query_report_buffer.pop_all()
+    recorder = start_query_recording(connection, "query:Products:abc")
+
+    # when
+    for product in product_list:
+        Product.objects.filter(pk=product.pk).first()
+    finish_query_recording(connection, recorder)
+
+    # then
+    assert recorder not in connection.execute_wrappers
+    assert list(recorder.get_repeated_statements().values()) == [len(product_list)]
+    stats = query_report_buffer.pop_all()["query:Products:abc"]
+    assert stats.sample_count == 1
+    assert stats.flagged_count == 1
+    assert stats.query_count == len(product_list)
+
+
+def test_flush_query_reports_merges_statistics(db):
+    # given
+    recorder = QueryRecorder("query:Products:abc")
+    recorder.statements.update({"SELECT 1": 4, "SELECT 2": 1})
+    recorder.query_time = 0.01
+    stats = OperationStats()
+    stats.add(recorder, flagged=True)
+    other_stats = OperationStats()
+    other_stats.add(recorder, flagged=False)
+
+    # when
+    flush_query_reports({"query:Products:abc": stats})
+    flush_query_reports({"query:Products:abc": other_stats})
+
+    # then
+    report = QueryReport.objects.get()
+    assert report.sample_count == 2
+    assert report.query_count == 10
+    assert report.max_query_count == 5
+    assert report.flagged_count == 1
+    assert report.statements == {
+        "SELECT 1": {"count": 8, "max": 4},
+        "SELECT 2": {"count": 2, "max": 1},
+    }
+
+
+@patch("saleor.core.query_report.logger")
+def test_query_report_middleware_records_operations(
+    mocked_logger, api_client, product_list, channel_USD, settings
+):
+    # given
+    settings.QUERY_REPORT_SAMPLE_RATE = 1
+    settings.QUERY_REPORT_FLUSH_INTERVAL = 0
+    query_report_buffer.pop_all()
+    query = """
+        query Products($channel: String) {
+            products(first: 10, channel: $channel) {
+                edges {
+                    node {
+                        name
+                    }
+                }
+            }
+        }
+    """
+
+    # when
+    api_client.post_graphql(query, {"channel": channel_USD.slug})
+
+    # then
+    report = QueryReport.objects.get()
+    assert report.operation_fingerprint.startswith("query:Products:")
+    assert report.sample_count == 1
+    assert report.query_count > 0
+    assert report.statements
+
+
+def test_query_report_middleware_skips_requests_when_disabled(
+    api_client, product, channel_USD, settings
+):
+    # given
+    settings.QUERY_REPORT_SAMPLE_RATE = 0
+    settings.QUERY_REPORT_FLUSH_INTERVAL = 0
+    query = "query { shop { name } }"
+
+    # when
+    api_client.post_graphql(query)
+
+    # then
+    assert not QueryReport.objects.exists()
+
+
+def test_query_report_command(db):
+    # given
+    QueryReport.objects.create(
+        operation_fingerprint="query:Products:abc",
+        sample_count=2,
+        query_count=30,
+        max_query_count=20,
+        query_time=12.5,
+        flagged_count=1,
+        statements={"SELECT 1": {"count": 24, "max": 16}},
+    )
+    query_report_buffer.pop_all()
+    out = io.StringIO()
+
+    # when
+    call_command("query_report", clear=True, stdout=out)
+
+    # then
+    output = out.getvalue()
+    assert "query:Products:abc" in output
+    assert "max 16 per request, 24 total: SELECT 1" in output
+    assert not QueryReport.objects.exists()
@@ -0,0 +1,123 @@
+import io
+
+from django.core.management import call_command
+
+from ...account.models import Address, User
+from ...attribute.models import AssignedProductAttributeValue
+from ...order.models import Order, OrderLine
+from ...product.models import Product, ProductChannelListing, ProductVariant
+from ...vendor.models import Vendor
+from ...warehouse.models import Stock, Warehouse
+from ..utils.synthetic_data import (
+    SyntheticDataGenerator,
+    SyntheticDataSize,
+    copy_rows,
+    reserve_ids,
+)
+
+SMALL_SIZE = SyntheticDataSize(
+    vendors=2,
+    warehouses=3,
+    categories=5,
+    products=12,
+    variants_per_product=2,
+    attributes=2,
+    attribute_values=3,
+    customers=7,
+    orders=20,
+    max_order_lines=3,
+)
+
+
+def test_reserve_ids(db):
+    # when
+    first_id = reserve_ids(Vendor, 5)
+
+    # then
+    assert Vendor.objects.create(shop_name="Next", slug="next").pk == first_id + 5
+
+
+def test_copy_rows_uses_field_defaults(db):
+    # given
+    vendor_id = reserve_ids(Vendor, 1)
+
+    # when
+    count = copy_rows(Vendor, [{"id": vendor_id, "shop_name": "Shop", "slug": "s"}])
+
+    # then
+    assert count == 1
+    vendor = Vendor.objects.get(pk=vendor_id)
+    assert vendor.shop_name == "Shop"
+    assert vendor.user is None
+
+
+def test_generate_synthetic_data(db):
+    # given
+    generator = SyntheticDataGenerator(SMALL_SIZE, seed=1, batch_size=5)
+
+    # when
+    messages = list(generator.generate())
+
+    # then
+    assert messages
+    assert Vendor.objects.count() == 2
+    assert Warehouse.objects.count() == 3
+    assert Product.objects.count() == 12
+    assert ProductChannelListing.objects.count() == 12
+    assert ProductVariant.objects.count() == 24
+    assert Stock.objects.count() == 24
+    assert AssignedProductAttributeValue.objects.count() == 24
+    assert User.objects.count() == 7
+    assert Order.objects.count() == 20
+    assert Address.objects.count() == 3 + 7 + 20 * 2
+    assert OrderLine.objects.filter(variant__isnull=True).count() == 0
+
+    product = Product.objects.first()
+    assert product.default_variant.product_id == product.pk
+    assert product.search_vector
+
+    user = User.objects.filter(order_count__gt=0).first()
+    assert user.order_count == user.orders.count()
+    assert user.email in user.search_document
+
+    order = user.orders.first()
+    customer_address = user.default_billing_address
+    assert order.billing_address_id != customer_address.pk
+    assert order.shipping_address_id != order.billing_address_id
+    assert order.billing_address.as_data() == customer_address.as_data()
+    assert order.shipping_address.as_data() == customer_address.as_data()
+    assert Order.objects.filter(search_document__contains=user.email).exists()
+
+
+def test_generate_synthetic_data_is_deterministic(db):
+    # given
+    size = SyntheticDataSize(
+        vendors=1, warehouses=1, products=5, customers=3, orders=10
+    )
+
+    # when
+    list(SyntheticDataGenerator(size, seed=7).generate())
+    list(SyntheticDataGenerator(size, seed=7).generate())
+
+    # then
+    orders = list(
+        Order.objects.order_by("pk").values_list("status", "total_gross_amount")
+    )
+    assert orders[: size.orders] == orders[size.orders :]  # noqa: E203
+
+
+def test_generate_synthetic_data_command(db):
+    # when
+    call_command(
+        "generate_synthetic_data",
+        vendors=1,
+        warehouses=1,
+        products=3,
+        customers=2,
+        orders=4,
+        stdout=io.StringIO(),
+    )
+
+    # then
+    assert Product.objects.count() == 3
+    assert Order.objects.count() == 4
@@ -12,7 +12,6 @@ from django.utils.encoding import iri_to_uri
 from django.utils.text import slugify
 from django_prices_openexchangerates import exchange_currency
 from prices import MoneyRange
-from versatileimagefield.image_warmer import VersatileImageFieldWarmer
 
 task_logger = get_task_logger(__name__)
 
@@ -95,6 +94,8 @@ def to_local_currency(price, currency):
 
 
 def create_thumbnails(pk, model, size_set, image_attr=None):
+    from ...thumbnail.warmer import warm_instances
+
     instance = model.objects.get(pk=pk)
     if not image_attr:
         image_attr = "image"
@@ -102,16 +103,13 @@ def create_thumbnails(pk, model, size_set, image_attr=None):
     if image_instance.name == "":
         # There is no file, skip processing
         return
-    warmer = VersatileImageFieldWarmer(
-        instance_or_queryset=instance, rendition_key_set=size_set, image_attr=image_attr
-    )
     task_logger.info("Creating thumbnails for %s", pk)
-    num_created, failed_to_create = warmer.warm()
-    if num_created:
-        task_logger.info("Created %d thumbnails", num_created)
-    if failed_to_create:
+    (result,) = warm_instances([instance], image_attr, size_set)
+    if result.created:
+        task_logger.info("Created %d thumbnails", result.created)
+    if result.failed:
         task_logger.error(
-            "Failed to generate thumbnails", extra={"paths": failed_to_create}
+            "Failed to generate thumbnails", extra={"paths": result.failed}
         )
 
 
@@ -154,5 +152,8 @@ def generate_unique_slug(
 
 
 def delete_versatile_image(image):
+    from ...thumbnail.warmer import delete_thumbnails
+
+    delete_thumbnails(image)
     image.delete_all_created_images()
     image.delete(save=False)
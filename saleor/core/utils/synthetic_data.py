@@ -0,0 +1,752 @@
+"""Large synthetic datasets for performance testing.
+
+Unlike `random_data`, which creates a small demo catalog object by object, the
+generator writes the large tables with PostgreSQL `COPY`, in batches. Primary
+keys are reserved in blocks from the table sequences, so rows can reference each
+other before they are written, and all values are derived from the seed and the
+position of the row, so the same parameters produce the same dataset.
+
+Products are split between vendors, and variants are stocked in warehouses of
+the vendor of their product. Orders have their own billing and shipping copies
+of the address of their customer, as orders placed in a checkout. Signals are
+not sent for the copied rows, so search documents are written together with the
+rows and order statistics of customers are recalculated once all orders exist.
+"""
+import csv
+import io
+import json
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Type
+
+import graphene
+from django.contrib.auth.hashers import make_password
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Model
+from django.utils import timezone
+from django.utils.text import slugify
+
+from ...account.models import Address, User
+from ...account.order_stats import update_users_order_stats
+from ...account.search import generate_search_document
+from ...attribute import AttributeInputType, AttributeType
+from ...attribute.models import (
+    AssignedProductAttribute,
+    AssignedProductAttributeValue,
+    Attribute,
+    AttributeProduct,
+    AttributeValue,
+)
+from ...channel.models import Channel
+from ...order import OrderOrigin, OrderStatus
+from ...order.models import Order, OrderLine
+from ...product import ProductTypeKind
+from ...product.models import (
+    Category,
+    Product,
+    ProductChannelListing,
+    ProductType,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from ...shipping.models import ShippingZone
+from ...vendor.models import Vendor, VendorWarehouse
+from ...warehouse.models import Stock, Warehouse
+
+COPY_NULL = "\\N"
+
+FIRST_NAMES = [
+    "Alice",
+    "Bruno",
+    "Carla",
+    "David",
+    "Emma",
+    "Felix",
+    "Grace",
+    "Hugo",
+    "Irene",
+    "Jakub",
+    "Kasia",
+    "Leon",
+    "Maria",
+    "Nina",
+    "Oscar",
+    "Paula",
+    "Quinn",
+    "Rafal",
+    "Sofia",
+    "Tomas",
+]
+LAST_NAMES = [
+    "Adams",
+    "Baker",
+    "Clark",
+    "Davis",
+    "Evans",
+    "Fischer",
+    "Garcia",
+    "Hill",
+    "Kowalski",
+    "Lopez",
+    "Miller",
+    "Nowak",
+    "Olsen",
+    "Perez",
+    "Rossi",
+    "Smith",
+    "Taylor",
+    "Wagner",
+    "Young",
+    "Zielinski",
+]
+CITIES = [
+    "Amsterdam",
+    "Berlin",
+    "Chicago",
+    "Dublin",
+    "Lisbon",
+    "London",
+    "Madrid",
+    "New York",
+    "Paris",
+    "Prague",
+    "Warsaw",
+    "Vienna",
+]
+PRODUCT_ADJECTIVES = [
+    "Classic",
+    "Compact",
+    "Deluxe",
+    "Eco",
+    "Essential",
+    "Light",
+    "Modern",
+    "Pro",
+    "Smart",
+    "Vintage",
+]
+PRODUCT_NOUNS = [
+    "Backpack",
+    "Blender",
+    "Boots",
+    "Chair",
+    "Headphones",
+    "Jacket",
+    "Kettle",
+    "Lamp",
+    "Mug",
+    "Sneakers",
+    "T-shirt",
+    "Watch",
+]
+ORDER_STATUSES = [
+    (OrderStatus.FULFILLED, 60),
+    (OrderStatus.UNFULFILLED, 20),
+    (OrderStatus.PARTIALLY_FULFILLED, 5),
+    (OrderStatus.CANCELED, 5),
+    (OrderStatus.RETURNED, 5),
+    (OrderStatus.UNCONFIRMED, 5),
+]
+PAID_ORDER_STATUSES = {
+    OrderStatus.FULFILLED,
+    OrderStatus.PARTIALLY_FULFILLED,
+    OrderStatus.RETURNED,
+}
+
+
+@dataclass
+class SyntheticDataSize:
+    vendors: int = 10
+    warehouses: int = 20
+    categories: int = 20
+    products: int = 10_000
+    variants_per_product: int = 3
+    attributes: int = 5
+    attribute_values: int = 20
+    customers: int = 10_000
+    orders: int = 50_000
+    max_order_lines: int = 5
+    order_days: int = 365
+
+
+def reserve_ids(model: Type[Model], count: int) -> int:
+    """Reserve `count` consecutive IDs in the sequence of the model's table.
+
+    Return the first of the reserved IDs.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_get_serial_sequence(%s, %s)",
+            [model._meta.db_table, model._meta.pk.column],
+        )
+        sequence = cursor.fetchone()[0]
+        cursor.execute("SELECT nextval(%s)", [sequence])
+        first_id = cursor.fetchone()[0]
+        if count > 1:
+            cursor.execute("SELECT setval(%s, %s)", [sequence, first_id + count - 1])
+    return first_id
+
+
+def format_copy_value(value) -> str:
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def get_copy_defaults(model: Type[Model]) -> Dict[str, object]:
+    """Return values of the defaults of the model fields, prepared for the database.
+
+    Callable defaults are evaluated once, so fields with unique values have to be
+    given in each row.
+    """
+    defaults = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key:
+            continue
+        defaults[field.attname] = field.get_prep_value(field.get_default())
+    return defaults
+
+
+def copy_rows(model: Type[Model], rows: Iterable[dict]) -> int:
+    """Write the rows to the table of the model with a single `COPY`.
+
+    Fields missing in the rows are set to the defaults of the model fields.
+    """
+    fields = model._meta.concrete_fields
+    defaults = get_copy_defaults(model)
+    quote_name = connection.ops.quote_name
+    sql = "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '{}')".format(
+        quote_name(model._meta.db_table),
+        ", ".join(quote_name(field.column) for field in fields),
+        COPY_NULL,
+    )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for row in rows:
+        writer.writerow(
+            [
+                format_copy_value(
+                    row[field.attname]
+                    if field.attname in row
+                    else defaults.get(field.attname)
+                )
+                for field in fields
+            ]
+        )
+        count += 1
+    if count:
+        buffer.seek(0)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(sql, buffer)
+    return count
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class SyntheticDataGenerator:
+    def __init__(
+        self,
+        size: SyntheticDataSize,
+        seed: int = 0,
+        batch_size: int = 10_000,
+        channel_slug: str = "synthetic",
+        currency: str = "USD",
+        country: str = "US",
+    ):
+        self.size = size
+        self.seed = seed
+        self.batch_size = batch_size
+        self.channel_slug = channel_slug
+        self.currency = currency
+        self.country = country
+        self.now = timezone.now().replace(microsecond=0)
+
+    def get_random(self, name: str, index: int = 0) -> random.Random:
+        # string seeds are hashed with SHA-512, independently of PYTHONHASHSEED
+        return random.Random(f"{self.seed}:{name}:{index}")
+
+    def get_uuid(self, name: str, index: int) -> uuid.UUID:
+        return uuid.uuid5(uuid.NAMESPACE_URL, f"saleor:{self.seed}:{name}:{index}")
+
+    def generate(self) -> Iterator[str]:
+        """Create the dataset, yielding a message after each step."""
+        self.create_channel()
+        yield f"Channel: {self.channel}"
+        self.create_warehouses()
+        yield f"Created {len(self.warehouse_ids)} warehouses"
+        self.create_vendors()
+        yield f"Created {len(self.vendor_warehouse_ids)} vendors"
+        self.create_categories()
+        yield f"Created {len(self.category_ids)} categories"
+        self.create_product_type()
+        yield f"Created {len(self.attribute_value_ids)} attributes"
+        for created, total in self.create_products():
+            yield f"Created {created}/{total} products"
+        for created, total in self.create_customers():
+            yield f"Created {created}/{total} customers"
+        for created, total in self.create_orders():
+            yield f"Created {created}/{total} orders"
+        for updated, total in self.update_customers_order_stats():
+            yield f"Updated order statistics of {updated}/{total} customers"
+
+    def create_channel(self):
+        self.channel, _ = Channel.objects.get_or_create(
+            slug=self.channel_slug,
+            defaults={
+                "name": f"Channel {self.channel_slug}",
+                "currency_code": self.currency,
+                "is_active": True,
+                "default_country": self.country,
+            },
+        )
+        self.currency = self.channel.currency_code
+
+    def get_address(self, name: str, index: int) -> dict:
+        rng = self.get_random(name, index)
+        return {
+            "first_name": rng.choice(FIRST_NAMES),
+            "last_name": rng.choice(LAST_NAMES),
+            "street_address_1": f"{rng.randint(1, 300)} Synthetic Street",
+            "city": rng.choice(CITIES),
+            "postal_code": f"{rng.randint(10000, 99999)}",
+            "country": self.country,
+        }
+
+    def create_warehouses(self):
+        count = self.size.warehouses
+        first_address_id = reserve_ids(Address, count)
+        addresses = [
+            Address(id=first_address_id + i, **self.get_address("warehouse", i))
+            for i in range(count)
+        ]
+        Address.objects.bulk_create(addresses)
+        warehouses = [
+            Warehouse(
+                id=self.get_uuid("warehouse", address.pk),
+                name=f"Warehouse {address.pk}",
+                slug=f"synthetic-warehouse-{address.pk}",
+                address=address,
+            )
+            for address in addresses
+        ]
+        Warehouse.objects.bulk_create(warehouses)
+        self.warehouse_ids = [warehouse.pk for warehouse in warehouses]
+
+        shipping_zone = ShippingZone.objects.create(
+            name=f"Synthetic {self.channel_slug}", countries=[self.country]
+        )
+        shipping_zone.channels.add(self.channel)
+        shipping_zone.warehouses.add(*warehouses)
+
+    def create_vendors(self):
+        count = max(self.size.vendors, 1)
+        first_id = reserve_ids(Vendor, count)
+        vendors = [
+            Vendor(
+                id=first_id + i,
+                shop_name=f"Vendor {first_id + i}",
+                slug=f"synthetic-vendor-{first_id + i}",
+            )
+            for i in range(count)
+        ]
+        Vendor.objects.bulk_create(vendors)
+        # warehouses are assigned to vendors in turns, vendors without their own
+        # warehouses stock products in the shared ones
+        self.vendor_warehouse_ids: List[List[uuid.UUID]] = [[] for _ in vendors]
+        vendor_warehouses = []
+        for i, warehouse_id in enumerate(self.warehouse_ids):
+            vendor_index = i % count
+            self.vendor_warehouse_ids[vendor_index].append(warehouse_id)
+            vendor_warehouses.append(
+                VendorWarehouse(
+                    vendor_id_id=vendors[vendor_index].pk, warehouse_id=warehouse_id
+                )
+            )
+        VendorWarehouse.objects.bulk_create(vendor_warehouses)
+        for vendor_index, warehouse_ids in enumerate(self.vendor_warehouse_ids):
+            if not warehouse_ids and self.warehouse_ids:
+                warehouse_ids.append(
+                    self.warehouse_ids[vendor_index % len(self.warehouse_ids)]
+                )
+
+    def create_categories(self):
+        count = max(self.size.categories, 1)
+        root = Category.objects.create(
+            name=f"Synthetic {self.seed}",
+            slug=f"synthetic-{self.seed}-{reserve_ids(Category, 1)}",
+        )
+        self.category_ids = [root.pk]
+        for i in range(1, count):
+            parent_id = self.category_ids[(i - 1) // 4]
+            category = Category.objects.create(
+                name=f"Category {i}",
+                slug=f"{root.slug}-{i}",
+                parent_id=parent_id,
+            )
+            self.category_ids.append(category.pk)
+
+    def create_product_type(self):
+        self.product_type = ProductType.objects.create(
+            name=f"Synthetic {self.seed}",
+            slug=f"synthetic-{self.seed}-{reserve_ids(ProductType, 1)}",
+            kind=ProductTypeKind.NORMAL,
+            has_variants=self.size.variants_per_product > 1,
+        )
+        self.attribute_value_ids: Dict[int, List[int]] = {}
+        for i in range(self.size.attributes):
+            attribute = Attribute.objects.create(
+                name=f"Attribute {i}",
+                slug=f"{self.product_type.slug}-attribute-{i}",
+                type=AttributeType.PRODUCT_TYPE,
+                input_type=AttributeInputType.DROPDOWN,
+                filterable_in_storefront=True,
+                filterable_in_dashboard=True,
+            )
+            values = AttributeValue.objects.bulk_create(
+                [
+                    AttributeValue(
+                        attribute=attribute,
+                        name=f"Value {j}",
+                        slug=f"value-{j}",
+                        sort_order=j,
+                    )
+                    for j in range(max(self.size.attribute_values, 1))
+                ]
+            )
+            assignment = AttributeProduct.objects.create(
+                attribute=attribute, product_type=self.product_type, sort_order=i
+            )
+            self.attribute_value_ids[assignment.pk] = [value.pk for value in values]
+
+    def get_variant_price(self, variant_index: int) -> Decimal:
+        rng = self.get_random("price", variant_index)
+        return Decimal(rng.randint(100, 50_000)) / 100
+
+    def get_product_name(self, product_index: int) -> str:
+        rng = self.get_random("product", product_index)
+        return (
+            f"{rng.choice(PRODUCT_ADJECTIVES)} {rng.choice(PRODUCT_NOUNS)} "
+            f"{product_index}"
+        )
+
+    def create_products(self) -> Iterator[tuple]:
+        total = self.size.products
+        variants_per_product = max(self.size.variants_per_product, 1)
+        self.first_product_id = reserve_ids(Product, total)
+        self.first_variant_id = reserve_ids(
+            ProductVariant, total * variants_per_product
+        )
+        created = 0
+        for product_indexes in chunked(range(total), self.batch_size):
+            with transaction.atomic():
+                self.copy_products(product_indexes, variants_per_product)
+            created += len(product_indexes)
+            yield created, total
+
+    def copy_products(self, product_indexes: List[int], variants_per_product: int):
+        channel_id = self.channel.pk
+        products = []
+        product_listings = []
+        variants = []
+        variant_listings = []
+        stocks = []
+        assigned_attributes = []
+        assigned_values = []
+        for index in product_indexes:
+            rng = self.get_random("product", index)
+            product_id = self.first_product_id + index
+            name = self.get_product_name(index)
+            first_variant_index = index * variants_per_product
+            prices = []
+            vendor_warehouse_ids = self.vendor_warehouse_ids[
+                index % len(self.vendor_warehouse_ids)
+            ]
+            for variant_number in range(variants_per_product):
+                variant_index = first_variant_index + variant_number
+                variant_id = self.first_variant_id + variant_index
+                price = self.get_variant_price(variant_index)
+                prices.append(price)
+                variants.append(
+                    {
+                        "id": variant_id,
+                        "product_id": product_id,
+                        "sku": f"SKU-{variant_id}",
+                        "name": f"Variant {variant_number}",
+                        "sort_order": variant_number,
+                    }
+                )
+                variant_listings.append(
+                    {
+                        "variant_id": variant_id,
+                        "channel_id": channel_id,
+                        "currency": self.currency,
+                        "price_amount": price,
+                        "cost_price_amount": price / 2,
+                    }
+                )
+                if vendor_warehouse_ids:
+                    stocks.append(
+                        {
+                            "warehouse_id": rng.choice(vendor_warehouse_ids),
+                            "product_variant_id": variant_id,
+                            "quantity": rng.randint(0, 500),
+                        }
+                    )
+            description = f"{name} from the synthetic catalog."
+            products.append(
+                {
+                    "id": product_id,
+                    "product_type_id": self.product_type.pk,
+                    "name": name,
+                    "slug": f"{slugify(name)}-{product_id}",
+                    "description": {
+                        "blocks": [{"type": "paragraph", "data": {"text": description}}]
+                    },
+                    "description_plaintext": description,
+                    "category_id": rng.choice(self.category_ids),
+                    "updated_at": self.now,
+                    "default_variant_id": self.first_variant_id + first_variant_index,
+                    "rating": rng.randint(10, 50) / 10,
+                }
+            )
+            product_listings.append(
+                {
+                    "product_id": product_id,
+                    "channel_id": channel_id,
+                    "is_published": True,
+                    "publication_date": self.now.date(),
+                    "visible_in_listings": True,
+                    "available_for_purchase": self.now.date(),
+                    "currency": self.currency,
+                    "discounted_price_amount": min(prices),
+                }
+            )
+            for assignment_id, value_ids in self.attribute_value_ids.items():
+                assigned_attributes.append(
+                    {"product_id": product_id, "assignment_id": assignment_id}
+                )
+                assigned_values.append({"value_id": rng.choice(value_ids)})
+
+        self.copy_with_ids(Product, products)
+        self.copy_with_ids(ProductChannelListing, product_listings)
+        self.copy_with_ids(ProductVariant, variants)
+        self.copy_with_ids(ProductVariantChannelListing, variant_listings)
+        self.copy_with_ids(Stock, stocks)
+        self.copy_with_ids(AssignedProductAttribute, assigned_attributes)
+        for assigned_attribute, assigned_value in zip(
+            assigned_attributes, assigned_values
+        ):
+            assigned_value["assignment_id"] = assigned_attribute["id"]
+            assigned_value["sort_order"] = 0
+        self.copy_with_ids(AssignedProductAttributeValue, assigned_values)
+
+    def copy_with_ids(self, model: Type[Model], rows: List[dict]):
+        """Copy the rows, setting IDs reserved for them when missing."""
+        if not rows:
+            return
+        if "id" not in rows[0]:
+            first_id = reserve_ids(model, len(rows))
+            for offset, row in enumerate(rows):
+                row["id"] = first_id + offset
+        copy_rows(model, rows)
+
+    def get_customer(self, customer_index: int) -> dict:
+        rng = self.get_random("customer", customer_index)
+        user_id = self.first_customer_id + customer_index
+        return {
+            "id": user_id,
+            "email": f"customer{user_id}@example.com",
+            "first_name": rng.choice(FIRST_NAMES),
+            "last_name": rng.choice(LAST_NAMES),
+        }
+
+    def get_customer_address(self, customer_index: int, customer: dict) -> dict:
+        return {
+            **self.get_address("customer", customer_index),
+            "first_name": customer["first_name"],
+            "last_name": customer["last_name"],
+        }
+
+    def create_customers(self) -> Iterator[tuple]:
+        total = self.size.customers
+        self.first_customer_id = reserve_ids(User, total)
+        self.first_customer_address_id = reserve_ids(Address, total)
+        # hashing is slow, so all customers share the same password
+        self.customer_password = make_password("password")
+        created = 0
+        for customer_indexes in chunked(range(total), self.batch_size):
+            with transaction.atomic():
+                self.copy_customers(customer_indexes)
+            created += len(customer_indexes)
+            yield created, total
+
+    def copy_customers(self, customer_indexes: List[int]):
+        users = []
+        addresses = []
+        user_addresses = []
+        for index in customer_indexes:
+            user = self.get_customer(index)
+            address_id = self.first_customer_address_id + index
+            address = {**self.get_customer_address(index, user), "id": address_id}
+            addresses.append(address)
+            date_joined = self.now - timedelta(
+                seconds=self.get_random("joined", index).randrange(
+                    self.size.order_days * 86400 + 1
+                )
+            )
+            users.append(
+                {
+                    **user,
+                    "password": self.customer_password,
+                    "date_joined": date_joined,
+                    "default_billing_address_id": address_id,
+                    "default_shipping_address_id": address_id,
+                    "search_document": generate_search_document(
+                        [
+                            user["email"],
+                            user["first_name"],
+                            user["last_name"],
+                            address["first_name"],
+                            address["last_name"],
+                            address["city"],
+                            self.country,
+                        ]
+                    ),
+                }
+            )
+            user_addresses.append({"user_id": user["id"], "address_id": address_id})
+        copy_rows(Address, addresses)
+        copy_rows(User, users)
+        self.copy_with_ids(User.addresses.through, user_addresses)
+
+    def create_orders(self) -> Iterator[tuple]:
+        total = self.size.orders
+        if not self.size.customers or not self.size.products:
+            return
+        self.first_order_id = reserve_ids(Order, total)
+        # billing and shipping addresses of each order
+        self.first_order_address_id = reserve_ids(Address, total * 2)
+        created = 0
+        for order_indexes in chunked(range(total), self.batch_size):
+            with transaction.atomic():
+                self.copy_orders(order_indexes)
+            created += len(order_indexes)
+            yield created, total
+
+    def copy_orders(self, order_indexes: List[int]):
+        variants_per_product = max(self.size.variants_per_product, 1)
+        variant_count = self.size.products * variants_per_product
+        statuses, weights = zip(*ORDER_STATUSES)
+        orders = []
+        addresses = []
+        lines = []
+        for index in order_indexes:
+            rng = self.get_random("order", index)
+            order_id = self.first_order_id + index
+            customer_index = rng.randrange(self.size.customers)
+            customer = self.get_customer(customer_index)
+            address = self.get_customer_address(customer_index, customer)
+            billing_address_id = self.first_order_address_id + index * 2
+            shipping_address_id = billing_address_id + 1
+            addresses.append({**address, "id": billing_address_id})
+            addresses.append({**address, "id": shipping_address_id})
+            status = rng.choices(statuses, weights)[0]
+            total = Decimal(0)
+            for _ in range(rng.randint(1, max(self.size.max_order_lines, 1))):
+                variant_index = rng.randrange(variant_count)
+                product_index = variant_index // variants_per_product
+                variant_id = self.first_variant_id + variant_index
+                quantity = rng.randint(1, 3)
+                price = self.get_variant_price(variant_index)
+                total += price * quantity
+                lines.append(
+                    {
+                        "order_id": order_id,
+                        "variant_id": variant_id,
+                        "product_name": self.get_product_name(product_index),
+                        "variant_name": (
+                            f"Variant {variant_index % variants_per_product}"
+                        ),
+                        "product_sku": f"SKU-{variant_id}",
+                        "product_variant_id": graphene.Node.to_global_id(
+                            "ProductVariant", variant_id
+                        ),
+                        "is_shipping_required": True,
+                        "is_gift_card": False,
+                        "quantity": quantity,
+                        "quantity_fulfilled": (
+                            quantity if status == OrderStatus.FULFILLED else 0
+                        ),
+                        "currency": self.currency,
+                        "unit_price_net_amount": price,
+                        "unit_price_gross_amount": price,
+                        "undiscounted_unit_price_net_amount": price,
+                        "undiscounted_unit_price_gross_amount": price,
+                        "total_price_net_amount": price * quantity,
+                        "total_price_gross_amount": price * quantity,
+                        "undiscounted_total_price_net_amount": price * quantity,
+                        "undiscounted_total_price_gross_amount": price * quantity,
+                    }
+                )
+            created = self.now - timedelta(
+                seconds=rng.randrange(self.size.order_days * 86400 + 1)
+            )
+            orders.append(
+                {
+                    "id": order_id,
+                    "created": created,
+                    "status": status,
+                    "user_id": customer["id"],
+                    "user_email": customer["email"],
+                    "billing_address_id": billing_address_id,
+                    "shipping_address_id": shipping_address_id,
+                    "origin": OrderOrigin.CHECKOUT,
+                    "currency": self.currency,
+                    "channel_id": self.channel.pk,
+                    "token": str(self.get_uuid("order", order_id)),
+                    "total_net_amount": total,
+                    "total_gross_amount": total,
+                    "undiscounted_total_net_amount": total,
+                    "undiscounted_total_gross_amount": total,
+                    "total_paid_amount": (
+                        total if status in PAID_ORDER_STATUSES else Decimal(0)
+                    ),
+                    "search_document": generate_search_document(
+                        [
+                            customer["email"],
+                            customer["email"],
+                            customer["first_name"],
+                            customer["last_name"],
+                        ]
+                    ),
+                }
+            )
+        copy_rows(Address, addresses)
+        copy_rows(Order, orders)
+        self.copy_with_ids(OrderLine, lines)
+
+    def update_customers_order_stats(self) -> Iterator[tuple]:
+        total = self.size.customers
+        updated = 0
+        for customer_indexes in chunked(range(total), self.batch_size):
+            update_users_order_stats(
+                self.first_customer_id + index for index in customer_indexes
+            )
+            updated += len(customer_indexes)
+            yield updated, total
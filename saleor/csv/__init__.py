@@ -24,6 +24,22 @@ class ExportEvents:
     ]
 
 
+class ImportEvents:
+    """The different csv import events types."""
+
+    IMPORT_PENDING = "import_pending"
+    IMPORT_BATCH_PROCESSED = "import_batch_processed"
+    IMPORT_SUCCESS = "import_success"
+    IMPORT_FAILED = "import_failed"
+
+    CHOICES = [
+        (IMPORT_PENDING, "Data import was started."),
+        (IMPORT_BATCH_PROCESSED, "Batch of imported rows was processed."),
+        (IMPORT_SUCCESS, "Data import was completed successfully."),
+        (IMPORT_FAILED, "Data import failed."),
+    ]
+
+
 class FileTypes:
     CSV = "csv"
     XLSX = "xlsx"
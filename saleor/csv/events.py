@@ -1,12 +1,12 @@
 from typing import TYPE_CHECKING, Optional
 
-from . import ExportEvents
-from .models import ExportEvent
+from . import ExportEvents, ImportEvents
+from .models import ExportEvent, ImportEvent
 
 if TYPE_CHECKING:
     from ..account.models import User
     from ..app.models import App
-    from .models import ExportFile
+    from .models import ExportFile, ImportFile
 
 
 UserType = Optional["User"]
@@ -68,3 +68,52 @@ def export_failed_info_sent_event(*, export_file_id: int, user_id: int):
         user_id=user_id,
         type=ExportEvents.EXPORT_FAILED_INFO_SENT,
     )
+
+
+def import_started_event(
+    *, import_file: "ImportFile", user: UserType = None, app: AppType = None
+):
+    ImportEvent.objects.create(
+        import_file=import_file, user=user, app=app, type=ImportEvents.IMPORT_PENDING
+    )
+
+
+def import_batch_processed_event(
+    *,
+    import_file: "ImportFile",
+    user: UserType = None,
+    app: AppType = None,
+    summary: dict
+):
+    ImportEvent.objects.create(
+        import_file=import_file,
+        user=user,
+        app=app,
+        type=ImportEvents.IMPORT_BATCH_PROCESSED,
+        parameters=summary,
+    )
+
+
+def import_success_event(
+    *, import_file: "ImportFile", user: UserType = None, app: AppType = None
+):
+    ImportEvent.objects.create(
+        import_file=import_file, user=user, app=app, type=ImportEvents.IMPORT_SUCCESS
+    )
+
+
+def import_failed_event(
+    *,
+    import_file: "ImportFile",
+    user: UserType = None,
+    app: AppType = None,
+    message: str,
+    error_type: str
+):
+    ImportEvent.objects.create(
+        import_file=import_file,
+        user=user,
+        app=app,
+        type=ImportEvents.IMPORT_FAILED,
+        parameters={"message": message, "error_type": error_type},
+    )
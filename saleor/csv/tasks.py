@@ -1,11 +1,27 @@
-from typing import Dict, Union
+from copy import deepcopy
+from typing import Dict, List, Union
+
+from celery import chord
+from django.conf import settings
 
 from ..celeryconf import app
 from ..core import JobStatus
 from . import events
-from .models import ExportFile
+from .models import ExportFile, ImportFile
 from .notifications import send_export_failed_info
-from .utils.export import export_products
+from .utils.export import (
+    export_products,
+    export_products_part,
+    get_export_part_name,
+    get_product_pk_ranges,
+    get_product_queryset,
+    merge_export_parts,
+)
+from .utils.import_products import import_products
+
+# Returned by `export_products_task` when the export was split into parts; the final
+# status of the export file is set by `merge_export_parts_task` in that case.
+EXPORT_SPLIT_INTO_PARTS = "export_split_into_parts"
 
 
 def on_task_failure(self, exc, task_id, args, kwargs, einfo):
@@ -28,6 +44,9 @@ def on_task_failure(self, exc, task_id, args, kwargs, einfo):
 
 
 def on_task_success(self, retval, task_id, args, kwargs):
+    if retval == EXPORT_SPLIT_INTO_PARTS:
+        return
+
     export_file_id = args[0]
 
     export_file = ExportFile.objects.get(pk=export_file_id)
@@ -38,6 +57,17 @@ def on_task_success(self, retval, task_id, args, kwargs):
     )
 
 
+def can_split_export() -> bool:
+    """Return whether exports may be processed by parallel subtasks.
+
+    Joining the parts with a chord requires a result backend, unless tasks are
+    executed eagerly.
+    """
+    return bool(settings.EXPORT_PRODUCTS_SHARD_SIZE) and bool(
+        settings.CELERY_TASK_ALWAYS_EAGER or settings.CELERY_RESULT_BACKEND
+    )
+
+
 @app.task(on_success=on_task_success, on_failure=on_task_failure)
 def export_products_task(
     export_file_id: int,
@@ -47,4 +77,98 @@ def export_products_task(
     delimiter: str = ";",
 ):
     export_file = ExportFile.objects.get(pk=export_file_id)
-    export_products(export_file, scope, export_info, file_type, delimiter)
+
+    pk_ranges = []
+    if can_split_export():
+        queryset = get_product_queryset(deepcopy(scope))
+        pk_ranges = get_product_pk_ranges(queryset, settings.EXPORT_PRODUCTS_SHARD_SIZE)
+
+    if len(pk_ranges) <= 1:
+        export_products(export_file, scope, export_info, file_type, delimiter)
+        return None
+
+    part_names = [
+        get_export_part_name(export_file_id, index, file_type)
+        for index in range(len(pk_ranges))
+    ]
+    parts = [
+        export_products_part_task.si(
+            export_file_id,
+            scope,
+            export_info,
+            pk_range,
+            part_name,
+            file_type,
+            delimiter,
+        )
+        for pk_range, part_name in zip(pk_ranges, part_names)
+    ]
+    chord(parts)(
+        merge_export_parts_task.si(
+            export_file_id, export_info, part_names, file_type, delimiter
+        )
+    )
+    return EXPORT_SPLIT_INTO_PARTS
+
+
+@app.task(on_failure=on_task_failure)
+def export_products_part_task(
+    export_file_id: int,
+    scope: Dict[str, Union[str, dict]],
+    export_info: Dict[str, list],
+    pk_range: List[int],
+    part_name: str,
+    file_type: str,
+    delimiter: str = ";",
+):
+    export_products_part(
+        scope, export_info, tuple(pk_range), part_name, file_type, delimiter
+    )
+
+
+@app.task(on_success=on_task_success, on_failure=on_task_failure)
+def merge_export_parts_task(
+    export_file_id: int,
+    export_info: Dict[str, list],
+    part_names: List[str],
+    file_type: str,
+    delimiter: str = ";",
+):
+    export_file = ExportFile.objects.get(pk=export_file_id)
+    merge_export_parts(export_file, export_info, part_names, file_type, delimiter)
+
+
+def on_import_task_failure(self, exc, task_id, args, kwargs, einfo):
+    import_file_id = args[0]
+    import_file = ImportFile.objects.get(pk=import_file_id)
+
+    import_file.status = JobStatus.FAILED
+    import_file.message = str(exc)[:255]
+    import_file.save(update_fields=["status", "message", "updated_at"])
+
+    events.import_failed_event(
+        import_file=import_file,
+        user=import_file.user,
+        app=import_file.app,
+        message=str(exc),
+        error_type=str(einfo.type),
+    )
+
+
+def on_import_task_success(self, retval, task_id, args, kwargs):
+    import_file_id = args[0]
+
+    import_file = ImportFile.objects.get(pk=import_file_id)
+    import_file.status = JobStatus.SUCCESS
+    import_file.message = retval
+    import_file.save(update_fields=["status", "message", "updated_at"])
+    events.import_success_event(
+        import_file=import_file, user=import_file.user, app=import_file.app
+    )
+
+
+@app.task(on_success=on_import_task_success, on_failure=on_import_task_failure)
+def import_products_task(import_file_id: int, delimiter: str = ";"):
+    import_file = ImportFile.objects.get(pk=import_file_id)
+    summary = import_products(import_file, delimiter)
+    return f"Processed {summary.rows} rows, {summary.errors_count} rows rejected."
@@ -9,6 +9,8 @@ import openpyxl
 import petl as etl
 import pytest
 from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from freezegun import freeze_time
 
 from ....core import JobStatus
@@ -20,8 +22,12 @@ from ...utils.export import (
     create_file_with_headers,
     export_products,
     export_products_in_batches,
+    export_products_part,
+    get_export_part_name,
     get_filename,
+    get_product_pk_ranges,
     get_product_queryset,
+    merge_export_parts,
     parse_input,
     save_csv_file_in_export_file,
 )
@@ -328,6 +334,132 @@ def get_product_queryset_filter(product_list):
     assert queryset.count() == len(product_list) - 1
 
 
+def test_get_product_pk_ranges(product_list):
+    # given
+    queryset = get_product_queryset({"all": ""})
+    pks = sorted(product.pk for product in product_list)
+
+    # when
+    pk_ranges = get_product_pk_ranges(queryset, 2)
+
+    # then
+    assert pk_ranges == [(pks[0], pks[1]), (pks[2], pks[2])]
+
+
+def test_get_product_pk_ranges_exact_shards(product_list):
+    # given
+    queryset = get_product_queryset({"all": ""})
+    pks = sorted(product.pk for product in product_list)
+
+    # when
+    pk_ranges = get_product_pk_ranges(queryset, 1)
+
+    # then
+    assert pk_ranges == [(pk, pk) for pk in pks]
+
+
+def test_get_product_pk_ranges_empty_queryset():
+    # given
+    queryset = get_product_queryset({"all": ""})
+
+    # when
+    pk_ranges = get_product_pk_ranges(queryset, 2)
+
+    # then
+    assert pk_ranges == []
+
+
+def test_export_products_part(product_list, user_export_file, media_root):
+    # given
+    pks = sorted(product.pk for product in product_list)
+    export_info = {
+        "fields": [ProductFieldEnum.NAME.value],
+        "warehouses": [],
+        "attributes": [],
+        "channels": [],
+    }
+    part_name = get_export_part_name(user_export_file.pk, 0, FileTypes.CSV)
+
+    # when
+    export_products_part(
+        {"all": ""},
+        export_info,
+        (pks[0], pks[1]),
+        part_name,
+        FileTypes.CSV,
+        delimiter=";",
+    )
+
+    # then
+    with default_storage.open(part_name, "rb") as part_file:
+        file_content = part_file.read().decode().split("\r\n")
+
+    assert file_content[0] == "id;name"
+    for product in product_list[:2]:
+        id = graphene.Node.to_global_id("Product", product.pk)
+        assert f"{id};{product.name}" in file_content
+    id = graphene.Node.to_global_id("Product", product_list[2].pk)
+    assert f"{id};{product_list[2].name}" not in file_content
+
+
+@patch("saleor.csv.utils.export.send_export_download_link_notification")
+def test_merge_export_parts_for_csv(send_email_mock, user_export_file, media_root):
+    # given
+    export_info = {
+        "fields": [ProductFieldEnum.NAME.value],
+        "warehouses": [],
+        "attributes": [],
+        "channels": [],
+    }
+    part_names = [
+        get_export_part_name(user_export_file.pk, 0, FileTypes.CSV),
+        get_export_part_name(user_export_file.pk, 1, FileTypes.CSV),
+    ]
+    default_storage.save(part_names[0], ContentFile(b"id;name\r\n1;A\r\n2;B\r\n"))
+    default_storage.save(part_names[1], ContentFile(b"id;name\r\n3;C\r\n"))
+
+    # when
+    merge_export_parts(user_export_file, export_info, part_names, FileTypes.CSV)
+
+    # then
+    user_export_file.refresh_from_db()
+    file_content = user_export_file.content_file.read().decode().split("\r\n")
+    assert file_content[:4] == ["id;name", "1;A", "2;B", "3;C"]
+    assert not any(default_storage.exists(part_name) for part_name in part_names)
+    send_email_mock.assert_called_once_with(user_export_file)
+
+
+@patch("saleor.csv.utils.export.send_export_download_link_notification")
+def test_merge_export_parts_for_xlsx(send_email_mock, user_export_file, media_root):
+    # given
+    export_info = {
+        "fields": [ProductFieldEnum.NAME.value],
+        "warehouses": [],
+        "attributes": [],
+        "channels": [],
+    }
+    part_names = [
+        get_export_part_name(user_export_file.pk, 0, FileTypes.XLSX),
+        get_export_part_name(user_export_file.pk, 1, FileTypes.XLSX),
+    ]
+    part_rows = [[["id", "name"], [1, "A"]], [["id", "name"], [2, "B"]]]
+    for part_name, rows in zip(part_names, part_rows):
+        with NamedTemporaryFile(suffix=".xlsx") as part_file:
+            etl.io.xlsx.toxlsx(etl.wrap(rows), part_file.name)
+            default_storage.save(part_name, File(part_file))
+
+    # when
+    merge_export_parts(user_export_file, export_info, part_names, FileTypes.XLSX)
+
+    # then
+    user_export_file.refresh_from_db()
+    wb_obj = openpyxl.load_workbook(user_export_file.content_file.path)
+    rows = [[cell.value for cell in row] for row in wb_obj.active.iter_rows()]
+    assert rows == [["id", "name"], [1, "A"], [2, "B"]]
+    assert not any(default_storage.exists(part_name) for part_name in part_names)
+    send_email_mock.assert_called_once_with(user_export_file)
+
+
 def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
     # given
     file_headers = ["id", "name", "collections"]
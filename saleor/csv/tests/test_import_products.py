@@ -0,0 +1,432 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...product.models import (
+    Product,
+    ProductChannelListing,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from ...warehouse.models import Stock
+from .. import ImportEvents
+from ..models import ImportEvent
+from ..utils.import_products import (
+    get_import_columns,
+    import_products,
+    import_products_batch,
+)
+
+
+def _save_import_content(import_file, lines):
+    content = "\r\n".join(";".join(line) for line in lines) + "\r\n"
+    import_file.content_file.save("products.csv", ContentFile(content.encode()))
+
+
+def _to_global_id(instance):
+    return graphene.Node.to_global_id(type(instance).__name__, instance.pk)
+
+
+@patch("saleor.csv.utils.import_products.update_products_discounted_prices_task.delay")
+def test_import_products(
+    update_prices_mock,
+    user_import_file,
+    product_list,
+    warehouse,
+    channel_USD,
+    channel_PLN,
+    media_root,
+):
+    # given
+    variants = [product.variants.get() for product in product_list]
+    _save_import_content(
+        user_import_file,
+        [
+            [
+                "id",
+                "variant id",
+                "name",
+                "charge taxes",
+                f"{warehouse.slug} (warehouse quantity)",
+                f"{channel_USD.slug} (channel price amount)",
+                f"{channel_PLN.slug} (channel price amount)",
+            ],
+            [
+                _to_global_id(product_list[0]),
+                _to_global_id(variants[0]),
+                "New name",
+                "False",
+                "7",
+                "12.50",
+                "40",
+            ],
+            [
+                _to_global_id(product_list[1]),
+                _to_global_id(variants[1]),
+                " ",
+                " ",
+                "0",
+                " ",
+                " ",
+            ],
+        ],
+    )
+
+    # when
+    summary = import_products(user_import_file)
+
+    # then
+    assert summary.rows == 2
+    assert summary.errors_count == 0
+    product_list[0].refresh_from_db()
+    assert product_list[0].name == "New name"
+    assert product_list[0].charge_taxes is False
+    product_list[1].refresh_from_db()
+    assert product_list[1].name == "Test product 2"
+
+    stocks = Stock.objects.filter(warehouse=warehouse)
+    assert stocks.get(product_variant=variants[0]).quantity == 7
+    assert stocks.get(product_variant=variants[1]).quantity == 0
+    assert stocks.get(product_variant=variants[2]).quantity == 100
+
+    listing_usd = variants[0].channel_listings.get(channel=channel_USD)
+    assert listing_usd.price_amount == Decimal("12.50")
+    assert listing_usd.cost_price_amount == Decimal(1)
+    listing_pln = variants[0].channel_listings.get(channel=channel_PLN)
+    assert listing_pln.price_amount == Decimal(40)
+    assert listing_pln.currency == channel_PLN.currency_code
+    assert not variants[1].channel_listings.filter(channel=channel_PLN).exists()
+
+    update_prices_mock.assert_called_once_with([product_list[0].pk])
+
+    event = ImportEvent.objects.get(
+        import_file=user_import_file, type=ImportEvents.IMPORT_BATCH_PROCESSED
+    )
+    assert event.parameters["rows"] == 2
+    assert event.parameters["products_updated"] == 1
+    assert event.parameters["stocks_updated"] == 2
+    assert event.parameters["channel_listings_created"] == 1
+    assert event.parameters["channel_listings_updated"] == 1
+
+
+def test_import_products_by_sku(user_import_file, product_list, warehouse, media_root):
+    # given
+    variant = product_list[0].variants.get()
+    Stock.objects.filter(product_variant=variant).delete()
+    _save_import_content(
+        user_import_file,
+        [
+            ["variant sku", f"{warehouse.slug} (warehouse quantity)"],
+            [variant.sku, "15"],
+        ],
+    )
+
+    # when
+    summary = import_products(user_import_file)
+
+    # then
+    assert summary.stocks_created == 1
+    stock = Stock.objects.get(product_variant=variant, warehouse=warehouse)
+    assert stock.quantity == 15
+
+
+def test_import_products_update_variant_fields(
+    user_import_file, product_list, media_root
+):
+    # given
+    variant = product_list[0].variants.get()
+    _save_import_content(
+        user_import_file,
+        [
+            [
+                "variant id",
+                "variant sku",
+                "variant is preorder",
+                "variant preorder global threshold",
+            ],
+            [_to_global_id(variant), "NEW-SKU", "True", "10"],
+        ],
+    )
+
+    # when
+    summary = import_products(user_import_file)
+
+    # then
+    assert summary.variants_updated == 1
+    variant.refresh_from_db()
+    assert variant.sku == "NEW-SKU"
+    assert variant.is_preorder is True
+    assert variant.preorder_global_threshold == 10
+
+
+def test_import_products_invalid_rows_are_skipped(
+    user_import_file, product_list, warehouse, channel_PLN, media_root
+):
+    # given
+    variants = [product.variants.get() for product in product_list]
+    _save_import_content(
+        user_import_file,
+        [
+            [
+                "variant id",
+                "variant sku",
+                f"{warehouse.slug} (warehouse quantity)",
+                f"{channel_PLN.slug} (channel variant cost price)",
+            ],
+            [_to_global_id(variants[0]), " ", "-1", " "],
+            [_to_global_id(variants[1]), variants[2].sku, "1", " "],
+            [_to_global_id(variants[2]), " ", "5", "3"],
+            ["UHJvZHVjdFZhcmlhbnQ6MA==", " ", "5", " "],
+            [_to_global_id(product_list[0]), " ", "5", " "],
+        ],
+    )
+
+    # when
+    summary = import_products(user_import_file)
+
+    # then
+    assert summary.rows == 5
+    assert summary.errors_count == 5
+    assert not Stock.objects.filter(quantity=5).exists()
+    event = ImportEvent.objects.get(
+        import_file=user_import_file, type=ImportEvents.IMPORT_BATCH_PROCESSED
+    )
+    assert [error["row"] for error in event.parameters["errors"]] == [2, 5, 6, 3, 4]
+
+
+def test_import_products_creates_products_and_variants(
+    user_import_file,
+    product_list,
+    product_type,
+    category,
+    warehouse,
+    channel_USD,
+    media_root,
+):
+    # given
+    product = product_list[0]
+    _save_import_content(
+        user_import_file,
+        [
+            [
+                "id",
+                "name",
+                "product type",
+                "category",
+                "variant sku",
+                f"{warehouse.slug} (warehouse quantity)",
+                f"{channel_USD.slug} (channel price amount)",
+            ],
+            [" ", "New product", product_type.name, category.slug, "NEW-1", "5", "10"],
+            [" ", "New product", " ", " ", "NEW-2", "6", "11"],
+            [_to_global_id(product), " ", " ", " ", "NEW-3", "7", "12"],
+        ],
+    )
+
+    # when
+    summary = import_products(user_import_file)
+
+    # then
+    assert summary.errors_count == 0
+    assert summary.products_created == 1
+    assert summary.variants_created == 3
+    assert summary.stocks_created == 3
+    assert summary.channel_listings_created == 3
+    assert summary.product_channel_listings_created == 1
+
+    new_product = Product.objects.get(slug="new-product")
+    assert new_product.name == "New product"
+    assert new_product.product_type == product_type
+    assert new_product.category == category
+    variants = list(new_product.variants.order_by("sort_order"))
+    assert [variant.sku for variant in variants] == ["NEW-1", "NEW-2"]
+    assert [variant.sort_order for variant in variants] == [0, 1]
+    assert new_product.default_variant == variants[0]
+    assert variants[1].stocks.get(warehouse=warehouse).quantity == 6
+    listing = variants[1].channel_listings.get(channel=channel_USD)
+    assert listing.price_amount == Decimal(11)
+    product_listing = ProductChannelListing.objects.get(
+        product=new_product, channel=channel_USD
+    )
+    assert product_listing.is_published is False
+
+    new_variant = ProductVariant.objects.get(sku="NEW-3")
+    assert new_variant.product == product
+    assert new_variant.stocks.get(warehouse=warehouse).quantity == 7
+
+
+def test_import_products_new_product_errors(
+    user_import_file, product_type_without_variant, media_root
+):
+    # given
+    _save_import_content(
+        user_import_file,
+        [
+            ["name", "product type", "category", "variant sku"],
+            ["No type", " ", " ", "SKU-1"],
+            ["Unknown type", "Not existing", " ", "SKU-2"],
+            ["Unknown category", product_type_without_variant.name, "none", "SKU-3"],
+            ["Simple", product_type_without_variant.name, " ", "SKU-4"],
+            ["Simple", product_type_without_variant.name, " ", "SKU-5"],
+        ],
+    )
+
+    # when
+    summary = import_products(user_import_file)
+
+    # then
+    assert summary.errors_count == 4
+    assert summary.products_created == 1
+    assert list(
+        ProductVariant.objects.filter(sku__startswith="SKU-").values_list(
+            "sku", flat=True
+        )
+    ) == ["SKU-4"]
+    event = ImportEvent.objects.get(
+        import_file=user_import_file, type=ImportEvents.IMPORT_BATCH_PROCESSED
+    )
+    assert [error["row"] for error in event.parameters["errors"]] == [2, 3, 4, 6]
+
+
+@pytest.mark.parametrize(
+    "price, message",
+    [
+        ("NaN", 'Invalid decimal value "NaN"'),
+        ("Infinity", 'Invalid decimal value "Infinity"'),
+        ("-1", "cannot be negative"),
+        ("12345678901234", "no more than 12 digits"),
+        ("1.2345", "no more than 3 decimal places"),
+    ],
+)
+def test_import_products_invalid_price(
+    price, message, user_import_file, product_list, channel_USD, media_root
+):
+    # given
+    variant = product_list[0].variants.get()
+    listing = variant.channel_listings.get(channel=channel_USD)
+    _save_import_content(
+        user_import_file,
+        [
+            ["variant id", f"{channel_USD.slug} (channel price amount)"],
+            [_to_global_id(variant), price],
+        ],
+    )
+
+    # when
+    summary = import_products(user_import_file)
+
+    # then
+    assert summary.errors_count == 1
+    event = ImportEvent.objects.get(
+        import_file=user_import_file, type=ImportEvents.IMPORT_BATCH_PROCESSED
+    )
+    assert message in event.parameters["errors"][0]["message"]
+    listing_after_import = variant.channel_listings.get(channel=channel_USD)
+    assert listing_after_import.price_amount == listing.price_amount
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        ["name", "example-warehouse (warehouse quantity)"],
+        ["variant sku", "not-existing (warehouse quantity)"],
+        ["variant sku", "not-existing (channel price amount)"],
+    ],
+)
+def test_get_import_columns_invalid_headers(headers, warehouse):
+    with pytest.raises(ValueError):
+        get_import_columns(headers)
+
+
+def test_import_products_batch_query_count_does_not_depend_on_rows(
+    product_list, warehouse, channel_USD, channel_PLN
+):
+    # given
+    variants = list(ProductVariant.objects.filter(product__in=product_list))
+    columns = get_import_columns(
+        [
+            "id",
+            "variant id",
+            "name",
+            f"{warehouse.slug} (warehouse quantity)",
+            f"{channel_USD.slug} (channel price amount)",
+            f"{channel_PLN.slug} (channel price amount)",
+        ]
+    )
+
+    def get_rows(variants):
+        return [
+            (
+                index,
+                {
+                    "id": _to_global_id(variant.product),
+                    "variant id": _to_global_id(variant),
+                    "name": f"Product {index}",
+                    f"{warehouse.slug} (warehouse quantity)": str(index),
+                    f"{channel_USD.slug} (channel price amount)": str(index),
+                    f"{channel_PLN.slug} (channel price amount)": str(index),
+                },
+            )
+            for index, variant in enumerate(variants, start=2)
+        ]
+
+    # when
+    with CaptureQueriesContext(connection) as single_row_queries:
+        import_products_batch(get_rows(variants[:1]), columns)
+    ProductVariantChannelListing.objects.filter(channel=channel_PLN).delete()
+    with CaptureQueriesContext(connection) as many_rows_queries:
+        summary = import_products_batch(get_rows(variants), columns)
+
+    # then
+    assert summary.errors_count == 0
+    assert summary.channel_listings_created == len(variants)
+    assert len(many_rows_queries) == len(single_row_queries)
+
+
+def test_import_products_batch_creating_products_query_count_does_not_depend_on_rows(
+    product_type, category, warehouse, channel_USD
+):
+    # given
+    columns = get_import_columns(
+        [
+            "name",
+            "product type",
+            "category",
+            "variant sku",
+            f"{warehouse.slug} (warehouse quantity)",
+            f"{channel_USD.slug} (channel price amount)",
+        ]
+    )
+
+    def get_rows(prefix, count):
+        return [
+            (
+                index,
+                {
+                    "name": f"{prefix} product {index}",
+                    "product type": product_type.name,
+                    "category": category.slug,
+                    "variant sku": f"{prefix}-{index}",
+                    f"{warehouse.slug} (warehouse quantity)": str(index),
+                    f"{channel_USD.slug} (channel price amount)": str(index),
+                },
+            )
+            for index in range(2, count + 2)
+        ]
+
+    # when
+    with CaptureQueriesContext(connection) as single_row_queries:
+        import_products_batch(get_rows("single", 1), columns)
+    with CaptureQueriesContext(connection) as many_rows_queries:
+        summary = import_products_batch(get_rows("many", 10), columns)
+
+    # then
+    assert summary.errors_count == 0
+    assert summary.products_created == 10
+    assert summary.variants_created == 10
+    assert len(many_rows_queries) == len(single_row_queries)
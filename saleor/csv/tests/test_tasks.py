@@ -1,13 +1,22 @@
 import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
+import pytest
 import pytz
 from freezegun import freeze_time
 
 from ...core import JobStatus
-from .. import ExportEvents, FileTypes
-from ..models import ExportEvent
-from ..tasks import export_products_task, on_task_failure, on_task_success
+from .. import ExportEvents, FileTypes, ImportEvents
+from ..models import ExportEvent, ImportEvent
+from ..tasks import (
+    EXPORT_SPLIT_INTO_PARTS,
+    export_products_task,
+    import_products_task,
+    on_task_failure,
+    on_task_success,
+)
+from ..utils.export import get_export_part_name
+from ..utils.import_products import ImportSummary
 
 
 @patch("saleor.csv.tasks.export_products")
@@ -131,3 +140,162 @@ def test_on_task_success(user_export_file):
         user=user_export_file.user,
         type=ExportEvents.EXPORT_SUCCESS,
     )
+
+
+@patch("saleor.csv.tasks.export_products")
+@patch("saleor.csv.tasks.merge_export_parts")
+@patch("saleor.csv.tasks.export_products_part")
+def test_export_products_task_split_into_parts(
+    export_products_part_mock,
+    merge_export_parts_mock,
+    export_products_mock,
+    user_export_file,
+    product_list,
+    settings,
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 2
+    scope = {"all": ""}
+    export_info = {"fields": "name"}
+    file_type = FileTypes.XLSX
+    delimiter = ";"
+    pks = sorted(product.pk for product in product_list)
+
+    # when
+    result = export_products_task(
+        user_export_file.id, scope, export_info, file_type, delimiter
+    )
+
+    # then
+    assert result == EXPORT_SPLIT_INTO_PARTS
+    export_products_mock.assert_not_called()
+
+    part_names = [
+        get_export_part_name(user_export_file.pk, 0, file_type),
+        get_export_part_name(user_export_file.pk, 1, file_type),
+    ]
+    export_products_part_mock.assert_has_calls(
+        [
+            call(
+                scope,
+                export_info,
+                (pks[0], pks[1]),
+                part_names[0],
+                file_type,
+                delimiter,
+            ),
+            call(
+                scope,
+                export_info,
+                (pks[2], pks[2]),
+                part_names[1],
+                file_type,
+                delimiter,
+            ),
+        ]
+    )
+    merge_export_parts_mock.assert_called_once_with(
+        user_export_file, export_info, part_names, file_type, delimiter
+    )
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.SUCCESS
+
+
+@patch("saleor.csv.tasks.export_products")
+def test_export_products_task_splitting_disabled(
+    export_products_mock, user_export_file, product_list, settings
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 0
+    scope = {"all": ""}
+    export_info = {"fields": "name"}
+    file_type = FileTypes.CSV
+    delimiter = ";"
+
+    # when
+    result = export_products_task(
+        user_export_file.id, scope, export_info, file_type, delimiter
+    )
+
+    # then
+    assert result is None
+    export_products_mock.assert_called_once_with(
+        user_export_file, scope, export_info, file_type, delimiter
+    )
+
+
+@patch("saleor.csv.tasks.send_export_failed_info")
+@patch("saleor.csv.tasks.merge_export_parts")
+@patch("saleor.csv.tasks.export_products_part")
+def test_export_products_task_part_failure(
+    export_products_part_mock,
+    merge_export_parts_mock,
+    send_export_failed_info_mock,
+    user_export_file,
+    product_list,
+    settings,
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 2
+    export_products_part_mock.side_effect = Exception("Test")
+
+    # when
+    with pytest.raises(Exception):
+        export_products_task(user_export_file.id, {"all": ""}, {}, FileTypes.CSV)
+
+    # then
+    merge_export_parts_mock.assert_not_called()
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.FAILED
+    send_export_failed_info_mock.assert_called_with(user_export_file)
+
+
+def test_on_task_success_export_split_into_parts(user_export_file):
+    # given
+    args = [user_export_file.pk, {"filter": {}}]
+
+    # when
+    on_task_success(None, EXPORT_SPLIT_INTO_PARTS, "task_id", args, {})
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.PENDING
+    assert not ExportEvent.objects.filter(
+        export_file=user_export_file, type=ExportEvents.EXPORT_SUCCESS
+    ).exists()
+
+
+@patch("saleor.csv.tasks.import_products")
+def test_import_products_task(import_products_mock, user_import_file):
+    # given
+    import_products_mock.return_value = ImportSummary(rows=10, errors_count=2)
+
+    # when
+    import_products_task.delay(user_import_file.pk, ",")
+
+    # then
+    import_products_mock.assert_called_once_with(user_import_file, ",")
+    user_import_file.refresh_from_db()
+    assert user_import_file.status == JobStatus.SUCCESS
+    assert user_import_file.message == "Processed 10 rows, 2 rows rejected."
+    assert ImportEvent.objects.filter(
+        import_file=user_import_file, type=ImportEvents.IMPORT_SUCCESS
+    ).exists()
+
+
+@patch("saleor.csv.tasks.import_products")
+def test_import_products_task_failure(import_products_mock, user_import_file):
+    # given
+    import_products_mock.side_effect = ValueError("Unknown warehouse slugs in headers.")
+
+    # when
+    import_products_task.delay(user_import_file.pk)
+
+    # then
+    user_import_file.refresh_from_db()
+    assert user_import_file.status == JobStatus.FAILED
+    assert user_import_file.message == "Unknown warehouse slugs in headers."
+    event = ImportEvent.objects.get(
+        import_file=user_import_file, type=ImportEvents.IMPORT_FAILED
+    )
+    assert event.parameters["message"] == "Unknown warehouse slugs in headers."
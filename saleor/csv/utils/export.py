@@ -1,9 +1,13 @@
 import secrets
+import shutil
+from copy import deepcopy
 from datetime import date, datetime
 from tempfile import NamedTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, Dict, List, Set, Union
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Set, Tuple, Union
 
 import petl as etl
+from django.core.files import File
+from django.core.files.storage import default_storage
 from django.utils import timezone
 
 from ...product.models import Product
@@ -20,6 +24,7 @@ if TYPE_CHECKING:
 
 
 BATCH_SIZE = 10000
+EXPORT_PARTS_DIR = "export_files/parts"
 
 
 def export_products(
@@ -108,7 +113,7 @@ def get_product_queryset(scope: Dict[str, Union[str, dict]]) -> "QuerySet":
 def queryset_in_batches(queryset):
     """Slice a queryset into batches.
 
-    Input queryset should be sorted be pk.
+    Input queryset should be sorted by pk.
     """
     start_pk = 0
 
@@ -124,6 +129,116 @@ def queryset_in_batches(queryset):
         start_pk = pks[-1]
 
 
+def get_product_pk_ranges(
+    queryset: "QuerySet", shard_size: int
+) -> List[Tuple[int, int]]:
+    """Split a queryset into inclusive pk ranges of at most `shard_size` products.
+
+    Input queryset should be sorted by pk.
+    """
+    pk_ranges = []
+    last_pk = 0
+
+    while True:
+        pks = queryset.filter(pk__gt=last_pk).values_list("pk", flat=True)
+        first_pk = pks.first()
+        if first_pk is None:
+            break
+
+        shard_end = list(pks[shard_size - 1 : shard_size])  # noqa: E203
+        if not shard_end:
+            pk_ranges.append((first_pk, pks.last()))
+            break
+
+        pk_ranges.append((first_pk, shard_end[0]))
+        last_pk = shard_end[0]
+
+    return pk_ranges
+
+
+def get_export_part_name(export_file_id: int, index: int, file_type: str) -> str:
+    return "{}/{}/part_{:05d}.{}".format(
+        EXPORT_PARTS_DIR, export_file_id, index, file_type
+    )
+
+
+def export_products_part(
+    scope: Dict[str, Union[str, dict]],
+    export_info: Dict[str, list],
+    pk_range: Tuple[int, int],
+    part_name: str,
+    file_type: str,
+    delimiter: str = ";",
+):
+    """Export products from the given pk range to a part file in the storage.
+
+    Part files have data headers and the requested file type, so XLSX cells keep
+    their types, and are concatenated into the final file by `merge_export_parts`.
+    """
+    start_pk, end_pk = pk_range
+    queryset = get_product_queryset(deepcopy(scope)).filter(
+        pk__gte=start_pk, pk__lte=end_pk
+    )
+
+    export_fields, _, data_headers = get_export_fields_and_headers_info(export_info)
+
+    temporary_file = create_file_with_headers(data_headers, delimiter, file_type)
+
+    export_products_in_batches(
+        queryset,
+        export_info,
+        set(export_fields),
+        data_headers,
+        delimiter,
+        temporary_file,
+        file_type,
+    )
+
+    temporary_file.seek(0)
+    default_storage.delete(part_name)
+    default_storage.save(part_name, File(temporary_file))
+    temporary_file.close()
+
+
+def merge_export_parts(
+    export_file: "ExportFile",
+    export_info: Dict[str, list],
+    part_names: List[str],
+    file_type: str,
+    delimiter: str = ";",
+):
+    """Concatenate part files created by `export_products_part` into the export file.
+
+    Part files are removed from the storage once the final file is saved.
+    """
+    file_name = get_filename("product", file_type)
+
+    _, file_headers, _ = get_export_fields_and_headers_info(export_info)
+
+    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+
+    for part_name in part_names:
+        with NamedTemporaryFile(suffix=f".{file_type}") as part_file:
+            with default_storage.open(part_name, "rb") as stored_part:
+                shutil.copyfileobj(stored_part, part_file)
+            part_file.flush()
+
+            if file_type == FileTypes.CSV:
+                table = etl.fromcsv(part_file.name, delimiter=delimiter)
+                etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
+            else:
+                table = etl.io.xlsx.fromxlsx(part_file.name)
+                etl.io.xlsx.appendxlsx(table, temporary_file.name)
+
+    save_csv_file_in_export_file(export_file, temporary_file, file_name)
+    temporary_file.close()
+
+    for part_name in part_names:
+        default_storage.delete(part_name)
+
+    send_export_download_link_notification(export_file)
+
+
 def export_products_in_batches(
     queryset: "QuerySet",
     export_info: Dict[str, list],
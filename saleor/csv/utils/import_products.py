@@ -0,0 +1,927 @@
+import csv
+import io
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+import graphene
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+from django.utils.text import slugify
+
+from ...attribute.models import AttributeProduct, AttributeVariant
+from ...channel.models import Channel
+from ...checkout.lines_cache import invalidate_checkout_lines_catalogue_version
+from ...product.models import (
+    Category,
+    Product,
+    ProductChannelListing,
+    ProductType,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from ...product.tasks import update_products_discounted_prices_task
+from ...warehouse.models import Stock, Warehouse
+from .. import events
+
+if TYPE_CHECKING:
+    # flake8: noqa
+    from ..models import ImportFile
+
+
+IMPORT_BATCH_SIZE = 1000
+# Maximal number of row errors stored in a single batch event.
+MAX_BATCH_ERRORS = 100
+
+# Columns use the headers of the product export file, see `product_headers.py`.
+PRODUCT_ID_HEADER = "id"
+PRODUCT_NAME_HEADER = "name"
+PRODUCT_TYPE_HEADER = "product type"
+CATEGORY_HEADER = "category"
+VARIANT_ID_HEADER = "variant id"
+VARIANT_SKU_HEADER = "variant sku"
+PRODUCT_FIELDS = {PRODUCT_NAME_HEADER: "name", "charge taxes": "charge_taxes"}
+VARIANT_FIELDS = {
+    VARIANT_SKU_HEADER: "sku",
+    "variant is preorder": "is_preorder",
+    "variant preorder global threshold": "preorder_global_threshold",
+}
+WAREHOUSE_QUANTITY_HEADER_SUFFIX = " (warehouse quantity)"
+CHANNEL_PRICE_HEADER_SUFFIX = " (channel price amount)"
+CHANNEL_COST_PRICE_HEADER_SUFFIX = " (channel variant cost price)"
+
+BOOLEAN_VALUES = {"true": True, "false": False}
+
+
+@dataclass
+class ImportColumns:
+    """Columns of the imported file which are handled by the import."""
+
+    product_fields: Dict[str, str] = field(default_factory=dict)
+    variant_fields: Dict[str, str] = field(default_factory=dict)
+    warehouses: Dict[str, Warehouse] = field(default_factory=dict)
+    channel_prices: Dict[str, Channel] = field(default_factory=dict)
+    channel_cost_prices: Dict[str, Channel] = field(default_factory=dict)
+    product_type: bool = False
+    category: bool = False
+
+    @property
+    def channels(self) -> Dict[int, Channel]:
+        return {
+            channel.pk: channel
+            for channel in [
+                *self.channel_prices.values(),
+                *self.channel_cost_prices.values(),
+            ]
+        }
+
+
+@dataclass
+class ImportRow:
+    row_number: int
+    product_pk: Optional[int] = None
+    variant_pk: Optional[int] = None
+    variant_sku: Optional[str] = None
+    product_type_name: Optional[str] = None
+    category_slug: Optional[str] = None
+    product_values: Dict[str, object] = field(default_factory=dict)
+    variant_values: Dict[str, object] = field(default_factory=dict)
+    quantities: Dict[int, int] = field(default_factory=dict)
+    prices: Dict[int, Decimal] = field(default_factory=dict)
+    cost_prices: Dict[int, Decimal] = field(default_factory=dict)
+
+    @property
+    def has_variant_data(self):
+        return bool(
+            self.variant_values or self.quantities or self.prices or self.cost_prices
+        )
+
+    @property
+    def product_slug(self) -> Optional[str]:
+        """Return the slug which identifies the product of a row without product id."""
+        name = self.product_values.get("name")
+        if self.product_pk or not name:
+            return None
+        return slugify(name, allow_unicode=True) or None
+
+
+@dataclass
+class ImportSummary:
+    rows: int = 0
+    products_created: int = 0
+    products_updated: int = 0
+    variants_created: int = 0
+    variants_updated: int = 0
+    stocks_created: int = 0
+    stocks_updated: int = 0
+    product_channel_listings_created: int = 0
+    channel_listings_created: int = 0
+    channel_listings_updated: int = 0
+    errors_count: int = 0
+    errors: List[Dict[str, object]] = field(default_factory=list)
+    repriced_product_ids: Set[int] = field(default_factory=set)
+
+    def add_error(self, row_number: int, message: str):
+        self.errors_count += 1
+        if len(self.errors) < MAX_BATCH_ERRORS:
+            self.errors.append({"row": row_number, "message": message})
+
+    def update(self, other: "ImportSummary"):
+        self.rows += other.rows
+        self.products_created += other.products_created
+        self.products_updated += other.products_updated
+        self.variants_created += other.variants_created
+        self.variants_updated += other.variants_updated
+        self.stocks_created += other.stocks_created
+        self.stocks_updated += other.stocks_updated
+        self.product_channel_listings_created += other.product_channel_listings_created
+        self.channel_listings_created += other.channel_listings_created
+        self.channel_listings_updated += other.channel_listings_updated
+        self.errors_count += other.errors_count
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "rows": self.rows,
+            "products_created": self.products_created,
+            "products_updated": self.products_updated,
+            "variants_created": self.variants_created,
+            "variants_updated": self.variants_updated,
+            "stocks_created": self.stocks_created,
+            "stocks_updated": self.stocks_updated,
+            "product_channel_listings_created": self.product_channel_listings_created,
+            "channel_listings_created": self.channel_listings_created,
+            "channel_listings_updated": self.channel_listings_updated,
+            "errors_count": self.errors_count,
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class BatchData:
+    """Database state of the objects referenced by a batch of rows."""
+
+    variants_by_pk: Dict[int, ProductVariant]
+    variants_by_sku: Dict[str, ProductVariant]
+    products_by_pk: Dict[int, Product]
+    products_by_slug: Dict[str, Product]
+    product_types: Dict[str, List[ProductType]]
+    categories: Dict[str, Category]
+    # Product types which cannot be used by imported products or variants, as they
+    # have attributes with required values.
+    product_attributes_required: Set[int]
+    variant_attributes_required: Set[int]
+    sku_owners: Dict[str, Optional[int]]
+    channel_listings: Dict[Tuple[int, int], ProductVariantChannelListing]
+
+
+def import_products(import_file: "ImportFile", delimiter: str = ";") -> ImportSummary:
+    """Import products data from the CSV file in the export file format.
+
+    The file is streamed and processed in batches of `IMPORT_BATCH_SIZE` rows.
+    Every batch is validated and saved with bulk queries in a single transaction,
+    then one `IMPORT_BATCH_PROCESSED` event is created for the whole batch.
+    Invalid rows are skipped and reported in the batch event.
+    """
+    summary = ImportSummary()
+
+    with import_file.content_file.open("rb") as content_file:
+        reader = csv.DictReader(
+            io.TextIOWrapper(content_file, encoding="utf-8-sig", newline=""),
+            delimiter=delimiter,
+        )
+        columns = get_import_columns(reader.fieldnames or [])
+
+        for rows in rows_in_batches(reader, IMPORT_BATCH_SIZE):
+            with transaction.atomic():
+                batch_summary = import_products_batch(rows, columns)
+
+            events.import_batch_processed_event(
+                import_file=import_file,
+                user=import_file.user,
+                app=import_file.app,
+                summary=batch_summary.as_dict(),
+            )
+            if batch_summary.repriced_product_ids:
+                update_products_discounted_prices_task.delay(
+                    sorted(batch_summary.repriced_product_ids)
+                )
+            summary.update(batch_summary)
+
+    return summary
+
+
+def rows_in_batches(
+    rows: Iterable[Dict[str, str]], batch_size: int
+) -> Iterator[List[Tuple[int, Dict[str, str]]]]:
+    """Yield batches of rows together with their numbers in the file.
+
+    The first row of data has number 2, as the first line contains headers.
+    """
+    numbered_rows = enumerate(rows, start=2)
+    while True:
+        batch = list(islice(numbered_rows, batch_size))
+        if not batch:
+            break
+        yield batch
+
+
+def get_import_columns(headers: List[str]) -> ImportColumns:
+    """Map file headers to product, variant, warehouse and channel columns.
+
+    Raise ValueError when the file cannot be imported, e.g. when there is no column
+    identifying rows or a header refers to a not existing warehouse or channel.
+    """
+    if not {PRODUCT_ID_HEADER, VARIANT_ID_HEADER, VARIANT_SKU_HEADER} & set(
+        headers
+    ) and not {PRODUCT_NAME_HEADER, PRODUCT_TYPE_HEADER} <= set(headers):
+        raise ValueError(
+            "The file must contain one of the columns: "
+            f'"{PRODUCT_ID_HEADER}", "{VARIANT_ID_HEADER}", "{VARIANT_SKU_HEADER}", '
+            f'or the "{PRODUCT_NAME_HEADER}" and "{PRODUCT_TYPE_HEADER}" columns.'
+        )
+
+    columns = ImportColumns()
+    warehouse_slugs: Dict[str, str] = {}
+    price_slugs: Dict[str, str] = {}
+    cost_price_slugs: Dict[str, str] = {}
+    for header in headers:
+        if header in PRODUCT_FIELDS:
+            columns.product_fields[header] = PRODUCT_FIELDS[header]
+        elif header == PRODUCT_TYPE_HEADER:
+            columns.product_type = True
+        elif header == CATEGORY_HEADER:
+            columns.category = True
+        elif header in VARIANT_FIELDS:
+            if header != VARIANT_SKU_HEADER or VARIANT_ID_HEADER in headers:
+                columns.variant_fields[header] = VARIANT_FIELDS[header]
+        elif header.endswith(WAREHOUSE_QUANTITY_HEADER_SUFFIX):
+            slug = header[: -len(WAREHOUSE_QUANTITY_HEADER_SUFFIX)]
+            warehouse_slugs[header] = slug
+        elif header.endswith(CHANNEL_PRICE_HEADER_SUFFIX):
+            price_slugs[header] = header[: -len(CHANNEL_PRICE_HEADER_SUFFIX)]
+        elif header.endswith(CHANNEL_COST_PRICE_HEADER_SUFFIX):
+            cost_price_slugs[header] = header[: -len(CHANNEL_COST_PRICE_HEADER_SUFFIX)]
+
+    if warehouse_slugs:
+        warehouses = Warehouse.objects.in_bulk(
+            set(warehouse_slugs.values()), field_name="slug"
+        )
+        columns.warehouses = _get_header_instances(
+            warehouse_slugs, warehouses, "warehouse"
+        )
+
+    if price_slugs or cost_price_slugs:
+        channels = Channel.objects.in_bulk(
+            {*price_slugs.values(), *cost_price_slugs.values()}, field_name="slug"
+        )
+        columns.channel_prices = _get_header_instances(price_slugs, channels, "channel")
+        columns.channel_cost_prices = _get_header_instances(
+            cost_price_slugs, channels, "channel"
+        )
+
+    return columns
+
+
+def _get_header_instances(header_slugs: Dict[str, str], instances: Mapping, name):
+    missing_slugs = set(header_slugs.values()) - set(instances)
+    if missing_slugs:
+        raise ValueError(
+            f"Unknown {name} slugs in headers: {', '.join(sorted(missing_slugs))}."
+        )
+    return {header: instances[slug] for header, slug in header_slugs.items()}
+
+
+def import_products_batch(
+    rows: List[Tuple[int, Dict[str, str]]], columns: ImportColumns
+) -> ImportSummary:
+    """Validate and save a batch of rows with a constant number of queries.
+
+    Rows are matched with products by id or by the slug of the product name, and
+    with variants by id or SKU. Products and variants which do not exist are created
+    with the stocks and channel listings from the row; new products are not
+    published in their channels.
+    """
+    summary = ImportSummary(rows=len(rows))
+
+    import_rows = []
+    for row_number, row in rows:
+        try:
+            import_rows.append(parse_row(row_number, row, columns))
+        except ValueError as e:
+            summary.add_error(row_number, str(e))
+
+    data = fetch_batch_data(import_rows, columns)
+
+    new_products: Dict[str, Product] = {}
+    new_variants: Dict[str, ProductVariant] = {}
+    products_to_update: Dict[int, Product] = {}
+    variants_to_update: Dict[int, ProductVariant] = {}
+    valid_rows: List[Tuple[ImportRow, Optional[ProductVariant]]] = []
+
+    for import_row in import_rows:
+        try:
+            if (
+                import_row.variant_pk
+                and import_row.variant_pk not in data.variants_by_pk
+            ):
+                raise ValueError("Variant does not exist.")
+            product = get_or_build_product(import_row, data, new_products)
+            variant = get_or_build_variant(import_row, product, data, new_variants)
+            category = _get_row_category(import_row, data)
+            validate_row(import_row, variant, data)
+        except ValueError as e:
+            summary.add_error(import_row.row_number, str(e))
+            continue
+
+        for field_name, value in import_row.product_values.items():
+            setattr(product, field_name, value)
+        if category:
+            product.category = category
+        if product.pk is None:
+            new_products[product.slug] = product
+        elif import_row.product_values or category:
+            products_to_update[product.pk] = product
+
+        if variant:
+            for field_name, value in import_row.variant_values.items():
+                setattr(variant, field_name, value)
+            if variant.pk is None:
+                new_variants[variant.sku] = variant  # type: ignore
+                data.sku_owners[variant.sku] = None  # type: ignore
+            elif import_row.variant_values:
+                if "sku" in import_row.variant_values:
+                    data.sku_owners[variant.sku] = variant.pk  # type: ignore
+                variants_to_update[variant.pk] = variant
+
+        valid_rows.append((import_row, variant))
+
+    create_products_and_variants(
+        list(new_products.values()), list(new_variants.values())
+    )
+
+    stocks_to_create: Dict[Tuple[int, int], Stock] = {}
+    stocks_to_update: Dict[Tuple[int, int], Stock] = {}
+    listings_to_create: Dict[Tuple[int, int], ProductVariantChannelListing] = {}
+    listings_to_update: Dict[Tuple[int, int], ProductVariantChannelListing] = {}
+    stocks = _fetch_stocks(data.variants_by_pk, columns) if valid_rows else {}
+    channels = columns.channels
+
+    for import_row, variant in valid_rows:
+        if not variant:
+            continue
+
+        for warehouse_pk, quantity in import_row.quantities.items():
+            key = (variant.pk, warehouse_pk)
+            if key in stocks:
+                stocks[key].quantity = quantity
+                stocks_to_update[key] = stocks[key]
+            elif key in stocks_to_create:
+                stocks_to_create[key].quantity = quantity
+            else:
+                stocks_to_create[key] = Stock(
+                    product_variant=variant,
+                    warehouse_id=warehouse_pk,
+                    quantity=quantity,
+                )
+
+        for channel_pk in {*import_row.prices, *import_row.cost_prices}:
+            key = (variant.pk, channel_pk)
+            listing = data.channel_listings.get(key) or listings_to_create.get(key)
+            if listing is None:
+                listing = ProductVariantChannelListing(
+                    variant=variant,
+                    channel_id=channel_pk,
+                    currency=channels[channel_pk].currency_code,
+                )
+                listings_to_create[key] = listing
+            elif listing.pk:
+                listings_to_update[key] = listing
+            if channel_pk in import_row.prices:
+                listing.price_amount = import_row.prices[channel_pk]
+                summary.repriced_product_ids.add(variant.product_id)
+            if channel_pk in import_row.cost_prices:
+                listing.cost_price_amount = import_row.cost_prices[channel_pk]
+
+    if products_to_update:
+        now = timezone.now()
+        for product in products_to_update.values():
+            product.updated_at = now
+        product_fields = set(columns.product_fields.values())
+        if columns.category:
+            product_fields.add("category")
+        Product.objects.bulk_update(
+            products_to_update.values(), ["updated_at", *product_fields]
+        )
+    if variants_to_update:
+        ProductVariant.objects.bulk_update(
+            variants_to_update.values(), list(set(columns.variant_fields.values()))
+        )
+    Stock.objects.bulk_create(stocks_to_create.values())
+    Stock.objects.bulk_update(stocks_to_update.values(), ["quantity"])
+    product_listings = create_product_channel_listings(
+        listings_to_create.values(), channels
+    )
+    ProductVariantChannelListing.objects.bulk_create(listings_to_create.values())
+    ProductVariantChannelListing.objects.bulk_update(
+        listings_to_update.values(), ["price_amount", "cost_price_amount"]
+    )
+    if products_to_update or variants_to_update or listings_to_update:
+        invalidate_checkout_lines_catalogue_version()
+
+    summary.products_created = len(new_products)
+    summary.products_updated = len(products_to_update)
+    summary.variants_created = len(new_variants)
+    summary.variants_updated = len(variants_to_update)
+    summary.stocks_created = len(stocks_to_create)
+    summary.stocks_updated = len(stocks_to_update)
+    summary.product_channel_listings_created = len(product_listings)
+    summary.channel_listings_created = len(listings_to_create)
+    summary.channel_listings_updated = len(listings_to_update)
+    return summary
+
+
+def fetch_batch_data(import_rows: List[ImportRow], columns: ImportColumns) -> BatchData:
+    """Fetch objects referenced by the batch rows with a constant number of queries."""
+    variants_by_pk, variants_by_sku = _fetch_variants(import_rows)
+    for import_row in import_rows:
+        variant = _get_row_variant(import_row, variants_by_pk, variants_by_sku)
+        if variant and import_row.product_pk is None:
+            import_row.product_pk = variant.product_id
+
+    products_by_pk, products_by_slug = _fetch_products(import_rows)
+
+    product_types: Dict[str, List[ProductType]] = defaultdict(list)
+    type_names = {row.product_type_name for row in import_rows if row.product_type_name}
+    if type_names:
+        for product_type in ProductType.objects.filter(name__in=type_names):
+            product_types[product_type.name].append(product_type)
+
+    category_slugs = {row.category_slug for row in import_rows if row.category_slug}
+    categories = (
+        Category.objects.in_bulk(category_slugs, field_name="slug")
+        if category_slugs
+        else {}
+    )
+
+    # Product types of new products and of products which may get new variants.
+    product_type_pks = {
+        product_type.pk for types in product_types.values() for product_type in types
+    }
+    for import_row in import_rows:
+        if not import_row.variant_sku or import_row.variant_sku in variants_by_sku:
+            continue
+        if import_row.product_pk:
+            product = products_by_pk.get(import_row.product_pk)
+        else:
+            product = products_by_slug.get(import_row.product_slug or "")
+        if product:
+            product_type_pks.add(product.product_type_id)
+
+    variant_pks = list(variants_by_pk)
+    channel_listings = {
+        (listing.variant_id, listing.channel_id): listing
+        for listing in ProductVariantChannelListing.objects.filter(
+            variant_id__in=variant_pks, channel_id__in=list(columns.channels)
+        )
+    }
+    new_skus = {
+        row.variant_values["sku"]
+        for row in import_rows
+        if row.variant_values.get("sku")
+    }
+    sku_owners: Dict[str, Optional[int]] = dict(
+        ProductVariant.objects.filter(sku__in=new_skus).values_list("sku", "pk")
+    )
+
+    return BatchData(
+        variants_by_pk=variants_by_pk,
+        variants_by_sku=variants_by_sku,
+        products_by_pk=products_by_pk,
+        products_by_slug=products_by_slug,
+        product_types=product_types,
+        categories=categories,
+        product_attributes_required=_get_product_types_with_required_attributes(
+            AttributeProduct, product_type_pks
+        ),
+        variant_attributes_required=_get_product_types_with_required_attributes(
+            AttributeVariant, product_type_pks
+        ),
+        sku_owners=sku_owners,
+        channel_listings=channel_listings,
+    )
+
+
+def get_or_build_product(
+    import_row: ImportRow, data: BatchData, new_products: Dict[str, Product]
+) -> Product:
+    """Return the product of the row, or a new unsaved product built from the row.
+
+    Raise ValueError when the row does not identify a product and cannot create one.
+    """
+    if import_row.product_pk:
+        product = data.products_by_pk.get(import_row.product_pk)
+        if not product:
+            raise ValueError("Product does not exist.")
+        return product
+
+    slug = import_row.product_slug
+    if not slug:
+        if import_row.product_values.get("name"):
+            raise ValueError("Cannot generate a product slug from the product name.")
+        raise ValueError("Product id or product name is required.")
+    product = data.products_by_slug.get(slug) or new_products.get(slug)
+    if product:
+        return product
+
+    if not import_row.product_type_name:
+        raise ValueError("Product type is required for a new product.")
+    product_types = data.product_types.get(import_row.product_type_name, [])
+    if not product_types:
+        raise ValueError(
+            f'Product type "{import_row.product_type_name}" does not exist.'
+        )
+    if len(product_types) > 1:
+        raise ValueError(
+            f'Product type name "{import_row.product_type_name}" is not unique.'
+        )
+    product_type = product_types[0]
+    if product_type.pk in data.product_attributes_required:
+        raise ValueError(
+            "Product type has required product attributes, which cannot be imported."
+        )
+    return Product(slug=slug, product_type=product_type)
+
+
+def get_or_build_variant(
+    import_row: ImportRow,
+    product: Product,
+    data: BatchData,
+    new_variants: Dict[str, ProductVariant],
+) -> Optional[ProductVariant]:
+    """Return the variant of the row, or a new unsaved variant built from the row.
+
+    New variants can be created only for rows identified by the variant SKU.
+    Raise ValueError when the variant cannot be created.
+    """
+    variant = _get_row_variant(import_row, data.variants_by_pk, data.variants_by_sku)
+    if variant or not import_row.variant_sku:
+        return variant
+
+    sku = import_row.variant_sku
+    variant = new_variants.get(sku)
+    if variant:
+        if variant.product is not product:
+            raise ValueError("Variant does not belong to the product.")
+        return variant
+
+    product_type = product.product_type
+    if product_type.pk in data.variant_attributes_required:
+        raise ValueError(
+            "Product type has required variant attributes, which cannot be imported."
+        )
+    has_variant = product.default_variant_id or any(
+        new_variant.product is product for new_variant in new_variants.values()
+    )
+    if not product_type.has_variants and has_variant:
+        raise ValueError("Product type does not allow multiple variants.")
+    if sku in data.sku_owners:
+        raise ValueError(f'Variant with SKU "{sku}" already exists.')
+    return ProductVariant(product=product, sku=sku)
+
+
+def create_products_and_variants(
+    products: List[Product], variants: List[ProductVariant]
+):
+    """Save new products and variants built from the batch rows.
+
+    Variants are placed after the existing variants of their products, and the
+    first variant of a product without variants becomes its default variant.
+    """
+    Product.objects.bulk_create(products)
+    if not variants:
+        return
+
+    for variant in variants:
+        # Assign the product again, now that it has a primary key.
+        variant.product = variant.product
+
+    max_sort_orders = dict(
+        ProductVariant.objects.filter(
+            product_id__in={variant.product_id for variant in variants}
+        )
+        .values("product_id")
+        .annotate(max_sort_order=Max("sort_order"))
+        .values_list("product_id", "max_sort_order")
+    )
+    for variant in variants:
+        max_sort_order = max_sort_orders.get(variant.product_id)
+        variant.sort_order = 0 if max_sort_order is None else max_sort_order + 1
+        max_sort_orders[variant.product_id] = variant.sort_order
+    ProductVariant.objects.bulk_create(variants)
+
+    products_to_update = {}
+    for variant in variants:
+        product = variant.product
+        if not product.default_variant_id:
+            product.default_variant = variant
+            products_to_update[product.pk] = product
+    Product.objects.bulk_update(products_to_update.values(), ["default_variant"])
+
+
+def create_product_channel_listings(
+    variant_listings: Iterable[ProductVariantChannelListing],
+    channels: Dict[int, Channel],
+) -> List[ProductChannelListing]:
+    """Create missing product listings in channels of the new variant listings."""
+    product_channels = {
+        (listing.variant.product_id, listing.channel_id) for listing in variant_listings
+    }
+    if not product_channels:
+        return []
+
+    existing_product_channels = set(
+        ProductChannelListing.objects.filter(
+            product_id__in={product_pk for product_pk, _ in product_channels},
+            channel_id__in={channel_pk for _, channel_pk in product_channels},
+        ).values_list("product_id", "channel_id")
+    )
+    product_listings = [
+        ProductChannelListing(
+            product_id=product_pk,
+            channel_id=channel_pk,
+            currency=channels[channel_pk].currency_code,
+        )
+        for product_pk, channel_pk in sorted(
+            product_channels - existing_product_channels
+        )
+    ]
+    return ProductChannelListing.objects.bulk_create(product_listings)
+
+
+def parse_row(row_number: int, row: Dict[str, str], columns: ImportColumns):
+    """Convert a raw CSV row to the import row.
+
+    Empty cells are skipped; the export file fills missing values with a space.
+    Raise ValueError when any of cell values is invalid.
+    """
+    import_row = ImportRow(row_number=row_number)
+
+    product_id = _get_value(row, PRODUCT_ID_HEADER)
+    if product_id:
+        import_row.product_pk = _parse_global_id(product_id, "Product")
+    variant_id = _get_value(row, VARIANT_ID_HEADER)
+    if variant_id:
+        import_row.variant_pk = _parse_global_id(variant_id, "ProductVariant")
+    else:
+        import_row.variant_sku = _get_value(row, VARIANT_SKU_HEADER)
+        if import_row.variant_sku:
+            _validate_value(
+                ProductVariant, "sku", import_row.variant_sku, VARIANT_SKU_HEADER
+            )
+    if columns.product_type:
+        import_row.product_type_name = _get_value(row, PRODUCT_TYPE_HEADER)
+    if columns.category:
+        import_row.category_slug = _get_value(row, CATEGORY_HEADER)
+
+    for header, field_name in columns.product_fields.items():
+        value = _get_value(row, header)
+        if value is None:
+            continue
+        if field_name == "charge_taxes":
+            import_row.product_values[field_name] = _parse_bool(value, header)
+        else:
+            import_row.product_values[field_name] = _validate_value(
+                Product, field_name, value, header
+            )
+
+    for header, field_name in columns.variant_fields.items():
+        value = _get_value(row, header)
+        if value is None:
+            continue
+        if field_name == "is_preorder":
+            import_row.variant_values[field_name] = _parse_bool(value, header)
+        elif field_name == "preorder_global_threshold":
+            import_row.variant_values[field_name] = _validate_value(
+                ProductVariant, field_name, _parse_int(value, header), header
+            )
+        else:
+            import_row.variant_values[field_name] = _validate_value(
+                ProductVariant, field_name, value, header
+            )
+
+    for header, warehouse in columns.warehouses.items():
+        value = _get_value(row, header)
+        if value is not None:
+            import_row.quantities[warehouse.pk] = _validate_value(
+                Stock, "quantity", _parse_int(value, header), header
+            )
+
+    for header, channel in columns.channel_prices.items():
+        value = _get_value(row, header)
+        if value is not None:
+            import_row.prices[channel.pk] = _validate_value(
+                ProductVariantChannelListing,
+                "price_amount",
+                _parse_decimal(value, header),
+                header,
+            )
+
+    for header, channel in columns.channel_cost_prices.items():
+        value = _get_value(row, header)
+        if value is not None:
+            import_row.cost_prices[channel.pk] = _validate_value(
+                ProductVariantChannelListing,
+                "cost_price_amount",
+                _parse_decimal(value, header),
+                header,
+            )
+
+    if import_row.has_variant_data and not (
+        import_row.variant_pk or import_row.variant_sku
+    ):
+        raise ValueError("Variant id or variant SKU is required.")
+    if not import_row.has_variant_data and not (
+        import_row.product_pk
+        or import_row.variant_pk
+        or import_row.variant_sku
+        or import_row.product_values.get("name")
+    ):
+        raise ValueError("Product id or product name is required.")
+    return import_row
+
+
+def validate_row(
+    import_row: ImportRow, variant: Optional[ProductVariant], data: BatchData
+):
+    """Validate the row against the current database state.
+
+    Raise ValueError when the row cannot be saved.
+    """
+    if (
+        variant
+        and variant.pk
+        and import_row.product_pk
+        and variant.product_id != import_row.product_pk
+    ):
+        raise ValueError("Variant does not belong to the product.")
+
+    if not variant:
+        return
+
+    sku = import_row.variant_values.get("sku")
+    if sku and data.sku_owners.get(sku, variant.pk) != variant.pk:  # type: ignore
+        raise ValueError(f'Variant with SKU "{sku}" already exists.')
+
+    for channel_pk in import_row.cost_prices:
+        if (
+            variant.pk,
+            channel_pk,
+        ) not in data.channel_listings and channel_pk not in import_row.prices:
+            raise ValueError("Price is required for a new channel listing.")
+
+
+def _fetch_variants(
+    import_rows: List[ImportRow],
+) -> Tuple[Dict[int, ProductVariant], Dict[str, ProductVariant]]:
+    pks = {row.variant_pk for row in import_rows if row.variant_pk}
+    skus = {row.variant_sku for row in import_rows if row.variant_sku}
+    if not pks and not skus:
+        return {}, {}
+    variants = ProductVariant.objects.filter(Q(pk__in=pks) | Q(sku__in=skus))
+    variants_by_pk = {variant.pk: variant for variant in variants}
+    variants_by_sku = {
+        variant.sku: variant for variant in variants_by_pk.values() if variant.sku
+    }
+    return variants_by_pk, variants_by_sku
+
+
+def _fetch_products(
+    import_rows: List[ImportRow],
+) -> Tuple[Dict[int, Product], Dict[str, Product]]:
+    pks = {row.product_pk for row in import_rows if row.product_pk}
+    slugs = {row.product_slug for row in import_rows if row.product_slug}
+    if not pks and not slugs:
+        return {}, {}
+    products = Product.objects.filter(Q(pk__in=pks) | Q(slug__in=slugs)).select_related(
+        "product_type"
+    )
+    products_by_pk = {product.pk: product for product in products}
+    products_by_slug = {product.slug: product for product in products_by_pk.values()}
+    return products_by_pk, products_by_slug
+
+
+def _fetch_stocks(
+    variants_by_pk: Dict[int, ProductVariant], columns: ImportColumns
+) -> Dict[Tuple[int, int], Stock]:
+    return {
+        (stock.product_variant_id, stock.warehouse_id): stock
+        for stock in Stock.objects.filter(
+            product_variant_id__in=list(variants_by_pk),
+            warehouse_id__in=[w.pk for w in columns.warehouses.values()],
+        )
+    }
+
+
+def _get_product_types_with_required_attributes(
+    assignment_model: Type[models.Model], product_type_pks: Set[int]
+) -> Set[int]:
+    if not product_type_pks:
+        return set()
+    return set(
+        assignment_model.objects.filter(  # type: ignore
+            product_type_id__in=product_type_pks, attribute__value_required=True
+        ).values_list("product_type_id", flat=True)
+    )
+
+
+def _get_row_variant(
+    import_row: ImportRow,
+    variants_by_pk: Dict[int, ProductVariant],
+    variants_by_sku: Dict[str, ProductVariant],
+) -> Optional[ProductVariant]:
+    if import_row.variant_pk:
+        return variants_by_pk.get(import_row.variant_pk)
+    if import_row.variant_sku:
+        return variants_by_sku.get(import_row.variant_sku)
+    return None
+
+
+def _get_row_category(import_row: ImportRow, data: BatchData) -> Optional[Category]:
+    if not import_row.category_slug:
+        return None
+    category = data.categories.get(import_row.category_slug)
+    if not category:
+        raise ValueError(f'Category "{import_row.category_slug}" does not exist.')
+    return category
+
+
+def _get_value(row: Dict[str, str], header: str) -> Optional[str]:
+    value = row.get(header)
+    if value is None or not value.strip():
+        return None
+    return value.strip()
+
+
+def _validate_value(model: Type[models.Model], field_name: str, value, header: str):
+    """Run validators of the model field, e.g. max length or max digits checks."""
+    try:
+        model._meta.get_field(field_name).run_validators(value)
+    except ValidationError as e:
+        raise ValueError(
+            f'Invalid value "{value}" in column "{header}": {" ".join(e.messages)}'
+        )
+    return value
+
+
+def _parse_global_id(value: str, type_name: str) -> int:
+    try:
+        graphene_type, pk = graphene.Node.from_global_id(value)
+    except Exception:
+        graphene_type, pk = None, None
+    if graphene_type != type_name or not pk or not pk.isdigit():
+        raise ValueError(f'Invalid {type_name} id "{value}".')
+    return int(pk)
+
+
+def _parse_bool(value: str, header: str) -> bool:
+    try:
+        return BOOLEAN_VALUES[value.lower()]
+    except KeyError:
+        raise ValueError(f'Invalid boolean value "{value}" in column "{header}".')
+
+
+def _parse_int(value: str, header: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f'Invalid integer value "{value}" in column "{header}".')
+    if number < 0:
+        raise ValueError(f'Value in column "{header}" cannot be negative.')
+    return number
+
+
+def _parse_decimal(value: str, header: str) -> Decimal:
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f'Invalid decimal value "{value}" in column "{header}".')
+    if not number.is_finite():
+        raise ValueError(f'Invalid decimal value "{value}" in column "{header}".')
+    if number < 0:
+        raise ValueError(f'Value in column "{header}" cannot be negative.')
+    return number
@@ -0,0 +1,85 @@
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+from prices import Money
+
+from ....channel.models import Channel
+from ... import DiscountInfo, DiscountValueType
+from ...models import Sale, SaleChannelListing
+from ...utils import DiscountInfoList, calculate_discounted_price
+
+CHANNEL_SLUG = "benchmark"
+
+
+def get_discounts(sales_count: int):
+    return [
+        DiscountInfo(
+            sale=Sale(pk=sale_id, type=DiscountValueType.FIXED),
+            channel_listings={
+                CHANNEL_SLUG: SaleChannelListing(
+                    discount_value=Decimal(sale_id % 7 + 1), currency="USD"
+                )
+            },
+            product_ids=set(range(sale_id * 10, sale_id * 10 + 10)),
+            category_ids={sale_id % 100},
+            collection_ids={sale_id % 50},
+            variants_ids=set(),
+        )
+        for sale_id in range(sales_count)
+    ]
+
+
+def get_products(products_count: int):
+    collections = [SimpleNamespace(id=collection_id) for collection_id in range(60)]
+    return [
+        (
+            SimpleNamespace(id=product_id, category_id=product_id % 150),
+            [collections[product_id % 60]],
+        )
+        for product_id in range(products_count)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the time of calculating discounted prices of products with the "
+        "discounts index and with a scan of all discounts. Runs in memory only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sales", type=int, default=1000)
+        parser.add_argument("--products", type=int, default=10000)
+        parser.add_argument(
+            "--scan-sample",
+            type=int,
+            default=50,
+            help="Scan the discounts for every n-th product only, as it is slow.",
+        )
+
+    def measure(self, products, discounts) -> float:
+        """Return the mean time of calculating the price of a product, in seconds."""
+        channel = Channel(slug=CHANNEL_SLUG)
+        price = Money(100, "USD")
+        start = time.perf_counter()
+        for product, collections in products:
+            calculate_discounted_price(
+                product=product,
+                price=price,
+                collections=collections,
+                discounts=discounts,
+                channel=channel,
+            )
+        return (time.perf_counter() - start) / max(len(products), 1)
+
+    def handle(self, *args, **options):
+        discounts = get_discounts(options["sales"])
+        products = get_products(options["products"])
+        indexed_time = self.measure(products, DiscountInfoList(discounts))
+        scanned_time = self.measure(products[:: options["scan_sample"]], discounts)
+        self.stdout.write(
+            f"{options['sales']} sales, {options['products']} products; time per "
+            f"product: indexed {indexed_time * 1e6:.1f}us, "
+            f"scan {scanned_time * 1e6:.1f}us"
+        )
@@ -0,0 +1,191 @@
+import io
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.core.management import call_command
+from prices import Money
+
+from ...channel.models import Channel
+from .. import DiscountInfo, DiscountValueType
+from ..models import Sale, SaleChannelListing
+from ..utils import (
+    DiscountInfoList,
+    DiscountsIndex,
+    calculate_discounted_price,
+    get_discounts_index,
+)
+
+
+def _get_discount_info(
+    sale_id,
+    channel_slugs=("main",),
+    product_ids=(),
+    category_ids=(),
+    collection_ids=(),
+    variants_ids=(),
+    discount_value=Decimal(1),
+):
+    sale = Sale(pk=sale_id, type=DiscountValueType.FIXED)
+    return DiscountInfo(
+        sale=sale,
+        channel_listings={
+            slug: SaleChannelListing(discount_value=discount_value, currency="USD")
+            for slug in channel_slugs
+        },
+        product_ids=set(product_ids),
+        category_ids=set(category_ids),
+        collection_ids=set(collection_ids),
+        variants_ids=set(variants_ids),
+    )
+
+
+def test_discounts_index_get_discounts():
+    # given
+    discounts = [
+        _get_discount_info(1, product_ids=[10], discount_value=Decimal(1)),
+        _get_discount_info(2, category_ids=[20], discount_value=Decimal(2)),
+        _get_discount_info(3, collection_ids=[30], discount_value=Decimal(3)),
+        _get_discount_info(4, variants_ids=[40], discount_value=Decimal(4)),
+        _get_discount_info(5, product_ids=[11], discount_value=Decimal(5)),
+    ]
+    index = DiscountsIndex(discounts)
+    price = Money(10, "USD")
+
+    # when
+    discount_functions = index.get_discounts(
+        "main", product_id=10, category_id=20, collection_ids={30}, variant_id=40
+    )
+
+    # then
+    assert [discount(price) for discount in discount_functions] == [
+        Money(9, "USD"),
+        Money(8, "USD"),
+        Money(7, "USD"),
+        Money(6, "USD"),
+    ]
+
+
+def test_discounts_index_get_discounts_matching_many_entities_returned_once():
+    # given
+    discounts = [_get_discount_info(1, product_ids=[10], category_ids=[20])]
+    index = DiscountsIndex(discounts)
+
+    # when
+    discount_functions = index.get_discounts(
+        "main", product_id=10, category_id=20, collection_ids=set()
+    )
+
+    # then
+    assert len(discount_functions) == 1
+
+
+def test_discounts_index_get_discounts_other_channel():
+    # given
+    discounts = [_get_discount_info(1, channel_slugs=["main"], product_ids=[10])]
+    index = DiscountsIndex(discounts)
+
+    # when
+    discount_functions = index.get_discounts(
+        "other", product_id=10, category_id=None, collection_ids=set()
+    )
+
+    # then
+    assert discount_functions == []
+
+
+def test_get_discounts_index_reuses_index_of_discount_info_list():
+    # given
+    discounts = DiscountInfoList([_get_discount_info(1, product_ids=[10])])
+
+    # when
+    index = get_discounts_index(discounts)
+
+    # then
+    assert index is get_discounts_index(discounts)
+
+
+def test_discounts_index_looks_up_only_ids_of_the_product():
+    # given
+    discounts = [
+        _get_discount_info(sale_id, product_ids=[sale_id], category_ids=[sale_id])
+        for sale_id in range(100)
+    ]
+    index = DiscountsIndex(discounts)
+    looked_up_keys = []
+    positions = index._positions
+
+    class RecordingPositions(dict):
+        def get(self, key, default=None):
+            looked_up_keys.append(key)
+            return positions.get(key, default)
+
+    index._positions = RecordingPositions()
+
+    # when
+    discount_functions = index.get_discounts(
+        "main", product_id=10, category_id=20, collection_ids={30}, variant_id=40
+    )
+
+    # then
+    assert len(discount_functions) == 2
+    assert sorted(looked_up_keys) == [
+        ("main", "category", 20),
+        ("main", "collection", 30),
+        ("main", "product", 10),
+        ("main", "variant", 40),
+    ]
+
+
+def test_calculate_discounted_price_with_index_matches_scan():
+    # given
+    discounts = [
+        _get_discount_info(
+            sale_id,
+            product_ids=range(sale_id * 10, sale_id * 10 + 10),
+            category_ids=[sale_id % 20],
+            collection_ids=[sale_id % 10],
+            discount_value=Decimal(sale_id % 7 + 1),
+        )
+        for sale_id in range(100)
+    ]
+    channel = Channel(slug="main")
+    collections = [SimpleNamespace(id=collection_id) for collection_id in range(15)]
+    products = [
+        (
+            SimpleNamespace(id=product_id, category_id=product_id % 30),
+            [collections[product_id % 15]],
+        )
+        for product_id in range(1000)
+    ]
+    price = Money(100, "USD")
+
+    def calculate(discounts):
+        return [
+            calculate_discounted_price(
+                product=product,
+                price=price,
+                collections=product_collections,
+                discounts=discounts,
+                channel=channel,
+            )
+            for product, product_collections in products
+        ]
+
+    # when
+    indexed_prices = calculate(DiscountInfoList(discounts))
+    scanned_prices = calculate(discounts)
+
+    # then
+    assert indexed_prices == scanned_prices
+    assert any(indexed_price != price for indexed_price in indexed_prices)
+
+
+def test_benchmark_discounts_command():
+    # given
+    out = io.StringIO()
+
+    # when
+    call_command("benchmark_discounts", sales=10, products=100, stdout=out)
+
+    # then
+    assert "10 sales, 100 products" in out.getvalue()
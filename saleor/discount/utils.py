@@ -1,9 +1,20 @@
 import datetime
 from collections import defaultdict
-from typing import TYPE_CHECKING, DefaultDict, Dict, Iterable, List, Optional, Set
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from django.db.models import F
 from django.utils import timezone
+from django.utils.functional import cached_property
 from prices import Money, TaxedMoney
 
 from ..channel.models import Channel
@@ -52,6 +63,89 @@ def remove_voucher_usage_by_customer(voucher: "Voucher", customer_email: str) ->
         voucher_customer.delete()
 
 
+class DiscountsIndex:
+    """Inverted index from catalogue entities to the discounts applicable to them.
+
+    Discount functions are built once per channel, so finding the discounts of a
+    product takes a few dict lookups instead of checking the catalogue of every
+    discount.
+    """
+
+    PRODUCT = "product"
+    CATEGORY = "category"
+    COLLECTION = "collection"
+    VARIANT = "variant"
+
+    def __init__(self, discounts: Iterable[DiscountInfo]):
+        self._discount_functions: Dict[
+            str, List[Callable[[Money], Money]]
+        ] = defaultdict(list)
+        self._positions: Dict[Tuple[str, str, int], List[int]] = defaultdict(list)
+        for discount in discounts:
+            for channel_slug, channel_listing in discount.channel_listings.items():
+                try:
+                    discount_function = discount.sale.get_discount(  # type: ignore
+                        channel_listing
+                    )
+                except NotApplicable:
+                    continue
+                channel_functions = self._discount_functions[channel_slug]
+                position = len(channel_functions)
+                channel_functions.append(discount_function)
+                for entity, ids in [
+                    (self.PRODUCT, discount.product_ids),
+                    (self.CATEGORY, discount.category_ids),
+                    (self.COLLECTION, discount.collection_ids),
+                    (self.VARIANT, discount.variants_ids),
+                ]:
+                    for id_ in ids:
+                        self._positions[(channel_slug, entity, id_)].append(position)
+
+    def get_discounts(
+        self,
+        channel_slug: str,
+        product_id: int,
+        category_id: Optional[int],
+        collection_ids: Iterable[int],
+        variant_id: Optional[int] = None,
+    ) -> List[Callable[[Money], Money]]:
+        """Return functions of discounts applicable to the product in the channel."""
+        channel_functions = self._discount_functions.get(channel_slug)
+        if not channel_functions:
+            return []
+        keys = [
+            (channel_slug, self.PRODUCT, product_id),
+            (channel_slug, self.CATEGORY, category_id),
+        ]
+        keys.extend(
+            (channel_slug, self.COLLECTION, collection_id)
+            for collection_id in collection_ids
+        )
+        if variant_id:
+            keys.append((channel_slug, self.VARIANT, variant_id))
+        positions: Set[int] = set()
+        for key in keys:
+            positions.update(self._positions.get(key, ()))
+        return [channel_functions[position] for position in sorted(positions)]
+
+
+class DiscountInfoList(list):
+    """List of discounts with the inverted index of their catalogues.
+
+    The index is built on first use; the list is not expected to change later.
+    """
+
+    @cached_property
+    def index(self) -> DiscountsIndex:
+        return DiscountsIndex(self)
+
+
+def get_discounts_index(discounts: Iterable[DiscountInfo]) -> DiscountsIndex:
+    if isinstance(discounts, DiscountInfoList):
+        return discounts.index
+    return DiscountsIndex(discounts)
+
+
 def get_product_discount_on_sale(
     product: "Product",
     product_collections: Set[int],
@@ -82,6 +176,15 @@ def get_product_discounts(
 ) -> Money:
     """Return discount values for all discounts applicable to a product."""
     product_collections = set(pc.id for pc in collections)
+    if isinstance(discounts, DiscountInfoList):
+        yield from discounts.index.get_discounts(
+            channel.slug,
+            product.id,
+            product.category_id,
+            product_collections,
+            variant_id=variant_id,
+        )
+        return
     for discount in discounts or []:
         try:
             yield get_product_discount_on_sale(
@@ -185,7 +288,7 @@ def get_products_voucher_discount(
 
 
 def fetch_categories(sale_pks: Iterable[str]) -> Dict[int, Set[int]]:
-    from ..product.models import Category
+    from ..product.category_tree import get_category_tree
 
     categories = (
         Sale.categories.through.objects.filter(sale_id__in=sale_pks)
@@ -196,12 +299,9 @@ def fetch_categories(sale_pks: Iterable[str]) -> Dict[int, Set[int]]:
     for sale_pk, category_pk in categories:
         category_map[sale_pk].add(category_pk)
     subcategory_map: Dict[int, Set[int]] = defaultdict(set)
+    category_tree = get_category_tree()
     for sale_pk, category_pks in category_map.items():
-        subcategory_map[sale_pk] = set(
-            Category.tree.filter(pk__in=category_pks)
-            .get_descendants(include_self=True)
-            .values_list("pk", flat=True)
-        )
+        subcategory_map[sale_pk] = category_tree.get_descendant_ids_of(category_pks)
     return subcategory_map
 
 
@@ -263,7 +363,7 @@ def fetch_discounts(date: datetime.date) -> List[DiscountInfo]:
     categories = fetch_categories(pks)
     variants = fetch_variants(pks)
 
-    return [
+    return DiscountInfoList(
         DiscountInfo(
             sale=sale,
             category_ids=categories[sale.pk],
@@ -273,7 +373,7 @@ def fetch_discounts(date: datetime.date) -> List[DiscountInfo]:
             variants_ids=variants[sale.pk],
         )
         for sale in sales
-    ]
+    )
 
 
 def fetch_active_discounts() -> List[DiscountInfo]:
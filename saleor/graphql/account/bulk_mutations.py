@@ -5,6 +5,7 @@ from django.core.exceptions import ValidationError
 
 from ...account import models
 from ...account.error_codes import AccountErrorCode
+from ...core.jwt import invalidate_user_auth_cache
 from ...core.permissions import AccountPermissions
 from ..core.mutations import BaseBulkMutation, ModelBulkDeleteMutation
 from ..core.types.common import AccountError, StaffError
@@ -110,3 +111,4 @@ class UserBulkSetActive(BaseBulkMutation):
     @classmethod
     def bulk_action(cls, info, queryset, is_active):
         queryset.update(is_active=is_active)
+        invalidate_user_auth_cache(queryset.values_list("pk", flat=True))
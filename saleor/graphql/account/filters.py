@@ -1,7 +1,11 @@
+from datetime import datetime, time
+
 import django_filters
-from django.db.models import Count, Exists, OuterRef, Q
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
 
-from ...account.models import Address, User
+from ...account.models import User
+from ...order.models import Order
 from ..core.filters import EnumFilter, MetadataFilterBase, ObjectTypeFilter
 from ..core.types.common import DateRangeInput, IntRangeInput
 from ..utils.filters import filter_range_field
@@ -13,12 +17,22 @@ def filter_date_joined(qs, _, value):
 
 
 def filter_number_of_orders(qs, _, value):
-    qs = qs.annotate(total_orders=Count("orders"))
-    return filter_range_field(qs, "total_orders", value)
+    return filter_range_field(qs, "order_count", value)
 
 
 def filter_placed_orders(qs, _, value):
-    return filter_range_field(qs, "orders__created__date", value)
+    gte, lte = value.get("gte"), value.get("lte")
+    if gte:
+        # users with any order placed since the date are the ones whose last order
+        # was placed since then; comparing datetimes allows using the index
+        qs = qs.filter(
+            last_order_date__gte=timezone.make_aware(datetime.combine(gte, time.min))
+        )
+    if lte:
+        orders = Order.objects.non_draft().filter(user_id=OuterRef("pk"))
+        orders = filter_range_field(orders, "created__date", value)
+        qs = qs.filter(Q(order_count__gt=0) & Exists(orders))
+    return qs
 
 
 def filter_staff_status(qs, _, value):
@@ -31,23 +45,7 @@ def filter_staff_status(qs, _, value):
 
 def filter_user_search(qs, _, value):
     if value:
-        UserAddress = User.addresses.through
-        addresses = Address.objects.filter(
-            Q(first_name__ilike=value)
-            | Q(last_name__ilike=value)
-            | Q(city__ilike=value)
-            | Q(country__ilike=value)
-            | Q(phone=value)
-        ).values("id")
-        user_addresses = UserAddress.objects.filter(
-            Exists(addresses.filter(pk=OuterRef("address_id")))
-        ).values("user_id")
-        qs = qs.filter(
-            Q(email__ilike=value)
-            | Q(first_name__ilike=value)
-            | Q(last_name__ilike=value)
-            | Q(Exists(user_addresses.filter(user_id=OuterRef("pk"))))
-        )
+        qs = qs.filter(search_document__ilike=value)
     return qs
 
 
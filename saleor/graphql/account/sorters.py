@@ -1,5 +1,4 @@
 import graphene
-from django.db.models import Count, QuerySet
 
 from ..core.types import SortInputObjectType
 
@@ -17,10 +16,6 @@ class UserSortField(graphene.Enum):
             return f"Sort users by {sort_name}."
         raise ValueError("Unsupported enum value: %s" % self.value)
 
-    @staticmethod
-    def qs_with_order_count(queryset: QuerySet, **_kwargs) -> QuerySet:
-        return queryset.annotate(order_count=Count("orders__id"))
-
 
 class UserSortingInput(SortInputObjectType):
     class Meta:
@@ -19,6 +19,8 @@ from ....account import events as account_events
 from ....account.error_codes import AccountErrorCode
 from ....account.models import Address, User
 from ....account.notifications import get_default_user_payload
+from ....account.order_stats import update_users_order_stats
+from ....account.search import update_users_search_documents
 from ....checkout import AddressType
 from ....core.jwt import create_token
 from ....core.notify_events import NotifyEventType
@@ -4361,6 +4363,7 @@ def test_query_customers_with_filter_placed_orders_(
             Order(user=customer_user, token=str(uuid.uuid4()), channel=channel_USD),
         ]
     )
+    update_users_order_stats([customer_user.pk])
     second_customer = User.objects.create(email="second_example@example.com")
     with freeze_time("2012-01-14 11:00:00"):
         Order.objects.create(user=second_customer, channel=channel_USD)
@@ -4519,6 +4522,7 @@ def test_query_customer_members_with_filter_search(
         ]
     )
     users[1].addresses.set([address])
+    update_users_search_documents(User.objects.filter(pk__in=[u.pk for u in users]))
 
     variables = {"filter": customer_filter}
     response = staff_api_client.post_graphql(
@@ -4626,6 +4630,7 @@ def test_query_staff_members_with_filter_search(
         ]
     )
     users[1].addresses.set([address])
+    update_users_search_documents(User.objects.filter(pk__in=[u.pk for u in users]))
 
     variables = {"filter": staff_member_filter}
     response = staff_api_client.post_graphql(
@@ -2,6 +2,7 @@ import pytest
 from django.contrib.auth import models as auth_models
 
 from ....account.models import User
+from ....account.search import update_users_search_documents
 from ....order.models import Order
 from ...tests.utils import get_graphql_content
 
@@ -50,6 +51,7 @@ def customers_for_search(db, address):
     for i, user in enumerate(accounts):
         if i in (0, 3, 4):
             user.addresses.set([address])
+    update_users_search_documents(User.objects.filter(pk__in=[a.pk for a in accounts]))
     return accounts
 
 
@@ -97,6 +99,7 @@ def staff_for_search(db, address):
     for i, user in enumerate(accounts):
         if i in (0, 3, 4):
             user.addresses.set([address])
+    update_users_search_documents(User.objects.filter(pk__in=[a.pk for a in accounts]))
     return accounts
 
 
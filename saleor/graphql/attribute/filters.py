@@ -5,6 +5,7 @@ from graphene_django.filter import GlobalIDFilter, GlobalIDMultipleChoiceFilter
 from ...attribute.models import Attribute, AttributeValue
 from ...core.permissions import has_one_of_permissions
 from ...product import models
+from ...product.category_tree import get_category_tree
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
 from ..attribute.enums import AttributeTypeEnum
 from ..channel.filters import get_channel_slug_from_filter_data
@@ -23,13 +24,12 @@ def filter_attributes_by_product_types(qs, field, value, requestor, channel_slug
 
     if field == "in_category":
         _type, category_id = from_global_id_or_error(value, "Category")
-        category = models.Category.objects.filter(pk=category_id).first()
+        category_ids = get_category_tree().get_descendant_ids(int(category_id))
 
-        if category is None:
+        if not category_ids:
             return qs.none()
 
-        tree = category.get_descendants(include_self=True)
-        product_qs = product_qs.filter(category__in=tree)
+        product_qs = product_qs.filter(category_id__in=category_ids)
 
         if not has_one_of_permissions(requestor, ALL_PRODUCTS_PERMISSIONS):
             product_qs = product_qs.annotate_visible_in_listings(channel_slug).exclude(
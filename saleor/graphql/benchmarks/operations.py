@@ -0,0 +1,588 @@
+import random
+from dataclasses import dataclass
+from typing import List, Optional
+
+import graphene
+
+from ...account.models import User
+from ...attribute.models import AttributeValue
+from ...channel.models import Channel
+from ...product.models import Category, Product, ProductVariant
+from ...vendor.models import Vendor
+from .runner import BenchmarkClient, BenchmarkError, BenchmarkOperation
+
+CHECKOUT_ADDRESS = {
+    "firstName": "John",
+    "lastName": "Doe",
+    "streetAddress1": "1600 Amphitheatre Pkwy",
+    "city": "Mountain View",
+    "postalCode": "94043",
+    "country": "US",
+    "countryArea": "CA",
+}
+
+PRODUCT_LIST_FRAGMENT = """
+    fragment ProductListItem on Product {
+      id
+      name
+      slug
+      thumbnail {
+        url
+      }
+      category {
+        id
+        name
+      }
+      pricing {
+        onSale
+        priceRange {
+          start {
+            gross {
+              amount
+              currency
+            }
+          }
+          stop {
+            gross {
+              amount
+              currency
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+@dataclass
+class BenchmarkContext:
+    """Objects of the dataset used as arguments of the benchmarked operations.
+
+    Each run uses the next object from the samples, so the operations don't
+    fetch the same data over and over.
+    """
+
+    channel: str
+    category_ids: List[str]
+    product_ids: List[str]
+    variant_ids: List[str]
+    customer_emails: List[str]
+    vendor_ids: List[str]
+    attribute_slug: Optional[str]
+    attribute_value_slugs: List[str]
+
+    @classmethod
+    def build(
+        cls, channel_slug: str, seed: int = 0, sample_size: int = 50
+    ) -> "BenchmarkContext":
+        channel = Channel.objects.get(slug=channel_slug)
+        rng = random.Random(seed)
+
+        def sample(queryset, type_name=None, field="pk"):
+            values = list(queryset.order_by("pk").values_list(field, flat=True))
+            values = rng.sample(values, min(sample_size, len(values)))
+            if type_name:
+                return [graphene.Node.to_global_id(type_name, pk) for pk in values]
+            return values
+
+        products = Product.objects.filter(
+            channel_listings__channel=channel, channel_listings__is_published=True
+        )
+        variants = ProductVariant.objects.filter(
+            product__in=products,
+            channel_listings__channel=channel,
+            channel_listings__price_amount__isnull=False,
+            stocks__quantity__gte=10,
+            stocks__warehouse__shipping_zones__channels=channel,
+        ).distinct()
+        attribute_value = (
+            AttributeValue.objects.filter(
+                productvalueassignment__assignment__product__in=products
+            )
+            .order_by("pk")
+            .select_related("attribute")
+            .first()
+        )
+        attribute_value_slugs = []
+        if attribute_value:
+            attribute_value_slugs = list(
+                AttributeValue.objects.filter(attribute_id=attribute_value.attribute_id)
+                .order_by("pk")
+                .values_list("slug", flat=True)[:3]
+            )
+        return cls(
+            channel=channel.slug,
+            category_ids=sample(
+                Category.objects.filter(products__in=products).distinct(), "Category"
+            ),
+            product_ids=sample(products, "Product"),
+            variant_ids=sample(variants, "ProductVariant"),
+            customer_emails=sample(
+                User.objects.filter(is_staff=False, order_count__gt=0), field="email"
+            ),
+            vendor_ids=sample(Vendor.objects.all(), "Vendor"),
+            attribute_slug=attribute_value.attribute.slug if attribute_value else None,
+            attribute_value_slugs=attribute_value_slugs,
+        )
+
+
+def pick(items: List, iteration: int):
+    if not items:
+        raise BenchmarkError("The dataset has no objects for this operation.")
+    return items[iteration % len(items)]
+
+
+HOMEPAGE_QUERY = (
+    PRODUCT_LIST_FRAGMENT
+    + """
+    query Homepage($channel: String!) {
+      shop {
+        name
+        description
+      }
+      categories(level: 0, first: 4) {
+        edges {
+          node {
+            id
+            name
+            backgroundImage {
+              url
+            }
+          }
+        }
+      }
+      collections(first: 4, channel: $channel) {
+        edges {
+          node {
+            id
+            name
+          }
+        }
+      }
+      products(first: 8, channel: $channel) {
+        edges {
+          node {
+            ...ProductListItem
+          }
+        }
+      }
+    }
+"""
+)
+
+
+def run_homepage(client: BenchmarkClient, context: BenchmarkContext, iteration: int):
+    client.execute(HOMEPAGE_QUERY, {"channel": context.channel})
+
+
+PRODUCT_LIST_QUERY = (
+    PRODUCT_LIST_FRAGMENT
+    + """
+    query ProductList(
+      $channel: String!, $filter: ProductFilterInput, $sortBy: ProductOrder
+    ) {
+      products(first: 20, channel: $channel, filter: $filter, sortBy: $sortBy) {
+        totalCount
+        edges {
+          node {
+            ...ProductListItem
+          }
+        }
+      }
+    }
+"""
+)
+
+
+def run_product_list(
+    client: BenchmarkClient, context: BenchmarkContext, iteration: int
+):
+    product_filter = {
+        "categories": [pick(context.category_ids, iteration)],
+        "price": {"gte": 10, "lte": 400},
+    }
+    if context.attribute_slug:
+        product_filter["attributes"] = [
+            {
+                "slug": context.attribute_slug,
+                "values": [pick(context.attribute_value_slugs, iteration)],
+            }
+        ]
+    client.execute(
+        PRODUCT_LIST_QUERY,
+        {
+            "channel": context.channel,
+            "filter": product_filter,
+            "sortBy": {"field": "PRICE", "direction": "ASC"},
+        },
+    )
+
+
+PRODUCT_DETAILS_QUERY = """
+    query ProductDetails($id: ID!, $channel: String!) {
+      product(id: $id, channel: $channel) {
+        id
+        name
+        description
+        seoTitle
+        seoDescription
+        isAvailableForPurchase
+        category {
+          id
+          name
+        }
+        attributes {
+          attribute {
+            id
+            name
+          }
+          values {
+            id
+            name
+          }
+        }
+        media {
+          url
+        }
+        pricing {
+          onSale
+          priceRange {
+            start {
+              gross {
+                amount
+                currency
+              }
+            }
+          }
+        }
+        variants {
+          id
+          name
+          sku
+          quantityAvailable
+          pricing {
+            price {
+              gross {
+                amount
+                currency
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+def run_product_details(
+    client: BenchmarkClient, context: BenchmarkContext, iteration: int
+):
+    client.execute(
+        PRODUCT_DETAILS_QUERY,
+        {"id": pick(context.product_ids, iteration), "channel": context.channel},
+    )
+
+
+CHECKOUT_CREATE_MUTATION = """
+    mutation CheckoutCreate($input: CheckoutCreateInput!) {
+      checkoutCreate(input: $input) {
+        checkout {
+          token
+        }
+        errors {
+          field
+          message
+        }
+      }
+    }
+"""
+
+CHECKOUT_LINES_ADD_MUTATION = """
+    mutation CheckoutLinesAdd($token: UUID!, $lines: [CheckoutLineInput]!) {
+      checkoutLinesAdd(token: $token, lines: $lines) {
+        checkout {
+          token
+        }
+        errors {
+          field
+          message
+        }
+      }
+    }
+"""
+
+CHECKOUT_SHIPPING_ADDRESS_UPDATE_MUTATION = """
+    mutation CheckoutShippingAddressUpdate(
+      $token: UUID!, $shippingAddress: AddressInput!
+    ) {
+      checkoutShippingAddressUpdate(
+        token: $token, shippingAddress: $shippingAddress
+      ) {
+        checkout {
+          token
+        }
+        errors {
+          field
+          message
+        }
+      }
+    }
+"""
+
+CHECKOUT_QUERY = """
+    query Checkout($token: UUID!) {
+      checkout(token: $token) {
+        token
+        isShippingRequired
+        availableShippingMethods {
+          id
+          name
+        }
+        lines {
+          quantity
+          variant {
+            id
+            name
+          }
+          totalPrice {
+            gross {
+              amount
+            }
+          }
+        }
+        subtotalPrice {
+          gross {
+            amount
+          }
+        }
+        totalPrice {
+          gross {
+            amount
+            currency
+          }
+        }
+      }
+    }
+"""
+
+
+def get_mutation_checkout_token(data: dict, mutation_name: str) -> str:
+    result = data.get(mutation_name) or {}
+    if result.get("errors"):
+        raise BenchmarkError(f"{mutation_name} failed: {result['errors']}")
+    checkout = result.get("checkout")
+    if not checkout:
+        raise BenchmarkError(f"{mutation_name} didn't return a checkout.")
+    return checkout["token"]
+
+
+def run_checkout_lifecycle(
+    client: BenchmarkClient, context: BenchmarkContext, iteration: int
+):
+    first_variant_id = pick(context.variant_ids, iteration)
+    second_variant_id = pick(context.variant_ids, iteration + 1)
+    data = client.execute(
+        CHECKOUT_CREATE_MUTATION,
+        {
+            "input": {
+                "channel": context.channel,
+                "email": "benchmark-checkout@example.com",
+                "lines": [{"quantity": 1, "variantId": first_variant_id}],
+            }
+        },
+    )
+    token = get_mutation_checkout_token(data, "checkoutCreate")
+    data = client.execute(
+        CHECKOUT_LINES_ADD_MUTATION,
+        {"token": token, "lines": [{"quantity": 2, "variantId": second_variant_id}]},
+    )
+    get_mutation_checkout_token(data, "checkoutLinesAdd")
+    data = client.execute(
+        CHECKOUT_SHIPPING_ADDRESS_UPDATE_MUTATION,
+        {"token": token, "shippingAddress": CHECKOUT_ADDRESS},
+    )
+    get_mutation_checkout_token(data, "checkoutShippingAddressUpdate")
+    client.execute(CHECKOUT_QUERY, {"token": token})
+
+
+ORDER_LIST_QUERY = """
+    query OrderList($filter: OrderFilterInput, $sortBy: OrderSortingInput) {
+      orders(first: 20, filter: $filter, sortBy: $sortBy) {
+        totalCount
+        edges {
+          node {
+            id
+            number
+            created
+            status
+            paymentStatus
+            userEmail
+            billingAddress {
+              firstName
+              lastName
+            }
+            total {
+              gross {
+                amount
+                currency
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+def run_order_list(client: BenchmarkClient, context: BenchmarkContext, iteration: int):
+    client.execute(
+        ORDER_LIST_QUERY, {"sortBy": {"field": "NUMBER", "direction": "DESC"}}
+    )
+
+
+def run_order_search(
+    client: BenchmarkClient, context: BenchmarkContext, iteration: int
+):
+    email = pick(context.customer_emails, iteration)
+    client.execute(
+        ORDER_LIST_QUERY,
+        {
+            "filter": {"search": email.split("@")[0]},
+            "sortBy": {"field": "CREATION_DATE", "direction": "DESC"},
+        },
+    )
+
+
+CUSTOMER_LIST_QUERY = """
+    query CustomerList($filter: CustomerFilterInput, $sortBy: UserSortingInput) {
+      customers(first: 20, filter: $filter, sortBy: $sortBy) {
+        totalCount
+        edges {
+          node {
+            id
+            email
+            firstName
+            lastName
+            orders {
+              totalCount
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+def run_customer_list(
+    client: BenchmarkClient, context: BenchmarkContext, iteration: int
+):
+    client.execute(
+        CUSTOMER_LIST_QUERY,
+        {
+            "filter": {"numberOfOrders": {"gte": 1}},
+            "sortBy": {"field": "ORDER_COUNT", "direction": "DESC"},
+        },
+    )
+
+
+VENDOR_LIST_QUERY = """
+    query VendorList {
+      vendors(first: 20) {
+        totalCount
+        edges {
+          node {
+            id
+            shopName
+            slug
+          }
+        }
+      }
+      vendorWarehouses(first: 20) {
+        edges {
+          node {
+            id
+            vendorId {
+              id
+              shopName
+            }
+            warehouse {
+              id
+              name
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+def run_vendor_list(client: BenchmarkClient, context: BenchmarkContext, iteration: int):
+    client.execute(VENDOR_LIST_QUERY)
+
+
+def run_vendor_products(
+    client: BenchmarkClient, context: BenchmarkContext, iteration: int
+):
+    client.execute(
+        PRODUCT_LIST_QUERY,
+        {
+            "channel": context.channel,
+            "filter": {"vendor": [pick(context.vendor_ids, iteration)]},
+            "sortBy": {"field": "NAME", "direction": "ASC"},
+        },
+    )
+
+
+OPERATIONS = [
+    BenchmarkOperation(
+        "homepage",
+        "Storefront homepage with categories, collections and products.",
+        run_homepage,
+    ),
+    BenchmarkOperation(
+        "product_list",
+        "Storefront product list filtered by category, price and attribute.",
+        run_product_list,
+    ),
+    BenchmarkOperation(
+        "product_details",
+        "Storefront product page with attributes and variants.",
+        run_product_details,
+    ),
+    BenchmarkOperation(
+        "checkout_lifecycle",
+        "Checkout creation, adding lines, setting the address and fetching totals.",
+        run_checkout_lifecycle,
+        mutates=True,
+    ),
+    BenchmarkOperation(
+        "order_list",
+        "Dashboard order list sorted by number.",
+        run_order_list,
+        staff=True,
+    ),
+    BenchmarkOperation(
+        "order_search",
+        "Dashboard order list searched by customer.",
+        run_order_search,
+        staff=True,
+    ),
+    BenchmarkOperation(
+        "customer_list",
+        "Dashboard customer list filtered and sorted by orders.",
+        run_customer_list,
+        staff=True,
+    ),
+    BenchmarkOperation(
+        "vendor_list",
+        "Dashboard vendor and vendor warehouse lists.",
+        run_vendor_list,
+        staff=True,
+    ),
+    BenchmarkOperation(
+        "vendor_products",
+        "Product list filtered by vendor.",
+        run_vendor_products,
+        staff=True,
+    ),
+]
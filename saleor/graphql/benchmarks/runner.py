@@ -0,0 +1,180 @@
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.shortcuts import reverse
+from django.test import Client
+
+from ...core.jwt import create_access_token
+
+
+class BenchmarkError(Exception):
+    """Raised when an operation can't continue, e.g. a mutation failed."""
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    rows: int = 0
+    db_time: float = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+            rowcount = context["cursor"].rowcount
+            if rowcount and rowcount > 0:
+                self.rows += rowcount
+
+
+@dataclass
+class Sample:
+    latency: float
+    cpu_time: float
+    db_time: float
+    queries: int
+    rows: int
+    requests: int
+    errors: List[str] = field(default_factory=list)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Return the nearest-rank percentile of the values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(values: List[float], scale: float = 1.0) -> Dict[str, float]:
+    return {
+        "p50": round(percentile(values, 50) * scale, 3),
+        "p95": round(percentile(values, 95) * scale, 3),
+        "mean": round(sum(values) / len(values) * scale, 3) if values else 0.0,
+        "max": round(max(values, default=0.0) * scale, 3),
+    }
+
+
+def get_benchmark_host() -> str:
+    for host in settings.ALLOWED_HOSTS:
+        if host and "*" not in host:
+            return host.lstrip(".")
+    return "localhost"
+
+
+class BenchmarkClient:
+    """Send GraphQL requests through the full Django request stack."""
+
+    def __init__(self, user=None):
+        self.user = user or AnonymousUser()
+        self.client = Client(SERVER_NAME=get_benchmark_host())
+        self.path = reverse("api")
+        self.headers = {}
+        if not self.user.is_anonymous:
+            self.headers["HTTP_AUTHORIZATION"] = f"JWT {create_access_token(user)}"
+        self.requests = 0
+        self.errors: List[str] = []
+
+    def execute(self, query: str, variables: Optional[dict] = None) -> dict:
+        data = {"query": query}
+        if variables is not None:
+            data["variables"] = variables
+        response = self.client.post(
+            self.path,
+            json.dumps(data, cls=DjangoJSONEncoder),
+            content_type="application/json",
+            **self.headers,
+        )
+        self.requests += 1
+        content = json.loads(response.content.decode("utf8"))
+        for error in content.get("errors", []):
+            self.errors.append(error.get("message", str(error)))
+        return content.get("data") or {}
+
+
+@dataclass
+class BenchmarkOperation:
+    name: str
+    description: str
+    run: Callable[[BenchmarkClient, Any, int], None]
+    staff: bool = False
+    # changes are rolled back after each run, so every run sees the same data
+    mutates: bool = False
+
+
+class BenchmarkRunner:
+    def __init__(
+        self,
+        context,
+        staff_user,
+        iterations: int = 20,
+        warmup: int = 2,
+    ):
+        self.context = context
+        self.staff_user = staff_user
+        self.iterations = iterations
+        self.warmup = warmup
+
+    def run_once(self, operation: BenchmarkOperation, iteration: int) -> Sample:
+        client = BenchmarkClient(self.staff_user if operation.staff else None)
+        stats = QueryStats()
+        with connection.execute_wrapper(stats):
+            with transaction.atomic():
+                start = time.perf_counter()
+                cpu_start = time.process_time()
+                try:
+                    operation.run(client, self.context, iteration)
+                except BenchmarkError as e:
+                    client.errors.append(str(e))
+                cpu_time = time.process_time() - cpu_start
+                latency = time.perf_counter() - start
+                if operation.mutates:
+                    transaction.set_rollback(True)
+        return Sample(
+            latency=latency,
+            cpu_time=cpu_time,
+            db_time=stats.db_time,
+            queries=stats.queries,
+            rows=stats.rows,
+            requests=client.requests,
+            errors=client.errors,
+        )
+
+    def run_operation(self, operation: BenchmarkOperation) -> dict:
+        for iteration in range(self.warmup):
+            self.run_once(operation, iteration)
+        samples = [
+            self.run_once(operation, self.warmup + iteration)
+            for iteration in range(self.iterations)
+        ]
+        latencies = [sample.latency for sample in samples]
+        errors = [error for sample in samples for error in sample.errors]
+        total_time = sum(latencies)
+        return {
+            "name": operation.name,
+            "description": operation.description,
+            "iterations": len(samples),
+            "requests": sum(sample.requests for sample in samples),
+            "latency_ms": summarize(latencies, 1000),
+            "cpu_ms": summarize([sample.cpu_time for sample in samples], 1000),
+            "db_ms": summarize([sample.db_time for sample in samples], 1000),
+            "queries": summarize([sample.queries for sample in samples]),
+            "rows": summarize([sample.rows for sample in samples]),
+            "throughput": round(len(samples) / total_time, 3) if total_time else 0.0,
+            "errors": len(errors),
+            "error_messages": sorted(set(errors))[:5],
+        }
+
+    def run(self, operations: Iterable[BenchmarkOperation]) -> Iterable[dict]:
+        for operation in operations:
+            yield self.run_operation(operation)
@@ -0,0 +1,122 @@
+import io
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from ....checkout.models import Checkout
+from ....core.utils.synthetic_data import SyntheticDataGenerator, SyntheticDataSize
+from ....product.models import Category, Product
+from ..operations import OPERATIONS, BenchmarkContext
+from ..runner import BenchmarkRunner, QueryStats, percentile
+
+BENCHMARK_DATA_SIZE = SyntheticDataSize(
+    vendors=2,
+    warehouses=2,
+    categories=3,
+    products=10,
+    attributes=1,
+    attribute_values=3,
+    customers=5,
+    orders=10,
+)
+
+
+def test_percentile():
+    # given
+    values = [5, 1, 4, 2, 3, 10, 9, 8, 7, 6]
+
+    # when & then
+    assert percentile(values, 50) == 5
+    assert percentile(values, 95) == 10
+    assert percentile(values, 0) == 1
+    assert percentile([], 50) == 0.0
+
+
+def test_query_stats_counts_queries_and_rows(product, category):
+    # given
+    stats = QueryStats()
+
+    # when
+    with connection.execute_wrapper(stats):
+        list(Product.objects.all())
+        list(Category.objects.all())
+
+    # then
+    assert stats.queries == 2
+    assert stats.rows == 2
+    assert stats.db_time > 0
+
+
+def test_run_benchmarks(db, superuser):
+    # given
+    list(SyntheticDataGenerator(BENCHMARK_DATA_SIZE).generate())
+    context = BenchmarkContext.build("synthetic")
+    runner = BenchmarkRunner(context, superuser, iterations=2, warmup=0)
+
+    # when
+    results = list(runner.run(OPERATIONS))
+
+    # then
+    assert [result["name"] for result in results] == [
+        operation.name for operation in OPERATIONS
+    ]
+    for result in results:
+        assert result["errors"] == 0, result["error_messages"]
+        assert result["iterations"] == 2
+        assert result["queries"]["p50"] > 0
+
+
+def test_run_benchmarks_rolls_back_mutations(db, superuser):
+    # given
+    list(SyntheticDataGenerator(BENCHMARK_DATA_SIZE).generate())
+    context = BenchmarkContext.build("synthetic")
+    runner = BenchmarkRunner(context, superuser, iterations=1, warmup=0)
+    operation = next(op for op in OPERATIONS if op.name == "checkout_lifecycle")
+
+    # when
+    result = runner.run_operation(operation)
+
+    # then
+    assert result["errors"] == 0, result["error_messages"]
+    assert result["requests"] == 4
+    assert not Checkout.objects.exists()
+
+
+def test_benchmark_graphql_command(db, tmpdir, staff_user):
+    # given
+    list(SyntheticDataGenerator(BENCHMARK_DATA_SIZE).generate())
+    output = tmpdir.join("results.json")
+
+    # when
+    call_command(
+        "benchmark_graphql",
+        staff_email=staff_user.email,
+        iterations=1,
+        warmup=0,
+        operations=["homepage", "order_list"],
+        output=str(output),
+        stdout=io.StringIO(),
+    )
+
+    # then
+    report = json.loads(output.read())
+    assert report["dataset"]["products"] == BENCHMARK_DATA_SIZE.products
+    assert [result["name"] for result in report["operations"]] == [
+        "homepage",
+        "order_list",
+    ]
+
+
+def test_benchmark_graphql_command_requires_existing_staff_user(
+    customer_user, channel_USD
+):
+    # when & then
+    with pytest.raises(CommandError):
+        call_command(
+            "benchmark_graphql",
+            staff_email=customer_user.email,
+            channel=channel_USD.slug,
+            stdout=io.StringIO(),
+        )
@@ -15,8 +15,7 @@ from ...checkout.fetch import (
     CheckoutLineInfo,
     fetch_checkout_info,
     fetch_checkout_lines,
-    get_valid_collection_points_for_checkout_info,
-    get_valid_shipping_method_list_for_checkout_info,
+    update_delivery_method_lists_for_checkout_info,
 )
 from ...checkout.utils import (
     add_promo_code_to_checkout,
@@ -97,8 +96,9 @@ def clean_delivery_method(
             code=CheckoutErrorCode.SHIPPING_ADDRESS_NOT_SET.value,
         )
 
-    valid_methods = checkout_info.valid_delivery_methods
-    return method in valid_methods
+    if isinstance(method, models.ShippingMethod):
+        return method in checkout_info.valid_shipping_methods
+    return method in checkout_info.valid_pick_up_points
 
 
 def update_checkout_shipping_method_if_invalid(
@@ -505,15 +505,8 @@ class CheckoutLinesAdd(BaseMutation):
                 )
 
         lines = fetch_checkout_lines(checkout)
-        checkout_info.valid_shipping_methods = (
-            get_valid_shipping_method_list_for_checkout_info(
-                checkout_info, checkout_info.shipping_address, lines, discounts, manager
-            )
-        )
-        checkout_info.valid_pick_up_points = (
-            get_valid_collection_points_for_checkout_info(
-                checkout_info.shipping_address, lines, checkout_info
-            )
+        update_delivery_method_lists_for_checkout_info(
+            checkout_info, checkout_info.shipping_address, lines, discounts, manager
         )
         return lines
 
@@ -555,15 +548,8 @@ class CheckoutLinesAdd(BaseMutation):
             replace,
         )
 
-        checkout_info.valid_shipping_methods = (
-            get_valid_shipping_method_list_for_checkout_info(
-                checkout_info, checkout_info.shipping_address, lines, discounts, manager
-            )
-        )
-        checkout_info.valid_pick_up_points = (
-            get_valid_collection_points_for_checkout_info(
-                checkout_info.shipping_address, lines, checkout_info
-            )
+        update_delivery_method_lists_for_checkout_info(
+            checkout_info, checkout_info.shipping_address, lines, discounts, manager
         )
 
         update_checkout_shipping_method_if_invalid(checkout_info, lines)
@@ -1456,10 +1442,8 @@ class CheckoutAddPromoCode(BaseMutation):
             discounts,
         )
 
-        checkout_info.valid_shipping_methods = (
-            get_valid_shipping_method_list_for_checkout_info(
-                checkout_info, checkout_info.shipping_address, lines, discounts, manager
-            )
+        update_delivery_method_lists_for_checkout_info(
+            checkout_info, checkout_info.shipping_address, lines, discounts, manager
         )
 
         update_checkout_shipping_method_if_invalid(checkout_info, lines)
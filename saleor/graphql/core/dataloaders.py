@@ -1,3 +1,4 @@
+import time
 from typing import Generic, Iterable, List, TypeVar, Union
 
 import opentracing
@@ -6,6 +7,8 @@ from django.http import HttpRequest
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
+from ...core.instrumentation import get_current_instrumentation
+
 K = TypeVar("K")
 R = TypeVar("R")
 
@@ -32,13 +35,28 @@ class DataLoader(BaseLoader, Generic[K, R]):
             self.user = context.user
             super().__init__()
 
+    def load(self, key: K) -> Promise[R]:
+        if instrumentation := get_current_instrumentation():
+            cache_hit = bool(self.cache) and (
+                self.get_cache_key(key) in self._promise_cache
+            )
+            instrumentation.record_dataloader_load(self.__class__.__name__, cache_hit)
+        return super().load(key)
+
     def batch_load_fn(self, keys: Iterable[K]) -> Promise[List[R]]:
         with opentracing.global_tracer().start_active_span(
             self.__class__.__name__
         ) as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "dataloaders")
+            start = time.perf_counter()
             results = self.batch_load(keys)
+            if instrumentation := get_current_instrumentation():
+                instrumentation.record_dataloader_batch(
+                    self.__class__.__name__,
+                    len(keys),  # type: ignore
+                    time.perf_counter() - start,
+                )
             if not isinstance(results, Promise):
                 return Promise.resolve(results)
             return results
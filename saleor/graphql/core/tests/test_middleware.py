@@ -42,3 +42,21 @@ def test_app_middleware_skips_when_token_length_is_different_than_30(app, rf):
 
     # then
     assert not request.app
+
+
+def test_app_middleware_uses_cached_app(app, rf, django_assert_num_queries):
+    # given
+    request = rf.get(reverse("api"))
+    token = app.tokens.first().auth_token
+    request.META = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+    app_middleware(lambda root, info: info.context, Mock(), Mock(context=request))
+    assert request.app == app
+    del request.app
+
+    # when
+    with django_assert_num_queries(0):
+        app_middleware(lambda root, info: info.context, Mock(), Mock(context=request))
+        request_app = request.app.pk
+
+    # then
+    assert request_app == app.pk
@@ -416,3 +416,80 @@ def test_introspection_query_is_not_cached_in_debug_mode(
 def test_generate_cache_key_use_saleor_version():
     cache_key = generate_cache_key(INTROSPECTION_QUERY)
     assert saleor_version in cache_key
+
+
+INSTRUMENTATION_QUERY = """
+    query GetProducts($channel: String) {
+        products(first: 5, channel: $channel) {
+            edges {
+                node {
+                    name
+                    category {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_instrumentation_returned_to_staff_user(staff_api_client, product, channel_USD):
+    # when
+    response = staff_api_client.post_graphql(
+        INSTRUMENTATION_QUERY,
+        {"channel": channel_USD.slug},
+        HTTP_X_SALEOR_INSTRUMENTATION="1",
+    )
+
+    # then
+    content = get_graphql_content(response)
+    instrumentation = content["extensions"]["instrumentation"]
+    assert instrumentation["queries"]["count"] > 0
+    assert "CategoryByIdLoader" in instrumentation["dataloaders"]
+    assert "Query.products" in {
+        resolver["name"] for resolver in instrumentation["resolvers"]
+    }
+
+
+def test_instrumentation_not_returned_without_header(
+    staff_api_client, product, channel_USD
+):
+    # when
+    response = staff_api_client.post_graphql(
+        INSTRUMENTATION_QUERY, {"channel": channel_USD.slug}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert "extensions" not in content
+
+
+@override_settings(DEBUG=False)
+def test_instrumentation_not_returned_to_customer(
+    user_api_client, product, channel_USD
+):
+    # when
+    response = user_api_client.post_graphql(
+        INSTRUMENTATION_QUERY,
+        {"channel": channel_USD.slug},
+        HTTP_X_SALEOR_INSTRUMENTATION="1",
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert "extensions" not in content
+
+
+@override_settings(DEBUG=True)
+def test_instrumentation_returned_in_debug_mode(api_client, product, channel_USD):
+    # when
+    response = api_client.post_graphql(
+        INSTRUMENTATION_QUERY,
+        {"channel": channel_USD.slug},
+        HTTP_X_SALEOR_INSTRUMENTATION="true",
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["extensions"]["instrumentation"]["queries"]["count"] > 0
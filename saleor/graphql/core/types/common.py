@@ -4,8 +4,8 @@ import graphene
 from django.conf import settings
 
 from ....core.tracing import traced_resolver
-from ....product.product_images import get_thumbnail
 from ...account.enums import AddressTypeEnum
+from ...thumbnail.utils import get_thumbnail_url
 from ..enums import (
     AccountErrorCode,
     AppErrorCode,
@@ -18,6 +18,7 @@ from ..enums import (
     ExternalNotificationTriggerErrorCode,
     GiftCardErrorCode,
     GiftCardSettingsErrorCode,
+    ImportFileErrorCode,
     InvoiceErrorCode,
     JobStatusEnum,
     LanguageCodeEnum,
@@ -163,6 +164,10 @@ class ExportError(Error):
     code = ExportErrorCode(description="The error code.", required=True)
 
 
+class ImportFileError(Error):
+    code = ImportFileErrorCode(description="The error code.", required=True)
+
+
 class ExternalNotificationError(Error):
     code = ExternalNotificationTriggerErrorCode(
         description="The error code.", required=True
@@ -340,10 +345,12 @@ class UploadError(Error):
 class WarehouseError(Error):
     code = WarehouseErrorCode(description="The error code.", required=True)
 
+
 # to handle errors and its response for vendor app
 class VendorError(Error):
     code = VendorErrorCode(description="The error code.", required=True)
 
+
 class WebhookError(Error):
     code = WebhookErrorCode(description="The error code.", required=True)
 
@@ -379,17 +386,15 @@ class Image(graphene.ObjectType):
     @staticmethod
     def get_adjusted(image, alt, size, rendition_key_set, info):
         """Return Image adjusted with given size."""
-        if size:
-            url = get_thumbnail(
-                image_file=image,
-                size=size,
-                method="thumbnail",
-                rendition_key_set=rendition_key_set,
-            )
-        else:
-            url = image.url
-        url = info.context.build_absolute_uri(url)
-        return Image(url, alt)
+        if not size:
+            return Image(info.context.build_absolute_uri(image.url), alt)
+        return get_thumbnail_url(
+            info,
+            image_file=image,
+            size=size,
+            method="thumbnail",
+            rendition_key_set=rendition_key_set,
+        ).then(lambda url: Image(info.context.build_absolute_uri(url), alt))
 
 
 class File(graphene.ObjectType):
@@ -1,3 +1,4 @@
+import os
 from typing import Dict, List, Mapping, Union
 
 import graphene
@@ -5,18 +6,21 @@ from django.core.exceptions import ValidationError
 
 from ...core.permissions import ProductPermissions
 from ...csv import models as csv_models
-from ...csv.events import export_started_event
-from ...csv.tasks import export_products_task
+from ...csv.error_codes import ImportFileErrorCode
+from ...csv.events import export_started_event, import_started_event
+from ...csv.tasks import export_products_task, import_products_task
+from ...csv.utils.export import get_filename
 from ..attribute.types import Attribute
 from ..channel.types import Channel
 from ..core.enums import ExportErrorCode
 from ..core.mutations import BaseMutation
-from ..core.types.common import ExportError
+from ..core.types import Upload
+from ..core.types.common import ExportError, ImportFileError
 from ..product.filters import ProductFilterInput
 from ..product.types import Product
 from ..warehouse.types import Warehouse
 from .enums import ExportScope, FileTypeEnum, ProductFieldEnum
-from .types import ExportFile
+from .types import ExportFile, ImportFile
 
 
 class ExportInfoInput(graphene.InputObjectType):
@@ -156,3 +160,91 @@ class ExportProducts(BaseMutation):
             return
         pks = cls.get_global_ids_or_error(ids, only_type=graphene_type, field=field)
         return pks
+
+
+class ImportProducts(BaseMutation):
+    import_file = graphene.Field(
+        ImportFile,
+        description=(
+            "The newly created import file job which is responsible for import data."
+        ),
+    )
+
+    class Arguments:
+        file = Upload(
+            required=True,
+            description=(
+                "CSV file with products data, in the format of the products export "
+                "file. Products are matched by the `id` column or by the slug of "
+                "the product name, and variants by the `variant id` or `variant sku` "
+                "column. Missing products and variants are created; new products "
+                "require the `product type` column and are not published. Supported "
+                "columns are product name, product type, category and charge taxes, "
+                "variant SKU and preorder settings, warehouse quantities and channel "
+                "price and cost price."
+            ),
+        )
+        delimiter = graphene.String(
+            description="Delimiter of the CSV file columns.", default_value=";"
+        )
+
+    class Meta:
+        description = (
+            "Import products data from a CSV file. This mutation must be sent as a "
+            "`multipart` request. The file is processed in the background."
+        )
+        permissions = (ProductPermissions.MANAGE_PRODUCTS,)
+        error_type_class = ImportFileError
+
+    @classmethod
+    def perform_mutation(cls, root, info, **data):
+        file_data = cls.clean_file(info, data["file"])
+        delimiter = cls.clean_delimiter(data.get("delimiter"))
+
+        app = info.context.app
+        kwargs = {"app": app} if app else {"user": info.context.user}
+
+        import_file = csv_models.ImportFile.objects.create(**kwargs)
+        import_file.content_file.save(get_filename("product", "csv"), file_data)
+        import_started_event(import_file=import_file, **kwargs)
+        import_products_task.delay(import_file.pk, delimiter)
+
+        import_file.refresh_from_db()
+        return cls(import_file=import_file)
+
+    @staticmethod
+    def clean_file(info, file_name):
+        file_data = info.context.FILES.get(file_name)
+        if not file_data:
+            raise ValidationError(
+                {
+                    "file": ValidationError(
+                        "You must provide a file.",
+                        code=ImportFileErrorCode.REQUIRED.value,
+                    )
+                }
+            )
+        _, extension = os.path.splitext(file_data.name)
+        if extension.lower() != ".csv":
+            raise ValidationError(
+                {
+                    "file": ValidationError(
+                        "Only CSV files can be imported.",
+                        code=ImportFileErrorCode.INVALID.value,
+                    )
+                }
+            )
+        return file_data
+
+    @staticmethod
+    def clean_delimiter(delimiter):
+        if not delimiter or len(delimiter) != 1:
+            raise ValidationError(
+                {
+                    "delimiter": ValidationError(
+                        "Delimiter must be a single character.",
+                        code=ImportFileErrorCode.INVALID.value,
+                    )
+                }
+            )
+        return delimiter
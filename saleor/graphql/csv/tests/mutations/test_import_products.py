@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from .....csv import ImportEvents
+from .....csv.error_codes import ImportFileErrorCode
+from .....csv.models import ImportEvent, ImportFile
+from ....tests.utils import get_graphql_content, get_multipart_request_body
+
+IMPORT_PRODUCTS_MUTATION = """
+    mutation ImportProducts($file: Upload!, $delimiter: String){
+        importProducts(file: $file, delimiter: $delimiter){
+            importFile {
+                id
+                status
+                createdAt
+                user {
+                    email
+                }
+            }
+            errors {
+                field
+                code
+                message
+            }
+        }
+    }
+"""
+
+
+@patch("saleor.graphql.csv.mutations.import_products_task.delay")
+def test_import_products_mutation(
+    import_products_mock, staff_api_client, permission_manage_products, media_root
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    file = SimpleUploadedFile("products.csv", b"variant sku,name\r\n", "text/csv")
+    body = get_multipart_request_body(
+        IMPORT_PRODUCTS_MUTATION, {"file": "file", "delimiter": ","}, file, "file"
+    )
+
+    # when
+    response = staff_api_client.post_multipart(body)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["importProducts"]
+    assert not data["errors"]
+    assert data["importFile"]["status"] == "PENDING"
+    assert data["importFile"]["user"]["email"] == staff_api_client.user.email
+
+    import_file = ImportFile.objects.get()
+    assert import_file.content_file.read() == b"variant sku,name\r\n"
+    import_products_mock.assert_called_once_with(import_file.pk, ",")
+    assert ImportEvent.objects.filter(
+        import_file=import_file,
+        user=staff_api_client.user,
+        type=ImportEvents.IMPORT_PENDING,
+    ).exists()
+
+
+@patch("saleor.graphql.csv.mutations.import_products_task.delay")
+def test_import_products_mutation_invalid_file_type(
+    import_products_mock, staff_api_client, permission_manage_products, media_root
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    file = SimpleUploadedFile("products.xlsx", b"data", "application/octet-stream")
+    body = get_multipart_request_body(
+        IMPORT_PRODUCTS_MUTATION, {"file": "file"}, file, "file"
+    )
+
+    # when
+    response = staff_api_client.post_multipart(body)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["importProducts"]
+    assert data["importFile"] is None
+    assert data["errors"][0]["field"] == "file"
+    assert data["errors"][0]["code"] == ImportFileErrorCode.INVALID.name
+    import_products_mock.assert_not_called()
+    assert not ImportFile.objects.exists()
+
+
+@patch("saleor.graphql.csv.mutations.import_products_task.delay")
+def test_import_products_mutation_invalid_delimiter(
+    import_products_mock, staff_api_client, permission_manage_products, media_root
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    file = SimpleUploadedFile("products.csv", b"data", "text/csv")
+    body = get_multipart_request_body(
+        IMPORT_PRODUCTS_MUTATION, {"file": "file", "delimiter": ";;"}, file, "file"
+    )
+
+    # when
+    response = staff_api_client.post_multipart(body)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["importProducts"]
+    assert data["errors"][0]["field"] == "delimiter"
+    assert data["errors"][0]["code"] == ImportFileErrorCode.INVALID.name
+    import_products_mock.assert_not_called()
@@ -11,6 +11,7 @@ from ...discount.models import (
     VoucherChannelListing,
 )
 from ...discount.utils import (
+    DiscountInfoList,
     fetch_categories,
     fetch_collections,
     fetch_products,
@@ -35,8 +36,9 @@ class DiscountsByDateTimeLoader(DataLoader):
         categories = fetch_categories(pks)
         variants = fetch_variants(pks)
 
+        # products resolved in the request share the index of the discounts
         return [
-            [
+            DiscountInfoList(
                 DiscountInfo(
                     sale=sale,
                     channel_listings=channel_listings[sale.pk],
@@ -46,7 +48,7 @@ class DiscountsByDateTimeLoader(DataLoader):
                     variants_ids=variants[sale.pk],
                 )
                 for sale in sales_map[datetime]
-            ]
+            )
             for datetime in keys
         ]
 
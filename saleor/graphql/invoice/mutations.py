@@ -1,5 +1,6 @@
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from ...core import JobStatus
 from ...core.permissions import OrderPermissions
@@ -7,7 +8,8 @@ from ...invoice import events, models
 from ...invoice.error_codes import InvoiceErrorCode
 from ...invoice.notifications import send_invoice
 from ...order import events as order_events
-from ..core.mutations import ModelDeleteMutation, ModelMutation
+from ...order.models import Order as OrderModel
+from ..core.mutations import BaseBulkMutation, ModelDeleteMutation, ModelMutation
 from ..core.types.common import InvoiceError
 from ..invoice.types import Invoice
 from ..order.types import Order
@@ -54,19 +56,18 @@ class InvoiceRequest(ModelMutation):
                 }
             )
 
-    @classmethod
-    def perform_mutation(cls, _root, info, **data):
-        order = cls.get_node_or_error(
-            info, data["order_id"], only_type=Order, field="orderId"
-        )
-        cls.clean_order(order)
-
+    @staticmethod
+    def request_invoice(info, order, number=None):
         shallow_invoice = models.Invoice.objects.create(
             order=order,
-            number=data.get("number"),
+            number=number,
         )
         invoice = info.context.plugins.invoice_request(
-            order=order, invoice=shallow_invoice, number=data.get("number")
+            order=order,
+            invoice=shallow_invoice,
+            number=number,
+            user=info.context.user,
+            app=info.context.app,
         )
 
         if invoice.status == JobStatus.SUCCESS:
@@ -85,11 +86,49 @@ class InvoiceRequest(ModelMutation):
             user=info.context.user,
             app=info.context.app,
             order=order,
-            number=data.get("number"),
+            number=number,
+        )
+        return invoice
+
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        order = cls.get_node_or_error(
+            info, data["order_id"], only_type=Order, field="orderId"
         )
+        cls.clean_order(order)
+        invoice = cls.request_invoice(info, order, data.get("number"))
         return InvoiceRequest(invoice=invoice, order=order)
 
 
+class InvoiceRequestBulk(BaseBulkMutation):
+    class Arguments:
+        ids = graphene.List(
+            graphene.ID,
+            required=True,
+            description="List of orders IDs to request invoices for.",
+        )
+
+    class Meta:
+        description = (
+            "Request invoices for the orders using plugin. Invoices are requested "
+            "in a single transaction, so plugins may generate them in batches."
+        )
+        model = OrderModel
+        permissions = (OrderPermissions.MANAGE_ORDERS,)
+        error_type_class = InvoiceError
+        error_type_field = "invoice_errors"
+
+    @classmethod
+    def clean_instance(cls, info, instance):
+        InvoiceRequest.clean_order(instance)
+
+    @classmethod
+    @transaction.atomic
+    def bulk_action(cls, info, queryset):
+        for order in queryset.order_by("number"):
+            InvoiceRequest.request_invoice(info, order)
+
+
 class InvoiceCreateInput(graphene.InputObjectType):
     number = graphene.String(required=True, description="Invoice number.")
     url = graphene.String(required=True, description="URL of an invoice to download.")
@@ -4,6 +4,7 @@ from .mutations import (
     InvoiceCreate,
     InvoiceDelete,
     InvoiceRequest,
+    InvoiceRequestBulk,
     InvoiceRequestDelete,
     InvoiceSendNotification,
     InvoiceUpdate,
@@ -12,6 +13,7 @@ from .mutations import (
 
 class InvoiceMutations(graphene.ObjectType):
     invoice_request = InvoiceRequest.Field()
+    invoice_request_bulk = InvoiceRequestBulk.Field()
     invoice_request_delete = InvoiceRequestDelete.Field()
     invoice_create = InvoiceCreate.Field()
     invoice_delete = InvoiceDelete.Field()
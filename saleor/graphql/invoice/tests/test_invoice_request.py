@@ -61,7 +61,13 @@ def test_invoice_request(
         number=number, order=order.pk, status=JobStatus.PENDING
     ).first()
     assert invoice
-    plugin_mock.assert_called_once_with(order=order, invoice=invoice, number=number)
+    plugin_mock.assert_called_once_with(
+        order=order,
+        invoice=invoice,
+        number=number,
+        user=staff_api_client.user,
+        app=None,
+    )
     assert InvoiceEvent.objects.filter(
         type=InvoiceEvents.REQUESTED,
         user=staff_api_client.user,
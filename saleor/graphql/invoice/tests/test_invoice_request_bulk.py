@@ -0,0 +1,171 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.test import TestCase
+
+from ....core import JobStatus
+from ....graphql.tests.utils import get_graphql_content
+from ....invoice.models import Invoice, InvoiceEvent, InvoiceEvents
+from ....order import OrderEvents, OrderStatus
+from ....order.models import OrderEvent
+
+INVOICE_REQUEST_BULK_MUTATION = """
+    mutation InvoiceRequestBulk($ids: [ID]!) {
+        invoiceRequestBulk(ids: $ids) {
+            count
+            errors {
+                field
+                code
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture(autouse=True)
+def setup_dummy_gateways(settings):
+    settings.PLUGINS = [
+        "saleor.payment.gateways.dummy.plugin.DummyGatewayPlugin",
+    ]
+    return settings
+
+
+@patch("saleor.plugins.manager.PluginsManager.invoice_request")
+def test_invoice_request_bulk(
+    plugin_mock, staff_api_client, permission_manage_orders, order_list
+):
+    # given
+    plugin_mock.side_effect = lambda order, invoice, number, user, app: invoice
+    variables = {
+        "ids": [graphene.Node.to_global_id("Order", order.pk) for order in order_list]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        INVOICE_REQUEST_BULK_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["invoiceRequestBulk"]
+    assert not data["errors"]
+    assert data["count"] == len(order_list)
+    for order in order_list:
+        invoice = Invoice.objects.get(order=order, status=JobStatus.PENDING)
+        plugin_mock.assert_any_call(
+            order=order,
+            invoice=invoice,
+            number=None,
+            user=staff_api_client.user,
+            app=None,
+        )
+        assert InvoiceEvent.objects.filter(
+            type=InvoiceEvents.REQUESTED, user=staff_api_client.user, order=order
+        ).exists()
+        assert order.events.filter(
+            type=OrderEvents.INVOICE_REQUESTED, user=staff_api_client.user
+        ).exists()
+
+
+@patch("saleor.plugins.manager.PluginsManager.invoice_request")
+def test_invoice_request_bulk_invalid_order_status(
+    plugin_mock, staff_api_client, permission_manage_orders, order_list
+):
+    # given
+    plugin_mock.side_effect = lambda order, invoice, number, user, app: invoice
+    draft_order = order_list[0]
+    draft_order.status = OrderStatus.DRAFT
+    draft_order.save(update_fields=["status"])
+    draft_order_id = graphene.Node.to_global_id("Order", draft_order.pk)
+    variables = {
+        "ids": [graphene.Node.to_global_id("Order", order.pk) for order in order_list]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        INVOICE_REQUEST_BULK_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["invoiceRequestBulk"]
+    assert data["count"] == len(order_list) - 1
+    assert len(data["errors"]) == 1
+    assert data["errors"][0]["field"] == draft_order_id
+    assert not Invoice.objects.filter(order=draft_order).exists()
+    assert Invoice.objects.filter(order__in=order_list[1:]).count() == 2
+    assert not OrderEvent.objects.filter(
+        order=draft_order, type=OrderEvents.INVOICE_REQUESTED
+    ).exists()
+
+
+@patch("saleor.plugins.invoicing.plugin.generate_invoices_task.delay")
+def test_invoice_request_bulk_invoicing_plugin_generates_invoices_in_batch(
+    generate_invoices_mock,
+    staff_api_client,
+    permission_manage_orders,
+    order_list,
+    settings,
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.invoicing.plugin.InvoicingPlugin"]
+    variables = {
+        "ids": [graphene.Node.to_global_id("Order", order.pk) for order in order_list]
+    }
+
+    # when
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        response = staff_api_client.post_graphql(
+            INVOICE_REQUEST_BULK_MUTATION,
+            variables,
+            permissions=[permission_manage_orders],
+        )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["invoiceRequestBulk"]["count"] == len(order_list)
+    invoices = Invoice.objects.filter(order__in=order_list).order_by("pk")
+    generate_invoices_mock.assert_called_once_with(
+        [i.pk for i in invoices], user_id=staff_api_client.user.pk, app_id=None
+    )
+    period = datetime.now().strftime("%m/%Y")
+    assert [invoice.number for invoice in invoices] == [
+        f"{number}/{period}" for number in range(1, len(order_list) + 1)
+    ]
+
+
+@patch("saleor.plugins.invoicing.plugin.generate_invoices_task.delay")
+def test_invoice_request_bulk_by_app_passes_app_to_invoicing_plugin(
+    generate_invoices_mock,
+    app_api_client,
+    permission_manage_orders,
+    order_list,
+    settings,
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.invoicing.plugin.InvoicingPlugin"]
+    variables = {
+        "ids": [graphene.Node.to_global_id("Order", order.pk) for order in order_list]
+    }
+
+    # when
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        response = app_api_client.post_graphql(
+            INVOICE_REQUEST_BULK_MUTATION,
+            variables,
+            permissions=[permission_manage_orders],
+        )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["invoiceRequestBulk"]["count"] == len(order_list)
+    invoices = Invoice.objects.filter(order__in=order_list).order_by("pk")
+    generate_invoices_mock.assert_called_once_with(
+        [i.pk for i in invoices], user_id=None, app_id=app_api_client.app.pk
+    )
@@ -0,0 +1,129 @@
+import json
+import platform
+from datetime import datetime
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+
+from ....account.models import User
+from ....channel.models import Channel
+from ....order.models import Order
+from ....product.models import Product, ProductVariant
+from ....vendor.models import Vendor
+from ...benchmarks.operations import OPERATIONS, BenchmarkContext
+from ...benchmarks.runner import BenchmarkRunner
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures latency, CPU time and database queries of representative "
+        "storefront and dashboard GraphQL operations. Meant to be run against a "
+        "large dataset, e.g. created with `generate_synthetic_data`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--staff-email",
+            type=str,
+            required=True,
+            help="Email of the staff user the dashboard operations are run as.",
+        )
+        parser.add_argument(
+            "--channel",
+            type=str,
+            default="synthetic",
+            help="Slug of the channel used by the storefront operations.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Number of measured runs of each operation.",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=2,
+            help="Number of runs of each operation before the measured ones.",
+        )
+        parser.add_argument(
+            "--operation",
+            action="append",
+            dest="operations",
+            choices=[operation.name for operation in OPERATIONS],
+            help="Benchmark only the given operation, can be used multiple times.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed of the selection of products, variants and customers.",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            help="Path of a JSON file the results are written to.",
+        )
+
+    def get_staff_user(self, email):
+        user = User.objects.filter(email=email, is_staff=True, is_active=True).first()
+        if user is None:
+            raise CommandError(f"Active staff user {email} doesn't exist.")
+        return user
+
+    def get_dataset_stats(self):
+        return {
+            "products": Product.objects.count(),
+            "variants": ProductVariant.objects.count(),
+            "customers": User.objects.filter(is_staff=False).count(),
+            "orders": Order.objects.count(),
+            "vendors": Vendor.objects.count(),
+        }
+
+    def handle(self, *args, **options):
+        if not Channel.objects.filter(slug=options["channel"]).exists():
+            raise CommandError(f"Channel {options['channel']} doesn't exist.")
+        staff_user = self.get_staff_user(options["staff_email"])
+        operations = [
+            operation
+            for operation in OPERATIONS
+            if not options["operations"] or operation.name in options["operations"]
+        ]
+        context = BenchmarkContext.build(options["channel"], seed=options["seed"])
+        runner = BenchmarkRunner(
+            context,
+            staff_user,
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+        )
+        results = []
+        self.stdout.write(
+            f"{'operation':<20} {'p50 ms':>9} {'p95 ms':>9} {'cpu ms':>9} "
+            f"{'queries':>8} {'rows':>9} {'errors':>7}"
+        )
+        for result in runner.run(operations):
+            results.append(result)
+            self.stdout.write(
+                f"{result['name']:<20} {result['latency_ms']['p50']:>9.1f} "
+                f"{result['latency_ms']['p95']:>9.1f} {result['cpu_ms']['p50']:>9.1f} "
+                f"{result['queries']['p50']:>8.0f} {result['rows']['p50']:>9.0f} "
+                f"{result['errors']:>7}"
+            )
+            for message in result["error_messages"]:
+                self.stderr.write(f"  {message}")
+
+        if options["output"]:
+            report = {
+                "created": datetime.utcnow().isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "channel": options["channel"],
+                "iterations": options["iterations"],
+                "warmup": options["warmup"],
+                "seed": options["seed"],
+                "dataset": self.get_dataset_stats(),
+                "operations": results,
+            }
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}.")
@@ -1,7 +1,18 @@
 from collections import defaultdict
 
-from ...menu.models import Menu, MenuItem
+from ...menu.cache import fetch_menu_trees, get_translated_object_ids
+from ...menu.models import Menu, MenuItem, MenuItemTranslation
+from ...page.models import PageTranslation
+from ...product.models import CategoryTranslation, CollectionTranslation
 from ..core.dataloaders import DataLoader
+from ..page.dataloaders import PageByIdLoader
+from ..product.dataloaders import CategoryByIdLoader, CollectionByIdLoader
+from ..translations.dataloaders import (
+    CategoryTranslationByIdAndLanguageCodeLoader,
+    CollectionTranslationByIdAndLanguageCodeLoader,
+    MenuItemTranslationByIdAndLanguageCodeLoader,
+    PageTranslationByIdAndLanguageCodeLoader,
+)
 
 
 class MenuByIdLoader(DataLoader):
@@ -40,3 +51,57 @@ class MenuItemChildrenLoader(DataLoader):
         for menu_item in menu_items:
             items_map[menu_item.parent_id].append(menu_item)
         return [items_map[menu_item_id] for menu_item_id in keys]
+
+
+class MenuTreeByMenuIdLoader(DataLoader):
+    """Load cached menu trees.
+
+    Loaders of the menu items, the objects they link to and their translations
+    are primed with the objects of the trees, so the whole menu is resolved
+    without further queries.
+    """
+
+    context_key = "menu_tree_by_menu_id"
+
+    def batch_load(self, keys):
+        trees = fetch_menu_trees(keys)
+        for tree in trees.values():
+            self.prime_loaders(tree)
+        return [trees[menu_id] for menu_id in keys]
+
+    def prime_loaders(self, tree):
+        menu_item_loader = MenuItemByIdLoader(self.context)
+        for menu_item in tree.items:
+            menu_item_loader.prime(menu_item.pk, menu_item)
+
+        linked_object_loaders = {
+            "category": CategoryByIdLoader,
+            "collection": CollectionByIdLoader,
+            "page": PageByIdLoader,
+        }
+        for attr, loader in linked_object_loaders.items():
+            loader = loader(self.context)
+            for pk, instance in tree.linked_objects[attr].items():
+                loader.prime(pk, instance)
+
+        translation_loaders = {
+            MenuItemTranslation: MenuItemTranslationByIdAndLanguageCodeLoader,
+            CategoryTranslation: CategoryTranslationByIdAndLanguageCodeLoader,
+            CollectionTranslation: CollectionTranslationByIdAndLanguageCodeLoader,
+            PageTranslation: PageTranslationByIdAndLanguageCodeLoader,
+        }
+        # objects without a translation to one of the languages of the menu get
+        # None primed, so they are not queried for
+        language_codes = {
+            language_code
+            for translations in tree.translations.values()
+            for _, language_code in translations
+        }
+        object_ids = get_translated_object_ids(tree.items, tree.linked_objects)
+        for model, loader in translation_loaders.items():
+            loader = loader(self.context)
+            translations = tree.translations[model]
+            for pk in object_ids[model]:
+                for language_code in language_codes:
+                    key = (pk, language_code)
+                    loader.prime(key, translations.get(key))
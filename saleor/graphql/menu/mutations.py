@@ -9,6 +9,7 @@ from django.db.models import Model, QuerySet
 from ...core.permissions import MenuPermissions, SitePermissions
 from ...core.tracing import traced_atomic_transaction
 from ...menu import models
+from ...menu.cache import invalidate_menu_trees
 from ...menu.error_codes import MenuErrorCode
 from ...page import models as page_models
 from ...product import models as product_models
@@ -428,6 +429,8 @@ class MenuItemMove(BaseMutation):
         for parent_pk, operations in sort_operations.items():
             ordering_qs = sort_querysets[parent_pk]
             perform_reordering(ordering_qs, operations)
+        # sort orders are changed with bulk updates, which don't send signals
+        invalidate_menu_trees()
 
         menu = qs.get(pk=menu.pk)
         return MenuItemMove(menu=ChannelContext(node=menu, channel_slug=None))
@@ -3,9 +3,11 @@ import json
 import graphene
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from ....menu.error_codes import MenuErrorCode
-from ....menu.models import Menu, MenuItem
+from ....menu.models import Menu, MenuItem, MenuItemTranslation
 from ....product.models import Category
 from ...menu.mutations import NavigationType, _validate_menu_item_instance
 from ...tests.utils import (
@@ -1261,3 +1263,81 @@ def test_menu_cannot_pass_an_invalid_menu_item_node_type(
             }
         }
     }
+
+
+QUERY_MENU_TREE = """
+    query ($slug: String, $channel: String) {
+        menu(slug: $slug, channel: $channel) {
+            items {
+                name
+                translation(languageCode: FR) {
+                    name
+                }
+                category {
+                    name
+                    translation(languageCode: FR) {
+                        name
+                    }
+                }
+                page {
+                    title
+                }
+                children {
+                    name
+                    translation(languageCode: FR) {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_menu_query_tree_from_cache(
+    user_api_client, menu, category_translation_fr, page, channel_USD
+):
+    # given
+    category = category_translation_fr.category
+    parent = MenuItem.objects.create(menu=menu, name="Parent", category=category)
+    MenuItem.objects.create(menu=menu, name="Child", parent=parent, page=page)
+    MenuItem.objects.create(menu=menu, name="Page", page=page)
+    MenuItemTranslation.objects.create(
+        menu_item=parent, language_code="fr", name="Parent FR"
+    )
+    variables = {"slug": menu.slug, "channel": channel_USD.slug}
+    user_api_client.post_graphql(QUERY_MENU_TREE, variables)
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        response = user_api_client.post_graphql(QUERY_MENU_TREE, variables)
+
+    # then
+    items = get_graphql_content(response)["data"]["menu"]["items"]
+    assert items == [
+        {
+            "name": "Parent",
+            "translation": {"name": "Parent FR"},
+            "category": {
+                "name": category.name,
+                "translation": {"name": category_translation_fr.name},
+            },
+            "page": None,
+            "children": [{"name": "Child", "translation": None}],
+        },
+        {
+            "name": "Page",
+            "translation": None,
+            "category": None,
+            "page": {"title": page.title},
+            "children": [],
+        },
+    ]
+    cached_tables = [
+        "menu_menuitem",
+        "product_category",
+        "product_categorytranslation",
+        "page_page",
+    ]
+    for query in queries.captured_queries:
+        assert not any(f'"{table}"' in query["sql"] for table in cached_tables)
@@ -21,12 +21,7 @@ from ..product.dataloaders import (
 from ..translations.fields import TranslationField
 from ..translations.types import MenuItemTranslation
 from ..utils import get_user_or_app_from_context
-from .dataloaders import (
-    MenuByIdLoader,
-    MenuItemByIdLoader,
-    MenuItemChildrenLoader,
-    MenuItemsByParentMenuLoader,
-)
+from .dataloaders import MenuByIdLoader, MenuItemByIdLoader, MenuTreeByMenuIdLoader
 
 
 class Menu(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
@@ -44,11 +39,11 @@ class Menu(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
 
     @staticmethod
     def resolve_items(root: ChannelContext[models.Menu], info, **_kwargs):
-        menu_items = MenuItemsByParentMenuLoader(info.context).load(root.node.id)
-        return menu_items.then(
-            lambda menu_items: [
+        menu_tree = MenuTreeByMenuIdLoader(info.context).load(root.node.id)
+        return menu_tree.then(
+            lambda menu_tree: [
                 ChannelContext(node=menu_item, channel_slug=root.channel_slug)
-                for menu_item in menu_items
+                for menu_item in menu_tree.get_children()
             ]
         )
 
@@ -90,11 +85,11 @@ class MenuItem(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
 
     @staticmethod
     def resolve_children(root: ChannelContext[models.MenuItem], info, **_kwargs):
-        menus = MenuItemChildrenLoader(info.context).load(root.node.id)
-        return menus.then(
-            lambda menus: [
+        menu_tree = MenuTreeByMenuIdLoader(info.context).load(root.node.menu_id)
+        return menu_tree.then(
+            lambda menu_tree: [
                 ChannelContext(node=menu, channel_slug=root.channel_slug)
-                for menu in menus
+                for menu in menu_tree.get_children(root.node.pk)
             ]
         )
 
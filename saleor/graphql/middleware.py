@@ -1,14 +1,17 @@
+import time
 from typing import Optional
 
 from django.conf import settings
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import AnonymousUser
-from django.db.models import Exists, OuterRef
+from django.db import connection
 from django.utils.functional import SimpleLazyObject
 
-from ..app.models import App, AppToken
+from ..app.models import App
+from ..app.utils import get_active_app_by_token
 from ..core.auth import get_token_from_request
 from ..core.exceptions import ReadOnlyException
+from ..core.query_report import should_sample_request, start_query_recording
 from .views import API_PATH, GraphQLView
 
 
@@ -29,11 +32,39 @@ class JWTMiddleware:
         return next(root, info, **kwargs)
 
 
+def instrumentation_middleware(next, root, info, **kwargs):
+    instrumentation = getattr(info.context, "instrumentation", None)
+    if not instrumentation:
+        return next(root, info, **kwargs)
+    start = time.perf_counter()
+    try:
+        return next(root, info, **kwargs)
+    finally:
+        instrumentation.record_resolver(
+            f"{info.parent_type.name}.{info.field_name}", time.perf_counter() - start
+        )
+
+
+class QueryReportMiddleware:
+    """Record SQL statements of a sample of operations in query reports.
+
+    Recording starts with the first resolver of an operation and is finished by
+    the view once the whole response is resolved, including DataLoader batches.
+    """
+
+    def resolve(self, next, root, info, **kwargs):
+        request = info.context
+        if not hasattr(request, "query_recorder"):
+            request.query_recorder = None
+            if should_sample_request():
+                request.query_recorder = start_query_recording(
+                    connection, getattr(request, "query_fingerprint", "unknown")
+                )
+        return next(root, info, **kwargs)
+
+
 def get_app(auth_token) -> Optional[App]:
-    tokens = AppToken.objects.filter(auth_token=auth_token).values("pk")
-    return App.objects.filter(
-        Exists(tokens.filter(app_id=OuterRef("pk"))), is_active=True
-    ).first()
+    return get_active_app_by_token(auth_token)
 
 
 def app_middleware(next, root, info, **kwargs):
@@ -2,8 +2,6 @@ import django_filters
 from django.db.models import Exists, OuterRef, Q, Sum
 from graphene_django.filter import GlobalIDMultipleChoiceFilter
 
-from ...account.models import User
-from ...discount.models import OrderDiscount
 from ...order.models import Order, OrderLine
 from ...payment.models import Payment
 from ..core.filters import ListObjectTypeFilter, MetadataFilterBase, ObjectTypeFilter
@@ -76,14 +74,9 @@ def filter_order_search(qs, _, value):
     if payment_id := get_payment_id_from_query(value):
         return filter_order_by_payment(qs, payment_id)
 
-    users = User.objects.filter(
-        Q(email__trigram_similar=value)
-        | Q(first_name__trigram_similar=value)
-        | Q(last_name__trigram_similar=value)
-    ).values("pk")
-
-    filter_option = Q(user_email__trigram_similar=value) | Q(
-        Exists(users.filter(pk=OuterRef("user_id")))
+    # substrings match exactly, single words also with typos
+    filter_option = Q(search_document__ilike=value) | Q(
+        search_document__trigram_word_similar=value
     )
 
     if order_id := get_order_id_from_query(value):
@@ -92,11 +85,6 @@ def filter_order_search(qs, _, value):
     payments = Payment.objects.filter(psp_reference=value).values("id")
     filter_option |= Q(Exists(payments.filter(order_id=OuterRef("id"))))
 
-    discounts = OrderDiscount.objects.filter(
-        Q(name__trigram_similar=value) | Q(translated_name__trigram_similar=value)
-    ).values("id")
-    filter_option |= Q(Exists(discounts.filter(order_id=OuterRef("id"))))
-
     lines = OrderLine.objects.filter(product_sku=value).values("id")
     filter_option |= Q(Exists(lines.filter(order_id=OuterRef("id"))))
     return qs.filter(filter_option)
@@ -29,6 +29,7 @@ from ....order.error_codes import OrderErrorCode
 from ....order.events import order_replacement_created
 from ....order.models import Order, OrderEvent, OrderLine
 from ....order.notifications import get_default_order_payload
+from ....order.search import update_orders_search_documents
 from ....payment import ChargeStatus, PaymentError
 from ....payment.models import Payment
 from ....plugins.manager import PluginsManager
@@ -6918,6 +6919,7 @@ def test_query_draft_orders_with_sort(
         ({"search": "test@mirumee.com"}, 1),
         ({"search": "Leslie"}, 1),
         ({"search": "Wade"}, 1),
+        ({"search": "Wadee"}, 1),
         ({"search": ""}, 3),
         ({"search": "ExternalID"}, 1),
         ({"search": "SKU_A"}, 1),
@@ -6973,6 +6975,7 @@ def test_orders_query_with_filter_search(
             ),
         ]
     )
+    update_orders_search_documents(Order.objects.filter(pk__in=[o.pk for o in orders]))
     order_with_payment = orders[1]
     payment = Payment.objects.create(
         order=order_with_payment, psp_reference="ExternalID"
@@ -7259,6 +7262,7 @@ def test_draft_orders_query_with_filter_search(
             ),
         ]
     )
+    update_orders_search_documents(Order.objects.filter(pk__in=[o.pk for o in orders]))
     variables = {"filter": draft_orders_filter}
     staff_api_client.user.user_permissions.add(permission_manage_orders)
     response = staff_api_client.post_graphql(draft_orders_query_with_filter, variables)
@@ -9,6 +9,7 @@ from prices import Money, TaxedMoney
 
 from ....discount.models import OrderDiscount
 from ....order.models import Order, OrderStatus
+from ....order.search import update_orders_search_documents
 from ....payment import ChargeStatus
 from ...tests.utils import get_graphql_content
 
@@ -453,6 +454,7 @@ def test_orders_query_pagination_with_filter_search(
             ),
         ]
     )
+    update_orders_search_documents(Order.objects.filter(pk__in=[o.pk for o in orders]))
     page_size = 2
     variables = {"first": page_size, "after": None, "filter": orders_filter}
     staff_api_client.user.user_permissions.add(permission_manage_orders)
@@ -531,6 +533,7 @@ def test_draft_orders_query_pagination_with_filter_search(
             ),
         ]
     )
+    update_orders_search_documents(Order.objects.filter(pk__in=[o.pk for o in orders]))
     page_size = 2
     variables = {"first": page_size, "after": None, "filter": draft_orders_filter}
     staff_api_client.user.user_permissions.add(permission_manage_orders)
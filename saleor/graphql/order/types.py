@@ -41,7 +41,6 @@ from ...payment.model_helpers import (
 )
 from ...product import ProductMediaTypes
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
-from ...product.product_images import get_product_image_thumbnail
 from ..account.dataloaders import AddressByIdLoader, UserByUserIdLoader
 from ..account.types import User
 from ..account.utils import requestor_has_access
@@ -74,6 +73,7 @@ from ..product.dataloaders import (
 from ..product.types import ProductVariant
 from ..shipping.dataloaders import ShippingMethodByIdLoader
 from ..shipping.types import ShippingMethod
+from ..thumbnail.utils import get_thumbnail_url
 from ..warehouse.types import Allocation, Warehouse
 from .dataloaders import (
     AllocationsByOrderLineIdLoader,
@@ -482,9 +482,11 @@ class OrderLine(CountableDjangoObjectType):
             return None
 
         def _get_image_from_media(image):
-            url = get_product_image_thumbnail(image, size, method="thumbnail")
-            alt = image.alt
-            return Image(alt=alt, url=info.context.build_absolute_uri(url))
+            return get_thumbnail_url(info, image.image, size, method="thumbnail").then(
+                lambda url: Image(
+                    alt=image.alt, url=info.context.build_absolute_uri(url)
+                )
+            )
 
         def _get_first_variant_image(all_medias):
             if image := next(
@@ -1,6 +1,7 @@
 import graphene
 
 from ...core.permissions import PagePermissions, PageTypePermissions
+from ...menu.cache import invalidate_menu_trees
 from ...page import models
 from ..core.mutations import BaseBulkMutation, ModelBulkDeleteMutation
 from ..core.types.common import PageError
@@ -39,6 +40,7 @@ class PageBulkPublish(BaseBulkMutation):
     @classmethod
     def bulk_action(cls, info, queryset, is_published):
         queryset.update(is_published=is_published)
+        invalidate_menu_trees()
 
 
 class PageTypeBulkDelete(ModelBulkDeleteMutation):
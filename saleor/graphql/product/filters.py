@@ -24,6 +24,7 @@ from ...attribute.models import (
 )
 from ...channel.models import Channel
 from ...product import ProductTypeKind
+from ...product.category_tree import get_category_tree
 from ...product.models import (
     Category,
     Collection,
@@ -289,11 +290,8 @@ def filter_products_by_minimal_price(
 
 
 def filter_products_by_categories(qs, category_ids):
-    categories = Category.objects.filter(pk__in=category_ids)
-    categories = Category.tree.get_queryset_descendants(
-        categories, include_self=True
-    ).values("pk")
-    return qs.filter(Exists(categories.filter(pk=OuterRef("category_id"))))
+    category_ids = get_category_tree().get_descendant_ids_of(category_ids)
+    return qs.filter(category_id__in=category_ids)
 
 
 def filter_products_by_collections(qs, collection_pks):
@@ -7,6 +7,7 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.utils import IntegrityError
 
+from ....checkout.lines_cache import invalidate_checkout_lines_catalogue_version
 from ....checkout.models import CheckoutLine
 from ....core.permissions import ProductPermissions
 from ....core.tracing import traced_atomic_transaction
@@ -222,6 +223,7 @@ class ProductChannelListingUpdate(BaseChannelListingMutation):
                     )
                 }
             )
+        invalidate_checkout_lines_catalogue_version()
 
     @classmethod
     def remove_variants(
@@ -1,6 +1,7 @@
 import pytest
 
 from .....discount.models import Sale, SaleChannelListing
+from .....product.category_tree import invalidate_category_tree
 from .....product.models import Category
 
 
@@ -247,4 +248,5 @@ def categories_with_children(db):
         )
     )
     categories = Category.objects.bulk_create(categories)
+    invalidate_category_tree()
     return categories
@@ -2,7 +2,11 @@ from unittest import mock
 
 import graphene
 
-from ....product.utils.availability import get_product_availability
+from ....plugins.manager import get_plugins_manager
+from ....product.utils.availability import (
+    get_product_availability,
+    update_products_pricing_snapshots,
+)
 from ....warehouse.models import Warehouse
 from ...tests.utils import get_graphql_content
 
@@ -133,3 +137,77 @@ def test_product_channel_listing_pricing_field_no_address(
         mock_get_product_availability.call_args[1]["country"]
         == channel_USD.default_country
     )
+
+
+@mock.patch(
+    "saleor.graphql.product.types.products.get_product_availability",
+    wraps=get_product_availability,
+)
+def test_product_pricing_served_from_snapshot(
+    mock_get_product_availability,
+    staff_api_client,
+    permission_manage_products,
+    channel_USD,
+    product,
+    settings,
+):
+    # given
+    settings.PRODUCT_PRICING_SNAPSHOT_ENABLED = True
+    update_products_pricing_snapshots([product.pk], [], get_plugins_manager())
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    price = product_channel_listing.pricing_snapshot["price_range_undiscounted"]
+    price["start"]["gross"] = "1.23"
+    product_channel_listing.save(update_fields=["pricing_snapshot"])
+    product.channel_listings.exclude(channel__slug=channel_USD.slug).delete()
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_PRICING_ON_PRODUCT_CHANNEL_LISTING_NO_ADDRESS,
+        variables=variables,
+        permissions=(permission_manage_products,),
+        check_no_permissions=False,
+    )
+
+    # then
+    content = get_graphql_content(response)
+    pricing = content["data"]["product"]["pricing"]
+    assert pricing["priceRangeUndiscounted"]["start"]["gross"]["amount"] == 1.23
+    mock_get_product_availability.assert_not_called()
+
+
+@mock.patch(
+    "saleor.graphql.product.types.products.get_product_availability",
+    wraps=get_product_availability,
+)
+def test_product_pricing_without_snapshot_is_calculated(
+    mock_get_product_availability,
+    staff_api_client,
+    permission_manage_products,
+    channel_USD,
+    product,
+    settings,
+):
+    # given
+    settings.PRODUCT_PRICING_SNAPSHOT_ENABLED = True
+    product.channel_listings.exclude(channel__slug=channel_USD.slug).delete()
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_PRICING_ON_PRODUCT_CHANNEL_LISTING_NO_ADDRESS,
+        variables=variables,
+        permissions=(permission_manage_products,),
+        check_no_permissions=False,
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["pricing"]["priceRangeUndiscounted"]
+    mock_get_product_availability.assert_called_once()
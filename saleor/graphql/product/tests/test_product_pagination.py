@@ -6,6 +6,7 @@ import pytest
 
 from ....attribute.utils import associate_attribute_values_to_instance
 from ....product import ProductTypeKind
+from ....product.category_tree import invalidate_category_tree
 from ....product.models import (
     Category,
     Collection,
@@ -37,6 +38,7 @@ def categories_for_pagination(product_type):
         }
     )
     categories = Category.objects.bulk_create(categories)
+    invalidate_category_tree()
     Product.objects.bulk_create(
         [
             Product(
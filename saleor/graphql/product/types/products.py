@@ -6,6 +6,7 @@ from django.conf import settings
 from django_countries.fields import Country
 from graphene import relay
 from graphene_federation import key
+from promise import Promise
 
 from ....attribute import models as attribute_models
 from ....core.permissions import (
@@ -17,11 +18,12 @@ from ....core.tracing import traced_resolver
 from ....core.utils import get_currency_for_country
 from ....core.weight import convert_weight_to_default_weight_unit
 from ....product import models
+from ....product.category_tree import get_category_tree
 from ....product.models import ALL_PRODUCTS_PERMISSIONS
-from ....product.product_images import get_product_image_thumbnail, get_thumbnail
 from ....product.utils import calculate_revenue_for_variant
 from ....product.utils.availability import (
     get_product_availability,
+    get_product_availability_from_snapshot,
     get_variant_availability,
 )
 from ....product.utils.variants import get_variant_selection_attributes
@@ -63,6 +65,7 @@ from ...product.dataloaders.products import (
     AvailableProductVariantsByProductIdAndChannel,
     ProductVariantsByProductIdAndChannel,
 )
+from ...thumbnail.utils import get_thumbnail_url
 from ...translations.fields import TranslationField
 from ...translations.types import (
     CategoryTranslation,
@@ -766,9 +769,13 @@ class Product(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
                         alt=oembed_data["title"], url=oembed_data["thumbnail_url"]
                     )
 
-                url = get_product_image_thumbnail(image, size, method="thumbnail")
-                alt = image.alt
-                return Image(alt=alt, url=info.context.build_absolute_uri(url))
+                return get_thumbnail_url(
+                    info, image.image, size, method="thumbnail"
+                ).then(
+                    lambda url: Image(
+                        alt=image.alt, url=info.context.build_absolute_uri(url)
+                    )
+                )
             return None
 
         return (
@@ -793,6 +800,44 @@ class Product(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
         product_channel_listing = ProductChannelListingByProductIdAndChannelSlugLoader(
             context
         ).load((root.node.id, channel_slug))
+        channel = ChannelBySlugLoader(context).load(channel_slug)
+
+        address_country = address.country if address is not None else None
+
+        if address_country is None and settings.PRODUCT_PRICING_SNAPSHOT_ENABLED:
+            # Serve the pricing precomputed for the channel default country, and
+            # calculate it only for listings without an up-to-date snapshot.
+            def get_pricing_from_snapshot(product_channel_listing):
+                def get_pricing_from_snapshot_with_channel(channel):
+                    availability = get_product_availability_from_snapshot(
+                        product_channel_listing, channel.default_country.code
+                    )
+                    if availability is None:
+                        return Product._calculate_pricing(
+                            root, info, product_channel_listing, channel, None
+                        )
+                    return ProductPricingInfo(**asdict(availability))
+
+                return channel.then(get_pricing_from_snapshot_with_channel)
+
+            return product_channel_listing.then(get_pricing_from_snapshot)
+
+        return Product._calculate_pricing(
+            root, info, product_channel_listing, channel, address_country
+        )
+
+    @staticmethod
+    def _calculate_pricing(
+        root: ChannelContext[models.Product],
+        info,
+        product_channel_listing,
+        channel,
+        address_country,
+    ):
+        context = info.context
+        channel_slug = str(root.channel_slug)
+        product_channel_listing = Promise.resolve(product_channel_listing)
+        channel = Promise.resolve(channel)
         variants = ProductVariantsByProductIdLoader(context).load(root.node.id)
         variants_channel_listing = (
             VariantsChannelListingByProductIdAndChannelSlugLoader(context).load(
@@ -800,9 +845,6 @@ class Product(ChannelContextTypeWithMetadata, CountableDjangoObjectType):
             )
         )
         collections = CollectionsByProductIdLoader(context).load(root.node.id)
-        channel = ChannelBySlugLoader(context).load(channel_slug)
-
-        address_country = address.country if address is not None else None
 
         def calculate_pricing_info(discounts):
             def calculate_pricing_with_channel(channel):
@@ -1357,7 +1399,7 @@ class Category(CountableDjangoObjectType):
         has_required_permissions = has_one_of_permissions(
             requestor, ALL_PRODUCTS_PERMISSIONS
         )
-        tree = root.get_descendants(include_self=True)
+        category_ids = get_category_tree().get_descendant_ids(root.pk)
         if channel is None and not has_required_permissions:
             channel = get_default_channel_slug_or_graphql_error()
         qs = models.Product.objects.all()
@@ -1371,7 +1413,7 @@ class Category(CountableDjangoObjectType):
             )
         if channel and has_required_permissions:
             qs = qs.filter(channel_listings__channel__slug=channel)
-        qs = qs.filter(category__in=tree)
+        qs = qs.filter(category_id__in=category_ids)
         return ChannelQsContext(qs=qs, channel_slug=channel)
 
     @staticmethod
@@ -1398,11 +1440,11 @@ class ProductMedia(CountableDjangoObjectType):
         if root.external_url:
             return root.external_url
 
-        if size:
-            url = get_thumbnail(root.image, size, method="thumbnail")
-        else:
-            url = root.image.url
-        return info.context.build_absolute_uri(url)
+        if not size:
+            return info.context.build_absolute_uri(root.image.url)
+        return get_thumbnail_url(info, root.image, size, method="thumbnail").then(
+            info.context.build_absolute_uri
+        )
 
     @staticmethod
     def __resolve_reference(root: "ProductMedia", _info, **_kwargs):
@@ -1436,8 +1478,8 @@ class ProductImage(graphene.ObjectType):
 
     @staticmethod
     def resolve_url(root: models.ProductMedia, info, *, size=None):
-        if size:
-            url = get_thumbnail(root.image, size, method="thumbnail")
-        else:
-            url = root.image.url
-        return info.context.build_absolute_uri(url)
+        if not size:
+            return info.context.build_absolute_uri(root.image.url)
+        return get_thumbnail_url(info, root.image, size, method="thumbnail").then(
+            info.context.build_absolute_uri
+        )
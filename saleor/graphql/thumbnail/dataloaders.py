@@ -0,0 +1,28 @@
+from django.core.files.storage import default_storage
+
+from ...thumbnail.models import Thumbnail
+from ..core.dataloaders import DataLoader
+
+
+class ThumbnailUrlByImageSizeAndFormatLoader(DataLoader):
+    """Load URLs of thumbnails recorded in the thumbnails manifest.
+
+    Keys are tuples of the image name, the rendition key and the thumbnail format;
+    None is returned for thumbnails missing in the manifest. The manifest stores
+    only storage names, URLs are built by the storage on every request, so signed
+    and custom domain URLs stay valid.
+    """
+
+    context_key = "thumbnail_url_by_image_size_and_format"
+
+    def batch_load(self, keys):
+        thumbnails = Thumbnail.objects.filter(image__in={image for image, _, _ in keys})
+        names = {
+            (image, size, fmt): name
+            for image, size, fmt, name in thumbnails.values_list(
+                "image", "size", "format", "name"
+            )
+        }
+        return [
+            default_storage.url(names[key]) if key in names else None for key in keys
+        ]
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import graphene
+from django.core.files.storage import default_storage
+
+from ....product.product_images import get_thumbnail
+from ....thumbnail import ThumbnailFormat
+from ....thumbnail.models import Thumbnail
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCT_THUMBNAILS = """
+    query Product($id: ID!, $channel: String) {
+        product(id: $id, channel: $channel) {
+            thumbnail(size: 255) {
+                url
+            }
+            media {
+                url(size: 255)
+            }
+        }
+    }
+"""
+
+
+def _record_thumbnails(product):
+    return {
+        media.image.name: Thumbnail.objects.create(
+            image=media.image.name,
+            size="thumbnail__255x255",
+            format=ThumbnailFormat.ORIGINAL,
+            name=f"thumbnails/{media.pk}.jpg",
+        )
+        for media in product.media.all()
+    }
+
+
+@patch("saleor.graphql.thumbnail.utils.get_thumbnail", wraps=get_thumbnail)
+def test_product_thumbnails_resolved_from_manifest(
+    get_thumbnail_mock, api_client, product_with_images, channel_USD, settings
+):
+    # given
+    settings.VERSATILEIMAGEFIELD_SETTINGS = {"create_images_on_demand": False}
+    product = product_with_images
+    thumbnails = _record_thumbnails(product)
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_THUMBNAILS, variables)
+
+    # then
+    data = get_graphql_content(response)["data"]["product"]
+    expected_urls = [
+        f"http://testserver{default_storage.url(thumbnails[media.image.name].name)}"
+        for media in product.media.all()
+    ]
+    assert data["thumbnail"]["url"] == expected_urls[0]
+    assert [media["url"] for media in data["media"]] == expected_urls
+    get_thumbnail_mock.assert_not_called()
+
+
+@patch("saleor.graphql.thumbnail.utils.get_thumbnail", wraps=get_thumbnail)
+def test_product_thumbnails_missing_in_manifest(
+    get_thumbnail_mock, api_client, product_with_images, channel_USD, settings
+):
+    # given
+    settings.VERSATILEIMAGEFIELD_SETTINGS = {"create_images_on_demand": False}
+    product = product_with_images
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT_THUMBNAILS, variables)
+
+    # then
+    data = get_graphql_content(response)["data"]["product"]
+    assert len(data["media"]) == 2
+    assert get_thumbnail_mock.call_count == 3
@@ -0,0 +1,33 @@
+from promise import Promise
+
+from ...product.product_images import get_thumbnail, get_thumbnail_rendition_key
+from ...thumbnail import ThumbnailFormat
+from .dataloaders import ThumbnailUrlByImageSizeAndFormatLoader
+
+
+def get_thumbnail_url(
+    info, image_file, size, method, rendition_key_set="products"
+) -> Promise:
+    """Return a promise of the thumbnail URL, as returned by `get_thumbnail`.
+
+    URLs of the thumbnails recorded in the manifest are loaded in one query for
+    all images of the request; the storage is accessed only for the other ones.
+    """
+    if not image_file:
+        return Promise.resolve(get_thumbnail(image_file, size, method))
+    rendition_key = get_thumbnail_rendition_key(size, method, rendition_key_set)
+    if rendition_key is None:
+        return Promise.resolve(
+            get_thumbnail(image_file, size, method, rendition_key_set)
+        )
+
+    def get_url(manifest_url):
+        if manifest_url:
+            return manifest_url
+        return get_thumbnail(image_file, size, method, rendition_key_set)
+
+    return (
+        ThumbnailUrlByImageSizeAndFormatLoader(info.context)
+        .load((image_file.name, rendition_key, ThumbnailFormat.ORIGINAL))
+        .then(get_url)
+    )
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import opentracing
 import opentracing.tags
 from django.conf import settings
+from django.contrib.auth import authenticate
 from django.core.cache import cache
 from django.db import connection
 from django.db.backends.postgresql.base import DatabaseWrapper
@@ -26,11 +27,14 @@ from jwt.exceptions import PyJWTError
 
 from .. import __version__ as saleor_version
 from ..core.exceptions import PermissionDenied, ReadOnlyException
+from ..core.instrumentation import Instrumentation
+from ..core.query_report import finish_query_recording
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from .utils import query_fingerprint
 
 API_PATH = SimpleLazyObject(lambda: reverse("api"))
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
+INSTRUMENTATION_HEADER = "HTTP_X_SALEOR_INSTRUMENTATION"
 
 unhandled_errors_logger = logging.getLogger("saleor.graphql.errors.unhandled")
 handled_errors_logger = logging.getLogger("saleor.graphql.errors.handled")
@@ -51,6 +55,27 @@ def tracing_wrapper(execute, sql, params, many, context):
         return execute(sql, params, many, context)
 
 
+def should_instrument_request(request: HttpRequest) -> bool:
+    """Check if performance details should be returned with the response.
+
+    The details are returned to staff users, or to anyone in debug mode, when
+    the request has the `X-Saleor-Instrumentation` header.
+    """
+    if request.META.get(INSTRUMENTATION_HEADER, "").lower() not in ("1", "true"):
+        return False
+    if settings.DEBUG:
+        return True
+    if not hasattr(request, "_cached_user"):
+        try:
+            user = authenticate(request=request)
+        except PyJWTError:
+            # leave reporting invalid tokens to the execution of the query
+            return False
+        request._cached_user = user
+    user = request._cached_user
+    return bool(user and user.is_active and user.is_staff)
+
+
 class GraphQLView(View):
     # This class is our implementation of `graphene_django.views.GraphQLView`,
     # which was extended to support the following features:
@@ -187,7 +212,22 @@ class GraphQLView(View):
     def get_response(
         self, request: HttpRequest, data: dict
     ) -> Tuple[Optional[Dict[str, List[Any]]], int]:
-        execution_result = self.execute_graphql_request(request, data)
+        request.instrumentation = None
+        try:
+            if should_instrument_request(request):
+                request.instrumentation = Instrumentation()
+                with request.instrumentation.activate(), connection.execute_wrapper(
+                    request.instrumentation
+                ):
+                    execution_result = self.execute_graphql_request(request, data)
+            else:
+                execution_result = self.execute_graphql_request(request, data)
+        finally:
+            # the query recorder is started by `QueryReportMiddleware`
+            if hasattr(request, "query_recorder"):
+                if request.query_recorder:
+                    finish_query_recording(connection, request.query_recorder)
+                del request.query_recorder
         status_code = 200
         if execution_result:
             response = {}
@@ -199,6 +239,10 @@ class GraphQLView(View):
                 status_code = 400
             else:
                 response["data"] = execution_result.data
+            if request.instrumentation:
+                response["extensions"] = {
+                    "instrumentation": request.instrumentation.as_dict()
+                }
             result: Optional[Dict[str, List[Any]]] = response
         else:
             result = None
@@ -262,7 +306,8 @@ class GraphQLView(View):
             if document is not None:
                 raw_query_string = document.document_string
                 span.set_tag("graphql.query", raw_query_string)
-                span.set_tag("graphql.query_fingerprint", query_fingerprint(document))
+                request.query_fingerprint = query_fingerprint(document)
+                span.set_tag("graphql.query_fingerprint", request.query_fingerprint)
                 try:
                     query_contains_schema = self.check_if_query_contains_only_schema(
                         document
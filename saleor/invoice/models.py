@@ -45,6 +45,17 @@ class Invoice(ModelWithMetadata, Job):
             self.external_url = url
 
 
+class InvoiceNumberSequence(models.Model):
+    """Last invoice number generated in the period, e.g. "07/2021".
+
+    The row is locked while the next number is generated, so concurrent requests
+    get consecutive numbers without gaps or duplicates.
+    """
+
+    period = models.CharField(max_length=32, unique=True)
+    last_number = models.PositiveIntegerField(default=0)
+
+
 class InvoiceEvent(models.Model):
     """Model used to store events that happened during the invoice lifecycle."""
 
@@ -0,0 +1,40 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class MenuAppConfig(AppConfig):
+    name = "saleor.menu"
+
+    def ready(self):
+        from ..page.models import Page, PageTranslation
+        from ..product.models import (
+            Category,
+            CategoryTranslation,
+            Collection,
+            CollectionTranslation,
+        )
+        from .models import Menu, MenuItem, MenuItemTranslation
+        from .signals import invalidate_menu_trees_on_change
+
+        # invalidating cached menu trees
+        for model in [
+            Menu,
+            MenuItem,
+            MenuItemTranslation,
+            Category,
+            CategoryTranslation,
+            Collection,
+            CollectionTranslation,
+            Page,
+            PageTranslation,
+        ]:
+            post_save.connect(
+                invalidate_menu_trees_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_menu_trees_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_menu_trees_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_menu_trees_{model.__name__}_delete",
+            )
@@ -0,0 +1,233 @@
+"""Menu trees cached between requests.
+
+Storefronts render the same menus on every page view, while menus change rarely.
+All items of a menu, the categories, collections and pages they link to and the
+translations of all of them are fetched at once and cached under the menu ID.
+Visibility of the linked objects depends on the channel and the requestor, so
+it is still checked when the cached tree is resolved.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model
+
+from ..core.cache import CacheVersion
+from ..core.snapshots import get_snapshot_values, instance_from_snapshot_values
+from ..page.models import Page, PageTranslation
+from ..product.models import (
+    Category,
+    CategoryTranslation,
+    Collection,
+    CollectionTranslation,
+)
+from .models import MenuItem, MenuItemTranslation
+
+MENU_TREE_CACHE_KEY = "menu_tree:{}:{}"
+menu_trees_version = CacheVersion("menu_trees_version")
+
+# Linked objects of menu items, with their translation models and the names of
+# the translation fields referencing them.
+MENU_ITEM_LINKED_MODELS = {
+    "category": (Category, CategoryTranslation, "category_id"),
+    "collection": (Collection, CollectionTranslation, "collection_id"),
+    "page": (Page, PageTranslation, "page_id"),
+}
+
+
+def get_item_sort_key(item: MenuItem):
+    # same order as `MenuItem.Meta.ordering`, items without sort order go last
+    return (item.sort_order is None, item.sort_order or 0, item.pk)
+
+
+class MenuTree:
+    """Items of a menu with the objects they link to and all their translations."""
+
+    def __init__(
+        self,
+        items: List[MenuItem],
+        linked_objects: Dict[str, Dict[int, Model]],
+        translations: Dict[Type[Model], Dict[Tuple[int, str], Model]],
+    ):
+        self.items = items
+        self.linked_objects = linked_objects
+        self.translations = translations
+        self.children: Dict[Optional[int], List[MenuItem]] = defaultdict(list)
+        for item in sorted(items, key=get_item_sort_key):
+            self.children[item.parent_id].append(item)
+
+    def get_children(self, menu_item_id: Optional[int] = None) -> List[MenuItem]:
+        """Return children of the item, or top-level items of the menu for None."""
+        return self.children.get(menu_item_id, [])
+
+
+class MenuTreeSnapshot:
+    """Field values of the objects of a menu tree, stored in the cache."""
+
+    __slots__ = ("items", "linked_objects", "translations")
+
+    def __init__(
+        self,
+        items: List[tuple],
+        linked_objects: Dict[str, List[tuple]],
+        translations: Dict[str, List[tuple]],
+    ):
+        self.items = items
+        self.linked_objects = linked_objects
+        self.translations = translations
+
+    @classmethod
+    def from_tree(cls, tree: MenuTree) -> "MenuTreeSnapshot":
+        return cls(
+            items=[get_snapshot_values(item) for item in tree.items],
+            linked_objects={
+                attr: [get_snapshot_values(instance) for instance in instances.values()]
+                for attr, instances in tree.linked_objects.items()
+            },
+            translations={
+                model._meta.label: [
+                    get_snapshot_values(translation)
+                    for translation in translations.values()
+                ]
+                for model, translations in tree.translations.items()
+            },
+        )
+
+    def to_tree(self) -> MenuTree:
+        linked_objects = {}
+        translations = {}
+        for attr, (model, _, _) in MENU_ITEM_LINKED_MODELS.items():
+            linked_objects[attr] = {
+                instance.pk: instance
+                for instance in (
+                    instance_from_snapshot_values(model, values)
+                    for values in self.linked_objects[attr]
+                )
+            }
+        for translation_model, object_id_attr in get_translation_models():
+            translations[translation_model] = index_translations(
+                (
+                    instance_from_snapshot_values(translation_model, values)
+                    for values in self.translations[translation_model._meta.label]
+                ),
+                object_id_attr,
+            )
+        return MenuTree(
+            items=[
+                instance_from_snapshot_values(MenuItem, values) for values in self.items
+            ],
+            linked_objects=linked_objects,
+            translations=translations,
+        )
+
+
+def get_translation_models() -> List[Tuple[Type[Model], str]]:
+    return [(MenuItemTranslation, "menu_item_id")] + [
+        (translation_model, object_id_attr)
+        for _, translation_model, object_id_attr in MENU_ITEM_LINKED_MODELS.values()
+    ]
+
+
+def index_translations(
+    translations: Iterable[Model], object_id_attr: str
+) -> Dict[Tuple[int, str], Model]:
+    return {
+        (getattr(translation, object_id_attr), translation.language_code): translation
+        for translation in translations
+    }
+
+
+def get_translated_object_ids(
+    items: List[MenuItem], linked_objects: Dict[str, Dict[int, Model]]
+) -> Dict[Type[Model], Set[int]]:
+    object_ids = {MenuItemTranslation: {item.pk for item in items}}
+    for attr, (_, translation_model, _) in MENU_ITEM_LINKED_MODELS.items():
+        object_ids[translation_model] = set(linked_objects[attr])
+    return object_ids
+
+
+def build_menu_trees(menu_ids: Iterable[int]) -> Dict[int, MenuTree]:
+    trees_data: Dict[int, Tuple[List[MenuItem], Dict[str, Dict[int, Model]]]] = {
+        menu_id: ([], {attr: {} for attr in MENU_ITEM_LINKED_MODELS})
+        for menu_id in menu_ids
+    }
+    for item in MenuItem.objects.filter(menu_id__in=trees_data).select_related(
+        *MENU_ITEM_LINKED_MODELS
+    ):
+        items, linked_objects = trees_data[item.menu_id]
+        items.append(item)
+        for attr in MENU_ITEM_LINKED_MODELS:
+            instance = getattr(item, attr)
+            if instance is not None:
+                linked_objects[attr][instance.pk] = instance
+
+    menus_object_ids = {
+        menu_id: get_translated_object_ids(items, linked_objects)
+        for menu_id, (items, linked_objects) in trees_data.items()
+    }
+    translations: Dict[Type[Model], Dict[Tuple[int, str], Model]] = {}
+    for translation_model, object_id_attr in get_translation_models():
+        ids = set().union(
+            *(object_ids[translation_model] for object_ids in menus_object_ids.values())
+        )
+        translations[translation_model] = index_translations(
+            translation_model.objects.filter(**{f"{object_id_attr}__in": ids})
+            if ids
+            else [],
+            object_id_attr,
+        )
+
+    trees = {}
+    for menu_id, (items, linked_objects) in trees_data.items():
+        object_ids = menus_object_ids[menu_id]
+        trees[menu_id] = MenuTree(
+            items=items,
+            linked_objects=linked_objects,
+            translations={
+                translation_model: {
+                    key: translation
+                    for key, translation in model_translations.items()
+                    if key[0] in object_ids[translation_model]
+                }
+                for translation_model, model_translations in translations.items()
+            },
+        )
+    return trees
+
+
+def fetch_menu_trees(menu_ids: Iterable[int]) -> Dict[int, MenuTree]:
+    """Return trees of the given menus, from the cache when possible."""
+    menu_ids = list(menu_ids)
+    if not settings.MENU_CACHE_TIMEOUT:
+        return build_menu_trees(menu_ids)
+
+    version = menu_trees_version.get()
+    keys = {
+        menu_id: MENU_TREE_CACHE_KEY.format(version, menu_id) for menu_id in menu_ids
+    }
+    cached = cache.get_many(keys.values())
+    trees = {
+        menu_id: cached[key].to_tree() for menu_id, key in keys.items() if key in cached
+    }
+    missing_ids = [menu_id for menu_id in menu_ids if menu_id not in trees]
+    if missing_ids:
+        built_trees = build_menu_trees(missing_ids)
+        cache.set_many(
+            {
+                keys[menu_id]: MenuTreeSnapshot.from_tree(tree)
+                for menu_id, tree in built_trees.items()
+            },
+            timeout=settings.MENU_CACHE_TIMEOUT,
+        )
+        trees.update(built_trees)
+    return trees
+
+
+def invalidate_menu_trees():
+    """Make the cached trees of all menus outdated.
+
+    Called when menus, menu items, the objects they link to or any of their
+    translations change.
+    """
+    menu_trees_version.invalidate()
@@ -0,0 +1,5 @@
+from .cache import invalidate_menu_trees
+
+
+def invalidate_menu_trees_on_change(sender, **kwargs):
+    invalidate_menu_trees()
@@ -0,0 +1,115 @@
+from ..cache import fetch_menu_trees, invalidate_menu_trees
+from ..models import MenuItem, MenuItemTranslation
+
+
+def _get_tree_data(tree):
+    return [
+        (
+            menu_item.name,
+            [child.name for child in tree.get_children(menu_item.pk)],
+        )
+        for menu_item in tree.get_children()
+    ]
+
+
+def test_fetch_menu_trees_reuses_cached_tree(
+    menu, category_translation_fr, page, django_assert_num_queries
+):
+    # given
+    category = category_translation_fr.category
+    parent = MenuItem.objects.create(menu=menu, name="Parent", sort_order=1)
+    MenuItem.objects.create(menu=menu, name="Second", sort_order=2, page=page)
+    MenuItem.objects.create(
+        menu=menu, name="Child", parent=parent, category=category, sort_order=0
+    )
+    MenuItemTranslation.objects.create(
+        menu_item=parent, language_code="fr", name="Parent FR"
+    )
+    tree = fetch_menu_trees([menu.pk])[menu.pk]
+
+    # when
+    with django_assert_num_queries(0):
+        cached_tree = fetch_menu_trees([menu.pk])[menu.pk]
+
+    # then
+    assert _get_tree_data(cached_tree) == _get_tree_data(tree)
+    assert _get_tree_data(cached_tree) == [
+        ("Parent", ["Child"]),
+        ("Second", []),
+    ]
+    assert cached_tree.linked_objects["category"][category.pk].name == category.name
+    assert cached_tree.linked_objects["page"][page.pk].title == page.title
+    assert (
+        cached_tree.translations[MenuItemTranslation][(parent.pk, "fr")].name
+        == "Parent FR"
+    )
+    assert (
+        cached_tree.translations[type(category_translation_fr)][
+            (category.pk, "fr")
+        ].name
+        == category_translation_fr.name
+    )
+
+
+def test_fetch_menu_trees_of_menu_without_items(menu):
+    # when
+    trees = fetch_menu_trees([menu.pk])
+
+    # then
+    assert trees[menu.pk].get_children() == []
+
+
+def test_fetch_menu_trees_cache_invalidated_on_menu_item_change(menu_item):
+    # given
+    menu_id = menu_item.menu_id
+    fetch_menu_trees([menu_id])
+
+    # when
+    menu_item.name = "New name"
+    menu_item.save(update_fields=["name"])
+
+    # then
+    tree = fetch_menu_trees([menu_id])[menu_id]
+    assert tree.get_children()[0].name == "New name"
+
+
+def test_fetch_menu_trees_cache_invalidated_on_linked_object_change(menu, category):
+    # given
+    MenuItem.objects.create(menu=menu, name="Category", category=category)
+    fetch_menu_trees([menu.pk])
+
+    # when
+    category.name = "New name"
+    category.save(update_fields=["name"])
+
+    # then
+    tree = fetch_menu_trees([menu.pk])[menu.pk]
+    assert tree.linked_objects["category"][category.pk].name == "New name"
+
+
+def test_fetch_menu_trees_cache_invalidated_on_bulk_update(menu_item_list):
+    # given
+    menu_id = menu_item_list[0].menu_id
+    fetch_menu_trees([menu_id])
+    MenuItem.objects.filter(pk=menu_item_list[0].pk).update(name="Updated")
+
+    # when
+    invalidate_menu_trees()
+
+    # then
+    tree = fetch_menu_trees([menu_id])[menu_id]
+    assert "Updated" in [menu_item.name for menu_item in tree.get_children()]
+
+
+def test_fetch_menu_trees_without_cache(menu_item, settings, django_assert_num_queries):
+    # given
+    settings.MENU_CACHE_TIMEOUT = 0
+    menu_id = menu_item.menu_id
+    fetch_menu_trees([menu_id])
+
+    # when
+    with django_assert_num_queries(2):
+        tree = fetch_menu_trees([menu_id])[menu_id]
+
+    # then
+    assert tree.get_children() == [menu_item]
@@ -5,6 +5,8 @@ if TYPE_CHECKING:
     from ..product.models import ProductVariant
     from .models import FulfillmentLine, OrderLine
 
+default_app_config = "saleor.order.app.OrderAppConfig"
+
 
 class OrderStatus:
     DRAFT = "draft"  # fully editable, not finalized order created by staff users
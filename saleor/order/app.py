@@ -0,0 +1,45 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class OrderAppConfig(AppConfig):
+    name = "saleor.order"
+
+    def ready(self):
+        from ..discount.models import OrderDiscount
+        from .models import Order
+        from .signals import (
+            update_order_search_document_on_discount_change,
+            update_order_search_document_on_save,
+            update_user_order_stats_on_delete,
+            update_user_order_stats_on_save,
+        )
+
+        # keeping search documents of orders up to date
+        post_save.connect(
+            update_order_search_document_on_save,
+            sender=Order,
+            dispatch_uid="update_order_search_document_on_save",
+        )
+        post_save.connect(
+            update_order_search_document_on_discount_change,
+            sender=OrderDiscount,
+            dispatch_uid="update_order_search_document_on_discount_save",
+        )
+        post_delete.connect(
+            update_order_search_document_on_discount_change,
+            sender=OrderDiscount,
+            dispatch_uid="update_order_search_document_on_discount_delete",
+        )
+
+        # keeping order statistics of customers up to date
+        post_save.connect(
+            update_user_order_stats_on_save,
+            sender=Order,
+            dispatch_uid="update_user_order_stats_on_order_save",
+        )
+        post_delete.connect(
+            update_user_order_stats_on_delete,
+            sender=Order,
+            dispatch_uid="update_user_order_stats_on_order_delete",
+        )
@@ -0,0 +1,39 @@
+# Generated by Django 3.2.7 on 2026-10-19 22:10
+
+from django.db import migrations
+
+from ...order.search import prepare_order_search_document_value
+
+BATCH_SIZE = 1000
+
+
+def populate_order_search_document(apps, schema_editor):
+    Order = apps.get_model("order", "Order")
+    orders = Order.objects.filter(search_document="").order_by("pk")
+    last_pk = None
+    while True:
+        batch_orders = orders if last_pk is None else orders.filter(pk__gt=last_pk)
+        batch = list(
+            batch_orders.select_related("user").prefetch_related("discounts")[
+                :BATCH_SIZE
+            ]
+        )
+        if not batch:
+            break
+        for order in batch:
+            order.search_document = prepare_order_search_document_value(order)
+        Order.objects.bulk_update(batch, ["search_document"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+    # every batch is committed separately
+    atomic = False
+
+    dependencies = [
+        ("order", "0121_order_search_document"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_order_search_document, migrations.RunPython.noop),
+    ]
@@ -247,13 +247,22 @@ class Order(ModelWithMetadata):
         default=zero_weight,
     )
     redirect_url = models.URLField(blank=True, null=True)
+    search_document = models.TextField(blank=True, default="")
 
     objects = models.Manager.from_queryset(OrderQueryset)()
 
     class Meta:
         ordering = ("-pk",)
         permissions = ((OrderPermissions.MANAGE_ORDERS.codename, "Manage orders."),)
-        indexes = [*ModelWithMetadata.Meta.indexes, GinIndex(fields=["user_email"])]
+        indexes = [
+            *ModelWithMetadata.Meta.indexes,
+            GinIndex(fields=["user_email"]),
+            GinIndex(
+                name="order_search_document_gin",
+                fields=["search_document"],
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.token:
@@ -539,6 +548,9 @@ class OrderLine(models.Model):
 
     class Meta:
         ordering = ("pk",)
+        indexes = [
+            models.Index(name="orderline_product_sku_idx", fields=["product_sku"])
+        ]
 
     def __str__(self):
         return (
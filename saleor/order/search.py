@@ -0,0 +1,38 @@
+"""Search documents of orders.
+
+The dashboard searches orders by the customer's email and names and by the names
+of the order discounts. These values are joined into a single lowercased document
+per order, stored in `Order.search_document` and indexed with a trigram GIN
+index, so the search doesn't join users and discounts.
+"""
+from typing import List
+
+from django.db.models import QuerySet
+
+from ..account.search import generate_search_document
+from .models import Order
+
+
+def get_order_search_values(order: Order) -> List:
+    values = [order.user_email]
+    if user := order.user:
+        values.extend([user.email, user.first_name, user.last_name])
+    for discount in order.discounts.all():
+        values.extend([discount.name, discount.translated_name])
+    return values
+
+
+def prepare_order_search_document_value(order: Order) -> str:
+    return generate_search_document(get_order_search_values(order))
+
+
+def update_order_search_document(order: Order):
+    order.search_document = prepare_order_search_document_value(order)
+    Order.objects.filter(pk=order.pk).update(search_document=order.search_document)
+
+
+def update_orders_search_documents(orders: QuerySet):
+    orders = list(orders.select_related("user").prefetch_related("discounts"))
+    for order in orders:
+        order.search_document = prepare_order_search_document_value(order)
+    Order.objects.bulk_update(orders, ["search_document"])
@@ -0,0 +1,39 @@
+from ..account.order_stats import update_users_order_stats
+from .models import Order
+from .search import update_order_search_document
+
+ORDER_SEARCH_FIELDS = {"user", "user_id", "user_email"}
+ORDER_DISCOUNT_SEARCH_FIELDS = {"name", "translated_name"}
+ORDER_STATS_FIELDS = {"user", "user_id", "status", "total_paid_amount"}
+
+
+def update_order_search_document_on_save(
+    sender, instance, created, update_fields, **kwargs
+):
+    if update_fields is not None and not ORDER_SEARCH_FIELDS.intersection(
+        update_fields
+    ):
+        return
+    update_order_search_document(instance)
+
+
+def update_order_search_document_on_discount_change(
+    sender, instance, update_fields=None, **kwargs
+):
+    if update_fields is not None and not ORDER_DISCOUNT_SEARCH_FIELDS.intersection(
+        update_fields
+    ):
+        return
+    # the order is fetched again, as it could be deleted together with the discount
+    if order := Order.objects.filter(pk=instance.order_id).first():
+        update_order_search_document(order)
+
+
+def update_user_order_stats_on_save(sender, instance, update_fields, **kwargs):
+    if update_fields is not None and not ORDER_STATS_FIELDS.intersection(update_fields):
+        return
+    update_users_order_stats([instance.user_id])
+
+
+def update_user_order_stats_on_delete(sender, instance, **kwargs):
+    update_users_order_stats([instance.user_id])
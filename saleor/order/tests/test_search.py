@@ -0,0 +1,94 @@
+from decimal import Decimal
+
+from ...discount.models import OrderDiscount
+from ..models import Order
+from ..search import prepare_order_search_document_value, update_orders_search_documents
+from ..utils import match_orders_with_new_user
+
+
+def test_prepare_order_search_document_value(order):
+    # given
+    order.discounts.create(
+        name="Discount name",
+        translated_name="Translated name",
+        value=Decimal("1"),
+        amount_value=Decimal("1"),
+    )
+
+    # when
+    search_document = prepare_order_search_document_value(order)
+
+    # then
+    assert search_document == (
+        "test@example.com\ntest@example.com\nleslie\nwade\n"
+        "discount name\ntranslated name"
+    )
+
+
+def test_order_search_document_set_on_create(order):
+    # when
+    order.refresh_from_db()
+
+    # then
+    assert order.search_document == "test@example.com\ntest@example.com\nleslie\nwade"
+
+
+def test_order_search_document_updated_on_discount_change(order):
+    # given
+    discount = order.discounts.create(
+        name="Discount name", value=Decimal("1"), amount_value=Decimal("1")
+    )
+    order.refresh_from_db()
+    assert "discount name" in order.search_document
+
+    # when
+    discount.delete()
+
+    # then
+    order.refresh_from_db()
+    assert "discount name" not in order.search_document
+
+
+def test_order_search_document_not_updated_on_unrelated_discount_change(order):
+    # given
+    discount = order.discounts.create(
+        name="Discount name", value=Decimal("1"), amount_value=Decimal("1")
+    )
+    Order.objects.filter(pk=order.pk).update(search_document="")
+    discount.value = Decimal("2")
+
+    # when
+    discount.save(update_fields=["value"])
+
+    # then
+    order.refresh_from_db()
+    assert order.search_document == ""
+
+
+def test_update_orders_search_documents(order):
+    # given
+    OrderDiscount.objects.create(
+        order=order, name="Discount name", value=Decimal("1"), amount_value=1
+    )
+    Order.objects.update(search_document="")
+
+    # when
+    update_orders_search_documents(Order.objects.all())
+
+    # then
+    order.refresh_from_db()
+    assert order.search_document == prepare_order_search_document_value(order)
+
+
+def test_match_orders_with_new_user_updates_search_documents(order, customer_user2):
+    # given
+    order.user = None
+    order.user_email = customer_user2.email
+    order.save()
+
+    # when
+    match_orders_with_new_user(customer_user2)
+
+    # then
+    order.refresh_from_db()
+    assert order.search_document == ("test2@example.com\ntest2@example.com\njane\ndoe")
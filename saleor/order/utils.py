@@ -8,6 +8,7 @@ from django.utils import timezone
 from prices import Money, TaxedMoney, fixed_discount, percentage_discount
 
 from ..account.models import User
+from ..account.order_stats import update_users_order_stats
 from ..core.taxes import zero_money
 from ..core.tracing import traced_atomic_transaction
 from ..core.weight import zero_weight
@@ -29,6 +30,7 @@ from ..warehouse.management import (
 )
 from ..warehouse.models import Warehouse
 from . import events
+from .search import update_orders_search_documents
 
 if TYPE_CHECKING:
     from ..app.models import App
@@ -719,7 +721,11 @@ def get_voucher_discount_for_order(order: Order) -> Money:
 
 
 def match_orders_with_new_user(user: User) -> None:
-    Order.objects.confirmed().filter(user_email=user.email, user=None).update(user=user)
+    orders = Order.objects.confirmed().filter(user_email=user.email, user=None)
+    order_ids = list(orders.values_list("pk", flat=True))
+    orders.update(user=user)
+    update_orders_search_documents(Order.objects.filter(pk__in=order_ids))
+    update_users_order_stats([user.pk])
 
 
 def get_total_order_discount(order: Order) -> Money:
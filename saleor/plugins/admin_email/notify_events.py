@@ -1,4 +1,5 @@
-from ..email_common import get_email_subject, get_email_template_or_default
+from ..email_common import get_email_subject, get_email_template_reference_or_default
+from ..tasks import queue_email
 from . import constants
 from .tasks import (
     send_email_with_link_to_download_file_task,
@@ -13,7 +14,7 @@ def send_set_staff_password_email(
     payload: dict, config: dict, plugin_configuration: list
 ):
     recipient_email = payload["recipient_email"]
-    template = get_email_template_or_default(
+    template = get_email_template_reference_or_default(
         plugin_configuration,
         constants.SET_STAFF_PASSWORD_TEMPLATE_FIELD,
         constants.SET_STAFF_PASSWORD_DEFAULT_TEMPLATE,
@@ -24,8 +25,13 @@ def send_set_staff_password_email(
         constants.SET_STAFF_PASSWORD_SUBJECT_FIELD,
         constants.SET_STAFF_PASSWORD_DEFAULT_SUBJECT,
     )
-    send_set_staff_password_email_task.delay(
-        recipient_email, payload, config, subject, template
+    queue_email(
+        send_set_staff_password_email_task,
+        recipient_email,
+        payload,
+        config,
+        subject,
+        template,
     )
 
 
@@ -34,7 +40,7 @@ def send_csv_product_export_success(
 ):
     recipient_email = payload.get("recipient_email")
     if recipient_email:
-        template = get_email_template_or_default(
+        template = get_email_template_reference_or_default(
             plugin_configuration,
             constants.CSV_PRODUCT_EXPORT_SUCCESS_TEMPLATE_FIELD,
             constants.CSV_PRODUCT_EXPORT_SUCCESS_DEFAULT_TEMPLATE,
@@ -45,8 +51,13 @@ def send_csv_product_export_success(
             constants.CSV_PRODUCT_EXPORT_SUCCESS_SUBJECT_FIELD,
             constants.CSV_PRODUCT_EXPORT_SUCCESS_DEFAULT_SUBJECT,
         )
-        send_email_with_link_to_download_file_task.delay(
-            recipient_email, payload, config, subject, template
+        queue_email(
+            send_email_with_link_to_download_file_task,
+            recipient_email,
+            payload,
+            config,
+            subject,
+            template,
         )
 
 
@@ -54,7 +65,7 @@ def send_staff_order_confirmation(
     payload: dict, config: dict, plugin_configuration: list
 ):
     recipient_list = payload.get("recipient_list")
-    template = get_email_template_or_default(
+    template = get_email_template_reference_or_default(
         plugin_configuration,
         constants.STAFF_ORDER_CONFIRMATION_TEMPLATE_FIELD,
         constants.STAFF_ORDER_CONFIRMATION_DEFAULT_TEMPLATE,
@@ -65,15 +76,20 @@ def send_staff_order_confirmation(
         constants.STAFF_ORDER_CONFIRMATION_SUBJECT_FIELD,
         constants.STAFF_ORDER_CONFIRMATION_DEFAULT_SUBJECT,
     )
-    send_staff_order_confirmation_email_task.delay(
-        recipient_list, payload, config, subject, template
+    queue_email(
+        send_staff_order_confirmation_email_task,
+        recipient_list,
+        payload,
+        config,
+        subject,
+        template,
     )
 
 
 def send_csv_export_failed(payload: dict, config: dict, plugin_configuration: list):
     recipient_email = payload.get("recipient_email")
     if recipient_email:
-        template = get_email_template_or_default(
+        template = get_email_template_reference_or_default(
             plugin_configuration,
             constants.CSV_EXPORT_FAILED_TEMPLATE_FIELD,
             constants.CSV_EXPORT_FAILED_TEMPLATE_DEFAULT_TEMPLATE,
@@ -84,15 +100,20 @@ def send_csv_export_failed(payload: dict, config: dict, plugin_configuration: li
             constants.CSV_EXPORT_FAILED_SUBJECT_FIELD,
             constants.CSV_EXPORT_FAILED_DEFAULT_SUBJECT,
         )
-        send_export_failed_email_task.delay(
-            recipient_email, payload, config, subject, template
+        queue_email(
+            send_export_failed_email_task,
+            recipient_email,
+            payload,
+            config,
+            subject,
+            template,
         )
 
 
 def send_staff_reset_password(payload: dict, config: dict, plugin_configuration: list):
     recipient_email = payload.get("recipient_email")
     if recipient_email:
-        template = get_email_template_or_default(
+        template = get_email_template_reference_or_default(
             plugin_configuration,
             constants.STAFF_PASSWORD_RESET_TEMPLATE_FIELD,
             constants.STAFF_PASSWORD_RESET_DEFAULT_TEMPLATE,
@@ -103,6 +124,11 @@ def send_staff_reset_password(payload: dict, config: dict, plugin_configuration:
             constants.STAFF_PASSWORD_RESET_SUBJECT_FIELD,
             constants.STAFF_PASSWORD_RESET_DEFAULT_SUBJECT,
         )
-        send_staff_password_reset_email_task.delay(
-            recipient_email, payload, config, subject, template
+        queue_email(
+            send_staff_password_reset_email_task,
+            recipient_email,
+            payload,
+            config,
+            subject,
+            template,
         )
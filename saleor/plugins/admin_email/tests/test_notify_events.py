@@ -9,13 +9,17 @@ from ..notify_events import (
     send_staff_order_confirmation,
     send_staff_reset_password,
 )
+from ..tasks import (
+    send_email_with_link_to_download_file_task,
+    send_export_failed_email_task,
+    send_set_staff_password_email_task,
+    send_staff_order_confirmation_email_task,
+    send_staff_password_reset_email_task,
+)
 
 
-@mock.patch(
-    "saleor.plugins.admin_email.notify_events.send_staff_password_reset_email_task."
-    "delay"
-)
-def test_send_account_password_reset_event(mocked_email_task, customer_user):
+@mock.patch("saleor.plugins.admin_email.notify_events.queue_email")
+def test_send_account_password_reset_event(mocked_queue_email, customer_user):
     token = "token123"
     payload = {
         "user": get_default_user_payload(customer_user),
@@ -27,15 +31,18 @@ def test_send_account_password_reset_event(mocked_email_task, customer_user):
     }
     config = {"host": "localhost", "port": "1025"}
     send_staff_reset_password(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_staff_password_reset_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.admin_email.notify_events.send_set_staff_password_email_task.delay"
-)
-def test_send_set_staff_password_email(mocked_email_task):
+@mock.patch("saleor.plugins.admin_email.notify_events.queue_email")
+def test_send_set_staff_password_email(mocked_queue_email):
     payload = {
         "recipient_email": "admin@example.com",
         "redirect_url": "http://127.0.0.1:8000/redirect",
@@ -45,16 +52,18 @@ def test_send_set_staff_password_email(mocked_email_task):
     send_set_staff_password_email(
         payload=payload, config=config, plugin_configuration=[]
     )
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_set_staff_password_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.admin_email.notify_events."
-    "send_email_with_link_to_download_file_task.delay"
-)
-def test_send_csv_product_export_success(mocked_email_task):
+@mock.patch("saleor.plugins.admin_email.notify_events.queue_email")
+def test_send_csv_product_export_success(mocked_queue_email):
     payload = {
         "recipient_email": "admin@example.com",
         "csv_link": "http://127.0.0.1:8000/download/csv",
@@ -63,16 +72,18 @@ def test_send_csv_product_export_success(mocked_email_task):
     send_csv_product_export_success(
         payload=payload, config=config, plugin_configuration=[]
     )
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_email_with_link_to_download_file_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.admin_email.notify_events."
-    "send_staff_order_confirmation_email_task.delay"
-)
-def test_send_staff_order_confirmation(mocked_email_task, order):
+@mock.patch("saleor.plugins.admin_email.notify_events.queue_email")
+def test_send_staff_order_confirmation(mocked_queue_email, order):
     order_payload = get_default_order_payload(order)
     payload = {
         "order": order_payload,
@@ -82,20 +93,28 @@ def test_send_staff_order_confirmation(mocked_email_task, order):
     send_staff_order_confirmation(
         payload=payload, config=config, plugin_configuration=[]
     )
-    mocked_email_task.assert_called_with(
-        payload["recipient_list"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_staff_order_confirmation_email_task,
+        payload["recipient_list"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.admin_email.notify_events." "send_export_failed_email_task.delay"
-)
-def test_send_csv_export_failed(mocked_email_task):
+@mock.patch("saleor.plugins.admin_email.notify_events.queue_email")
+def test_send_csv_export_failed(mocked_queue_email):
     payload = {
         "recipient_email": "admin@example.com",
     }
     config = {"host": "localhost", "port": "1025"}
     send_csv_export_failed(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_export_failed_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
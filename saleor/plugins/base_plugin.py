@@ -20,6 +20,7 @@ from .models import PluginConfiguration
 if TYPE_CHECKING:
     # flake8: noqa
     from ..account.models import Address, User
+    from ..app.models import App
     from ..channel.models import Channel
     from ..checkout.fetch import CheckoutInfo, CheckoutLineInfo
     from ..checkout.models import Checkout
@@ -417,11 +418,14 @@ class BasePlugin:
         order: "Order",
         invoice: "Invoice",
         number: Optional[str],
+        user: Optional["User"],
+        app: Optional["App"],
         previous_value: Any,
     ) -> Any:
         """Trigger when invoice creation starts.
 
         Overwrite to create invoice with proper data, call invoice.update_invoice.
+        The user or app which requested the invoice is passed, if any.
         """
         return NotImplemented
 
@@ -1,17 +1,23 @@
+import hashlib
 import logging
 import operator
 import os
 import re
-from dataclasses import dataclass
+import smtplib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import astuple, dataclass
 from decimal import Decimal, InvalidOperation
 from email.headerregistry import Address
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Union
 
 import dateutil.parser
 import html2text
 import i18naddress
 import pybars
 from babel.numbers import format_currency
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.mail import send_mail
 from django.core.mail.backends.smtp import EmailBackend
@@ -33,6 +39,11 @@ DEFAULT_TEMPLATE_HELP_TEXT = (
 DEFAULT_SUBJECT_HELP_TEXT = "An email subject built with Handlebars template language."
 DEFAULT_EMAIL_VALUE = "DEFAULT"
 DEFAULT_EMAIL_TIMEOUT = 5
+COMPILED_TEMPLATES_CACHE_SIZE = 256
+
+# Email template passed to the email tasks: either a template string or a reference
+# to the default template file, e.g. {"path": "saleor/.../confirm_order.html"}.
+EmailTemplate = Union[str, Dict[str, str]]
 
 
 @dataclass
@@ -178,26 +189,142 @@ def price(this, net_amount, gross_amount, currency, display_gross=False):
     return pybars.strlist([formatted_price])
 
 
-def send_email(
-    config: EmailConfig, recipient_list, context, subject="", template_str=""
-):
-    sender_name = config.sender_name or ""
-    sender_address = config.sender_address
+def get_template_hash(template_str: str) -> str:
+    return hashlib.sha256(template_str.encode("utf-8")).hexdigest()
 
-    from_email = str(Address(sender_name, addr_spec=sender_address))
 
-    email_backend = EmailBackend(
-        host=config.host,
-        port=config.port,
-        username=config.username,
-        password=config.password,
-        use_ssl=config.use_ssl,
-        use_tls=config.use_tls,
-        timeout=DEFAULT_EMAIL_TIMEOUT,
+class CompiledTemplatesCache:
+    """Keep the most recently used compiled Handlebars templates.
+
+    Compiling a template is much more expensive than rendering it, so each worker
+    compiles a template once and reuses it for the next emails.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._templates: "OrderedDict[str, Callable]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compile(self, key: str, get_template_str: Callable[[], str]):
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                return template
+
+        template = pybars.Compiler().compile(get_template_str())
+        with self._lock:
+            self._templates[key] = template
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+        return template
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self):
+        return len(self._templates)
+
+
+compiled_templates_cache = CompiledTemplatesCache(COMPILED_TEMPLATES_CACHE_SIZE)
+
+
+def get_compiled_template(template: EmailTemplate):
+    """Return the compiled template for a template string or a template reference."""
+    if isinstance(template, dict):
+        template_path = os.path.join(settings.PROJECT_ROOT, template["path"])
+        return compiled_templates_cache.get_or_compile(
+            f"file:{template_path}", lambda: read_template_file(template_path)
+        )
+    return compiled_templates_cache.get_or_compile(
+        get_template_hash(template), lambda: template
     )
-    compiler = pybars.Compiler()
-    template = compiler.compile(template_str)
-    subject_template = compiler.compile(subject)
+
+
+class PooledEmailBackend(EmailBackend):
+    """SMTP backend which keeps its connection open between sent messages.
+
+    A connection idle for longer than `keep_alive` seconds is reopened before
+    sending, and a connection closed by the server is reopened once.
+    """
+
+    def __init__(self, keep_alive: float, **kwargs):
+        super().__init__(**kwargs)
+        self.keep_alive = keep_alive
+        self.last_used_at: Optional[float] = None
+
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return 0
+        with self._lock:
+            num_sent = 0
+            for message in email_messages:
+                if self._send_with_reconnect(message):
+                    num_sent += 1
+            self.last_used_at = time.monotonic()
+        return num_sent
+
+    def _send_with_reconnect(self, message):
+        if self.connection is not None and self._is_expired():
+            self.close()
+        reused = self.open() is False
+        try:
+            return self._send(message)
+        except smtplib.SMTPServerDisconnected:
+            if not reused:
+                raise
+            self.close()
+            self.open()
+            return self._send(message)
+
+    def _is_expired(self) -> bool:
+        if self.last_used_at is None:
+            return False
+        return time.monotonic() - self.last_used_at > self.keep_alive
+
+
+class EmailConnectionPool(threading.local):
+    """Keep an open SMTP connection per email configuration in each worker."""
+
+    def __init__(self):
+        self._connections: Dict[tuple, PooledEmailBackend] = {}
+
+    def get_connection(self, config: EmailConfig) -> PooledEmailBackend:
+        key = astuple(config)
+        connection = self._connections.get(key)
+        if connection is None:
+            connection = PooledEmailBackend(
+                keep_alive=settings.EMAIL_CONNECTION_KEEP_ALIVE.total_seconds(),
+                host=config.host,
+                port=config.port,
+                username=config.username,
+                password=config.password,
+                use_ssl=config.use_ssl,
+                use_tls=config.use_tls,
+                timeout=DEFAULT_EMAIL_TIMEOUT,
+            )
+            self._connections[key] = connection
+        return connection
+
+    def close_all(self):
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+
+
+email_connection_pool = EmailConnectionPool()
+
+
+def get_from_email(config: EmailConfig) -> str:
+    sender_name = config.sender_name or ""
+    return str(Address(sender_name, addr_spec=config.sender_address))
+
+
+def render_email(context, subject: str, template_str: EmailTemplate):
+    """Return the subject and the HTML message rendered from the templates."""
+    template = get_compiled_template(template_str)
+    subject_template = get_compiled_template(subject)
     helpers = {
         "format_address": format_address,
         "price": price,
@@ -207,13 +334,24 @@ def send_email(
     }
     message = template(context, helpers=helpers)
     subject_message = subject_template(context, helpers)
+    return subject_message, message
+
+
+def send_email(
+    config: EmailConfig,
+    recipient_list,
+    context,
+    subject="",
+    template_str: EmailTemplate = "",
+):
+    subject_message, message = render_email(context, subject, template_str)
     send_mail(
         subject_message,
         html2text.html2text(message),
-        from_email,
+        get_from_email(config),
         recipient_list,
         html_message=message,
-        connection=email_backend,
+        connection=email_connection_pool.get_connection(config),
     )
 
 
@@ -354,6 +492,30 @@ def get_email_template_or_default(
     return email_template_str
 
 
+def get_email_template_reference_or_default(
+    plugin_configuration: Optional[list],
+    template_field_name: str,
+    default_template_file_name: str,
+    default_template_path: str,
+) -> EmailTemplate:
+    """Return the custom template or a reference to the default template file.
+
+    The default templates are available to every worker, so only their path is
+    passed to the email tasks instead of the whole template.
+    """
+    email_template_str = DEFAULT_EMAIL_VALUE
+    if plugin_configuration:
+        email_template_str = get_email_template(
+            plugin_configuration=plugin_configuration,
+            template_field_name=template_field_name,
+            default=DEFAULT_EMAIL_VALUE,
+        )
+    if email_template_str == DEFAULT_EMAIL_VALUE:
+        template_path = os.path.join(default_template_path, default_template_file_name)
+        return {"path": os.path.relpath(template_path, settings.PROJECT_ROOT)}
+    return email_template_str
+
+
 def get_email_subject(
     plugin_configuration: Optional[list],
     subject_field_name: str,
@@ -373,6 +535,9 @@ def get_default_email_template(
 ) -> str:
     """Get default template."""
     default_template_path = os.path.join(default_template_path, template_file_name)
-    with open(default_template_path) as f:
-        template_str = f.read()
-        return template_str
+    return read_template_file(default_template_path)
+
+
+def read_template_file(template_path: str) -> str:
+    with open(template_path) as f:
+        return f.read()
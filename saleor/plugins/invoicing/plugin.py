@@ -1,14 +1,18 @@
-from typing import Any, Optional
-from uuid import uuid4
+from collections import defaultdict
+from typing import Any, DefaultDict, List, Optional, Tuple
 
-from django.core.files.base import ContentFile
-from django.utils.text import slugify
+from django.db import transaction
 
-from ...core import JobStatus
+from ...account.models import User
+from ...app.models import App
+from ...core.utils.validators import user_is_valid
 from ...invoice.models import Invoice
 from ...order.models import Order
 from ..base_plugin import BasePlugin
-from .utils import generate_invoice_number, generate_invoice_pdf
+from .tasks import generate_invoices_task
+from .utils import generate_invoice_number
+
+INVOICES_BATCH_SIZE = 50
 
 
 class InvoicingPlugin(BasePlugin):
@@ -18,24 +22,44 @@ class InvoicingPlugin(BasePlugin):
     PLUGIN_DESCRIPTION = "Built-in saleor plugin that handles invoice creation."
     CONFIGURATION_PER_CHANNEL = False
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Invoices to generate, grouped by IDs of the requesting user and app.
+        self._pending_invoice_ids: DefaultDict[
+            Tuple[Optional[int], Optional[int]], List[int]
+        ] = defaultdict(list)
+
     def invoice_request(
         self,
         order: "Order",
         invoice: "Invoice",
         number: Optional[str],
+        user: Optional["User"],
+        app: Optional["App"],
         previous_value: Any,
     ) -> Any:
-        invoice_number = generate_invoice_number()
-        invoice.update_invoice(number=invoice_number)
-        file_content, creation_date = generate_invoice_pdf(invoice)
-        invoice.created = creation_date
-        slugified_invoice_number = slugify(invoice_number)
-        invoice.invoice_file.save(
-            f"invoice-{slugified_invoice_number}-order-{order.id}-{uuid4()}.pdf",
-            ContentFile(file_content),
-        )
-        invoice.status = JobStatus.SUCCESS
-        invoice.save(
-            update_fields=["created", "number", "invoice_file", "status", "updated_at"]
+        with transaction.atomic():
+            invoice_number = generate_invoice_number()
+            invoice.update_invoice(number=invoice_number)
+            invoice.save(update_fields=["number", "updated_at"])
+
+        # Invoices requested within one transaction, e.g. by a bulk request, are
+        # generated in batches once the transaction is committed.
+        requestor_ids = (
+            user.pk if user_is_valid(user) else None,
+            app.pk if app else None,
         )
+        self._pending_invoice_ids[requestor_ids].append(invoice.pk)
+        transaction.on_commit(self._generate_pending_invoices)
         return invoice
+
+    def _generate_pending_invoices(self):
+        pending_invoice_ids = self._pending_invoice_ids
+        self._pending_invoice_ids = defaultdict(list)
+        for (user_id, app_id), invoice_ids in pending_invoice_ids.items():
+            for index in range(0, len(invoice_ids), INVOICES_BATCH_SIZE):
+                generate_invoices_task.delay(
+                    invoice_ids[index : index + INVOICES_BATCH_SIZE],  # noqa: E203
+                    user_id=user_id,
+                    app_id=app_id,
+                )
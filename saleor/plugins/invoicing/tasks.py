@@ -0,0 +1,47 @@
+from typing import List, Optional
+
+from celery.utils.log import get_task_logger
+
+from ...account.models import User
+from ...app.models import App
+from ...celeryconf import app
+from ...core import JobStatus
+from ...invoice.models import Invoice
+from ...order import events as order_events
+from .utils import generate_invoice_file
+
+task_logger = get_task_logger(__name__)
+
+
+@app.task
+def generate_invoices_task(
+    invoice_ids: List[int],
+    user_id: Optional[int] = None,
+    app_id: Optional[int] = None,
+):
+    """Generate PDF files of the pending invoices.
+
+    Invoices of a batch reuse the template, fonts and stylesheet loaded by the worker.
+    The user or app which requested the invoices is recorded on the order events.
+    """
+    user = User.objects.filter(pk=user_id).first() if user_id else None
+    requesting_app = App.objects.filter(pk=app_id).first() if app_id else None
+    invoices = Invoice.objects.filter(
+        pk__in=invoice_ids, status=JobStatus.PENDING
+    ).select_related("order")
+    for invoice in invoices.order_by("pk"):
+        try:
+            generate_invoice_file(invoice)
+        except Exception as e:
+            task_logger.exception("Failed to generate invoice %s.", invoice.pk)
+            invoice.status = JobStatus.FAILED
+            invoice.message = str(e)[:255]
+            invoice.save(update_fields=["status", "message", "updated_at"])
+            continue
+        if invoice.order:
+            order_events.invoice_generated_event(
+                order=invoice.order,
+                user=user,
+                app=requesting_app,
+                invoice_number=invoice.number,
+            )
@@ -1,15 +1,23 @@
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytz
+from django.test import TestCase
 
+from ....core import JobStatus
+from ....invoice.models import Invoice, InvoiceNumberSequence
+from ....order import OrderEvents
 from ....plugins.invoicing.utils import (
     chunk_products,
     generate_invoice_number,
     generate_invoice_pdf,
+    get_invoice_font_config,
+    get_invoice_stylesheet,
     get_product_limit_first_page,
-    make_full_invoice_number,
 )
+from ...manager import get_plugins_manager
+from ..plugin import InvoicingPlugin
+from ..tasks import generate_invoices_task
 
 
 def test_chunk_products(product):
@@ -28,14 +36,18 @@ def test_get_product_limit_first_page(product):
     assert get_product_limit_first_page([product] * 16) == 4
 
 
+@patch("saleor.plugins.invoicing.utils.get_invoice_font_config")
+@patch("saleor.plugins.invoicing.utils.get_invoice_stylesheet")
 @patch("saleor.plugins.invoicing.utils.HTML")
 @patch("saleor.plugins.invoicing.utils.get_template")
-@patch("saleor.plugins.invoicing.utils.os")
 def test_generate_invoice_pdf_for_order(
-    os_mock, get_template_mock, HTML_mock, fulfilled_order
+    get_template_mock,
+    HTML_mock,
+    get_invoice_stylesheet_mock,
+    get_invoice_font_config_mock,
+    fulfilled_order,
 ):
     get_template_mock.return_value.render = Mock(return_value="<html></html>")
-    os_mock.path.join.return_value = "test"
 
     content, creation = generate_invoice_pdf(fulfilled_order.invoices.first())
 
@@ -44,7 +56,6 @@ def test_generate_invoice_pdf_for_order(
             "invoice": fulfilled_order.invoices.first(),
             "creation_date": datetime.now(tz=pytz.utc).strftime("%d %b %Y"),
             "order": fulfilled_order,
-            "font_path": "file://test",
             "products_first_page": list(fulfilled_order.lines.all()),
             "rest_of_products": [],
         }
@@ -52,15 +63,162 @@ def test_generate_invoice_pdf_for_order(
     HTML_mock.assert_called_once_with(
         string=get_template_mock.return_value.render.return_value
     )
+    HTML_mock.return_value.write_pdf.assert_called_once_with(
+        stylesheets=[get_invoice_stylesheet_mock.return_value],
+        font_config=get_invoice_font_config_mock.return_value,
+    )
+
+
+@patch("saleor.plugins.invoicing.utils.CSS")
+@patch("saleor.plugins.invoicing.utils.get_template")
+def test_get_invoice_stylesheet_is_cached(get_template_mock, CSS_mock):
+    get_invoice_stylesheet.cache_clear()
+    get_template_mock.return_value.render = Mock(return_value="body {}")
+
+    stylesheet = get_invoice_stylesheet()
+
+    assert get_invoice_stylesheet() is stylesheet
+    get_template_mock.assert_called_once_with("invoices/invoice.css")
+    CSS_mock.assert_called_once_with(
+        string="body {}", font_config=get_invoice_font_config()
+    )
+    get_invoice_stylesheet.cache_clear()
 
 
 def test_generate_invoice_number_invalid_numeration(fulfilled_order):
     invoice = fulfilled_order.invoices.last()
     invoice.number = "invalid/06/2020"
     invoice.save(update_fields=["number"])
-    assert generate_invoice_number() == make_full_invoice_number()
+    period = datetime.now().strftime("%m/%Y")
+    assert generate_invoice_number() == f"1/{period}"
 
 
 def test_generate_invoice_number_no_existing_invoice(fulfilled_order):
     fulfilled_order.invoices.all().delete()
-    assert generate_invoice_number() == make_full_invoice_number()
+    period = datetime.now().strftime("%m/%Y")
+    assert generate_invoice_number() == f"1/{period}"
+
+
+def test_generate_invoice_number_increments_sequence(order):
+    period = datetime.now().strftime("%m/%Y")
+    Invoice.objects.create(order=order, number=f"3/{period}")
+
+    numbers = [generate_invoice_number() for _ in range(3)]
+
+    assert numbers == [f"4/{period}", f"5/{period}", f"6/{period}"]
+    assert InvoiceNumberSequence.objects.get(period=period).last_number == 6
+
+
+def test_generate_invoice_number_ignores_invoices_created_later(order):
+    period = datetime.now().strftime("%m/%Y")
+    InvoiceNumberSequence.objects.create(period=period, last_number=7)
+    Invoice.objects.create(order=order, number=f"20/{period}")
+
+    assert generate_invoice_number() == f"8/{period}"
+
+
+@patch("saleor.plugins.invoicing.plugin.generate_invoices_task.delay")
+def test_invoice_request_generates_number_and_queues_invoice(
+    generate_invoices_mock, order, settings
+):
+    settings.PLUGINS = ["saleor.plugins.invoicing.plugin.InvoicingPlugin"]
+    manager = get_plugins_manager()
+    invoice = Invoice.objects.create(order=order)
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        result = manager.invoice_request(order=order, invoice=invoice, number=None)
+
+    invoice.refresh_from_db()
+    assert result == invoice
+    assert invoice.number == f"1/{datetime.now().strftime('%m/%Y')}"
+    assert invoice.status == JobStatus.PENDING
+    generate_invoices_mock.assert_called_once_with(
+        [invoice.pk], user_id=None, app_id=None
+    )
+
+
+@patch("saleor.plugins.invoicing.plugin.generate_invoices_task.delay")
+def test_invoice_request_queues_invoices_with_requestor_ids(
+    generate_invoices_mock, order, staff_user, app
+):
+    plugin = InvoicingPlugin(configuration=[], active=True)
+    user_invoice = Invoice.objects.create(order=order)
+    app_invoice = Invoice.objects.create(order=order)
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        plugin.invoice_request(order, user_invoice, None, staff_user, None, None)
+        plugin.invoice_request(order, app_invoice, None, None, app, None)
+
+    generate_invoices_mock.assert_has_calls(
+        [
+            call([user_invoice.pk], user_id=staff_user.pk, app_id=None),
+            call([app_invoice.pk], user_id=None, app_id=app.pk),
+        ]
+    )
+
+
+@patch("saleor.plugins.invoicing.plugin.generate_invoices_task.delay")
+@patch("saleor.plugins.invoicing.plugin.INVOICES_BATCH_SIZE", 2)
+def test_invoice_request_queues_invoices_of_transaction_in_batches(
+    generate_invoices_mock, order_list
+):
+    plugin = InvoicingPlugin(configuration=[], active=True)
+    invoices = [Invoice.objects.create(order=order) for order in order_list]
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        for invoice in invoices:
+            plugin.invoice_request(invoice.order, invoice, None, None, None, None)
+
+    assert [call.args[0] for call in generate_invoices_mock.call_args_list] == [
+        [invoices[0].pk, invoices[1].pk],
+        [invoices[2].pk],
+    ]
+
+
+@patch("saleor.plugins.invoicing.utils.generate_invoice_pdf")
+def test_generate_invoices_task(
+    generate_invoice_pdf_mock, order_list, staff_user, media_root
+):
+    creation_date = datetime.now(tz=pytz.utc)
+    generate_invoice_pdf_mock.return_value = (b"pdf", creation_date)
+    invoices = [
+        Invoice.objects.create(order=order, number=f"{index}/01/2021")
+        for index, order in enumerate(order_list, start=1)
+    ]
+
+    generate_invoices_task([invoice.pk for invoice in invoices], user_id=staff_user.pk)
+
+    assert generate_invoice_pdf_mock.call_count == len(invoices)
+    for invoice in invoices:
+        invoice.refresh_from_db()
+        assert invoice.status == JobStatus.SUCCESS
+        assert invoice.created == creation_date
+        assert invoice.invoice_file.read() == b"pdf"
+        assert invoice.order.events.filter(
+            type=OrderEvents.INVOICE_GENERATED,
+            user=staff_user,
+            app=None,
+            parameters__invoice_number=invoice.number,
+        ).exists()
+
+
+@patch("saleor.plugins.invoicing.utils.generate_invoice_pdf")
+def test_generate_invoices_task_failed_invoice(
+    generate_invoice_pdf_mock, order_list, media_root
+):
+    generate_invoice_pdf_mock.side_effect = [
+        Exception("Rendering failed."),
+        (b"pdf", datetime.now(tz=pytz.utc)),
+    ]
+    failed_invoice, invoice = [
+        Invoice.objects.create(order=order, number=f"{index}/01/2021")
+        for index, order in enumerate(order_list[:2], start=1)
+    ]
+
+    generate_invoices_task([failed_invoice.pk, invoice.pk])
+
+    failed_invoice.refresh_from_db()
+    assert failed_invoice.status == JobStatus.FAILED
+    assert failed_invoice.message == "Rendering failed."
+    invoice.refresh_from_db()
+    assert invoice.status == JobStatus.SUCCESS
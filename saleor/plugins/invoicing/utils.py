@@ -1,46 +1,56 @@
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
+from uuid import uuid4
 
 import pytz
 from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
 from django.template.loader import get_template
-from weasyprint import HTML
+from django.utils.text import slugify
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 
-from ...invoice.models import Invoice
+from ...core import JobStatus
+from ...invoice.models import Invoice, InvoiceNumberSequence
 
 MAX_PRODUCTS_WITH_TABLE = 3
 MAX_PRODUCTS_WITHOUT_TABLE = 4
 MAX_PRODUCTS_PER_PAGE = 13
 
 
-def make_full_invoice_number(number=None, month=None, year=None):
-    now = datetime.now()
-    current_month = int(now.strftime("%m"))
-    current_year = int(now.strftime("%Y"))
-    month_and_year = now.strftime("%m/%Y")
-
-    if month == current_month and year == current_year:
-        new_number = (number or 0) + 1
-        return f"{new_number}/{month_and_year}"
-    return f"1/{month_and_year}"
-
-
-def parse_invoice_dates(invoice):
-    match = re.match(r"^(\d+)\/(\d+)\/(\d+)", invoice.number)
-    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+def get_last_invoice_number(period: str) -> int:
+    """Return the highest number of the invoices generated in the period."""
+    last_number = 0
+    for number in Invoice.objects.filter(number__endswith=f"/{period}").values_list(
+        "number", flat=True
+    ):
+        match = re.match(r"^(\d+)\/", number)
+        if match and f"{match.group(1)}/{period}" == number:
+            last_number = max(last_number, int(match.group(1)))
+    return last_number
 
 
 def generate_invoice_number():
-    last_invoice = Invoice.objects.filter(number__isnull=False).last()
-    if not last_invoice or not last_invoice.number:
-        return make_full_invoice_number()
+    """Return the next invoice number of the current month.
 
-    try:
-        number, month, year = parse_invoice_dates(last_invoice)
-        return make_full_invoice_number(number, month, year)
-    except (IndexError, ValueError, AttributeError):
-        return make_full_invoice_number()
+    The number sequence row stays locked until the end of the transaction, call it
+    within the transaction that saves the number to keep the numbering gap-free.
+    """
+    period = datetime.now().strftime("%m/%Y")
+    with transaction.atomic():
+        sequences = InvoiceNumberSequence.objects.select_for_update()
+        sequence = sequences.filter(period=period).first()
+        if sequence is None:
+            sequence, _ = sequences.get_or_create(
+                period=period,
+                defaults={"last_number": get_last_invoice_number(period)},
+            )
+        sequence.last_number += 1
+        sequence.save(update_fields=["last_number"])
+    return f"{sequence.last_number}/{period}"
 
 
 def chunk_products(products, product_limit):
@@ -62,11 +72,24 @@ def get_product_limit_first_page(products):
     return MAX_PRODUCTS_WITHOUT_TABLE
 
 
-def generate_invoice_pdf(invoice):
+@lru_cache(maxsize=None)
+def get_invoice_font_config():
+    return FontConfiguration()
+
+
+@lru_cache(maxsize=None)
+def get_invoice_stylesheet():
+    """Return the invoice stylesheet, parsed once per worker."""
     font_path = os.path.join(
         settings.PROJECT_ROOT, "templates", "invoices", "inter.ttf"
     )
+    css = get_template("invoices/invoice.css").render(
+        {"font_path": f"file://{font_path}"}
+    )
+    return CSS(string=css, font_config=get_invoice_font_config())
+
 
+def generate_invoice_pdf(invoice):
     all_products = invoice.order.lines.all()
 
     product_limit_first_page = get_product_limit_first_page(all_products)
@@ -81,9 +104,24 @@ def generate_invoice_pdf(invoice):
             "invoice": invoice,
             "creation_date": creation_date.strftime("%d %b %Y"),
             "order": invoice.order,
-            "font_path": f"file://{font_path}",
             "products_first_page": products_first_page,
             "rest_of_products": rest_of_products,
         }
     )
-    return HTML(string=rendered_template).write_pdf(), creation_date
+    pdf = HTML(string=rendered_template).write_pdf(
+        stylesheets=[get_invoice_stylesheet()], font_config=get_invoice_font_config()
+    )
+    return pdf, creation_date
+
+
+def generate_invoice_file(invoice):
+    file_content, creation_date = generate_invoice_pdf(invoice)
+    invoice.created = creation_date
+    slugified_invoice_number = slugify(invoice.number)
+    invoice.invoice_file.save(
+        f"invoice-{slugified_invoice_number}-order-{invoice.order_id}-{uuid4()}.pdf",
+        ContentFile(file_content),
+        save=False,
+    )
+    invoice.status = JobStatus.SUCCESS
+    invoice.save(update_fields=["created", "invoice_file", "status", "updated_at"])
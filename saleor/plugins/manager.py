@@ -1,9 +1,11 @@
+import time
 from collections import defaultdict
 from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -22,6 +24,8 @@ from prices import Money, TaxedMoney
 
 from ..channel.models import Channel
 from ..checkout import base_calculations
+from ..checkout.prices_cache import CheckoutPricesCache, get_line_key
+from ..core.instrumentation import get_current_instrumentation
 from ..core.payments import PaymentInterface
 from ..core.prices import quantize_price
 from ..core.taxes import TaxType, zero_taxed_money
@@ -32,6 +36,7 @@ from .models import PluginConfiguration
 if TYPE_CHECKING:
     # flake8: noqa
     from ..account.models import Address, User
+    from ..app.models import App
     from ..checkout.fetch import CheckoutInfo, CheckoutLineInfo
     from ..checkout.models import Checkout
     from ..discount.models import Sale
@@ -82,6 +87,8 @@ class PluginsManager(PaymentInterface):
 
     def __init__(self, plugins: List[str]):
         with opentracing.global_tracer().start_active_span("PluginsManager.__init__"):
+            # The manager is created per request, so are the memoized checkout prices.
+            self.checkout_prices_cache = CheckoutPricesCache()
             self.plugins_per_channel = defaultdict(list)
             self.all_plugins = []
             (
@@ -144,7 +151,12 @@ class PluginsManager(PaymentInterface):
         plugin_method = getattr(plugin, method_name, NotImplemented)
         if plugin_method == NotImplemented:
             return previous_value
+        start = time.perf_counter()
         returned_value = plugin_method(*args, **kwargs, previous_value=previous_value)
+        if instrumentation := get_current_instrumentation():
+            instrumentation.record_plugin_hook(
+                f"{type(plugin).__name__}.{method_name}", time.perf_counter() - start
+            )
         if returned_value == NotImplemented:
             return previous_value
         return returned_value
@@ -164,13 +176,39 @@ class PluginsManager(PaymentInterface):
         address: Optional["Address"],
         discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
+        checkout_key = self.checkout_prices_cache.get_checkout_key(
+            checkout_info, lines, address, discounts
+        )
+        return self.checkout_prices_cache.get_or_calculate(
+            "calculate_checkout_total",
+            checkout_key,
+            lambda: self._calculate_checkout_total(
+                checkout_info, lines, address, discounts, checkout_key
+            ),
+        )
 
+    def _calculate_checkout_total(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        address: Optional["Address"],
+        discounts: Iterable[DiscountInfo],
+        checkout_key: Hashable,
+    ) -> TaxedMoney:
         default_value = base_calculations.base_checkout_total(
-            subtotal=self.calculate_checkout_subtotal(
-                checkout_info, lines, address, discounts
+            subtotal=self.checkout_prices_cache.get_or_calculate(
+                "calculate_checkout_subtotal",
+                checkout_key,
+                lambda: self._calculate_checkout_subtotal(
+                    checkout_info, lines, address, discounts, checkout_key
+                ),
             ),
-            shipping_price=self.calculate_checkout_shipping(
-                checkout_info, lines, address, discounts
+            shipping_price=self.checkout_prices_cache.get_or_calculate(
+                "calculate_checkout_shipping",
+                checkout_key,
+                lambda: self._calculate_checkout_shipping(
+                    checkout_info, lines, address, discounts
+                ),
             ),
             discount=checkout_info.checkout.discount,
             currency=checkout_info.checkout.currency,
@@ -194,14 +232,37 @@ class PluginsManager(PaymentInterface):
         lines: Iterable["CheckoutLineInfo"],
         address: Optional["Address"],
         discounts: Iterable[DiscountInfo],
+    ) -> TaxedMoney:
+        checkout_key = self.checkout_prices_cache.get_checkout_key(
+            checkout_info, lines, address, discounts
+        )
+        return self.checkout_prices_cache.get_or_calculate(
+            "calculate_checkout_subtotal",
+            checkout_key,
+            lambda: self._calculate_checkout_subtotal(
+                checkout_info, lines, address, discounts, checkout_key
+            ),
+        )
+
+    def _calculate_checkout_subtotal(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        address: Optional["Address"],
+        discounts: Iterable[DiscountInfo],
+        checkout_key: Hashable,
     ) -> TaxedMoney:
         line_totals = [
-            self.calculate_checkout_line_total(
-                checkout_info,
-                lines,
-                line_info,
-                address,
-                discounts,
+            self.checkout_prices_cache.get_or_calculate(
+                "calculate_checkout_line_total",
+                (checkout_key, get_line_key(line_info)),
+                lambda line_info=line_info: self._calculate_checkout_line_total(
+                    checkout_info,
+                    lines,
+                    line_info,
+                    address,
+                    discounts,
+                ),
             )
             for line_info in lines
         ]
@@ -218,6 +279,24 @@ class PluginsManager(PaymentInterface):
         lines: Iterable["CheckoutLineInfo"],
         address: Optional["Address"],
         discounts: Iterable[DiscountInfo],
+    ) -> TaxedMoney:
+        checkout_key = self.checkout_prices_cache.get_checkout_key(
+            checkout_info, lines, address, discounts
+        )
+        return self.checkout_prices_cache.get_or_calculate(
+            "calculate_checkout_shipping",
+            checkout_key,
+            lambda: self._calculate_checkout_shipping(
+                checkout_info, lines, address, discounts
+            ),
+        )
+
+    def _calculate_checkout_shipping(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        address: Optional["Address"],
+        discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
         default_value = base_calculations.base_checkout_shipping_price(
             checkout_info, lines
@@ -290,6 +369,25 @@ class PluginsManager(PaymentInterface):
         checkout_line_info: "CheckoutLineInfo",
         address: Optional["Address"],
         discounts: Iterable["DiscountInfo"],
+    ):
+        checkout_key = self.checkout_prices_cache.get_checkout_key(
+            checkout_info, lines, address, discounts
+        )
+        return self.checkout_prices_cache.get_or_calculate(
+            "calculate_checkout_line_total",
+            (checkout_key, get_line_key(checkout_line_info)),
+            lambda: self._calculate_checkout_line_total(
+                checkout_info, lines, checkout_line_info, address, discounts
+            ),
+        )
+
+    def _calculate_checkout_line_total(
+        self,
+        checkout_info: "CheckoutInfo",
+        lines: Iterable["CheckoutLineInfo"],
+        checkout_line_info: "CheckoutLineInfo",
+        address: Optional["Address"],
+        discounts: Iterable["DiscountInfo"],
     ):
         default_value = base_calculations.base_checkout_line_total(
             checkout_line_info,
@@ -582,7 +680,12 @@ class PluginsManager(PaymentInterface):
         )
 
     def invoice_request(
-        self, order: "Order", invoice: "Invoice", number: Optional[str]
+        self,
+        order: "Order",
+        invoice: "Invoice",
+        number: Optional[str],
+        user: Optional["User"] = None,
+        app: Optional["App"] = None,
     ):
         default_value = None
         return self.__run_method_on_plugins(
@@ -591,6 +694,8 @@ class PluginsManager(PaymentInterface):
             order,
             invoice,
             number,
+            user,
+            app,
             channel_slug=order.channel.slug,
         )
 
@@ -0,0 +1,44 @@
+# Generated by Django 3.2.7 on 2026-10-19 21:40
+
+from django.db import migrations, models
+
+import saleor.core.utils.json_serializer
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plugins", "0008_pluginconfiguration_channel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedEmail",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("config_key", models.CharField(db_index=True, max_length=64)),
+                ("task", models.CharField(max_length=255)),
+                ("recipient", models.JSONField()),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=saleor.core.utils.json_serializer.CustomJsonEncoder
+                    ),
+                ),
+                ("subject", models.TextField()),
+                ("template", models.JSONField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ("pk",),
+            },
+        ),
+    ]
@@ -24,3 +24,18 @@ class PluginConfiguration(models.Model):
 
     def __str__(self):
         return f"Configuration of {self.name}, active: {self.active}"
+
+
+class QueuedEmail(models.Model):
+    """Email waiting to be sent in a batch with other emails of its configuration."""
+
+    config_key = models.CharField(max_length=64, db_index=True)
+    task = models.CharField(max_length=255)
+    recipient = JSONField()
+    payload = JSONField(encoder=CustomJsonEncoder)
+    subject = models.TextField()
+    template = JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("pk",)
@@ -0,0 +1,88 @@
+import hashlib
+import json
+from typing import List
+
+from celery.utils.log import get_task_logger
+from django.core.cache import cache
+from django.db import transaction
+
+from ..celeryconf import app
+from .models import QueuedEmail
+
+task_logger = get_task_logger(__name__)
+
+# Number of queued emails sent by the batch task per database transaction.
+EMAIL_BATCH_SIZE = 100
+# Seconds emails are collected before the batch task sends them.
+EMAIL_BATCH_COUNTDOWN = 1
+# Seconds after which the batch task is scheduled again if the previous one was lost.
+EMAIL_BATCH_LOCK_TIMEOUT = 300
+EMAIL_BATCH_LOCK_KEY = "email_batch_scheduled_{config_key}"
+
+
+def get_email_config_key(config: dict) -> str:
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+
+def queue_email(task, recipient, payload: dict, config: dict, subject: str, template):
+    """Queue the email to be sent by the task in a batch with other emails.
+
+    The task is called with the same arguments as when it's delayed directly.
+    Emails sharing the email configuration are sent over one SMTP connection.
+    """
+    config_key = get_email_config_key(config)
+    QueuedEmail.objects.create(
+        config_key=config_key,
+        task=task.name,
+        recipient=recipient,
+        payload=payload,
+        subject=subject,
+        template=template,
+    )
+    transaction.on_commit(lambda: schedule_email_batch(config))
+
+
+def schedule_email_batch(config: dict):
+    # Only one batch task is scheduled per email configuration at a time.
+    lock_key = EMAIL_BATCH_LOCK_KEY.format(config_key=get_email_config_key(config))
+    if cache.add(lock_key, True, timeout=EMAIL_BATCH_LOCK_TIMEOUT):
+        send_email_batch_task.apply_async((config,), countdown=EMAIL_BATCH_COUNTDOWN)
+
+
+def claim_queued_emails(config_key: str) -> List[QueuedEmail]:
+    with transaction.atomic():
+        emails = list(
+            QueuedEmail.objects.select_for_update(skip_locked=True).filter(
+                config_key=config_key
+            )[:EMAIL_BATCH_SIZE]
+        )
+        QueuedEmail.objects.filter(pk__in=[email.pk for email in emails]).delete()
+    return emails
+
+
+@app.task(compression="zlib")
+def send_email_batch_task(config: dict):
+    """Send the emails queued for the email configuration over one SMTP connection."""
+    config_key = get_email_config_key(config)
+    while True:
+        emails = claim_queued_emails(config_key)
+        if not emails:
+            break
+        for email in emails:
+            try:
+                app.tasks[email.task](
+                    email.recipient,
+                    email.payload,
+                    config,
+                    email.subject,
+                    email.template,
+                )
+            except Exception:
+                task_logger.exception(
+                    "Sending the queued email failed.", extra={"task": email.task}
+                )
+
+    cache.delete(EMAIL_BATCH_LOCK_KEY.format(config_key=config_key))
+    # Emails queued while the lock was held have not scheduled a batch task.
+    if QueuedEmail.objects.filter(config_key=config_key).exists():
+        schedule_email_batch(config)
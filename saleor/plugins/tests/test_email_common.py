@@ -0,0 +1,464 @@
+import os
+import socketserver
+import threading
+import time
+from dataclasses import asdict
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase
+
+from ...account import CustomerEvents
+from ...account.models import CustomerEvent
+from ..email_common import (
+    DEFAULT_EMAIL_VALUE,
+    CompiledTemplatesCache,
+    EmailConfig,
+    compiled_templates_cache,
+    email_connection_pool,
+    get_compiled_template,
+    get_email_template_reference_or_default,
+    send_email,
+)
+from ..models import QueuedEmail
+from ..tasks import (
+    EMAIL_BATCH_COUNTDOWN,
+    get_email_config_key,
+    queue_email,
+    send_email_batch_task,
+)
+from ..user_email import constants
+from ..user_email.tasks import (
+    send_account_confirmation_email_task,
+    send_password_reset_email_task,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_templates_cache():
+    compiled_templates_cache.clear()
+    yield
+    compiled_templates_cache.clear()
+
+
+def test_get_compiled_template_reuses_compiled_template():
+    # given
+    template_str = "<p>Hello {{ name }}</p>"
+
+    # when
+    with mock.patch(
+        "saleor.plugins.email_common.pybars.Compiler.compile",
+        wraps=lambda source: lambda context, helpers=None: source,
+    ) as compile_mock:
+        first_template = get_compiled_template(template_str)
+        second_template = get_compiled_template(str(template_str))
+
+    # then
+    assert first_template is second_template
+    compile_mock.assert_called_once_with(template_str)
+
+
+def test_get_compiled_template_renders_template():
+    # when
+    template = get_compiled_template("<p>Hello {{ name }}</p>")
+
+    # then
+    assert str(template({"name": "Saleor"})) == "<p>Hello Saleor</p>"
+
+
+def test_get_compiled_template_from_reference():
+    # given
+    reference = get_email_template_reference_or_default(
+        None,
+        constants.ACCOUNT_CONFIRMATION_TEMPLATE_FIELD,
+        constants.ACCOUNT_CONFIRMATION_DEFAULT_TEMPLATE,
+        constants.DEFAULT_EMAIL_TEMPLATES_PATH,
+    )
+
+    # when
+    get_compiled_template(reference)
+    get_compiled_template(reference)
+
+    # then
+    assert not os.path.isabs(reference["path"])
+    assert os.path.isfile(os.path.join(settings.PROJECT_ROOT, reference["path"]))
+    assert len(compiled_templates_cache) == 1
+
+
+def test_get_email_template_reference_or_default_custom_template():
+    # given
+    template_str = "<p>Custom</p>"
+    plugin_configuration = [
+        {"name": constants.ACCOUNT_CONFIRMATION_TEMPLATE_FIELD, "value": template_str}
+    ]
+
+    # when
+    template = get_email_template_reference_or_default(
+        plugin_configuration,
+        constants.ACCOUNT_CONFIRMATION_TEMPLATE_FIELD,
+        constants.ACCOUNT_CONFIRMATION_DEFAULT_TEMPLATE,
+        constants.DEFAULT_EMAIL_TEMPLATES_PATH,
+    )
+
+    # then
+    assert template == template_str
+
+
+def test_get_email_template_reference_or_default_default_value():
+    # given
+    plugin_configuration = [
+        {
+            "name": constants.ACCOUNT_CONFIRMATION_TEMPLATE_FIELD,
+            "value": DEFAULT_EMAIL_VALUE,
+        }
+    ]
+
+    # when
+    template = get_email_template_reference_or_default(
+        plugin_configuration,
+        constants.ACCOUNT_CONFIRMATION_TEMPLATE_FIELD,
+        constants.ACCOUNT_CONFIRMATION_DEFAULT_TEMPLATE,
+        constants.DEFAULT_EMAIL_TEMPLATES_PATH,
+    )
+
+    # then
+    assert template["path"].endswith(constants.ACCOUNT_CONFIRMATION_DEFAULT_TEMPLATE)
+
+
+def test_compiled_templates_cache_evicts_least_recently_used():
+    # given
+    cache = CompiledTemplatesCache(max_size=2)
+    cache.get_or_compile("first", lambda: "first")
+    cache.get_or_compile("second", lambda: "second")
+    cache.get_or_compile("first", lambda: "first")
+
+    # when
+    cache.get_or_compile("third", lambda: "third")
+
+    # then
+    get_template_str = mock.Mock(return_value="second")
+    cache.get_or_compile("second", get_template_str)
+    get_template_str.assert_called_once_with()
+    assert len(cache) == 2
+
+
+@mock.patch("saleor.plugins.email_common.send_mail")
+def test_send_email_compiles_templates_once(mocked_send_mail, email_config):
+    # when
+    for name in ["John", "Jane"]:
+        send_email(
+            email_config,
+            ["user@example.com"],
+            {"name": name},
+            subject="Hello {{ name }}",
+            template_str="<p>Hello {{ name }}</p>",
+        )
+
+    # then
+    assert len(compiled_templates_cache) == 2
+    args, kwargs = mocked_send_mail.call_args
+    assert str(args[0]) == "Hello Jane"
+    assert str(kwargs["html_message"]) == "<p>Hello Jane</p>"
+
+
+class SMTPStubServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handshake_delay=0.0, disconnect_after_message=False):
+        super().__init__(("127.0.0.1", 0), SMTPStubHandler)
+        self.handshake_delay = handshake_delay
+        self.disconnect_after_message = disconnect_after_message
+        self.connections = 0
+        self.messages = 0
+        self.lock = threading.Lock()
+
+
+class SMTPStubHandler(socketserver.StreamRequestHandler):
+    """Accept every message, acknowledging only the commands used by smtplib."""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        # Simulate the cost of the TCP/TLS handshake of a remote relay.
+        time.sleep(server.handshake_delay)
+        self.reply("220 localhost ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250 localhost")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with server.lock:
+                    server.messages += 1
+                self.reply("250 OK")
+                if server.disconnect_after_message:
+                    return
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+@pytest.fixture
+def smtp_stub():
+    email_connection_pool.close_all()
+    servers = []
+
+    def start(**kwargs):
+        server = SMTPStubServer(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    email_connection_pool.close_all()
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def email_config():
+    return EmailConfig(
+        host="127.0.0.1",
+        port="1025",
+        sender_name="Saleor",
+        sender_address="noreply@example.com",
+    )
+
+
+def get_stub_email_config(server):
+    return EmailConfig(
+        host="127.0.0.1",
+        port=str(server.server_address[1]),
+        sender_address="noreply@example.com",
+    )
+
+
+def get_emails(count):
+    return [
+        {
+            "recipient_list": [f"user{index}@example.com"],
+            "context": {"name": f"User {index}"},
+            "subject": "Hello {{ name }}",
+            "template": "<p>Hello {{ name }}</p>",
+        }
+        for index in range(count)
+    ]
+
+
+def send_emails(config, emails):
+    for email in emails:
+        send_email(
+            config,
+            email["recipient_list"],
+            email["context"],
+            subject=email["subject"],
+            template_str=email["template"],
+        )
+
+
+def test_send_email_reuses_pooled_connection(smtp_stub):
+    # given
+    server = smtp_stub()
+    config = get_stub_email_config(server)
+
+    # when
+    send_emails(config, get_emails(10))
+
+    # then
+    assert server.messages == 10
+    assert server.connections == 1
+
+
+def test_send_email_reconnects_after_server_closed_connection(smtp_stub):
+    # given
+    server = smtp_stub(disconnect_after_message=True)
+    config = get_stub_email_config(server)
+
+    # when
+    send_emails(config, get_emails(3))
+
+    # then
+    assert server.messages == 3
+    assert server.connections == 3
+
+
+def test_send_email_reopens_connection_idle_longer_than_keep_alive(smtp_stub):
+    # given
+    server = smtp_stub()
+    config = get_stub_email_config(server)
+    send_emails(config, get_emails(1))
+    connection = email_connection_pool.get_connection(config)
+    connection.last_used_at -= connection.keep_alive + 1
+
+    # when
+    send_emails(config, get_emails(1))
+
+    # then
+    assert server.messages == 2
+    assert server.connections == 2
+
+
+def test_email_connection_pool_connection_per_config(smtp_stub):
+    # given
+    first_server = smtp_stub()
+    second_server = smtp_stub()
+
+    # when
+    for server in [first_server, second_server, first_server, second_server]:
+        send_emails(get_stub_email_config(server), get_emails(1))
+
+    # then
+    assert first_server.connections == second_server.connections == 1
+    assert first_server.messages == second_server.messages == 2
+
+
+def queue_emails(config, emails, task=send_account_confirmation_email_task):
+    for email in emails:
+        queue_email(
+            task,
+            email["recipient_list"][0],
+            email["context"],
+            asdict(config),
+            email["subject"],
+            email["template"],
+        )
+
+
+@pytest.fixture
+def clear_email_batch_locks():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@mock.patch("saleor.plugins.tasks.send_email_batch_task.apply_async")
+def test_queue_email_schedules_one_batch_task_per_config(
+    mocked_apply_async, email_config, clear_email_batch_locks
+):
+    # given
+    other_config = EmailConfig(host="127.0.0.2", port="1025")
+
+    # when
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        queue_emails(email_config, get_emails(3))
+        queue_emails(other_config, get_emails(2))
+
+    # then
+    assert QueuedEmail.objects.count() == 5
+    assert mocked_apply_async.call_count == 2
+    mocked_apply_async.assert_any_call(
+        (asdict(email_config),), countdown=EMAIL_BATCH_COUNTDOWN
+    )
+    mocked_apply_async.assert_any_call(
+        (asdict(other_config),), countdown=EMAIL_BATCH_COUNTDOWN
+    )
+
+
+def test_send_email_batch_task_sends_queued_emails_over_one_connection(
+    smtp_stub, clear_email_batch_locks
+):
+    # given
+    server = smtp_stub()
+    config = get_stub_email_config(server)
+    queue_emails(config, get_emails(10))
+
+    # when
+    send_email_batch_task(asdict(config))
+
+    # then
+    assert server.messages == 10
+    assert server.connections == 1
+    assert not QueuedEmail.objects.exists()
+
+
+def test_send_email_batch_task_runs_email_events(
+    smtp_stub, customer_user, clear_email_batch_locks
+):
+    # given
+    server = smtp_stub()
+    config = get_stub_email_config(server)
+    payload = {"user": {"id": customer_user.pk}, "reset_url": "http://localhost"}
+    queue_email(
+        send_password_reset_email_task,
+        customer_user.email,
+        payload,
+        asdict(config),
+        "Reset password",
+        "<p>{{ reset_url }}</p>",
+    )
+
+    # when
+    send_email_batch_task(asdict(config))
+
+    # then
+    assert server.messages == 1
+    assert CustomerEvent.objects.filter(
+        user=customer_user, type=CustomerEvents.PASSWORD_RESET_LINK_SENT
+    ).exists()
+
+
+def test_send_email_batch_task_sends_emails_queued_after_failed_one(
+    smtp_stub, clear_email_batch_locks
+):
+    # given
+    server = smtp_stub()
+    config = get_stub_email_config(server)
+    QueuedEmail.objects.create(
+        config_key=get_email_config_key(asdict(config)),
+        task="saleor.plugins.tasks.unknown_task",
+        recipient="user@example.com",
+        payload={},
+        subject="",
+        template="",
+    )
+    queue_emails(config, get_emails(2))
+
+    # when
+    send_email_batch_task(asdict(config))
+
+    # then
+    assert server.messages == 2
+    assert not QueuedEmail.objects.exists()
+
+
+def test_batched_delivery_throughput(smtp_stub, clear_email_batch_locks):
+    # given
+    server = smtp_stub(handshake_delay=0.01)
+    config = get_stub_email_config(server)
+    emails = get_emails(30)
+
+    # when
+    start = time.perf_counter()
+    for email in emails:
+        send_emails(config, [email])
+        email_connection_pool.close_all()
+    unbatched_time = time.perf_counter() - start
+    unbatched_connections = server.connections
+
+    start = time.perf_counter()
+    queue_emails(config, emails)
+    send_email_batch_task(asdict(config))
+    batched_time = time.perf_counter() - start
+
+    # then
+    assert server.messages == 2 * len(emails)
+    assert unbatched_connections == len(emails)
+    assert server.connections == len(emails) + 1
+    assert batched_time < unbatched_time
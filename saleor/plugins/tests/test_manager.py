@@ -183,6 +183,64 @@ def test_manager_calculates_checkout_subtotal(
     assert TaxedMoney(expected_subtotal, expected_subtotal) == taxed_subtotal
 
 
+def test_manager_memoizes_checkout_prices(checkout_with_item, discount_info):
+    # given
+    manager = PluginsManager(plugins=[])
+    lines = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(
+        checkout_with_item, lines, [discount_info], manager
+    )
+    discounts = [discount_info]
+    manager.calculate_checkout_total(checkout_info, lines, None, discounts)
+
+    # when
+    with mock.patch(
+        "saleor.checkout.base_calculations.base_checkout_line_total"
+    ) as line_total_mock:
+        subtotal = manager.calculate_checkout_subtotal(
+            checkout_info, lines, None, discounts
+        )
+        line_total = manager.calculate_checkout_line_total(
+            checkout_info, lines, lines[0], None, discounts
+        )
+        manager.calculate_checkout_total(checkout_info, lines, None, discounts)
+
+    # then
+    line_total_mock.assert_not_called()
+    assert subtotal == line_total
+    cache = manager.checkout_prices_cache
+    assert cache.misses["calculate_checkout_line_total"] == len(lines)
+    assert cache.hits["calculate_checkout_line_total"] == 1
+    assert cache.hits["calculate_checkout_subtotal"] == 1
+    assert cache.hits["calculate_checkout_total"] == 1
+
+
+def test_manager_recalculates_checkout_prices_when_lines_change(
+    checkout_with_item, discount_info
+):
+    # given
+    manager = PluginsManager(plugins=[])
+    lines = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(
+        checkout_with_item, lines, [discount_info], manager
+    )
+    discounts = [discount_info]
+    subtotal = manager.calculate_checkout_subtotal(
+        checkout_info, lines, None, discounts
+    )
+
+    # when
+    lines[0].line.quantity += 1
+    new_subtotal = manager.calculate_checkout_subtotal(
+        checkout_info, lines, None, discounts
+    )
+
+    # then
+    assert new_subtotal > subtotal
+    assert manager.checkout_prices_cache.misses["calculate_checkout_subtotal"] == 2
+    assert not manager.checkout_prices_cache.hits
+
+
 @pytest.mark.parametrize(
     "plugins, shipping_amount",
     [(["saleor.plugins.tests.sample_plugins.PluginSample"], "1.0"), ([], "0.0")],
@@ -21,12 +21,26 @@ from ..notify_events import (
     send_order_refund,
     send_payment_confirmation,
 )
+from ..tasks import (
+    send_account_confirmation_email_task,
+    send_account_delete_confirmation_email_task,
+    send_fulfillment_confirmation_email_task,
+    send_fulfillment_update_email_task,
+    send_invoice_email_task,
+    send_order_canceled_email_task,
+    send_order_confirmation_email_task,
+    send_order_confirmed_email_task,
+    send_order_refund_email_task,
+    send_password_reset_email_task,
+    send_payment_confirmation_email_task,
+    send_request_email_change_email_task,
+    send_set_user_password_email_task,
+    send_user_change_email_notification_task,
+)
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_password_reset_email_task.delay"
-)
-def test_send_account_password_reset_event(mocked_email_task, customer_user):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_account_password_reset_event(mocked_queue_email, customer_user):
     token = "token123"
     payload = {
         "user": get_default_user_payload(customer_user),
@@ -40,15 +54,18 @@ def test_send_account_password_reset_event(mocked_email_task, customer_user):
     send_account_password_reset_event(
         payload=payload, config=config, plugin_configuration=[]
     )
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_password_reset_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_account_confirmation_email_task.delay"
-)
-def test_send_account_confirmation(mocked_email_task, customer_user):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_account_confirmation(mocked_queue_email, customer_user):
     token = "token123"
     payload = {
         "user": get_default_user_payload(customer_user),
@@ -60,15 +77,18 @@ def test_send_account_confirmation(mocked_email_task, customer_user):
     }
     config = {"host": "localhost", "port": "1025"}
     send_account_confirmation(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_account_confirmation_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_request_email_change_email_task.delay"
-)
-def test_send_account_change_email_request(mocked_email_task, customer_user):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_account_change_email_request(mocked_queue_email, customer_user):
     token = "token123"
     payload = {
         "user": get_default_user_payload(customer_user),
@@ -84,16 +104,18 @@ def test_send_account_change_email_request(mocked_email_task, customer_user):
     send_account_change_email_request(
         payload=payload, config=config, plugin_configuration=[]
     )
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_request_email_change_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_user_change_email_notification_task."
-    "delay"
-)
-def test_send_account_change_email_confirm(mocked_email_task, customer_user):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_account_change_email_confirm(mocked_queue_email, customer_user):
     payload = {
         "user": get_default_user_payload(customer_user),
         "recipient_email": "user@example.com",
@@ -104,16 +126,18 @@ def test_send_account_change_email_confirm(mocked_email_task, customer_user):
     send_account_change_email_confirm(
         payload=payload, config=config, plugin_configuration=[]
     )
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_user_change_email_notification_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events."
-    "send_account_delete_confirmation_email_task.delay"
-)
-def test_send_account_delete(mocked_email_task, customer_user):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_account_delete(mocked_queue_email, customer_user):
     token = "token123"
     payload = {
         "user": get_default_user_payload(customer_user),
@@ -125,15 +149,18 @@ def test_send_account_delete(mocked_email_task, customer_user):
     }
     config = {"host": "localhost", "port": "1025"}
     send_account_delete(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_account_delete_confirmation_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_set_user_password_email_task.delay"
-)
-def test_send_account_set_customer_password(mocked_email_task, customer_user):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_account_set_customer_password(mocked_queue_email, customer_user):
     token = "token123"
     payload = {
         "user": get_default_user_payload(customer_user),
@@ -147,14 +174,19 @@ def test_send_account_set_customer_password(mocked_email_task, customer_user):
     send_account_set_customer_password(
         payload=payload, config=config, plugin_configuration=[]
     )
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_set_user_password_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch("saleor.plugins.user_email.notify_events.send_invoice_email_task.delay")
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
 def test_send_invoice(
-    mocked_email_task,
+    mocked_queue_email,
 ):
     payload = {
         "invoice": {
@@ -168,15 +200,18 @@ def test_send_invoice(
     }
     config = {"host": "localhost", "port": "1025"}
     send_invoice(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_invoice_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_order_confirmation_email_task.delay"
-)
-def test_send_order_confirmation(mocked_email_task, order):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_order_confirmation(mocked_queue_email, order):
     payload = {
         "order": get_default_order_payload(order, "http://localhost:8000/redirect"),
         "recipient_email": "user@example.com",
@@ -185,42 +220,50 @@ def test_send_order_confirmation(mocked_email_task, order):
     }
     config = {"host": "localhost", "port": "1025"}
     send_order_confirmation(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_order_confirmation_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_fulfillment_confirmation_email_task."
-    "delay"
-)
-def test_send_fulfillment_confirmation(mocked_email_task, order, fulfillment):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_fulfillment_confirmation(mocked_queue_email, order, fulfillment):
     payload = get_default_fulfillment_payload(order, fulfillment)
     config = {"host": "localhost", "port": "1025"}
     send_fulfillment_confirmation(
         payload=payload, config=config, plugin_configuration=[]
     )
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_fulfillment_confirmation_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_fulfillment_update_email_task.delay"
-)
-def test_send_fulfillment_update(mocked_email_task, order, fulfillment):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_fulfillment_update(mocked_queue_email, order, fulfillment):
     payload = get_default_fulfillment_payload(order, fulfillment)
     config = {"host": "localhost", "port": "1025"}
     send_fulfillment_update(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_fulfillment_update_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_payment_confirmation_email_task.delay"
-)
-def test_send_payment_confirmation(mocked_email_task, order, payment_dummy):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_payment_confirmation(mocked_queue_email, order, payment_dummy):
     payload = {
         "order": get_default_order_payload(order, "http://localhost:8000/redirect"),
         "recipient_email": "user@example.com",
@@ -237,15 +280,18 @@ def test_send_payment_confirmation(mocked_email_task, order, payment_dummy):
     }
     config = {"host": "localhost", "port": "1025"}
     send_payment_confirmation(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_payment_confirmation_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_order_canceled_email_task.delay"
-)
-def test_send_order_canceled(mocked_email_task, order):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_order_canceled(mocked_queue_email, order):
     payload = {
         "order": get_default_order_payload(order, "http://localhost:8000/redirect"),
         "recipient_email": "user@example.com",
@@ -254,15 +300,18 @@ def test_send_order_canceled(mocked_email_task, order):
     }
     config = {"host": "localhost", "port": "1025"}
     send_order_canceled(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_order_canceled_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_order_refund_email_task.delay"
-)
-def test_send_order_refund(mocked_email_task, order):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_order_refund(mocked_queue_email, order):
     payload = {
         "order": get_default_order_payload(order, "http://localhost:8000/redirect"),
         "recipient_email": "user@example.com",
@@ -273,15 +322,18 @@ def test_send_order_refund(mocked_email_task, order):
     }
     config = {"host": "localhost", "port": "1025"}
     send_order_refund(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_order_refund_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
 
 
-@mock.patch(
-    "saleor.plugins.user_email.notify_events.send_order_confirmed_email_task.delay"
-)
-def test_send_order_confirmed(mocked_email_task, order):
+@mock.patch("saleor.plugins.user_email.notify_events.queue_email")
+def test_send_order_confirmed(mocked_queue_email, order):
     payload = {
         "order": get_default_order_payload(order, "http://localhost:8000/redirect"),
         "recipient_email": "user@example.com",
@@ -290,6 +342,11 @@ def test_send_order_confirmed(mocked_email_task, order):
     }
     config = {"host": "localhost", "port": "1025"}
     send_order_confirmed(payload=payload, config=config, plugin_configuration=[])
-    mocked_email_task.assert_called_with(
-        payload["recipient_email"], payload, config, mock.ANY, mock.ANY
+    mocked_queue_email.assert_called_with(
+        send_order_confirmed_email_task,
+        payload["recipient_email"],
+        payload,
+        config,
+        mock.ANY,
+        mock.ANY,
     )
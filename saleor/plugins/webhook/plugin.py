@@ -125,6 +125,8 @@ class WebhookPlugin(BasePlugin):
         order: "Order",
         invoice: "Invoice",
         number: Optional[str],
+        user: Optional["User"],
+        app: Optional["App"],
         previous_value: Any,
     ) -> Any:
         if not self.active:
@@ -1,5 +1,5 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 
 
 class ProductAppConfig(AppConfig):
@@ -11,6 +11,7 @@ class ProductAppConfig(AppConfig):
             delete_background_image,
             delete_digital_content_file,
             delete_product_media_image,
+            invalidate_category_tree_on_change,
         )
 
         # preventing duplicate signals
@@ -34,3 +35,15 @@ class ProductAppConfig(AppConfig):
             sender=ProductMedia,
             dispatch_uid="delete_product_media_image",
         )
+
+        # invalidating the category tree index
+        post_save.connect(
+            invalidate_category_tree_on_change,
+            sender=Category,
+            dispatch_uid="invalidate_category_tree_on_category_save",
+        )
+        post_delete.connect(
+            invalidate_category_tree_on_change,
+            sender=Category,
+            dispatch_uid="invalidate_category_tree_on_category_delete",
+        )
@@ -0,0 +1,96 @@
+"""Category tree indexed in memory.
+
+Filtering products by categories needs the IDs of the categories together with
+all their descendants. Instead of querying the MPTT tree on every request, the
+parent of each category is loaded once per process and the descendants,
+ancestors and paths are found in memory; the index is rebuilt when any category
+changes.
+"""
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from ..core.cache import CacheVersion
+from .models import Category
+
+category_tree_version = CacheVersion("category_tree_version")
+
+# Index of this process, with the version it was built for.
+_category_tree: Optional[Tuple[str, "CategoryTree"]] = None
+
+
+class CategoryTree:
+    def __init__(self, parents: Dict[int, Optional[int]]):
+        self.parents = parents
+        self.children: Dict[int, List[int]] = defaultdict(list)
+        for category_id, parent_id in parents.items():
+            if parent_id is not None:
+                self.children[parent_id].append(category_id)
+        self._descendants: Dict[int, FrozenSet[int]] = {}
+        self._paths: Dict[int, Tuple[int, ...]] = {}
+
+    @classmethod
+    def build(cls) -> "CategoryTree":
+        return cls(dict(Category.objects.values_list("pk", "parent_id")))
+
+    def get_descendant_ids(self, category_id: int) -> FrozenSet[int]:
+        """Return IDs of the category and all its descendants.
+
+        An empty set is returned for categories which don't exist.
+        """
+        descendants = self._descendants.get(category_id)
+        if descendants is not None:
+            return descendants
+        if category_id not in self.parents:
+            return frozenset()
+        ids = []
+        stack = [category_id]
+        while stack:
+            current_id = stack.pop()
+            ids.append(current_id)
+            stack.extend(self.children.get(current_id, []))
+        descendants = frozenset(ids)
+        self._descendants[category_id] = descendants
+        return descendants
+
+    def get_descendant_ids_of(self, category_ids: Iterable[int]) -> Set[int]:
+        """Return IDs of the categories and all their descendants."""
+        ids: Set[int] = set()
+        for category_id in category_ids:
+            ids.update(self.get_descendant_ids(int(category_id)))
+        return ids
+
+    def get_path(self, category_id: int) -> Tuple[int, ...]:
+        """Return IDs of the categories from the root to the given one.
+
+        An empty tuple is returned for categories which don't exist.
+        """
+        path = self._paths.get(category_id)
+        if path is not None:
+            return path
+        if category_id not in self.parents:
+            return ()
+        parent_id = self.parents[category_id]
+        parent_path = self.get_path(parent_id) if parent_id is not None else ()
+        path = (*parent_path, category_id)
+        self._paths[category_id] = path
+        return path
+
+    def get_ancestor_ids(self, category_id: int) -> Tuple[int, ...]:
+        """Return IDs of the ancestors of the category, starting from the root."""
+        return self.get_path(category_id)[:-1]
+
+
+def get_category_tree() -> CategoryTree:
+    global _category_tree
+
+    version = category_tree_version.get()
+    if _category_tree is not None and _category_tree[0] == version:
+        return _category_tree[1]
+    tree = CategoryTree.build()
+    _category_tree = (version, tree)
+    return tree
+
+
+def invalidate_category_tree():
+    """Make all processes rebuild their category tree index."""
+    category_tree_version.invalidate()
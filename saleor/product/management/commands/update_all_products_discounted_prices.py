@@ -1,10 +1,14 @@
 import logging
+import time
 
 from django.core.management.base import BaseCommand
 
 from ....discount.utils import fetch_active_discounts
 from ...models import Product
-from ...utils.variant_prices import update_product_discounted_price
+from ...utils.variant_prices import (
+    DISCOUNTED_PRICES_BATCH_SIZE,
+    update_products_discounted_prices,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -12,12 +16,31 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = "Recalculates the discounted prices for products in all channels."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DISCOUNTED_PRICES_BATCH_SIZE,
+            help="Number of products recalculated in a single batch.",
+        )
+
     def handle(self, *args, **options):
         self.stdout.write('Updating "discounted_price" field of all the products.')
+        start = time.monotonic()
+
+        def report_progress(processed, total):
+            elapsed = time.monotonic() - start
+            self.stdout.write(
+                f"Processed {processed}/{total} products in {elapsed:.2f}s "
+                f"({processed / max(elapsed, 1e-6):.0f} products/s)."
+            )
+
         # Fetching the discounts just once and reusing them
         discounts = fetch_active_discounts()
-        # Run the update on all the products
-        qs = Product.objects.all()
-        for product in qs.iterator():
-            self.stdout.write(f"Updating product PK: {product.pk}")
-            update_product_discounted_price(product, discounts=discounts)
+        updated_count = update_products_discounted_prices(
+            Product.objects.all(),
+            discounts=discounts,
+            progress_callback=report_progress,
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(f"Updated {updated_count} product channel listings.")
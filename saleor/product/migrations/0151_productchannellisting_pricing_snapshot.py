@@ -0,0 +1,18 @@
+# Generated by Django 3.2.7 on 2026-10-19 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0150_auto_20211001_1004"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productchannellisting",
+            name="pricing_snapshot",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -524,6 +524,9 @@ class ProductChannelListing(PublishableModel):
     discounted_price = MoneyField(
         amount_field="discounted_price_amount", currency_field="currency"
     )
+    # Storefront pricing in the channel default country, precomputed together with
+    # the discounted price when PRODUCT_PRICING_SNAPSHOT_ENABLED is set.
+    pricing_snapshot = JSONField(blank=True, null=True)
 
     class Meta:
         unique_together = [["product", "channel"]]
@@ -1,7 +1,8 @@
 import logging
 import re
 import warnings
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from django.conf import settings
 from django.templatetags.static import static
@@ -64,6 +65,11 @@ def get_available_sizes_by_method(method, rendition_key_set):
     return sizes
 
 
+@lru_cache()
+def get_sorted_available_sizes_by_method(method, rendition_key_set) -> Tuple[int, ...]:
+    return tuple(sorted(get_available_sizes_by_method(method, rendition_key_set)))
+
+
 def get_thumbnail_size(size, method, rendition_key_set, on_demand=None):
     """Return the closest larger size if not more than 2 times larger.
 
@@ -78,7 +84,7 @@ def get_thumbnail_size(size, method, rendition_key_set, on_demand=None):
     size_name = "%s__%s" % (method, size_str)
     if size_name in AVAILABLE_SIZES[rendition_key_set] or on_demand:
         return size_str
-    avail_sizes = sorted(get_available_sizes_by_method(method, rendition_key_set))
+    avail_sizes = get_sorted_available_sizes_by_method(method, rendition_key_set)
     larger = [x for x in avail_sizes if size < x <= size * 2]
     smaller = [x for x in avail_sizes if x <= size]
 
@@ -94,6 +100,16 @@ def get_thumbnail_size(size, method, rendition_key_set, on_demand=None):
     return None
 
 
+def get_thumbnail_rendition_key(
+    size, method, rendition_key_set="products"
+) -> Optional[str]:
+    """Return the rendition key of the thumbnail served for the given size."""
+    used_size = get_thumbnail_size(size, method, rendition_key_set)
+    if used_size is None:
+        return None
+    return "%s__%s" % (method, used_size)
+
+
 def get_thumbnail(image_file, size, method, rendition_key_set="products"):
     if image_file:
         used_size = get_thumbnail_size(size, method, rendition_key_set)
@@ -1,5 +1,6 @@
 from ..core.tasks import delete_from_storage_task
 from ..core.utils import delete_versatile_image
+from .category_tree import invalidate_category_tree
 
 
 def delete_background_image(sender, instance, **kwargs):
@@ -15,3 +16,10 @@ def delete_product_media_image(sender, instance, **kwargs):
 def delete_digital_content_file(sender, instance, **kwargs):
     if file := instance.content_file:
         delete_from_storage_task.delay(file.path)
+
+
+def invalidate_category_tree_on_change(sender, update_fields=None, **kwargs):
+    # saves not changing the parent don't affect the tree
+    if update_fields and "parent" not in update_fields:
+        return
+    invalidate_category_tree()
@@ -1,14 +1,19 @@
 import logging
-from typing import Iterable, List, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 
 from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from ..attribute.models import Attribute
 from ..celeryconf import app
 from ..core.exceptions import PreorderAllocationError
 from ..discount.models import Sale
+from ..discount.utils import fetch_catalogue_info
 from ..warehouse.management import deactivate_preorder_for_variant
 from .models import Product, ProductType, ProductVariant
 from .utils.variant_prices import (
@@ -22,6 +27,8 @@ from .utils.variants import generate_and_set_variant_name
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
+SALE_BOUNDARY_SCHEDULED_CACHE_KEY = "sale_boundary_scheduled:{}:{}"
+
 
 def _update_variants_names(instance: ProductType, saved_attributes: Iterable):
     """Product variant names are created from names of assigned attributes.
@@ -93,6 +100,67 @@ def update_products_discounted_prices_task(product_ids: List[int]):
     update_products_discounted_prices(products)
 
 
+def _get_sale_boundaries(
+    since: datetime, until: datetime
+) -> Iterable[Tuple[int, datetime]]:
+    """Return sale ids with start and end dates that pass in the given period."""
+    sales = Sale.objects.order_by()
+    yield from sales.filter(start_date__gte=since, start_date__lt=until).values_list(
+        "pk", "start_date"
+    )
+    yield from sales.filter(end_date__gte=since, end_date__lt=until).values_list(
+        "pk", "end_date"
+    )
+
+
+@app.task
+def schedule_sale_boundaries_price_updates_task():
+    """Schedule recalculation of discounted prices when sales start or end.
+
+    The task is run periodically by the beat; each sale boundary passing within the
+    next interval gets its recalculation scheduled at the boundary instant.
+    Boundaries from the previous interval are included as well, so the ones
+    missed by a delayed run are still processed; the cache guarantees that each
+    boundary is scheduled once.
+    """
+    now = timezone.now()
+    interval = settings.SALE_BOUNDARIES_SCHEDULE_INTERVAL
+    for sale_id, boundary in _get_sale_boundaries(now - interval, now + interval):
+        cache_key = SALE_BOUNDARY_SCHEDULED_CACHE_KEY.format(
+            sale_id, boundary.isoformat()
+        )
+        if not cache.add(cache_key, True, timeout=interval.total_seconds() * 3):
+            continue
+        update_products_discounted_prices_of_sale_boundary_task.apply_async(
+            args=[sale_id, boundary.isoformat()], eta=boundary
+        )
+
+
+@app.task
+def update_products_discounted_prices_of_sale_boundary_task(
+    sale_id: int, boundary: str
+):
+    """Recalculate discounted prices of the sale catalogue when its boundary passes.
+
+    Sales changed after scheduling are skipped, as the change already triggered
+    the recalculation and a changed boundary is scheduled separately.
+    """
+    sale = Sale.objects.filter(pk=sale_id).first()
+    if not sale:
+        logging.warning(f"Cannot find discount with id: {sale_id}.")
+        return
+    boundary_date = parse_datetime(boundary)
+    if boundary_date not in [sale.start_date, sale.end_date]:
+        return
+    catalogue_info = fetch_catalogue_info(sale)
+    update_products_discounted_prices_of_catalogues(
+        product_ids=catalogue_info["products"],
+        category_ids=catalogue_info["categories"],
+        collection_ids=catalogue_info["collections"],
+        variant_ids=catalogue_info["variants"],
+    )
+
+
 @app.task
 def deactivate_preorder_for_variants_task():
     variants_to_clean = _get_preorder_variants_to_clean()
@@ -0,0 +1,95 @@
+from ..category_tree import CategoryTree, get_category_tree
+from ..models import Category
+
+
+def test_category_tree_get_descendant_ids():
+    # given
+    tree = CategoryTree({1: None, 2: 1, 3: 2, 4: 1, 5: None})
+
+    # when
+    descendant_ids = tree.get_descendant_ids(1)
+
+    # then
+    assert descendant_ids == {1, 2, 3, 4}
+    assert tree.get_descendant_ids(3) == {3}
+    assert tree.get_descendant_ids(100) == set()
+    assert tree.get_descendant_ids_of(["2", 5]) == {2, 3, 5}
+
+
+def test_category_tree_get_path_and_ancestor_ids():
+    # given
+    tree = CategoryTree({1: None, 2: 1, 3: 2, 4: 1, 5: None})
+
+    # when
+    path = tree.get_path(3)
+
+    # then
+    assert path == (1, 2, 3)
+    assert tree.get_ancestor_ids(3) == (1, 2)
+    assert tree.get_ancestor_ids(5) == ()
+    assert tree.get_path(100) == ()
+
+
+def test_get_category_tree_matches_mptt_ancestors(categories_tree):
+    # given
+    child = categories_tree.children.first()
+    grandchild = Category.objects.create(
+        name="Grandchild", slug="grandchild", parent=child
+    )
+
+    # when
+    ancestor_ids = get_category_tree().get_ancestor_ids(grandchild.pk)
+
+    # then
+    assert list(ancestor_ids) == list(
+        grandchild.get_ancestors().values_list("pk", flat=True)
+    )
+
+
+def test_get_category_tree_matches_mptt_descendants(
+    categories_tree, django_assert_num_queries
+):
+    # given
+    parent = categories_tree
+    child = parent.children.first()
+    Category.objects.create(name="Grandchild", slug="grandchild", parent=child)
+    get_category_tree()
+
+    # when
+    with django_assert_num_queries(0):
+        descendant_ids = get_category_tree().get_descendant_ids(parent.pk)
+
+    # then
+    assert descendant_ids == set(
+        parent.get_descendants(include_self=True).values_list("pk", flat=True)
+    )
+
+
+def test_get_category_tree_rebuilt_on_category_move(categories_tree):
+    # given
+    parent = categories_tree
+    child = parent.children.first()
+    other = Category.objects.create(name="Other", slug="other")
+    assert child.pk in get_category_tree().get_descendant_ids(parent.pk)
+
+    # when
+    child.parent = other
+    child.save()
+
+    # then
+    tree = get_category_tree()
+    assert tree.get_descendant_ids(parent.pk) == {parent.pk}
+    assert tree.get_descendant_ids(other.pk) == {other.pk, child.pk}
+
+
+def test_get_category_tree_rebuilt_on_category_delete(categories_tree):
+    # given
+    parent = categories_tree
+    child = parent.children.first()
+    get_category_tree()
+
+    # when
+    child.delete()
+
+    # then
+    assert get_category_tree().get_descendant_ids(parent.pk) == {parent.pk}
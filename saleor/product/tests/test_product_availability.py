@@ -6,9 +6,15 @@ from django_countries.fields import Country
 from freezegun import freeze_time
 from prices import Money, TaxedMoney, TaxedMoneyRange
 
+from ...core.utils import get_currency_for_country
 from ...plugins.manager import PluginsManager, get_plugins_manager
 from .. import models
-from ..utils.availability import get_product_availability
+from ..utils.availability import (
+    get_product_availability,
+    get_product_availability_from_snapshot,
+    update_products_pricing_snapshots,
+)
+from ..utils.variant_prices import update_product_discounted_price
 
 
 def test_availability(stock, monkeypatch, settings, channel_USD):
@@ -352,3 +358,69 @@ def test_filter_not_published_product_without_assigned_channel(
 
     not_available_products_pln = models.Product.objects.not_published(channel_PLN.slug)
     assert not_available_products_pln.count() == 1
+
+
+def test_update_products_pricing_snapshots(product, channel_USD):
+    # given
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    variants = product.variants.all()
+    variants_channel_listing = models.ProductVariantChannelListing.objects.filter(
+        variant__in=variants, channel=channel_USD
+    )
+    manager = get_plugins_manager()
+    country_code = channel_USD.default_country.code
+
+    # when
+    update_products_pricing_snapshots([product.pk], [], manager)
+
+    # then
+    product_channel_listing.refresh_from_db()
+    assert product_channel_listing.pricing_snapshot["country"] == country_code
+    availability = get_product_availability_from_snapshot(
+        product_channel_listing, country_code
+    )
+    assert availability == get_product_availability(
+        product=product,
+        product_channel_listing=product_channel_listing,
+        variants=variants,
+        variants_channel_listing=variants_channel_listing,
+        collections=[],
+        discounts=[],
+        channel=channel_USD,
+        manager=manager,
+        country=Country(country_code),
+        local_currency=get_currency_for_country(country_code),
+    )
+
+
+def test_get_product_availability_from_snapshot_for_other_country(product, channel_USD):
+    # given
+    update_products_pricing_snapshots([product.pk], [], get_plugins_manager())
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+
+    # when
+    availability = get_product_availability_from_snapshot(product_channel_listing, "XX")
+
+    # then
+    assert availability is None
+
+
+def test_update_products_discounted_prices_refreshes_pricing_snapshots(
+    product, channel_USD, settings
+):
+    # given
+    settings.PRODUCT_PRICING_SNAPSHOT_ENABLED = True
+    product.variants.first().channel_listings.filter(channel=channel_USD).update(
+        price_amount=Decimal("4.50")
+    )
+
+    # when
+    update_product_discounted_price(product)
+
+    # then
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    availability = get_product_availability_from_snapshot(
+        product_channel_listing, channel_USD.default_country.code
+    )
+    assert availability.price_range.start.gross == Money("4.50", "USD")
+    assert product_channel_listing.discounted_price == Money("4.50", "USD")
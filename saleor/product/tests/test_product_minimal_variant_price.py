@@ -1,13 +1,21 @@
-from unittest.mock import patch
+from unittest.mock import Mock, call, patch
 
+import pytest
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from prices import Money
 
+from ...discount import DiscountInfo
+from ..models import Product
 from ..tasks import (
     update_products_discounted_prices_of_catalogues,
     update_products_discounted_prices_task,
 )
-from ..utils.variant_prices import update_product_discounted_price
+from ..utils.variant_prices import (
+    update_product_discounted_price,
+    update_products_discounted_prices,
+)
 
 
 def test_update_product_discounted_price(product, channel_USD):
@@ -125,15 +133,95 @@ def test_update_products_discounted_prices_task(product_list):
         assert product_channel_listing.discounted_price == price
 
 
+def test_update_products_discounted_prices_applies_sales(
+    product_list, channel_USD, sale
+):
+    # given
+    products = Product.objects.filter(pk__in=[product.pk for product in product_list])
+    discount = DiscountInfo(
+        sale=sale,
+        channel_listings={channel_USD.slug: sale.channel_listings.get()},
+        product_ids={product_list[0].pk},
+        category_ids=set(),
+        collection_ids=set(),
+        variants_ids=set(),
+    )
+
+    # when
+    updated_count = update_products_discounted_prices(products, discounts=[discount])
+
+    # then
+    assert updated_count == 1
+    product_listing = product_list[0].channel_listings.get(channel=channel_USD)
+    assert product_listing.discounted_price == Money("5", "USD")
+    for product in product_list[1:]:
+        variant_listing = product.variants.get().channel_listings.get(
+            channel=channel_USD
+        )
+        product_listing = product.channel_listings.get(channel=channel_USD)
+        assert product_listing.discounted_price == variant_listing.price
+
+
+def test_update_products_discounted_prices_reports_progress(product_list):
+    # given
+    progress_callback = Mock()
+
+    # when
+    update_products_discounted_prices(
+        Product.objects.all(),
+        discounts=[],
+        progress_callback=progress_callback,
+        batch_size=2,
+    )
+
+    # then
+    assert progress_callback.call_args_list == [call(2, 3), call(3, 3)]
+
+
+def test_update_products_discounted_prices_query_count_does_not_depend_on_products(
+    product_list, discount_info
+):
+    # given
+    products = Product.objects.filter(pk__in=[product.pk for product in product_list])
+
+    # when
+    with CaptureQueriesContext(connection) as single_product_queries:
+        update_products_discounted_prices(
+            products.filter(pk=product_list[0].pk), discounts=[discount_info]
+        )
+    with CaptureQueriesContext(connection) as many_products_queries:
+        updated_count = update_products_discounted_prices(
+            products, discounts=[discount_info]
+        )
+
+    # then
+    assert updated_count == len(product_list) - 1
+    assert len(many_products_queries) == len(single_product_queries)
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_update_products_discounted_prices_in_batches(
+    product_list, discount_info, count_queries
+):
+    update_products_discounted_prices(
+        Product.objects.all(), discounts=[discount_info], batch_size=1
+    )
+
+
 @patch(
     "saleor.product.management.commands"
     ".update_all_products_discounted_prices"
-    ".update_product_discounted_price"
+    ".update_products_discounted_prices"
 )
 def test_management_commmand_update_all_products_discounted_price(
-    mock_update_product_discounted_price, product_list
+    mock_update_products_discounted_prices, product_list
 ):
-    call_command("update_all_products_discounted_prices")
-    call_args_list = mock_update_product_discounted_price.call_args_list
-    for (args, kwargs), product in zip(call_args_list, product_list):
-        assert args[0] == product
+    # when
+    call_command("update_all_products_discounted_prices", batch_size=100)
+
+    # then
+    mock_update_products_discounted_prices.assert_called_once()
+    args, kwargs = mock_update_products_discounted_prices.call_args
+    assert set(args[0]) == set(product_list)
+    assert kwargs["batch_size"] == 100
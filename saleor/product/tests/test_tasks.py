@@ -6,8 +6,10 @@ from django.utils import timezone
 
 from ..tasks import (
     _get_preorder_variants_to_clean,
+    schedule_sale_boundaries_price_updates_task,
     update_product_discounted_price_task,
     update_products_discounted_prices_of_discount_task,
+    update_products_discounted_prices_of_sale_boundary_task,
     update_variants_names,
 )
 
@@ -114,3 +116,84 @@ def test_get_preorder_variants_to_clean(
     variants_to_clean = _get_preorder_variants_to_clean()
     assert len(variants_to_clean) == 1
     assert variants_to_clean[0] == preorder_variant_after_end_date
+
+
+@patch(
+    "saleor.product.tasks"
+    ".update_products_discounted_prices_of_sale_boundary_task.apply_async"
+)
+def test_schedule_sale_boundaries_price_updates_task(
+    update_prices_mock, sale, settings
+):
+    # given
+    settings.SALE_BOUNDARIES_SCHEDULE_INTERVAL = timedelta(minutes=5)
+    now = timezone.now()
+    sale.start_date = now + timedelta(minutes=2)
+    sale.end_date = now + timedelta(minutes=20)
+    sale.save(update_fields=["start_date", "end_date"])
+
+    # when
+    schedule_sale_boundaries_price_updates_task()
+    schedule_sale_boundaries_price_updates_task()
+
+    # then
+    update_prices_mock.assert_called_once_with(
+        args=[sale.pk, sale.start_date.isoformat()], eta=sale.start_date
+    )
+
+
+@patch(
+    "saleor.product.tasks"
+    ".update_products_discounted_prices_of_sale_boundary_task.apply_async"
+)
+def test_schedule_sale_boundaries_price_updates_task_includes_missed_boundaries(
+    update_prices_mock, sale, settings
+):
+    # given
+    settings.SALE_BOUNDARIES_SCHEDULE_INTERVAL = timedelta(minutes=5)
+    now = timezone.now()
+    sale.start_date = now - timedelta(days=1)
+    sale.end_date = now - timedelta(minutes=3)
+    sale.save(update_fields=["start_date", "end_date"])
+
+    # when
+    schedule_sale_boundaries_price_updates_task()
+
+    # then
+    update_prices_mock.assert_called_once_with(
+        args=[sale.pk, sale.end_date.isoformat()], eta=sale.end_date
+    )
+
+
+@patch("saleor.product.tasks.update_products_discounted_prices_of_catalogues")
+def test_update_products_discounted_prices_of_sale_boundary_task(
+    update_prices_mock, sale, product, category, collection, variant
+):
+    # when
+    update_products_discounted_prices_of_sale_boundary_task(
+        sale.pk, sale.start_date.isoformat()
+    )
+
+    # then
+    update_prices_mock.assert_called_once_with(
+        product_ids={product.pk},
+        category_ids={category.pk},
+        collection_ids={collection.pk},
+        variant_ids={variant.pk},
+    )
+
+
+@patch("saleor.product.tasks.update_products_discounted_prices_of_catalogues")
+def test_update_products_discounted_prices_of_sale_boundary_task_boundary_changed(
+    update_prices_mock, sale
+):
+    # given
+    boundary = sale.start_date.isoformat()
+    sale.start_date = sale.start_date + timedelta(hours=1)
+    sale.save(update_fields=["start_date"])
+
+    # when
+    update_products_discounted_prices_of_sale_boundary_task(sale.pk, boundary)
+
+    # then
+    update_prices_mock.assert_not_called()
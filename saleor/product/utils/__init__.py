@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Dict, Iterable, List, Union
 
 from ...core.taxes import TaxedMoney, zero_taxed_money
 from ...core.tracing import traced_atomic_transaction
+from ..category_tree import get_category_tree
 from ..models import Product, ProductChannelListing
 from ..tasks import update_products_discounted_prices_task
 
@@ -62,11 +63,12 @@ def delete_categories(categories_ids: List[str], manager):
 
 def collect_categories_tree_products(category: "Category") -> "QuerySet[Product]":
     """Collect products from all levels in category tree."""
-    products = category.products.prefetched_for_webhook(single_object=False)  # type: ignore
-    descendants = category.get_descendants()
-    for descendant in descendants:
-        products = products | descendant.products.all()
-    return products
+    category_ids = get_category_tree().get_descendant_ids(category.pk)
+    return Product.objects.filter(
+        category_id__in=category_ids
+    ).prefetched_for_webhook(  # type: ignore
+        single_object=False
+    )
 
 
 def get_products_ids_without_variants(products_list: "List[Product]") -> "List[str]":
@@ -1,13 +1,14 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import opentracing
 from django.conf import settings
 from django_countries.fields import Country
-from prices import MoneyRange, TaxedMoney, TaxedMoneyRange
+from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
 from ...channel.models import Channel
-from ...core.utils import to_local_currency
+from ...core.utils import get_currency_for_country, to_local_currency
 from ...discount import DiscountInfo
 from ...discount.utils import calculate_discounted_price
 from ...product.models import (
@@ -290,3 +291,124 @@ def get_variant_availability(
             price_local_currency=price_local_currency,
             discount_local_currency=discount_local_currency,
         )
+
+
+PRICING_SNAPSHOT_FIELDS = [
+    "price_range",
+    "price_range_undiscounted",
+    "discount",
+    "price_range_local_currency",
+    "discount_local_currency",
+]
+
+
+def _serialize_price(
+    price: Union[None, TaxedMoney, TaxedMoneyRange]
+) -> Optional[Dict[str, Any]]:
+    if price is None:
+        return None
+    if isinstance(price, TaxedMoneyRange):
+        return {
+            "start": _serialize_price(price.start),
+            "stop": _serialize_price(price.stop),
+        }
+    return {
+        "net": str(price.net.amount),
+        "gross": str(price.gross.amount),
+        "currency": price.currency,
+    }
+
+
+def _deserialize_price(
+    data: Optional[Dict[str, Any]]
+) -> Union[None, TaxedMoney, TaxedMoneyRange]:
+    if data is None:
+        return None
+    if "start" in data:
+        return TaxedMoneyRange(
+            start=_deserialize_price(data["start"]),
+            stop=_deserialize_price(data["stop"]),
+        )
+    currency = data["currency"]
+    return TaxedMoney(
+        net=Money(Decimal(data["net"]), currency),
+        gross=Money(Decimal(data["gross"]), currency),
+    )
+
+
+def get_product_pricing_snapshot(
+    availability: ProductAvailability, country_code: str
+) -> Dict[str, Any]:
+    snapshot: Dict[str, Any] = {
+        name: _serialize_price(getattr(availability, name))
+        for name in PRICING_SNAPSHOT_FIELDS
+    }
+    snapshot["country"] = country_code
+    return snapshot
+
+
+def get_product_availability_from_snapshot(
+    product_channel_listing: Optional[ProductChannelListing], country_code: str
+) -> Optional[ProductAvailability]:
+    """Return the product availability stored in the channel listing snapshot.
+
+    Return None when there is no snapshot for the given country. The sale flag
+    depends on the current listing visibility, so it's not stored in the snapshot.
+    """
+    snapshot = product_channel_listing and product_channel_listing.pricing_snapshot
+    if not snapshot or snapshot.get("country") != country_code:
+        return None
+    prices = {
+        name: _deserialize_price(snapshot[name]) for name in PRICING_SNAPSHOT_FIELDS
+    }
+    return ProductAvailability(
+        on_sale=product_channel_listing.is_visible  # type: ignore
+        and prices["discount"] is not None,
+        **prices,
+    )
+
+
+def update_products_pricing_snapshots(
+    product_ids: Iterable[int],
+    discounts: Iterable[DiscountInfo],
+    manager: "PluginsManager",
+):
+    """Store pricing of the products in their channels default countries."""
+    products = Product.objects.filter(pk__in=product_ids).prefetch_related(
+        "collections",
+        "variants__channel_listings",
+        "channel_listings__channel",
+    )
+    listings_to_update = []
+    for product in products:
+        variants = list(product.variants.all())
+        collections = list(product.collections.all())
+        for product_channel_listing in product.channel_listings.all():
+            channel = product_channel_listing.channel
+            variants_channel_listing = [
+                variant_channel_listing
+                for variant in variants
+                for variant_channel_listing in variant.channel_listings.all()
+                if variant_channel_listing.channel_id == channel.id
+                and variant_channel_listing.price_amount is not None
+            ]
+            snapshot = None
+            if variants_channel_listing:
+                country_code = channel.default_country.code
+                availability = get_product_availability(
+                    product=product,
+                    product_channel_listing=product_channel_listing,
+                    variants=variants,
+                    variants_channel_listing=variants_channel_listing,
+                    collections=collections,
+                    discounts=discounts,
+                    channel=channel,
+                    manager=manager,
+                    country=Country(country_code),
+                    local_currency=get_currency_for_country(country_code),
+                )
+                snapshot = get_product_pricing_snapshot(availability, country_code)
+            if product_channel_listing.pricing_snapshot != snapshot:
+                product_channel_listing.pricing_snapshot = snapshot
+                listings_to_update.append(product_channel_listing)
+    ProductChannelListing.objects.bulk_update(listings_to_update, ["pricing_snapshot"])
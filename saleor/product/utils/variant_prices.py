@@ -1,58 +1,100 @@
 import operator
 from collections import defaultdict
 from functools import reduce
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
+from django.conf import settings
 from django.db.models.query_utils import Q
 from prices import Money
 
-from ...discount.utils import calculate_discounted_price, fetch_active_discounts
-from ..models import Product, ProductChannelListing, ProductVariantChannelListing
+from ...channel.models import Channel
+from ...discount.utils import (
+    DiscountInfoList,
+    DiscountsIndex,
+    fetch_active_discounts,
+    get_discounts_index,
+)
+from ...plugins.manager import get_plugins_manager
+from ..models import (
+    CollectionProduct,
+    Product,
+    ProductChannelListing,
+    ProductVariantChannelListing,
+)
+from .availability import update_products_pricing_snapshots
+
+# Number of products which discounted prices are recalculated in a single round trip
+DISCOUNTED_PRICES_BATCH_SIZE = 2000
 
 
-def _get_variant_prices_in_channels_dict(product):
-    prices_dict = defaultdict(list)
-    for variant_channel_listing in ProductVariantChannelListing.objects.filter(
-        variant__product_id=product, price_amount__isnull=False
-    ):
-        channel_id = variant_channel_listing.channel_id
-        prices_dict[channel_id].append(variant_channel_listing.price)
-    return prices_dict
+def _get_product_discounted_price(
+    variant_prices: List[Money],
+    product_id: int,
+    category_id: Optional[int],
+    collection_ids: Set[int],
+    channel_slug: str,
+    discounts_index: DiscountsIndex,
+) -> Money:
+    discount_fns = discounts_index.get_discounts(
+        channel_slug, product_id, category_id, collection_ids
+    )
+    if not discount_fns:
+        return min(variant_prices)
+    return min(
+        discount_fn(variant_price)
+        for variant_price in variant_prices
+        for discount_fn in discount_fns
+    )
 
 
-def _get_product_discounted_price(
-    variant_prices, product, collections, discounts, channel
-) -> Optional[Money]:
-    discounted_variants_price = []
-    for variant_price in variant_prices:
-        discounted_variant_price = calculate_discounted_price(
-            product=product,
-            price=variant_price,
-            collections=collections,
-            discounts=discounts,
-            channel=channel,
-        )
-        discounted_variants_price.append(discounted_variant_price)
-    return min(discounted_variants_price)
+def _update_products_discounted_prices_batch(
+    product_ids: List[int],
+    discounts_index: DiscountsIndex,
+    channel_slugs: Dict[int, str],
+) -> int:
+    """Recalculate discounted prices of the given products in all channels.
 
+    Products, their collections, variant prices and channel listings are fetched
+    with a single query each, regardless of the number of products. Return the
+    number of updated product channel listings.
+    """
+    categories = dict(
+        Product.objects.filter(pk__in=product_ids).values_list("pk", "category_id")
+    )
+    collections: Dict[int, Set[int]] = defaultdict(set)
+    for product_id, collection_id in CollectionProduct.objects.filter(
+        product_id__in=product_ids
+    ).values_list("product_id", "collection_id"):
+        collections[product_id].add(collection_id)
+    variant_prices: Dict[Tuple[int, int], List[Money]] = defaultdict(list)
+    for (
+        product_id,
+        channel_id,
+        price_amount,
+        currency,
+    ) in ProductVariantChannelListing.objects.filter(
+        variant__product_id__in=product_ids, price_amount__isnull=False
+    ).values_list(
+        "variant__product_id", "channel_id", "price_amount", "currency"
+    ):
+        variant_prices[(product_id, channel_id)].append(Money(price_amount, currency))
 
-def update_product_discounted_price(product, discounts=None):
-    if discounts is None:
-        discounts = fetch_active_discounts()
-    collections = list(product.collections.all())
-    variant_prices_in_channels_dict = _get_variant_prices_in_channels_dict(product)
     changed_products_channels_to_update = []
-    for product_channel_listing in product.channel_listings.all():
+    for product_channel_listing in ProductChannelListing.objects.filter(
+        product_id__in=product_ids
+    ):
+        product_id = product_channel_listing.product_id
         channel_id = product_channel_listing.channel_id
-        variant_prices_dict = variant_prices_in_channels_dict.get(channel_id)
-        if not variant_prices_dict:
+        prices = variant_prices.get((product_id, channel_id))
+        if not prices:
             continue
         product_discounted_price = _get_product_discounted_price(
-            variant_prices_dict,
-            product,
-            collections,
-            discounts,
-            product_channel_listing.channel,
+            prices,
+            product_id,
+            categories.get(product_id),
+            collections[product_id],
+            channel_slugs[channel_id],
+            discounts_index,
         )
         if product_channel_listing.discounted_price != product_discounted_price:
             product_channel_listing.discounted_price_amount = (
@@ -62,14 +104,51 @@ def update_product_discounted_price(product, discounts=None):
     ProductChannelListing.objects.bulk_update(
         changed_products_channels_to_update, ["discounted_price_amount"]
     )
+    return len(changed_products_channels_to_update)
+
 
+def update_product_discounted_price(product, discounts=None):
+    update_products_discounted_prices(
+        Product.objects.filter(pk=product.pk), discounts=discounts
+    )
 
-def update_products_discounted_prices(products, discounts=None):
+
+def update_products_discounted_prices(
+    products,
+    discounts=None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    batch_size: int = DISCOUNTED_PRICES_BATCH_SIZE,
+) -> int:
+    """Recalculate discounted prices of the products in batches.
+
+    Pricing snapshots of the products are refreshed as well, when enabled.
+    `progress_callback` is called after each batch with the number of processed
+    and all products. Return the number of updated product channel listings.
+    """
     if discounts is None:
         discounts = fetch_active_discounts()
-
-    for product in products.prefetch_related("channel_listings"):
-        update_product_discounted_price(product, discounts)
+    elif not isinstance(discounts, DiscountInfoList):
+        discounts = DiscountInfoList(discounts)
+
+    product_ids = list(products.order_by("pk").values_list("pk", flat=True))
+    if not product_ids:
+        return 0
+    channel_slugs = dict(Channel.objects.values_list("pk", "slug"))
+    discounts_index = get_discounts_index(discounts)
+    manager = None
+    if settings.PRODUCT_PRICING_SNAPSHOT_ENABLED:
+        manager = get_plugins_manager()
+    updated_count = 0
+    for index in range(0, len(product_ids), batch_size):
+        batch_ids = product_ids[index : index + batch_size]  # noqa: E203
+        updated_count += _update_products_discounted_prices_batch(
+            batch_ids, discounts_index, channel_slugs
+        )
+        if manager:
+            update_products_pricing_snapshots(batch_ids, discounts, manager)
+        if progress_callback:
+            progress_callback(index + len(batch_ids), len(product_ids))
+    return updated_count
 
 
 def update_products_discounted_prices_of_catalogues(
@@ -118,6 +118,12 @@ if ENABLE_SSL:
 
 DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", EMAIL_HOST_USER)
 
+# SMTP connections of the email plugins are kept open by workers and reused for
+# the next messages unless they were idle for longer than this.
+EMAIL_CONNECTION_KEEP_ALIVE = timedelta(
+    seconds=parse(os.environ.get("EMAIL_CONNECTION_KEEP_ALIVE", "1 minute"))
+)
+
 MEDIA_ROOT = os.path.join(PROJECT_ROOT, "media")
 MEDIA_URL = os.environ.get("MEDIA_URL", "/media/")
 
@@ -210,6 +216,7 @@ INSTALLED_APPS = [
     "saleor.wishlist",
     "saleor.app",
     "saleor.vendor",
+    "saleor.thumbnail",
     # External apps
     "versatileimagefield",
     "django_measurement",
@@ -455,6 +462,14 @@ VERSATILEIMAGEFIELD_SETTINGS = {
     "create_images_on_demand": get_bool_from_env("CREATE_IMAGES_ON_DEMAND", DEBUG)
 }
 
+# Formats, next to the original one, to which thumbnails are converted when warmed,
+# e.g. "webp,avif". AVIF requires the pillow-avif-plugin package.
+THUMBNAIL_EXTRA_FORMATS = [
+    fmt.strip().lower()
+    for fmt in os.environ.get("THUMBNAIL_EXTRA_FORMATS", "").split(",")
+    if fmt.strip()
+]
+
 PLACEHOLDER_IMAGES = {
     60: "images/placeholder60x60.png",
     120: "images/placeholder120x120.png",
@@ -482,6 +497,22 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", None)
 
+# Store storefront pricing of products in the channel default country together
+# with their discounted prices, and serve it when no address is given.
+PRODUCT_PRICING_SNAPSHOT_ENABLED = get_bool_from_env(
+    "PRODUCT_PRICING_SNAPSHOT_ENABLED", False
+)
+
+# Find shipping methods applicable to checkouts and orders with the shipping rates of
+# the channel compiled in memory, instead of querying them each time.
+SHIPPING_RATE_TABLE_ENABLED = get_bool_from_env("SHIPPING_RATE_TABLE_ENABLED", True)
+
+# Interval of scheduling the recalculation of discounted prices for sales that
+# start or end soon; each recalculation runs when the sale boundary passes.
+SALE_BOUNDARIES_SCHEDULE_INTERVAL = timedelta(
+    seconds=parse(os.environ.get("SALE_BOUNDARIES_SCHEDULE_INTERVAL", "5 minutes"))
+)
+
 CELERY_BEAT_SCHEDULE = {
     "delete-empty-allocations": {
         "task": "saleor.warehouse.tasks.delete_empty_allocations_task",
@@ -491,8 +522,28 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.product.tasks.deactivate_preorder_for_variants_task",
         "schedule": timedelta(hours=1),
     },
+    "schedule-sale-boundaries-price-updates": {
+        "task": "saleor.product.tasks.schedule_sale_boundaries_price_updates_task",
+        "schedule": SALE_BOUNDARIES_SCHEDULE_INTERVAL,
+    },
 }
 
+# Number of products exported by a single subtask; exports of larger querysets are
+# split into parts processed in parallel and merged into the final file.
+# Set to 0 to always export products in a single task.
+EXPORT_PRODUCTS_SHARD_SIZE = int(os.environ.get("EXPORT_PRODUCTS_SHARD_SIZE", 50000))
+
+# Fraction of GraphQL requests whose SQL statements are recorded in query reports,
+# e.g. 0.01 records one in a hundred requests. Set to 0 to disable the reports.
+QUERY_REPORT_SAMPLE_RATE = float(os.environ.get("QUERY_REPORT_SAMPLE_RATE", 0))
+# Number of executions of the same statement template within a single request
+# from which the request is flagged as a likely N+1 pattern.
+QUERY_REPORT_REPEATED_STATEMENT_THRESHOLD = int(
+    os.environ.get("QUERY_REPORT_REPEATED_STATEMENT_THRESHOLD", 5)
+)
+# Seconds between writes of the statistics collected by a process to the reports.
+QUERY_REPORT_FLUSH_INTERVAL = int(os.environ.get("QUERY_REPORT_FLUSH_INTERVAL", 60))
+
 # Change this value if your application is running behind a proxy,
 # e.g. HTTP_CF_Connecting_IP for Cloudflare or X_FORWARDED_FOR
 REAL_IP_ENVIRON = os.environ.get("REAL_IP_ENVIRON", "REMOTE_ADDR")
@@ -526,6 +577,8 @@ GRAPHENE = {
     "MIDDLEWARE": [
         "saleor.graphql.middleware.app_middleware",
         "saleor.graphql.middleware.JWTMiddleware",
+        "saleor.graphql.middleware.QueryReportMiddleware",
+        "saleor.graphql.middleware.instrumentation_middleware",
     ],
 }
 
@@ -613,6 +666,26 @@ JWT_TTL_APP_ACCESS = timedelta(
 )
 JWT_TTL_REFRESH = timedelta(seconds=parse(os.environ.get("JWT_TTL_REFRESH", "30 days")))
 
+# Time in seconds for which the authentication data and permissions of the token
+# owner are cached; user, group and permission changes invalidate the cache.
+# Set to 0 to fetch the user from the database on every request.
+JWT_USER_CACHE_TIMEOUT = int(os.environ.get("JWT_USER_CACHE_TIMEOUT", 300))
+
+# Time in seconds for which the active flag and permissions of apps authenticated
+# with app tokens are cached; app and token changes invalidate the cache.
+# Set to 0 to fetch the app from the database on every request.
+APP_TOKEN_CACHE_TIMEOUT = int(os.environ.get("APP_TOKEN_CACHE_TIMEOUT", 300))
+
+# Time in seconds for which the lines of checkouts are cached between requests;
+# line, checkout and catalogue changes invalidate the cache.
+# Set to 0 to fetch checkout lines from the database on every request.
+CHECKOUT_LINES_CACHE_TIMEOUT = int(os.environ.get("CHECKOUT_LINES_CACHE_TIMEOUT", 1800))
+
+# Time in seconds for which menu trees are cached between requests; changes of
+# menus and of the categories, collections and pages they link to invalidate them.
+# Set to 0 to fetch menu trees from the database on every request.
+MENU_CACHE_TIMEOUT = int(os.environ.get("MENU_CACHE_TIMEOUT", 86400))
+
 
 JWT_TTL_REQUEST_EMAIL_CHANGE = timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REQUEST_EMAIL_CHANGE", "1 hour")),
@@ -0,0 +1,48 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class ShippingAppConfig(AppConfig):
+    name = "saleor.shipping"
+
+    def ready(self):
+        from .models import (
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+            ShippingZone,
+        )
+        from .signals import (
+            invalidate_shipping_rate_tables_on_change,
+            invalidate_shipping_rate_tables_on_m2m_change,
+        )
+
+        # invalidating compiled shipping rate tables
+        for model in [
+            ShippingZone,
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+        ]:
+            post_save.connect(
+                invalidate_shipping_rate_tables_on_change,
+                sender=model,
+                dispatch_uid=f"invalidate_shipping_rate_tables_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_shipping_rate_tables_on_change,
+                sender=model,
+                dispatch_uid=(
+                    f"invalidate_shipping_rate_tables_{model.__name__}_delete"
+                ),
+            )
+        m2m_changed.connect(
+            invalidate_shipping_rate_tables_on_m2m_change,
+            sender=ShippingZone.channels.through,
+            dispatch_uid="invalidate_shipping_rate_tables_zone_channels",
+        )
+        m2m_changed.connect(
+            invalidate_shipping_rate_tables_on_m2m_change,
+            sender=ShippingMethod.excluded_products.through,
+            dispatch_uid="invalidate_shipping_rate_tables_excluded_products",
+        )
@@ -165,6 +165,24 @@ class ShippingMethodQueryset(models.QuerySet):
             instance_product_ids = set(lines.values_list("variant__product", flat=True))
         else:
             instance_product_ids = {line.product.id for line in lines}
+        if settings.SHIPPING_RATE_TABLE_ENABLED:
+            from .rate_table import get_shipping_rate_table
+
+            shipping_address = instance.shipping_address
+            shipping_method_ids = get_shipping_rate_table(
+                channel_id
+            ).get_applicable_shipping_method_ids(
+                price=price,
+                weight=instance.get_total_weight(lines),
+                country_code=country_code,
+                product_ids=instance_product_ids,
+                postal_code_country=shipping_address.country.code,
+                postal_code=shipping_address.postal_code,
+            )
+            qs = self.filter(pk__in=shipping_method_ids)
+            qs = self.applicable_shipping_methods_by_channel(qs, channel_id)
+            return qs.prefetch_related("shipping_zone")
+
         applicable_methods = self.applicable_shipping_methods(
             price=price,
             channel_id=channel_id,
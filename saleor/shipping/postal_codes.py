@@ -2,6 +2,9 @@ import re
 
 from . import PostalCodeRuleInclusionType
 
+UK_POSTAL_CODE_PATTERN = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
+IRISH_POSTAL_CODE_PATTERN = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
+
 
 def group_values(pattern, *values):
     result = []
@@ -46,8 +49,7 @@ def check_uk_postal_code(code, start, end):
 
     Example postal codes: BH20 2BC  (UK), IM16 7HF  (Isle of Man).
     """
-    pattern = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
-    code, start, end = group_values(pattern, code, start, end)
+    code, start, end = group_values(UK_POSTAL_CODE_PATTERN, code, start, end)
     # replace second item of each tuple with it's value casted to int
     code, start, end = cast_tuple_index_to_type(1, int, code, start, end)
     return compare_values(code, start, end)
@@ -58,8 +60,7 @@ def check_irish_postal_code(code, start, end):
 
     Example postal codes: A65 2F0A, A61 2F0G.
     """
-    pattern = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
-    code, start, end = group_values(pattern, code, start, end)
+    code, start, end = group_values(IRISH_POSTAL_CODE_PATTERN, code, start, end)
     return compare_values(code, start, end)
 
 
@@ -71,6 +72,39 @@ def check_any_postal_code(code, start, end):
     return compare_values(code, start, end)
 
 
+def get_uk_postal_code_key(code):
+    """Return the comparison key of a postal code used by `check_uk_postal_code`."""
+    (code,) = cast_tuple_index_to_type(
+        1, int, *group_values(UK_POSTAL_CODE_PATTERN, code)
+    )
+    return code
+
+
+def get_irish_postal_code_key(code):
+    """Return the comparison key of a postal code used by `check_irish_postal_code`."""
+    (code,) = group_values(IRISH_POSTAL_CODE_PATTERN, code)
+    return code
+
+
+def get_any_postal_code_key(code):
+    return code
+
+
+def get_postal_code_key_function(country):
+    """Return the function that maps postal codes of the country to comparable keys.
+
+    Comparing the keys gives the same results as `check_postal_code_in_range`.
+    """
+    country_func_map = {
+        "GB": get_uk_postal_code_key,
+        "IM": get_uk_postal_code_key,
+        "GG": get_uk_postal_code_key,
+        "JE": get_uk_postal_code_key,
+        "IE": get_irish_postal_code_key,
+    }
+    return country_func_map.get(country, get_any_postal_code_key)
+
+
 def check_postal_code_in_range(country, code, start, end):
     country_func_map = {
         "GB": check_uk_postal_code,  # United Kingdom
@@ -0,0 +1,257 @@
+"""Shipping rates of a channel compiled to in-memory lookup structures.
+
+Finding the shipping methods applicable to a checkout or an order only needs the
+shipping zones, the channel listings, the postal code rules and the excluded
+products of the channel. These are loaded once and compiled per worker, and
+rebuilt when any of them changes.
+"""
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from measurement.measures import Weight
+from prices import Money
+
+from ..core.cache import CacheVersion
+from . import PostalCodeRuleInclusionType, ShippingMethodType
+from .models import (
+    ShippingMethod,
+    ShippingMethodChannelListing,
+    ShippingMethodPostalCodeRule,
+)
+from .postal_codes import get_postal_code_key_function
+
+shipping_rate_table_version = CacheVersion("shipping_rate_table_version")
+
+# Compiled tables of this process, keyed by channel ID.
+_shipping_rate_tables: Dict[int, Tuple[str, "ShippingRateTable"]] = {}
+
+
+class PostalCodeRanges:
+    """Postal code ranges sorted by start, matched with a binary search.
+
+    Keys of postal codes are compared the same way as in
+    `check_postal_code_in_range`: a range without a valid end is open-ended and
+    a range without a valid start never matches.
+    """
+
+    def __init__(self, ranges: Iterable[Tuple[str, Optional[str]]], key):
+        self.key = key
+        keyed_ranges = []
+        for start, end in ranges:
+            start_key = key(start)
+            if not start_key:
+                continue
+            keyed_ranges.append((start_key, key(end) or None))
+        keyed_ranges.sort(key=lambda keyed_range: keyed_range[0])
+
+        self._starts = [start for start, _ in keyed_ranges]
+        # the highest end and whether any range was open-ended, up to each index
+        self._max_ends: List = []
+        self._open_ended: List[bool] = []
+        max_end, open_ended = None, False
+        for _, end in keyed_ranges:
+            if end is None:
+                open_ended = True
+            elif max_end is None or end > max_end:
+                max_end = end
+            self._max_ends.append(max_end)
+            self._open_ended.append(open_ended)
+
+    def __contains__(self, postal_code: str) -> bool:
+        code_key = self.key(postal_code)
+        if not code_key:
+            return False
+        index = bisect_right(self._starts, code_key)
+        if not index:
+            return False
+        if self._open_ended[index - 1]:
+            return True
+        max_end = self._max_ends[index - 1]
+        return max_end is not None and code_key <= max_end
+
+
+class PostalCodeRules:
+    """Postal code rules of a shipping method."""
+
+    def __init__(self, rules: List[Tuple[str, Optional[str], str]]):
+        self.rules = rules
+        inclusion_types = {inclusion_type for _, _, inclusion_type in rules}
+        self.inclusion_type = (
+            inclusion_types.pop() if len(inclusion_types) == 1 else None
+        )
+        self._ranges: Dict = {}
+
+    def get_ranges(self, country_code: str) -> PostalCodeRanges:
+        key = get_postal_code_key_function(country_code)
+        ranges = self._ranges.get(key)
+        if ranges is None:
+            ranges = PostalCodeRanges(
+                [(start, end) for start, end, _ in self.rules], key
+            )
+            self._ranges[key] = ranges
+        return ranges
+
+    def is_applicable(self, country_code: str, postal_code: str) -> bool:
+        """Mirror `is_shipping_method_applicable_for_postal_code`."""
+        if self.inclusion_type is None:
+            # Shipping methods with complex rules are not supported for now
+            return False
+        matched = postal_code in self.get_ranges(country_code)
+        if self.inclusion_type == PostalCodeRuleInclusionType.INCLUDE:
+            return matched
+        return not matched
+
+
+class ShippingRate:
+    __slots__ = (
+        "shipping_method_id",
+        "type",
+        "currency",
+        "price_amount",
+        "minimum_order_price_amount",
+        "maximum_order_price_amount",
+        "minimum_order_weight",
+        "maximum_order_weight",
+        "excluded_product_ids",
+        "postal_code_rules",
+    )
+
+    def __init__(
+        self,
+        shipping_method: ShippingMethod,
+        channel_listing: ShippingMethodChannelListing,
+        excluded_product_ids: FrozenSet[int],
+        postal_code_rules: Optional[PostalCodeRules],
+    ):
+        self.shipping_method_id = shipping_method.pk
+        self.type = shipping_method.type
+        self.currency = channel_listing.currency
+        self.price_amount = channel_listing.price_amount
+        self.minimum_order_price_amount = channel_listing.minimum_order_price_amount
+        self.maximum_order_price_amount = channel_listing.maximum_order_price_amount
+        self.minimum_order_weight = shipping_method.minimum_order_weight
+        self.maximum_order_weight = shipping_method.maximum_order_weight
+        self.excluded_product_ids = excluded_product_ids
+        self.postal_code_rules = postal_code_rules
+
+    def is_applicable(self, price: Money, weight: Weight, product_ids) -> bool:
+        if self.currency != price.currency:
+            return False
+        if product_ids and not self.excluded_product_ids.isdisjoint(product_ids):
+            return False
+        if self.type == ShippingMethodType.PRICE_BASED:
+            return self._is_price_applicable(price.amount)
+        if self.type == ShippingMethodType.WEIGHT_BASED:
+            return self._is_weight_applicable(weight)
+        return False
+
+    def _is_price_applicable(self, amount) -> bool:
+        if self.minimum_order_price_amount is None:
+            return False
+        if amount < self.minimum_order_price_amount:
+            return False
+        maximum = self.maximum_order_price_amount
+        return maximum is None or amount <= maximum
+
+    def _is_weight_applicable(self, weight: Weight) -> bool:
+        minimum, maximum = self.minimum_order_weight, self.maximum_order_weight
+        if minimum is not None and minimum > weight:
+            return False
+        return maximum is None or maximum >= weight
+
+
+class ShippingRateTable:
+    """Shipping rates of the channel, grouped by the countries of shipping zones."""
+
+    def __init__(self, rates_by_country: Dict[str, List[ShippingRate]]):
+        self.rates_by_country = rates_by_country
+
+    @classmethod
+    def build(cls, channel_id: int) -> "ShippingRateTable":
+        channel_listings = (
+            ShippingMethodChannelListing.objects.filter(
+                channel_id=channel_id,
+                shipping_method__shipping_zone__channels__id=channel_id,
+            )
+            .select_related("shipping_method__shipping_zone")
+            .order_by("price_amount", "shipping_method_id")
+        )
+        channel_listings = list(channel_listings)
+        shipping_method_ids = [
+            listing.shipping_method_id for listing in channel_listings
+        ]
+
+        excluded_product_ids = defaultdict(set)
+        for (
+            shipping_method_id,
+            product_id,
+        ) in ShippingMethod.excluded_products.through.objects.filter(
+            shippingmethod_id__in=shipping_method_ids
+        ).values_list(
+            "shippingmethod_id", "product_id"
+        ):
+            excluded_product_ids[shipping_method_id].add(product_id)
+
+        postal_code_rules = defaultdict(list)
+        for (
+            shipping_method_id,
+            start,
+            end,
+            inclusion_type,
+        ) in ShippingMethodPostalCodeRule.objects.filter(
+            shipping_method_id__in=shipping_method_ids
+        ).values_list(
+            "shipping_method_id", "start", "end", "inclusion_type"
+        ):
+            postal_code_rules[shipping_method_id].append((start, end, inclusion_type))
+
+        rates_by_country: Dict[str, List[ShippingRate]] = defaultdict(list)
+        for listing in channel_listings:
+            shipping_method = listing.shipping_method
+            rules = postal_code_rules.get(shipping_method.pk)
+            rate = ShippingRate(
+                shipping_method,
+                listing,
+                frozenset(excluded_product_ids.get(shipping_method.pk, ())),
+                PostalCodeRules(rules) if rules else None,
+            )
+            for country in shipping_method.shipping_zone.countries:
+                rates_by_country[country.code].append(rate)
+        return cls(dict(rates_by_country))
+
+    def get_applicable_shipping_method_ids(
+        self,
+        price: Money,
+        weight: Weight,
+        country_code: str,
+        product_ids=None,
+        postal_code_country: Optional[str] = None,
+        postal_code: Optional[str] = None,
+    ) -> List[int]:
+        """Return IDs of the applicable shipping methods, ordered by their price."""
+        shipping_method_ids = []
+        for rate in self.rates_by_country.get(country_code, []):
+            if not rate.is_applicable(price, weight, product_ids):
+                continue
+            if rate.postal_code_rules and not rate.postal_code_rules.is_applicable(
+                postal_code_country or country_code, postal_code
+            ):
+                continue
+            shipping_method_ids.append(rate.shipping_method_id)
+        return shipping_method_ids
+
+
+def get_shipping_rate_table(channel_id: int) -> ShippingRateTable:
+    version = shipping_rate_table_version.get()
+    cached = _shipping_rate_tables.get(channel_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    table = ShippingRateTable.build(channel_id)
+    _shipping_rate_tables[channel_id] = (version, table)
+    return table
+
+
+def invalidate_shipping_rate_tables():
+    """Make all processes rebuild their shipping rate tables."""
+    shipping_rate_table_version.invalidate()
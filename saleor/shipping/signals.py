@@ -0,0 +1,10 @@
+from .rate_table import invalidate_shipping_rate_tables
+
+
+def invalidate_shipping_rate_tables_on_change(sender, **kwargs):
+    invalidate_shipping_rate_tables()
+
+
+def invalidate_shipping_rate_tables_on_m2m_change(sender, action, **kwargs):
+    if action.startswith("post_"):
+        invalidate_shipping_rate_tables()
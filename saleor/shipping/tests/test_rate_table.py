@@ -0,0 +1,349 @@
+import time
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from measurement.measures import Weight
+from prices import Money
+
+from ...checkout.fetch import fetch_checkout_lines
+from .. import PostalCodeRuleInclusionType
+from ..models import (
+    ShippingMethod,
+    ShippingMethodChannelListing,
+    ShippingMethodPostalCodeRule,
+    ShippingMethodType,
+    ShippingZone,
+)
+from ..postal_codes import get_postal_code_key_function
+from ..rate_table import (
+    PostalCodeRanges,
+    get_shipping_rate_table,
+    invalidate_shipping_rate_tables,
+)
+
+
+def _get_applicable_shipping_methods(checkout, channel, price, settings, enabled):
+    settings.SHIPPING_RATE_TABLE_ENABLED = enabled
+    lines = fetch_checkout_lines(checkout)
+    return list(
+        ShippingMethod.objects.applicable_shipping_methods_for_instance(
+            checkout, channel_id=channel.pk, price=price, lines=lines
+        )
+    )
+
+
+def _create_method(shipping_zone, channel, type, min_price=0, max_price=None, **kwargs):
+    method = shipping_zone.shipping_methods.create(type=type, **kwargs)
+    ShippingMethodChannelListing.objects.create(
+        shipping_method=method,
+        channel=channel,
+        currency=channel.currency_code,
+        minimum_order_price_amount=min_price,
+        maximum_order_price_amount=max_price,
+        price_amount=len(shipping_zone.shipping_methods.all()),
+    )
+    return method
+
+
+@pytest.mark.parametrize("price", [0, 5, 10, 50, 100])
+def test_rate_table_matches_query_for_price_based_methods(
+    price, checkout_with_item, address, shipping_zone, channel_USD, settings
+):
+    # given
+    checkout_with_item.shipping_address = address
+    checkout_with_item.save()
+    for min_price, max_price in [(0, 10), (5, 50), (10, None), (60, 100)]:
+        _create_method(
+            shipping_zone,
+            channel_USD,
+            ShippingMethodType.PRICE_BASED,
+            min_price=min_price,
+            max_price=max_price,
+        )
+    _create_method(
+        shipping_zone, channel_USD, ShippingMethodType.PRICE_BASED, min_price=None
+    )
+
+    # when
+    table_methods = _get_applicable_shipping_methods(
+        checkout_with_item, channel_USD, Money(price, "USD"), settings, True
+    )
+    query_methods = _get_applicable_shipping_methods(
+        checkout_with_item, channel_USD, Money(price, "USD"), settings, False
+    )
+
+    # then
+    assert table_methods == query_methods
+
+
+@pytest.mark.parametrize("quantity", [1, 3, 10, 100])
+def test_rate_table_matches_query_for_weight_based_methods(
+    quantity, checkout_with_item, address, shipping_zone, channel_USD, settings
+):
+    # given
+    checkout_with_item.shipping_address = address
+    checkout_with_item.save()
+    checkout_with_item.lines.update(quantity=quantity)
+    variant = checkout_with_item.lines.get().variant
+    variant.weight = Weight(kg=1)
+    variant.save(update_fields=["weight"])
+    for min_weight, max_weight in [(0, 2), (1, 10), (5, None), (20, 50)]:
+        _create_method(
+            shipping_zone,
+            channel_USD,
+            ShippingMethodType.WEIGHT_BASED,
+            minimum_order_weight=Weight(kg=min_weight),
+            maximum_order_weight=Weight(kg=max_weight) if max_weight else None,
+        )
+
+    # when
+    table_methods = _get_applicable_shipping_methods(
+        checkout_with_item, channel_USD, Money(10, "USD"), settings, True
+    )
+    query_methods = _get_applicable_shipping_methods(
+        checkout_with_item, channel_USD, Money(10, "USD"), settings, False
+    )
+
+    # then
+    assert table_methods == query_methods
+
+
+def test_rate_table_excludes_methods_with_excluded_products(
+    checkout_with_item, address, shipping_zone, channel_USD, settings
+):
+    # given
+    checkout_with_item.shipping_address = address
+    checkout_with_item.save()
+    product = checkout_with_item.lines.get().variant.product
+    excluded_method = _create_method(
+        shipping_zone, channel_USD, ShippingMethodType.PRICE_BASED
+    )
+    excluded_method.excluded_products.add(product)
+
+    # when
+    table_methods = _get_applicable_shipping_methods(
+        checkout_with_item, channel_USD, Money(10, "USD"), settings, True
+    )
+    query_methods = _get_applicable_shipping_methods(
+        checkout_with_item, channel_USD, Money(10, "USD"), settings, False
+    )
+
+    # then
+    assert excluded_method not in table_methods
+    assert table_methods == query_methods
+
+
+@pytest.mark.parametrize(
+    "country, postal_code",
+    [("PL", "53-601"), ("PL", "00-001"), ("GB", "BH16 7HF"), ("GB", "BH20 2BC")],
+)
+def test_rate_table_matches_query_for_postal_code_rules(
+    country,
+    postal_code,
+    checkout_with_item,
+    address,
+    shipping_zone,
+    channel_USD,
+    settings,
+):
+    # given
+    address.country = country
+    address.postal_code = postal_code
+    address.save()
+    checkout_with_item.shipping_address = address
+    checkout_with_item.save()
+    rules = [
+        (PostalCodeRuleInclusionType.INCLUDE, "50-000", "59-999"),
+        (PostalCodeRuleInclusionType.EXCLUDE, "50-000", None),
+        (PostalCodeRuleInclusionType.INCLUDE, "BH2 1AA", "BH17 9ZZ"),
+        (PostalCodeRuleInclusionType.EXCLUDE, "BH16 7HA", "BH16 7HG"),
+    ]
+    for inclusion_type, start, end in rules:
+        method = _create_method(
+            shipping_zone, channel_USD, ShippingMethodType.PRICE_BASED
+        )
+        ShippingMethodPostalCodeRule.objects.create(
+            shipping_method=method,
+            start=start,
+            end=end,
+            inclusion_type=inclusion_type,
+        )
+    mixed_method = _create_method(
+        shipping_zone, channel_USD, ShippingMethodType.PRICE_BASED
+    )
+    for inclusion_type, start in [
+        (PostalCodeRuleInclusionType.INCLUDE, "00-000"),
+        (PostalCodeRuleInclusionType.EXCLUDE, "99-000"),
+    ]:
+        ShippingMethodPostalCodeRule.objects.create(
+            shipping_method=mixed_method, inclusion_type=inclusion_type, start=start
+        )
+
+    # when
+    table_methods = _get_applicable_shipping_methods(
+        checkout_with_item, channel_USD, Money(10, "USD"), settings, True
+    )
+    query_methods = _get_applicable_shipping_methods(
+        checkout_with_item, channel_USD, Money(10, "USD"), settings, False
+    )
+
+    # then
+    assert mixed_method not in table_methods
+    assert table_methods == query_methods
+
+
+def test_rate_table_skips_methods_in_other_currency(shipping_zone, channel_USD):
+    # given
+    table = get_shipping_rate_table(channel_USD.pk)
+
+    # when
+    shipping_method_ids = table.get_applicable_shipping_method_ids(
+        price=Money(10, "PLN"), weight=Weight(kg=0), country_code="PL"
+    )
+
+    # then
+    assert shipping_method_ids == []
+
+
+def test_rate_table_rebuilt_after_channel_listing_change(shipping_zone, channel_USD):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    table = get_shipping_rate_table(channel_USD.pk)
+    price = Money(10, "USD")
+    assert table.get_applicable_shipping_method_ids(price, Weight(kg=0), "PL") == [
+        method.pk
+    ]
+
+    # when
+    listing = method.channel_listings.get()
+    listing.minimum_order_price_amount = 20
+    listing.save()
+
+    # then
+    table = get_shipping_rate_table(channel_USD.pk)
+    assert table.get_applicable_shipping_method_ids(price, Weight(kg=0), "PL") == []
+
+
+def test_rate_table_rebuilt_after_channel_removed_from_zone(shipping_zone, channel_USD):
+    # given
+    assert get_shipping_rate_table(channel_USD.pk).rates_by_country
+
+    # when
+    shipping_zone.channels.remove(channel_USD)
+
+    # then
+    assert not get_shipping_rate_table(channel_USD.pk).rates_by_country
+
+
+def test_rate_table_reused_until_invalidated(shipping_zone, channel_USD):
+    # given
+    table = get_shipping_rate_table(channel_USD.pk)
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        reused_table = get_shipping_rate_table(channel_USD.pk)
+    invalidate_shipping_rate_tables()
+
+    # then
+    assert reused_table is table
+    assert len(queries) == 0
+    assert get_shipping_rate_table(channel_USD.pk) is not table
+
+
+@pytest.mark.parametrize(
+    "country, ranges, code, in_ranges",
+    [
+        ("PL", [("50-000", "55-000"), ("60-000", "65-000")], "64-620", True),
+        ("PL", [("50-000", "55-000"), ("60-000", "65-000")], "57-000", False),
+        ("PL", [("10-000", "90-000"), ("20-000", "30-000")], "50-000", True),
+        ("PL", [("50-000", None)], "99-999", True),
+        ("PL", [("50-000", None)], "49-999", False),
+        ("GB", [("BH2 1AA", "BH4 9ZZ")], "BH3 2BC", True),
+        ("GB", [("BH2 1AA", "BH4 9ZZ")], "BH20 2BC", False),
+        ("GB", [("BH16 7HA", "BH16 7HG")], "invalid", False),
+        ("IE", [("A65 2F0A", "A65 2F0C")], "A65 2F0B", True),
+    ],
+)
+def test_postal_code_ranges(country, ranges, code, in_ranges):
+    postal_code_ranges = PostalCodeRanges(ranges, get_postal_code_key_function(country))
+    assert (code in postal_code_ranges) is in_ranges
+
+
+def test_rate_table_and_query_at_scale(
+    checkout_with_item, address, channel_USD, settings
+):
+    # given
+    zones_count, methods_per_zone = 20, 10
+    checkout_with_item.shipping_address = address
+    checkout_with_item.save()
+    zones = ShippingZone.objects.bulk_create(
+        [
+            ShippingZone(name=f"Zone {index}", countries=["PL", "DE", "CZ"])
+            for index in range(zones_count)
+        ]
+    )
+    for zone in zones:
+        zone.channels.add(channel_USD)
+    methods = ShippingMethod.objects.bulk_create(
+        [
+            ShippingMethod(
+                name=f"Method {index}",
+                shipping_zone=zone,
+                type=ShippingMethodType.PRICE_BASED,
+            )
+            for zone in zones
+            for index in range(methods_per_zone)
+        ]
+    )
+    listings = ShippingMethodChannelListing.objects.bulk_create(
+        [
+            ShippingMethodChannelListing(
+                shipping_method=method,
+                channel=channel_USD,
+                currency=channel_USD.currency_code,
+                minimum_order_price_amount=index % 20,
+                maximum_order_price_amount=index % 20 + 10,
+                price_amount=index,
+            )
+            for index, method in enumerate(methods)
+        ]
+    )
+    ShippingMethodPostalCodeRule.objects.bulk_create(
+        [
+            ShippingMethodPostalCodeRule(
+                shipping_method=listing.shipping_method,
+                start="50-000",
+                end="59-999",
+                inclusion_type=PostalCodeRuleInclusionType.INCLUDE,
+            )
+            for listing in listings[::3]
+        ]
+    )
+    invalidate_shipping_rate_tables()
+    _get_applicable_shipping_methods(
+        checkout_with_item, channel_USD, Money(15, "USD"), settings, True
+    )
+    iterations = 20
+
+    # when
+    start = time.perf_counter()
+    with CaptureQueriesContext(connection) as table_queries:
+        for _ in range(iterations):
+            table_methods = _get_applicable_shipping_methods(
+                checkout_with_item, channel_USD, Money(15, "USD"), settings, True
+            )
+    table_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with CaptureQueriesContext(connection) as query_queries:
+        for _ in range(iterations):
+            query_methods = _get_applicable_shipping_methods(
+                checkout_with_item, channel_USD, Money(15, "USD"), settings, False
+            )
+    query_time = time.perf_counter() - start
+
+    # then
+    assert table_methods == query_methods
+    assert len(table_queries) < len(query_queries)
+    assert table_time < query_time
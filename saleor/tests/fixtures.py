@@ -43,7 +43,7 @@ from ..core.payments import PaymentInterface
 from ..core.units import MeasurementUnits
 from ..core.utils.editorjs import clean_editor_js
 from ..csv.events import ExportEvents
-from ..csv.models import ExportEvent, ExportFile
+from ..csv.models import ExportEvent, ExportFile, ImportFile
 from ..discount import DiscountInfo, DiscountValueType, VoucherType
 from ..discount.models import (
     Sale,
@@ -5055,6 +5055,12 @@ def app_export_file(app):
     return job
 
 
+@pytest.fixture
+def user_import_file(staff_user):
+    job = ImportFile.objects.create(user=staff_user)
+    return job
+
+
 @pytest.fixture
 def export_file_list(staff_user):
     export_file_list = list(
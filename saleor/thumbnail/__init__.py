@@ -0,0 +1,16 @@
+class ThumbnailFormat:
+    """Formats of the stored thumbnails.
+
+    Thumbnails in the original format are created by versatileimagefield; the
+    other formats are converted from them.
+    """
+
+    ORIGINAL = ""
+    WEBP = "webp"
+    AVIF = "avif"
+
+    CHOICES = [
+        (ORIGINAL, "Original format of the image"),
+        (WEBP, "WebP"),
+        (AVIF, "AVIF"),
+    ]
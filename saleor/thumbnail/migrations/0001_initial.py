@@ -0,0 +1,47 @@
+# Generated by Django 3.2.7 on 2026-10-19 20:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Thumbnail",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("image", models.CharField(max_length=255)),
+                ("size", models.CharField(max_length=32)),
+                (
+                    "format",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("", "Original format of the image"),
+                            ("webp", "WebP"),
+                            ("avif", "AVIF"),
+                        ],
+                        default="",
+                        max_length=8,
+                    ),
+                ),
+                ("name", models.CharField(max_length=512)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "unique_together": {("image", "size", "format")},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import models
+
+from . import ThumbnailFormat
+
+
+class Thumbnail(models.Model):
+    """Manifest entry of a generated thumbnail.
+
+    Thumbnails are identified by the storage name of the source image, the
+    rendition key (e.g. `thumbnail__540x540`) and the format, so the entries are
+    shared by all models with versatile image fields.
+    """
+
+    image = models.CharField(max_length=255)
+    size = models.CharField(max_length=32)
+    format = models.CharField(
+        max_length=8, choices=ThumbnailFormat.CHOICES, blank=True, default=""
+    )
+    name = models.CharField(max_length=512)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("image", "size", "format")
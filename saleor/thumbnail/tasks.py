@@ -0,0 +1,21 @@
+from typing import List, Optional
+
+from celery.utils.log import get_task_logger
+
+from ..celeryconf import app
+from .warmer import WarmingStats, warm_thumbnails
+
+task_logger = get_task_logger(__name__)
+
+
+@app.task
+def warm_thumbnails_task(
+    source_name: str, pks: List[int], formats: Optional[List[str]] = None
+):
+    stats = WarmingStats()
+    stats.add(warm_thumbnails(source_name, pks, formats))
+    task_logger.info("Warmed %s thumbnails: %s", source_name, stats)
+    if stats.failed:
+        task_logger.error(
+            "Failed to generate thumbnails", extra={"paths": stats.failed}
+        )
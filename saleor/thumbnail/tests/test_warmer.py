@@ -0,0 +1,146 @@
+import pytest
+from django.core.management import call_command
+from PIL import Image
+
+from ...product.models import ProductMedia
+from .. import ThumbnailFormat
+from ..models import Thumbnail
+from ..warmer import (
+    ImageWarmingResult,
+    WarmingStats,
+    delete_thumbnails,
+    get_rendition_keys,
+    iter_pk_chunks,
+    warm_thumbnails,
+)
+
+
+@pytest.fixture(autouse=True)
+def disable_images_on_demand(settings):
+    settings.VERSATILEIMAGEFIELD_SETTINGS = {"create_images_on_demand": False}
+
+
+def test_warm_thumbnails_records_thumbnails(product_with_image):
+    # given
+    media = product_with_image.media.first()
+    rendition_keys = get_rendition_keys("products")
+
+    # when
+    (result,) = warm_thumbnails("products", [media.pk], formats=[])
+
+    # then
+    assert result.created == len(rendition_keys)
+    assert not result.failed
+    thumbnails = Thumbnail.objects.filter(image=media.image.name)
+    assert {thumbnail.size for thumbnail in thumbnails} == set(rendition_keys)
+    for thumbnail in thumbnails:
+        assert thumbnail.format == ThumbnailFormat.ORIGINAL
+        assert media.image.storage.exists(thumbnail.name)
+
+
+def test_warm_thumbnails_skips_recorded_thumbnails(
+    product_with_image, django_assert_num_queries
+):
+    # given
+    media = product_with_image.media.first()
+    warm_thumbnails("products", [media.pk], formats=[])
+
+    # when
+    with django_assert_num_queries(2):
+        (result,) = warm_thumbnails("products", [media.pk], formats=[])
+
+    # then
+    assert result.created == 0
+    assert result.skipped == len(get_rendition_keys("products"))
+
+
+@pytest.mark.skipif("WEBP" not in Image.SAVE, reason="WebP is not supported")
+def test_warm_thumbnails_converts_thumbnails(product_with_image):
+    # given
+    media = product_with_image.media.first()
+
+    # when
+    (result,) = warm_thumbnails("products", [media.pk], formats=[ThumbnailFormat.WEBP])
+
+    # then
+    assert result.created == 2 * len(get_rendition_keys("products"))
+    thumbnails = Thumbnail.objects.filter(
+        image=media.image.name, format=ThumbnailFormat.WEBP
+    )
+    for thumbnail in thumbnails:
+        assert thumbnail.name.endswith(".webp")
+        with media.image.storage.open(thumbnail.name) as thumbnail_file:
+            assert Image.open(thumbnail_file).format == "WEBP"
+
+
+def test_iter_pk_chunks(product_with_image, image):
+    # given
+    product = product_with_image
+    for _ in range(4):
+        ProductMedia.objects.create(product=product, image=image)
+    ProductMedia.objects.create(product=product, external_url="https://example.com")
+    pks = list(
+        ProductMedia.objects.exclude(image="")
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+    # when
+    chunks = list(iter_pk_chunks("products", 2, start_after=pks[0]))
+
+    # then
+    assert chunks == [pks[1:3], pks[3:5]]
+
+
+@pytest.mark.skipif("WEBP" not in Image.SAVE, reason="WebP is not supported")
+def test_delete_thumbnails(product_with_image):
+    # given
+    media = product_with_image.media.first()
+    warm_thumbnails("products", [media.pk], formats=[ThumbnailFormat.WEBP])
+    converted_names = list(
+        Thumbnail.objects.filter(format=ThumbnailFormat.WEBP).values_list(
+            "name", flat=True
+        )
+    )
+
+    # when
+    delete_thumbnails(media.image)
+
+    # then
+    assert not Thumbnail.objects.filter(image=media.image.name).exists()
+    for name in converted_names:
+        assert not media.image.storage.exists(name)
+
+
+def test_create_thumbnails_command(product_with_image, capsys):
+    # given
+    media = product_with_image.media.first()
+
+    # when
+    call_command("create_thumbnails", "--chunk-size", "10")
+
+    # then
+    out = capsys.readouterr().out
+    assert f"up to ID {media.pk}" in out
+    assert Thumbnail.objects.filter(image=media.image.name).count() == len(
+        get_rendition_keys("products")
+    )
+
+
+def test_warming_stats():
+    # given
+    stats = WarmingStats()
+
+    # when
+    stats.add(
+        [
+            ImageWarmingResult(pk=pk, created=1, duration=pk / 100)
+            for pk in range(1, 101)
+        ]
+    )
+
+    # then
+    assert stats.images == 100
+    assert stats.created == 100
+    assert stats.get_duration_percentile(50) == 0.51
+    assert stats.get_duration_percentile(95) == 0.96
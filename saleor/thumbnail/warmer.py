@@ -0,0 +1,324 @@
+"""Warming of image thumbnails recorded in the thumbnails manifest.
+
+Thumbnails are created by versatileimagefield for the sizes of the rendition key
+set, and optionally converted to WebP or AVIF. Every stored thumbnail is recorded
+as a `Thumbnail`, so warming images again skips the existing thumbnails with a
+single query per chunk of images.
+"""
+import logging
+import multiprocessing
+import os
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections
+from django.db.models import Model, Q
+from PIL import Image
+
+from . import ThumbnailFormat
+from .models import Thumbnail
+
+try:
+    # registers the AVIF format in Pillow when installed
+    import pillow_avif  # noqa: F401
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+CONVERTED_THUMBNAIL_QUALITY = 80
+
+
+@dataclass(frozen=True)
+class ThumbnailSource:
+    app_label: str
+    model_name: str
+    image_attr: str
+    rendition_key_set: str
+
+    @property
+    def model(self):
+        return apps.get_model(self.app_label, self.model_name)
+
+    def get_queryset(self):
+        empty_image = Q(**{self.image_attr: ""}) | Q(
+            **{f"{self.image_attr}__isnull": True}
+        )
+        return self.model.objects.exclude(empty_image)
+
+
+THUMBNAIL_SOURCES = {
+    "products": ThumbnailSource("product", "ProductMedia", "image", "products"),
+    "categories": ThumbnailSource(
+        "product", "Category", "background_image", "background_images"
+    ),
+    "collections": ThumbnailSource(
+        "product", "Collection", "background_image", "background_images"
+    ),
+    "avatars": ThumbnailSource("account", "User", "avatar", "user_avatars"),
+}
+
+
+@dataclass
+class ImageWarmingResult:
+    pk: int
+    created: int = 0
+    skipped: int = 0
+    failed: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+
+@dataclass
+class WarmingStats:
+    images: int = 0
+    created: int = 0
+    skipped: int = 0
+    failed: List[str] = field(default_factory=list)
+    durations: List[float] = field(default_factory=list)
+
+    def add(self, results: Iterable[ImageWarmingResult]):
+        for result in results:
+            self.images += 1
+            self.created += result.created
+            self.skipped += result.skipped
+            self.failed.extend(result.failed)
+            self.durations.append(result.duration)
+
+    def get_duration_percentile(self, percentile: int) -> float:
+        if not self.durations:
+            return 0.0
+        durations = sorted(self.durations)
+        index = min(len(durations) - 1, len(durations) * percentile // 100)
+        return durations[index]
+
+    def __str__(self):
+        mean = sum(self.durations) / len(self.durations) if self.durations else 0.0
+        return (
+            f"{self.images} images, {self.created} thumbnails created, "
+            f"{self.skipped} skipped, {len(self.failed)} failed; time per image: "
+            f"mean {mean:.3f}s, p50 {self.get_duration_percentile(50):.3f}s, "
+            f"p95 {self.get_duration_percentile(95):.3f}s, "
+            f"max {max(self.durations, default=0.0):.3f}s"
+        )
+
+
+def get_rendition_keys(rendition_key_set: str) -> List[str]:
+    return [
+        key
+        for _, key in settings.VERSATILEIMAGEFIELD_RENDITION_KEY_SETS[rendition_key_set]
+    ]
+
+
+def get_unsupported_formats(formats: Iterable[str]) -> List[str]:
+    Image.init()
+    return [fmt for fmt in formats if fmt.upper() not in Image.SAVE]
+
+
+def get_converted_thumbnail_name(name: str, fmt: str) -> str:
+    return f"{os.path.splitext(name)[0]}.{fmt}"
+
+
+def convert_thumbnail(storage, name: str, fmt: str) -> str:
+    """Store the thumbnail in the given format next to the original one."""
+    converted_name = get_converted_thumbnail_name(name, fmt)
+    if storage.exists(converted_name):
+        return converted_name
+    with storage.open(name) as thumbnail_file:
+        image = Image.open(thumbnail_file)
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+    content = BytesIO()
+    image.save(content, format=fmt.upper(), quality=CONVERTED_THUMBNAIL_QUALITY)
+    return storage.save(converted_name, ContentFile(content.getvalue()))
+
+
+def warm_image(
+    pk,
+    image_file,
+    rendition_keys: List[str],
+    formats: List[str],
+    existing: Set[Tuple[str, str]],
+) -> Tuple[ImageWarmingResult, List[Thumbnail]]:
+    """Create the thumbnails of the image missing in the manifest."""
+    result = ImageWarmingResult(pk=pk)
+    thumbnails = []
+    start = time.perf_counter()
+    image_file.create_on_demand = True
+    for size_key in rendition_keys:
+        missing_formats = [
+            fmt
+            for fmt in [ThumbnailFormat.ORIGINAL, *formats]
+            if (size_key, fmt) not in existing
+        ]
+        result.skipped += len(formats) + 1 - len(missing_formats)
+        if not missing_formats:
+            continue
+        method, size = size_key.split("__")
+        try:
+            rendition_name = getattr(image_file, method)[size].name
+            for fmt in missing_formats:
+                name = rendition_name
+                if fmt != ThumbnailFormat.ORIGINAL:
+                    name = convert_thumbnail(image_file.storage, rendition_name, fmt)
+                thumbnails.append(
+                    Thumbnail(
+                        image=image_file.name,
+                        size=size_key,
+                        format=fmt,
+                        name=name,
+                    )
+                )
+                result.created += 1
+        except Exception:
+            logger.exception(
+                "Thumbnail generation failed",
+                extra={"path": image_file.name, "size": size_key},
+            )
+            result.failed.append(f"{image_file.name} ({size_key})")
+    result.duration = time.perf_counter() - start
+    return result, thumbnails
+
+
+def warm_instances(
+    instances: Iterable[Model],
+    image_attr: str,
+    rendition_key_set: str,
+    formats: Optional[List[str]] = None,
+) -> List[ImageWarmingResult]:
+    if formats is None:
+        formats = settings.THUMBNAIL_EXTRA_FORMATS
+    rendition_keys = get_rendition_keys(rendition_key_set)
+    image_files = [
+        (instance.pk, getattr(instance, image_attr)) for instance in instances
+    ]
+    image_files = [(pk, image_file) for pk, image_file in image_files if image_file]
+
+    existing: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+    for image, size, fmt in Thumbnail.objects.filter(
+        image__in=[image_file.name for _, image_file in image_files]
+    ).values_list("image", "size", "format"):
+        existing[image].add((size, fmt))
+
+    results = []
+    thumbnails: List[Thumbnail] = []
+    for pk, image_file in image_files:
+        result, image_thumbnails = warm_image(
+            pk, image_file, rendition_keys, formats, existing[image_file.name]
+        )
+        results.append(result)
+        thumbnails.extend(image_thumbnails)
+    Thumbnail.objects.bulk_create(thumbnails, ignore_conflicts=True)
+    return results
+
+
+def warm_thumbnails(
+    source_name: str, pks: List[int], formats: Optional[List[str]] = None
+) -> List[ImageWarmingResult]:
+    """Warm thumbnails of the images of the given source with the given IDs."""
+    source = THUMBNAIL_SOURCES[source_name]
+    instances = (
+        source.get_queryset()
+        .filter(pk__in=pks)
+        .only("pk", source.image_attr)
+        .order_by("pk")
+    )
+    return warm_instances(
+        instances, source.image_attr, source.rendition_key_set, formats
+    )
+
+
+def iter_pk_chunks(
+    source_name: str, chunk_size: int, start_after: Optional[int] = None
+) -> Iterator[List[int]]:
+    """Yield IDs of the images of the source, in ascending order."""
+    queryset = (
+        THUMBNAIL_SOURCES[source_name]
+        .get_queryset()
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    cursor = start_after
+    while True:
+        chunk_queryset = queryset if cursor is None else queryset.filter(pk__gt=cursor)
+        pks = list(chunk_queryset[:chunk_size])
+        if not pks:
+            return
+        yield pks
+        cursor = pks[-1]
+
+
+ChunkCallback = Callable[[List[ImageWarmingResult], Optional[int]], None]
+
+
+def warm_thumbnails_in_processes(
+    source_name: str,
+    processes: int,
+    chunk_size: int,
+    start_after: Optional[int] = None,
+    formats: Optional[List[str]] = None,
+    on_chunk_done: Optional[ChunkCallback] = None,
+):
+    """Warm thumbnails of all images of the source in a pool of processes.
+
+    `on_chunk_done` receives the results of each chunk and the cursor: the highest
+    ID up to which all images were processed, so warming can be resumed after it.
+    The cursor is None when earlier chunks are still processed.
+    """
+    if formats is None:
+        formats = settings.THUMBNAIL_EXTRA_FORMATS
+    chunks = iter_pk_chunks(source_name, chunk_size, start_after)
+    if processes <= 1:
+        for pks in chunks:
+            results = warm_thumbnails(source_name, pks, formats)
+            if on_chunk_done:
+                on_chunk_done(results, pks[-1])
+        return
+
+    # workers are spawned, as forked ones would share the database connections
+    connections.close_all()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=context, initializer=django.setup
+    ) as executor:
+        # last IDs of the submitted chunks, in the order of submission
+        submitted: deque = deque()
+        finished_last_pks: Set[int] = set()
+        pending: Dict[Future, int] = {}
+        pks = next(chunks, None)
+        while pending or pks is not None:
+            while pks is not None and len(pending) < processes * 2:
+                future = executor.submit(warm_thumbnails, source_name, pks, formats)
+                pending[future] = pks[-1]
+                submitted.append(pks[-1])
+                pks = next(chunks, None)
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                finished_last_pks.add(pending.pop(future))
+                cursor = None
+                while submitted and submitted[0] in finished_last_pks:
+                    cursor = submitted.popleft()
+                    finished_last_pks.remove(cursor)
+                if on_chunk_done:
+                    on_chunk_done(future.result(), cursor)
+
+
+def delete_thumbnails(image_file):
+    """Delete converted thumbnails of the image and its manifest entries.
+
+    Thumbnails in the original format are deleted by versatileimagefield.
+    """
+    thumbnails = Thumbnail.objects.filter(image=image_file.name)
+    for name in thumbnails.exclude(format=ThumbnailFormat.ORIGINAL).values_list(
+        "name", flat=True
+    ):
+        image_file.storage.delete(name)
+    thumbnails.delete()